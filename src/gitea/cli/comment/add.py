@@ -56,6 +56,7 @@ def add_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository, resolve_issue_id  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -76,7 +77,7 @@ def add_command(
         target_repository = require_repository(repository, command="gitea-cli comment add")
         target_issue = resolve_issue_id(issue_id=issue_id, index=index, command="gitea-cli comment add")
 
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return client.comment.create_comment(
                 owner=owner,
                 repository=target_repository,
@@ -52,6 +52,7 @@ def delete_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -71,7 +72,7 @@ def delete_command(
         """
         target_repository = require_repository(repository, command="gitea-cli comment delete")
 
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return client.comment.delete_comment(
                 owner=owner,
                 repository=target_repository,
@@ -54,6 +54,7 @@ def edit_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -73,7 +74,7 @@ def edit_command(
         """
         target_repository = require_repository(repository, command="gitea-cli comment edit")
 
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return client.comment.edit_comment(
                 owner=owner,
                 repository=target_repository,
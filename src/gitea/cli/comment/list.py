@@ -64,6 +64,7 @@ def list_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository, resolve_issue_id  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -84,7 +85,7 @@ def list_command(
         target_repository = require_repository(repository, command="gitea-cli comment list")
         target_issue = resolve_issue_id(issue_id=issue_id, index=index, command="gitea-cli comment list")
 
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return client.comment.list_comments(
                 owner=owner,
                 repository=target_repository,
@@ -28,11 +28,11 @@ def delete_command(
     from gitea.cli.output import OutputFormat, emit, get_output_format  # noqa: PLC0415
     from gitea.config.manager import ConfigManager  # noqa: PLC0415
 
-    as_json = get_output_format(ctx) is OutputFormat.JSON
+    structured = get_output_format(ctx) is not OutputFormat.TEXT
 
     if not force:
-        # Keep the prompt off stdout in JSON mode so the envelope stays parsable.
-        confirm = typer.confirm(f"Are you sure you want to delete the account '{name}'?", err=as_json)
+        # Keep the prompt off stdout in JSON modes so the output stays parsable.
+        confirm = typer.confirm(f"Are you sure you want to delete the account '{name}'?", err=structured)
         if not confirm:
             emit(
                 ctx,
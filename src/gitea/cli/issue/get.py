@@ -61,6 +61,7 @@ def get_command(
     """
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository, resolve_issue_id  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
     from gitea.issue.project_column import resolve_project_column_ids  # noqa: PLC0415
@@ -86,7 +87,7 @@ def get_command(
         target_repository = require_repository(repository, command="gitea-cli issue get")
         target_issue = resolve_issue_id(issue_id=issue_id, index=index, command="gitea-cli issue get")
 
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             data, metadata = client.issue.get_issue(
                 owner=owner,
                 repository=target_repository,
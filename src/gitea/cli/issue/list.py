@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 import typer
 
+from gitea.cli.utils.listing import ALL_PAGES_HELP, PAGE_CONCURRENCY_HELP
 from gitea.cli.utils.options import REPOSITORY_REQUIRED_HELP
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def list_command(
     ctx: typer.Context,
@@ -61,6 +65,8 @@ def list_command(
         int | None,
         typer.Option("--limit", help="The number of issues per page."),
     ] = None,
+    all_pages: Annotated[bool, typer.Option("--all", "--all-pages", help=ALL_PAGES_HELP)] = False,
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help=PAGE_CONCURRENCY_HELP)] = 1,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -101,6 +107,8 @@ def list_command(
         mentioned_by: Filter issues mentioning this user.
         page: The page number for pagination.
         limit: The number of issues per page.
+        all_pages: Whether to walk every page of the listing rather than fetch one.
+        concurrency: Number of pages to fetch at once with --all.
         account_name: Name of the account to use for authentication.
         token: Token for authentication. If not provided, the token from the specified account will be used.
         base_url: Base URL of the Gitea platform. If not provided, the base URL from the specified account will be used.
@@ -108,9 +116,14 @@ def list_command(
     """
     from typing import Any  # noqa: PLC0415
 
-    from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.utils.api import execute_api_command, execute_api_stream  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.convert import list_str_to_list_int_or_none  # noqa: PLC0415
+    from gitea.cli.utils.issue_ids import issue_ids, listed_ids  # noqa: PLC0415
+    from gitea.cli.utils.listing import walk_listing  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -123,6 +136,51 @@ def list_command(
 
     milestones_values = list_str_to_list_int_or_none(milestones)
 
+    def list_page(client: Gitea, number: int | None, size: int | None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """List one page of issues in a repository.
+
+        Args:
+            client: The Gitea client.
+            number: The page number, or None for the instance's default.
+            size: The page size, or None for the instance's default.
+
+        Returns:
+            A tuple containing the issue data and metadata.
+
+        """
+        target_repository = require_repository(repository, command="gitea-cli issue list")
+        issues, metadata = client.issue.list_issues(
+            owner=owner,
+            repository=target_repository,
+            state=state,
+            labels=labels,
+            search_string=search_string,
+            issue_type=issue_type,
+            milestones=milestones_values,
+            since=since,
+            before=before,
+            created_by=created_by,
+            assigned_by=assigned_by,
+            mentioned_by=mentioned_by,
+            page=number,
+            limit=size,
+        )
+        return issues, metadata
+
+    def record(listed: dict[int, int]) -> None:
+        """Record the global IDs of the listed issues.
+
+        The listing carries every issue's ID, so the numbers it shows resolve
+        without a request from then on.
+
+        Args:
+            listed: The global ID of each listed issue, keyed by issue number.
+
+        """
+        ids = issue_ids(ctx, base_url)
+        if ids is not None:
+            ids.record(owner, require_repository(repository, command="gitea-cli issue list"), listed)
+
     def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
         """List issues in a repository.
 
@@ -130,24 +188,38 @@ def list_command(
             The issue information as a dictionary.
 
         """
-        target_repository = require_repository(repository, command="gitea-cli issue list")
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            issues, metadata = list_page(client, page, limit)
+        record(listed_ids(issues))
+        return issues, metadata
+
+    def pages() -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+        """Walk every page of issues in one session.
 
-        with Gitea(token=token, base_url=base_url) as client:
-            return client.issue.list_issues(
-                owner=owner,
-                repository=target_repository,
-                state=state,
-                labels=labels,
-                search_string=search_string,
-                issue_type=issue_type,
-                milestones=milestones_values,
-                since=since,
-                before=before,
-                created_by=created_by,
-                assigned_by=assigned_by,
-                mentioned_by=mentioned_by,
+        The IDs of the listed issues are recorded once, after the last page,
+        rather than by each page on the thread that fetched it.
+
+        Yields:
+            The issue data and metadata of each page.
+
+        """
+        listed: dict[int, int] = {}
+        with Gitea(
+            token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+        ) as client:
+            for issues, metadata in walk_listing(
+                lambda number, size: list_page(client, number, size),
+                client=client,
                 page=page,
                 limit=limit,
-            )
-
-    execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli issue list")
+                concurrency=concurrency,
+                command="gitea-cli issue list",
+            ):
+                listed.update(listed_ids(issues))
+                yield issues, metadata
+        record(listed)
+
+    if all_pages:
+        execute_api_stream(api_call=pages, base_url=base_url, command_name="gitea-cli issue list")
+    else:
+        execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli issue list")
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
+from gitea.cli.utils.listing import ALL_PAGES_HELP, PAGE_CONCURRENCY_HELP
 from gitea.cli.utils.options import REPOSITORY_REQUIRED_HELP
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def list_command(
     ctx: typer.Context,
@@ -21,6 +25,8 @@ def list_command(
         int | None,
         typer.Option("--limit", help="The number of labels per page."),
     ] = None,
+    all_pages: Annotated[bool, typer.Option("--all", "--all-pages", help=ALL_PAGES_HELP)] = False,
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help=PAGE_CONCURRENCY_HELP)] = 1,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -51,6 +57,8 @@ def list_command(
         repository: The name of the repository, which this command requires.
         page: The page number for pagination.
         limit: The number of labels per page.
+        all_pages: Whether to walk every page of the listing rather than fetch one.
+        concurrency: Number of pages to fetch at once with --all.
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the Gitea platform.
@@ -58,8 +66,12 @@ def list_command(
     """
     from typing import Any  # noqa: PLC0415
 
-    from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.utils.api import execute_api_command, execute_api_stream  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.listing import walk_listing  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -70,6 +82,25 @@ def list_command(
         base_url=base_url,
     )
 
+    def list_page(client: Gitea, number: int | None, size: int | None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """List one page of labels.
+
+        Args:
+            client: The Gitea client.
+            number: The page number, or None for the instance's default.
+            size: The page size, or None for the instance's default.
+
+        Returns:
+            A tuple containing the label data and metadata.
+
+        """
+        return client.label.list_labels(
+            owner=owner,
+            repository=require_repository(repository, command="gitea-cli label list"),
+            page=number,
+            limit=size,
+        )
+
     def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
         """List label information.
 
@@ -77,14 +108,29 @@ def list_command(
             A tuple containing the label data and metadata.
 
         """
-        target_repository = require_repository(repository, command="gitea-cli label list")
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            return list_page(client, page, limit)
 
-        with Gitea(token=token, base_url=base_url) as client:
-            return client.label.list_labels(
-                owner=owner,
-                repository=target_repository,
+    def pages() -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+        """Walk every page of labels in one session.
+
+        Yields:
+            The label data and metadata of each page.
+
+        """
+        with Gitea(
+            token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+        ) as client:
+            yield from walk_listing(
+                lambda number, size: list_page(client, number, size),
+                client=client,
                 page=page,
                 limit=limit,
+                concurrency=concurrency,
+                command="gitea-cli label list",
             )
 
-    execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli label list")
+    if all_pages:
+        execute_api_stream(api_call=pages, base_url=base_url, command_name="gitea-cli label list")
+    else:
+        execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli label list")
@@ -108,9 +108,47 @@ def main(
             "--output",
             "-o",
             envvar="PYTHON_GITEA_OUTPUT",
-            help="Output format for command results. `json` emits the `{data, metadata}` envelope for every subcommand.",
+            help=(
+                "Output format for command results. `json` emits the `{data, metadata}` envelope for every "
+                "subcommand; `jsonl` emits one record per item of `data`, then `{metadata}` as the last line."
+            ),
         ),
     ] = OutputFormat.TEXT,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            envvar="PYTHON_GITEA_NO_CACHE",
+            help="Send every request to the instance, neither reusing nor keeping responses in the response cache.",
+        ),
+    ] = False,
+    cache_ttl: Annotated[
+        float | None,
+        typer.Option(
+            "--cache-ttl",
+            envvar="PYTHON_GITEA_CACHE_TTL",
+            min=0,
+            help="Seconds to reuse a cached response for without asking the instance, for every endpoint. If not provided, labels and milestones are reused for a minute and everything else is revalidated on each read.",
+        ),
+    ] = None,
+    retries: Annotated[
+        int,
+        typer.Option(
+            "--retries",
+            envvar="PYTHON_GITEA_RETRIES",
+            min=0,
+            help="Times to send a GET, PUT or DELETE again when the connection fails or the instance answers 429, 502, 503 or 504, waiting longer before each. 0 sends every request once.",
+        ),
+    ] = 2,
+    rate_limit: Annotated[
+        float | None,
+        typer.Option(
+            "--rate-limit",
+            envvar="PYTHON_GITEA_RATE_LIMIT",
+            min=0,
+            help="Requests a second to send at most, shared by every invocation given a rate limit at the same time. If not provided, or 0, requests are sent as fast as the instance answers them.",
+        ),
+    ] = None,
     version: Annotated[
         bool,
         typer.Option(
@@ -128,6 +166,10 @@ def main(
         config_path: Path to the configuration file.
         verbose: Verbosity level for logging.
         output: Output format shared by every subcommand.
+        no_cache: Whether to leave the response cache out of every request.
+        cache_ttl: Seconds to reuse a cached response for, for every endpoint.
+        retries: Times to send an idempotent request again after a transient failure.
+        rate_limit: Requests a second to send at most, across concurrent invocations.
         version: Whether to print the version and exit. Handled by `version_callback`.
 
     """
@@ -135,7 +177,14 @@ def main(
 
     config_path = config_path or os.getenv("PYTHON_GITEA_CONFIG_PATH")
 
-    ctx.obj = {"config_path": config_path, "output": output}
+    ctx.obj = {
+        "config_path": config_path,
+        "output": output,
+        "no_cache": no_cache,
+        "cache_ttl": cache_ttl,
+        "retries": retries,
+        "rate_limit": rate_limit,
+    }
     setup_logging(verbose)
 
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 import typer
 
+from gitea.cli.utils.listing import ALL_PAGES_HELP, PAGE_CONCURRENCY_HELP
 from gitea.cli.utils.options import REPOSITORY_REQUIRED_HELP
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def list_command(
     ctx: typer.Context,
@@ -29,6 +33,8 @@ def list_command(
         int | None,
         typer.Option("--limit", help="The number of milestones per page."),
     ] = None,
+    all_pages: Annotated[bool, typer.Option("--all", "--all-pages", help=ALL_PAGES_HELP)] = False,
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help=PAGE_CONCURRENCY_HELP)] = 1,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -61,6 +67,8 @@ def list_command(
         name: Filter milestones by name.
         page: The page number for pagination.
         limit: The number of milestones per page.
+        all_pages: Whether to walk every page of the listing rather than fetch one.
+        concurrency: Number of pages to fetch at once with --all.
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the Gitea platform.
@@ -68,8 +76,12 @@ def list_command(
     """
     from typing import Any  # noqa: PLC0415
 
-    from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.utils.api import execute_api_command, execute_api_stream  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.listing import walk_listing  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -80,6 +92,27 @@ def list_command(
         base_url=base_url,
     )
 
+    def list_page(client: Gitea, number: int | None, size: int | None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """List one page of milestones.
+
+        Args:
+            client: The Gitea client.
+            number: The page number, or None for the instance's default.
+            size: The page size, or None for the instance's default.
+
+        Returns:
+            A tuple containing the milestone data and metadata.
+
+        """
+        return client.milestone.list_milestones(
+            owner=owner,
+            repository=require_repository(repository, command="gitea-cli milestone list"),
+            state=state,
+            name=name,
+            page=number,
+            limit=size,
+        )
+
     def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
         """List milestone information.
 
@@ -87,16 +120,29 @@ def list_command(
             A tuple containing the milestone data and metadata.
 
         """
-        target_repository = require_repository(repository, command="gitea-cli milestone list")
-
-        with Gitea(token=token, base_url=base_url) as client:
-            return client.milestone.list_milestones(
-                owner=owner,
-                repository=target_repository,
-                state=state,
-                name=name,
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            return list_page(client, page, limit)
+
+    def pages() -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+        """Walk every page of milestones in one session.
+
+        Yields:
+            The milestone data and metadata of each page.
+
+        """
+        with Gitea(
+            token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+        ) as client:
+            yield from walk_listing(
+                lambda number, size: list_page(client, number, size),
+                client=client,
                 page=page,
                 limit=limit,
+                concurrency=concurrency,
+                command="gitea-cli milestone list",
             )
 
-    execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli milestone list")
+    if all_pages:
+        execute_api_stream(api_call=pages, base_url=base_url, command_name="gitea-cli milestone list")
+    else:
+        execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli milestone list")
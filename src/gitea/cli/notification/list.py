@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
+from gitea.cli.utils.listing import NOTIFICATION_ALL_PAGES_HELP, PAGE_CONCURRENCY_HELP
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def list_command(
     ctx: typer.Context,
@@ -46,6 +51,8 @@ def list_command(
         int | None,
         typer.Option("--limit", help="The number of notifications per page."),
     ] = None,
+    all_pages: Annotated[bool, typer.Option("--all-pages", help=NOTIFICATION_ALL_PAGES_HELP)] = False,
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help=PAGE_CONCURRENCY_HELP)] = 1,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -81,6 +88,8 @@ def list_command(
         before: Only show notifications updated before the given time.
         page: The page number for pagination.
         limit: The number of notifications per page.
+        all_pages: Whether to walk every page of the listing rather than fetch one.
+        concurrency: Number of pages to fetch at once with --all-pages.
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the Gitea platform.
@@ -88,8 +97,12 @@ def list_command(
     """
     from typing import Any  # noqa: PLC0415
 
-    from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.utils.api import execute_api_command, execute_api_stream  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.listing import walk_listing  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
@@ -105,34 +118,70 @@ def list_command(
             "to list the authenticated user's notifications."
         )
 
-    def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
-        """List notification information.
+    def list_page(client: Gitea, number: int | None, size: int | None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """List one page of notifications.
+
+        Args:
+            client: The Gitea client.
+            number: The page number, or None for the instance's default.
+            size: The page size, or None for the instance's default.
 
         Returns:
             A tuple containing the notification data and metadata.
 
         """
-        with Gitea(token=token, base_url=base_url) as client:
-            if owner is not None and repository is not None:
-                return client.notification.list_repo_notifications(
-                    owner=owner,
-                    repository=repository,
-                    all_notifications=all_notifications,
-                    status_types=status_types,
-                    subject_type=subject_type,
-                    since=since,
-                    before=before,
-                    page=page,
-                    limit=limit,
-                )
-            return client.notification.list_notifications(
+        if owner is not None and repository is not None:
+            return client.notification.list_repo_notifications(
+                owner=owner,
+                repository=repository,
                 all_notifications=all_notifications,
                 status_types=status_types,
                 subject_type=subject_type,
                 since=since,
                 before=before,
+                page=number,
+                limit=size,
+            )
+        return client.notification.list_notifications(
+            all_notifications=all_notifications,
+            status_types=status_types,
+            subject_type=subject_type,
+            since=since,
+            before=before,
+            page=number,
+            limit=size,
+        )
+
+    def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
+        """List notification information.
+
+        Returns:
+            A tuple containing the notification data and metadata.
+
+        """
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            return list_page(client, page, limit)
+
+    def pages() -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+        """Walk every page of notifications in one session.
+
+        Yields:
+            The notification data and metadata of each page.
+
+        """
+        with Gitea(
+            token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+        ) as client:
+            yield from walk_listing(
+                lambda number, size: list_page(client, number, size),
+                client=client,
                 page=page,
                 limit=limit,
+                concurrency=concurrency,
+                command="gitea-cli notification list",
             )
 
-    execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli notification list")
+    if all_pages:
+        execute_api_stream(api_call=pages, base_url=base_url, command_name="gitea-cli notification list")
+    else:
+        execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli notification list")
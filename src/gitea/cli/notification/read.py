@@ -75,6 +75,7 @@ def read_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
@@ -97,7 +98,7 @@ def read_command(
             A tuple containing the response data and metadata.
 
         """
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             if owner is not None and repository is not None:
                 return client.notification.read_repo_notifications(
                     owner=owner,
@@ -4,23 +4,41 @@ This lives outside `gitea.cli.utils` on purpose: `main.py` needs `OutputFormat`
 at import time to declare the global `--output` option, and importing it from
 `gitea.cli.utils` would pull that package's configuration and API helpers - and
 so pydantic and YAML - into the startup path of every invocation.
+
+`json` prints a result as one document, the `{"data": ..., "metadata": ...}`
+envelope. `jsonl` prints the same result as JSON Lines: one compact object per
+item of `data`, then `{"metadata": ...}` as the last line. A listing walked page
+by page is written out as its pages arrive in either format, but only the lines
+can be read as they come - a reader has to wait for the end of a document - so
+`jsonl` is the one a pipe into `jq` or a loader starts on at the first item and
+holds one item of at a time.
 """
 
 from __future__ import annotations
 
 import enum
 import json
-from collections.abc import Callable
+import sys
+import textwrap
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import typer
 
+# Newer typer releases vendor click as `typer._click` rather than depending on
+# it, and the invocation's context is only reachable through click.
+try:
+    from typer._click.globals import get_current_context
+except ImportError:  # pragma: no cover - typer depending on click itself
+    from click import get_current_context
+
 
 class OutputFormat(enum.StrEnum):
     """Output formats accepted by the global `--output` option."""
 
     TEXT = "text"
     JSON = "json"
+    JSONL = "jsonl"
 
 
 def get_output_format(ctx: typer.Context) -> OutputFormat:
@@ -36,6 +54,103 @@ def get_output_format(ctx: typer.Context) -> OutputFormat:
     return (ctx.obj or {}).get("output", OutputFormat.TEXT)
 
 
+def _invocation_format() -> OutputFormat:
+    """Get the output format of the invocation running, for a printer not handed its context.
+
+    `execute_api_command` prints for dozens of commands without being passed
+    their context, which click keeps for the invocation running anyway.
+
+    Returns:
+        The requested output format, or `OutputFormat.JSON` outside an
+        invocation, since the envelope is what every caller got before there
+        was a choice.
+
+    """
+    ctx = get_current_context(silent=True)
+    return get_output_format(ctx) if ctx is not None else OutputFormat.JSON
+
+
+def _write_record(record: Any) -> None:
+    """Write one JSON Lines record.
+
+    Args:
+        record: The value to write, as one compact line.
+
+    """
+    sys.stdout.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+
+
+def print_record(record: Any) -> None:
+    """Print one JSON Lines record and flush it, for a command whose output has no end.
+
+    Args:
+        record: The value to write, as one compact line.
+
+    """
+    _write_record(record)
+    sys.stdout.flush()
+
+
+def print_records(data: Any, metadata: dict[str, Any]) -> None:
+    """Print a result as JSON Lines: a line per item of `data`, then the metadata.
+
+    A `data` that is not a list is a single record. The metadata comes last, as
+    `{"metadata": ...}`, because a listing walked page by page only knows it at
+    the end - and so a reader missing that line knows the output was cut short.
+
+    Args:
+        data: Payload of the command.
+        metadata: Information about the call that produced the payload.
+
+    """
+    for item in data if isinstance(data, list) else [data]:
+        _write_record(item)
+    _write_record({"metadata": metadata})
+    sys.stdout.flush()
+
+
+def print_result(data: Any, metadata: dict[str, Any]) -> None:
+    """Print a result of a command that only reports an API result.
+
+    Such a command prints the envelope in `text` mode as well as in `json`, so
+    only `jsonl` changes what it prints.
+
+    Args:
+        data: Payload of the command.
+        metadata: Information about the call that produced the payload.
+
+    """
+    if _invocation_format() is OutputFormat.JSONL:
+        print_records(data=data, metadata=metadata)
+    else:
+        print_envelope(data=data, metadata=metadata)
+
+
+def print_pages(pages: Iterable[tuple[list[Any], dict[str, Any]]]) -> None:
+    """Print a paged listing in the invocation's format, each page as it arrives.
+
+    In `jsonl` every item is a line written as its page arrives and the last
+    page's metadata the final line, so a walk failing part-way leaves the lines
+    it got and no metadata line. Otherwise the listing is the envelope
+    `print_envelope_pages` writes.
+
+    Args:
+        pages: The items and the metadata of each page, in order.
+
+    """
+    if _invocation_format() is not OutputFormat.JSONL:
+        print_envelope_pages(pages)
+        return
+    metadata: dict[str, Any] = {}
+    for batch, page_metadata in pages:
+        metadata = page_metadata
+        for item in batch:
+            _write_record(item)
+        sys.stdout.flush()
+    _write_record({"metadata": metadata})
+    sys.stdout.flush()
+
+
 def print_envelope(data: Any, metadata: dict[str, Any]) -> None:
     """Print a result as the `{"data": ..., "metadata": ...}` JSON envelope.
 
@@ -47,6 +162,40 @@ def print_envelope(data: Any, metadata: dict[str, Any]) -> None:
     print(json.dumps({"data": data, "metadata": metadata}, indent=2, default=str))
 
 
+def print_envelope_pages(pages: Iterable[tuple[list[Any], dict[str, Any]]]) -> None:
+    """Print a paged listing as the JSON envelope, writing each page's items as it arrives.
+
+    The document written is the one `print_envelope` writes for every item of
+    every page and the metadata of the last, byte for byte, so a reader cannot
+    tell a walked listing from one fetched at once. Nothing is written until
+    the first page arrives, so a walk failing before then prints nothing; one
+    failing after leaves the document unterminated, which a reader fails to
+    parse rather than mistaking the pages it got for the whole listing.
+
+    Args:
+        pages: The items and the metadata of each page, in order.
+
+    """
+    metadata: dict[str, Any] = {}
+    started = written = False
+    for batch, page_metadata in pages:
+        metadata = page_metadata
+        if not started:
+            sys.stdout.write('{\n  "data": [')
+            started = True
+        for item in batch:
+            sys.stdout.write(",\n" if written else "\n")
+            sys.stdout.write(textwrap.indent(json.dumps(item, indent=2, default=str), "    "))
+            written = True
+        sys.stdout.flush()
+    if not started:
+        sys.stdout.write('{\n  "data": [')
+    sys.stdout.write("\n  ]" if written else "]")
+    metadata_text = json.dumps(metadata, indent=2, default=str).replace("\n", "\n  ")
+    sys.stdout.write(f',\n  "metadata": {metadata_text}\n}}\n')
+    sys.stdout.flush()
+
+
 def emit(
     ctx: typer.Context,
     *,
@@ -58,13 +207,16 @@ def emit(
 
     Args:
         ctx: Typer context carrying the state set by the root callback.
-        data: Payload of the command, used for the JSON envelope.
-        metadata: Information about the call, used for the JSON envelope.
+        data: Payload of the command, used for the JSON envelope and records.
+        metadata: Information about the call, used for the JSON envelope and records.
         render_text: Callable printing the human-readable rendering. When
             omitted, the command prints nothing on stdout in text mode.
 
     """
-    if get_output_format(ctx) is OutputFormat.JSON:
+    output_format = get_output_format(ctx)
+    if output_format is OutputFormat.JSON:
         print_envelope(data=data, metadata=metadata)
+    elif output_format is OutputFormat.JSONL:
+        print_records(data=data, metadata=metadata)
     elif render_text is not None:
         render_text()
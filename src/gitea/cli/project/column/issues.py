@@ -65,6 +65,7 @@ def list_column_issues_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
@@ -81,7 +82,7 @@ def list_column_issues_command(
             A tuple containing the issue data and metadata.
 
         """
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return client.project.list_project_column_issues(
                 owner=owner,
                 repository=repository,
@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Annotated
 
 import typer
 
+from gitea.issue.project_column import BOARD_CONCURRENCY
+
 
 def move_issue_command(
     ctx: typer.Context,
     owner: Annotated[str, typer.Option("--owner", help="Owner of the repository.")],
     project_id: Annotated[int, typer.Option("--project-id", help="ID of the project.")],
     issue_id: Annotated[
-        int,
+        int | None,
         typer.Option(
             "--issue-id",
             help="Issue number shown in the web UI, or the global ID of the issue when the repository holding it is unknown.",
         ),
-    ],
-    column_id: Annotated[int, typer.Option("--column-id", help="Target column ID.")],
+    ] = None,
+    column_id: Annotated[int | None, typer.Option("--column-id", help="Target column ID.")] = None,
     sorting: Annotated[
         int | None,
         typer.Option("--sorting", help="Position within the column, ascending."),
@@ -30,6 +33,17 @@ def move_issue_command(
             help="Put the issue in the target column when it has no card on the project yet, instead of failing.",
         ),
     ] = False,
+    from_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--from-file",
+            help="Make every move listed in a JSON Lines or CSV file, instead of the one --issue-id and --column-id name.",
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", min=1, help="Number of moves to make at once with --from-file."),
+    ] = BOARD_CONCURRENCY,
     repository: Annotated[
         str | None,
         typer.Option("--repository", help="Name of the repository. Omit for organization projects."),
@@ -72,6 +86,11 @@ def move_issue_command(
     which is the command that puts an issue on a board. Pass --add-if-missing to
     have this command do that itself when there is no card yet.
 
+    With --from-file, every move the file lists is made in one run: the board is
+    read once, the moves are made --concurrency at a time, and each column they
+    touched is read back once to confirm the cards landed. Each move is reported
+    with its own result, and the command exits non-zero if any of them failed.
+
     Args:
         ctx: The Typer context.
         owner: The owner of the repository.
@@ -83,6 +102,9 @@ def move_issue_command(
         sorting: The position within the column, ascending.
         add_if_missing: Whether to put the issue in the target column when it has
             no card on the project yet, rather than reporting that it has none.
+        from_file: Path of a file listing the moves to make, or None to make the
+            one the options name.
+        concurrency: Number of moves to make at once with --from-file.
         issue_repository: The name of the repository holding the issue,
             defaulting to the repository holding the project.
         account_name: Name of the account to use for authentication.
@@ -92,9 +114,16 @@ def move_issue_command(
     """
     from typing import Any  # noqa: PLC0415
 
-    from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.output import print_result  # noqa: PLC0415
+    from gitea.cli.utils.api import execute_api_call, execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from gitea.cli.utils.issue import run_project_issue_move  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.errors import CommandError  # noqa: PLC0415
+    from gitea.cli.utils.issue import run_project_issue_move, run_project_issue_moves  # noqa: PLC0415
+    from gitea.cli.utils.issue_ids import issue_ids  # noqa: PLC0415
+    from gitea.cli.utils.moves import read_card_moves  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
@@ -110,8 +139,32 @@ def move_issue_command(
         Returns:
             A tuple containing the response data and metadata.
 
+        Raises:
+            CommandError: If --from-file is combined with the options naming a
+                single move, or neither names one.
+
         """
-        with Gitea(token=token, base_url=base_url) as client:
+        if from_file is not None:
+            if issue_id is not None or column_id is not None or sorting is not None:
+                raise CommandError("--from-file lists the moves itself; drop --issue-id, --column-id and --sorting.")
+            moves = read_card_moves(from_file, issue_repository=issue_repository or repository)
+            with Gitea(
+                token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+            ) as client:
+                return run_project_issue_moves(
+                    client=client,
+                    owner=owner,
+                    repository=repository,
+                    project_id=project_id,
+                    moves=moves,
+                    add_if_missing=add_if_missing,
+                    ids=issue_ids(ctx, base_url),
+                    concurrency=concurrency,
+                )
+
+        if issue_id is None or column_id is None:
+            raise CommandError("Name the move with both --issue-id and --column-id, or list moves with --from-file.")
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return run_project_issue_move(
                 client=client,
                 owner=owner,
@@ -121,7 +174,34 @@ def move_issue_command(
                 column_id=column_id,
                 sorting=sorting,
                 issue_repository=issue_repository or repository,
+                ids=issue_ids(ctx, base_url),
                 add_if_missing=add_if_missing,
             )
 
-    execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli project issue move")
+    if from_file is None:
+        execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli project issue move")
+        return
+
+    def report(data: dict[str, Any] | list[dict[str, Any]], metadata: dict[str, Any]) -> None:
+        """Print the result, and fail the command if any move failed.
+
+        A batch reports every move, the failed ones included, so the result is
+        printed before the command fails: the moves that were made are as much a
+        part of the outcome as the ones that were not.
+
+        Args:
+            data: The payload.
+            metadata: The metadata.
+
+        Raises:
+            CommandError: If any move failed.
+
+        """
+        print_result(data=data, metadata=metadata)
+        failed = metadata["failed_count"]
+        if failed:
+            raise CommandError(
+                f"{failed} of {metadata['move_count']} moves failed; see the 'error' of each in the output."
+            )
+
+    execute_api_call(api_call=api_call, report=report, base_url=base_url, command_name="gitea-cli project issue move")
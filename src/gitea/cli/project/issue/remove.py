@@ -98,7 +98,9 @@ def remove_issue_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.issue import run_project_issue_remove  # noqa: PLC0415
+    from gitea.cli.utils.issue_ids import issue_ids  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
@@ -115,7 +117,7 @@ def remove_issue_command(
             A tuple containing the response data and metadata.
 
         """
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return run_project_issue_remove(
                 client=client,
                 owner=owner,
@@ -124,6 +126,7 @@ def remove_issue_command(
                 issue_number=issue_id,
                 column_id=column_id,
                 issue_repository=issue_repository or repository,
+                ids=issue_ids(ctx, base_url),
             )
 
     execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli project issue remove")
@@ -6,7 +6,8 @@ from typing import Annotated, Any
 
 import typer
 
-from gitea.utils.pagination import PAGE_SIZE, collect_all_pages
+from gitea.issue.project_column import BOARD_CONCURRENCY
+from gitea.utils.pagination import async_listing_page_size, collect_all_async_pages
 
 
 def list_project_issues_command(
@@ -17,6 +18,10 @@ def list_project_issues_command(
         str | None,
         typer.Option("--repository", help="Name of the repository. Omit for organization projects."),
     ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", min=1, help="Number of columns to read at once."),
+    ] = BOARD_CONCURRENCY,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -46,6 +51,7 @@ def list_project_issues_command(
         owner: The owner of the repository.
         repository: The name of the repository, or None for organization projects.
         project_id: The ID of the project.
+        concurrency: Number of columns to read at once.
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the Gitea platform.
@@ -53,7 +59,9 @@ def list_project_issues_command(
     """
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from gitea.client.gitea import Gitea  # noqa: PLC0415
+    from gitea.cli.utils.board import async_read_columns, column_timings  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.client.async_gitea import AsyncGitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj.get("config_path"),
@@ -62,47 +70,48 @@ def list_project_issues_command(
         base_url=base_url,
     )
 
-    def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
+    async def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
         """List the issues on every column of a project.
 
-        Every page of columns, and every page of each column's issues, is fetched.
+        Every page of columns, and every page of each column's issues, is fetched,
+        the columns' issues side by side on the one session. How long each
+        column took is reported as `column_timings`.
 
         Returns:
             A tuple containing one entry per column, each with its issues, and metadata.
 
         """
-        with Gitea(token=token, base_url=base_url) as client:
-            columns, metadata = collect_all_pages(
+        async with AsyncGitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            size = await async_listing_page_size(client)
+            columns, metadata = await collect_all_async_pages(
                 lambda page: client.project.list_project_columns(
                     owner=owner,
                     repository=repository,
                     project_id=project_id,
                     page=page,
-                    limit=PAGE_SIZE,
+                    limit=size,
                 )
             )
 
-            data: list[dict[str, Any]] = []
-            issue_count = 0
-            for column in columns:
-                issues, _ = collect_all_pages(
-                    lambda page, column_id=column["id"]: client.project.list_project_column_issues(
-                        owner=owner,
-                        repository=repository,
-                        project_id=project_id,
-                        column_id=column_id,
-                        page=page,
-                        limit=PAGE_SIZE,
-                    )
-                )
-                issue_count += len(issues)
-                data.append(
-                    {
-                        "column": {"id": column["id"], "title": column.get("title")},
-                        "issues": issues,
-                    }
-                )
+            column_ids = [column["id"] for column in columns]
+            read = await async_read_columns(
+                client=client,
+                owner=owner,
+                repository=repository,
+                project_id=project_id,
+                column_ids=column_ids,
+                concurrency=concurrency,
+            )
 
-        return data, {**metadata, "column_count": len(data), "issue_count": issue_count}
+        data = [
+            {"column": {"id": column["id"], "title": column.get("title")}, "issues": issues}
+            for column, (issues, _) in zip(columns, read, strict=True)
+        ]
+        return data, {
+            **metadata,
+            "column_count": len(data),
+            "issue_count": sum(len(issues) for issues, _ in read),
+            "column_timings": column_timings(column_ids, [seconds for _, seconds in read]),
+        }
 
     execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli project issues")
@@ -6,7 +6,8 @@ from typing import Annotated, Any
 
 import typer
 
-from gitea.utils.pagination import PAGE_SIZE, collect_all_pages
+from gitea.issue.project_column import BOARD_CONCURRENCY
+from gitea.utils.pagination import async_listing_page_size, collect_all_async_pages
 
 
 def show_command(
@@ -21,6 +22,10 @@ def show_command(
         str | None,
         typer.Option("--repository", help="Name of the repository. Omit for organization projects."),
     ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", min=1, help="Number of columns to read at once."),
+    ] = BOARD_CONCURRENCY,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -54,6 +59,7 @@ def show_command(
         owner: The owner of the repository.
         repository: The name of the repository, or None for organization projects.
         project_id: The ID of the project.
+        concurrency: Number of columns to read at once.
         full: Whether to include each column's issues in full.
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
@@ -62,7 +68,9 @@ def show_command(
     """
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from gitea.client.gitea import Gitea  # noqa: PLC0415
+    from gitea.cli.utils.board import async_read_columns, column_timings  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.client.async_gitea import AsyncGitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj.get("config_path"),
@@ -71,52 +79,57 @@ def show_command(
         base_url=base_url,
     )
 
-    def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
+    async def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
         """Fetch the project, its columns, and the issues on each column.
 
         Every page of columns, and every page of each column's issues, is
         fetched, so the counts describe the whole board rather than its first
-        page.
+        page. The columns' issues are fetched side by side on the one session,
+        as `project issues` does, and how long each column took is reported as
+        `column_timings`.
 
         Returns:
             A tuple containing the project with its columns, and metadata.
 
         """
-        with Gitea(token=token, base_url=base_url) as client:
-            project, metadata = client.project.get_project(
+        async with AsyncGitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            project, metadata = await client.project.get_project(
                 owner=owner,
                 repository=repository,
                 project_id=project_id,
             )
 
-            columns, _ = collect_all_pages(
+            size = await async_listing_page_size(client)
+            columns, _ = await collect_all_async_pages(
                 lambda page: client.project.list_project_columns(
                     owner=owner,
                     repository=repository,
                     project_id=project_id,
                     page=page,
-                    limit=PAGE_SIZE,
+                    limit=size,
                 )
             )
 
-            described: list[dict[str, Any]] = []
-            issue_count = 0
-            for column in columns:
-                issues, _ = collect_all_pages(
-                    lambda page, column_id=column["id"]: client.project.list_project_column_issues(
-                        owner=owner,
-                        repository=repository,
-                        project_id=project_id,
-                        column_id=column_id,
-                        page=page,
-                        limit=PAGE_SIZE,
-                    )
-                )
-                issue_count += len(issues)
-                described.append(_describe_column(column, issues, full=full))
+            column_ids = [column["id"] for column in columns]
+            read = await async_read_columns(
+                client=client,
+                owner=owner,
+                repository=repository,
+                project_id=project_id,
+                column_ids=column_ids,
+                concurrency=concurrency,
+            )
 
+        described = [
+            _describe_column(column, issues, full=full) for column, (issues, _) in zip(columns, read, strict=True)
+        ]
         data = {"project": project, "columns": described}
-        return data, {**metadata, "column_count": len(described), "issue_count": issue_count}
+        return data, {
+            **metadata,
+            "column_count": len(described),
+            "issue_count": sum(len(issues) for issues, _ in read),
+            "column_timings": column_timings(column_ids, [seconds for _, seconds in read]),
+        }
 
     execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli project show")
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 import typer
 
+from gitea.cli.utils.listing import ALL_PAGES_HELP, PAGE_CONCURRENCY_HELP
 from gitea.cli.utils.options import REPOSITORY_REQUIRED_HELP
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def list_command(
     ctx: typer.Context,
@@ -46,6 +50,8 @@ def list_command(
         int | None,
         typer.Option("--limit", help="The number of pull requests per page."),
     ] = None,
+    all_pages: Annotated[bool, typer.Option("--all", "--all-pages", help=ALL_PAGES_HELP)] = False,
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help=PAGE_CONCURRENCY_HELP)] = 1,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -82,6 +88,8 @@ def list_command(
         poster: Filter pull requests by poster.
         page: The page number for pagination.
         limit: The number of pull requests per page.
+        all_pages: Whether to walk every page of the listing rather than fetch one.
+        concurrency: Number of pages to fetch at once with --all.
         account_name: Name of the account to use for authentication.
         token: Token for authentication. If not provided, the token from the specified account will be used.
         base_url: Base URL of the Gitea platform. If not provided, the base URL from the specified account will be used.
@@ -89,8 +97,12 @@ def list_command(
     """
     from typing import Any  # noqa: PLC0415
 
-    from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.utils.api import execute_api_command, execute_api_stream  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.listing import walk_listing  # noqa: PLC0415
     from gitea.cli.utils.options import require_repository  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -101,22 +113,61 @@ def list_command(
         base_url=base_url,
     )
 
+    def list_page(client: Gitea, number: int | None, size: int | None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """List one page of pull requests.
+
+        Args:
+            client: The Gitea client.
+            number: The page number, or None for the instance's default.
+            size: The page size, or None for the instance's default.
+
+        Returns:
+            A tuple containing the pull request data and metadata.
+
+        """
+        return client.pull_request.list_pull_requests(
+            owner=owner,
+            repository=require_repository(repository, command="gitea-cli pull-request list"),
+            base_branch=base_branch,
+            state=state,
+            sort=sort,
+            milestone=milestone,
+            labels=labels,
+            poster=poster,
+            page=number,
+            limit=size,
+        )
+
     def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
-        """List pull requests information."""
-        target_repository = require_repository(repository, command="gitea-cli pull-request list")
-
-        with Gitea(token=token, base_url=base_url) as client:
-            return client.pull_request.list_pull_requests(
-                owner=owner,
-                repository=target_repository,
-                base_branch=base_branch,
-                state=state,
-                sort=sort,
-                milestone=milestone,
-                labels=labels,
-                poster=poster,
+        """List pull requests information.
+
+        Returns:
+            A tuple containing the pull request data and metadata.
+
+        """
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            return list_page(client, page, limit)
+
+    def pages() -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+        """Walk every page of pull requests in one session.
+
+        Yields:
+            The pull request data and metadata of each page.
+
+        """
+        with Gitea(
+            token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+        ) as client:
+            yield from walk_listing(
+                lambda number, size: list_page(client, number, size),
+                client=client,
                 page=page,
                 limit=limit,
+                concurrency=concurrency,
+                command="gitea-cli pull-request list",
             )
 
-    execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli pull-request list")
+    if all_pages:
+        execute_api_stream(api_call=pages, base_url=base_url, command_name="gitea-cli pull-request list")
+    else:
+        execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli pull-request list")
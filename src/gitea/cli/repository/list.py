@@ -15,10 +15,15 @@ back to: a value that is neither is refused rather than read as an organization.
 from __future__ import annotations
 
 import enum
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
+from gitea.cli.utils.listing import ALL_PAGES_HELP, PAGE_CONCURRENCY_HELP
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class OwnerType(enum.StrEnum):
     """What kind of account `--owner` names, and so which endpoint answers for it."""
@@ -45,6 +50,8 @@ def list_command(
         int | None,
         typer.Option("--limit", help="The number of repositories per page."),
     ] = None,
+    all_pages: Annotated[bool, typer.Option("--all", "--all-pages", help=ALL_PAGES_HELP)] = False,
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help=PAGE_CONCURRENCY_HELP)] = 1,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -75,6 +82,8 @@ def list_command(
         owner_type: Whether the owner is an organization or a user account.
         page: The page number for pagination.
         limit: The number of repositories per page.
+        all_pages: Whether to walk every page of the listing rather than fetch one.
+        concurrency: Number of pages to fetch at once with --all.
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the Gitea platform.
@@ -82,8 +91,12 @@ def list_command(
     """
     from typing import Any  # noqa: PLC0415
 
-    from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.utils.api import execute_api_command, execute_api_stream  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.listing import walk_listing  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
@@ -93,8 +106,13 @@ def list_command(
         base_url=base_url,
     )
 
-    def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
-        """List repository information.
+    def list_page(client: Gitea, number: int | None, size: int | None) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """List one page of repositories.
+
+        Args:
+            client: The Gitea client.
+            number: The page number, or None for the instance's default.
+            size: The page size, or None for the instance's default.
 
         Returns:
             A tuple containing the repository data and metadata.
@@ -103,13 +121,43 @@ def list_command(
         # Reading the option through the enum refuses a value that is neither
         # kind, where comparing against one of them would read it as the other.
         kind = OwnerType(owner_type)
+        return client.repository.list_repositories(
+            username=owner if kind is OwnerType.USER else None,
+            organization=owner if kind is OwnerType.ORGANIZATION else None,
+            page=number,
+            limit=size,
+        )
+
+    def api_call() -> tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]:
+        """List repository information.
 
-        with Gitea(token=token, base_url=base_url) as client:
-            return client.repository.list_repositories(
-                username=owner if kind is OwnerType.USER else None,
-                organization=owner if kind is OwnerType.ORGANIZATION else None,
+        Returns:
+            A tuple containing the repository data and metadata.
+
+        """
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            return list_page(client, page, limit)
+
+    def pages() -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+        """Walk every page of repositories in one session.
+
+        Yields:
+            The repository data and metadata of each page.
+
+        """
+        with Gitea(
+            token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+        ) as client:
+            yield from walk_listing(
+                lambda number, size: list_page(client, number, size),
+                client=client,
                 page=page,
                 limit=limit,
+                concurrency=concurrency,
+                command="gitea-cli repo list",
             )
 
-    execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli repo list")
+    if all_pages:
+        execute_api_stream(api_call=pages, base_url=base_url, command_name="gitea-cli repo list")
+    else:
+        execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli repo list")
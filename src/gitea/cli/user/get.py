@@ -48,6 +48,7 @@ def get_command(
 
     from gitea.cli.utils.api import execute_api_command  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
     token, base_url = get_auth_params(
@@ -64,7 +65,7 @@ def get_command(
             The user information as a dictionary.
 
         """
-        with Gitea(token=token, base_url=base_url) as client:
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
             return client.user.get_user(username=username)
 
     execute_api_command(api_call=api_call, base_url=base_url, command_name="gitea-cli user get")
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import closing, contextmanager
 from typing import Any
 
 import requests
 import typer
+from aiohttp import ClientConnectionError
 
-from gitea.cli.output import print_envelope
+from gitea.cli.output import print_pages, print_result
 from gitea.cli.utils.errors import CommandError, unreachable_message
 
 logger = logging.getLogger("gitea")
@@ -21,21 +25,26 @@ logger = logging.getLogger("gitea")
 # so every error below is logged as literal text.
 _AS_TEXT = {"markup": False}
 
+# What a command's call hands back: the data and the metadata of the envelope.
+type ApiResult = tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]
+
 
 def execute_api_command(
-    api_call: Callable[[], tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]],
+    api_call: Callable[[], ApiResult | Awaitable[ApiResult]],
     command_name: str = "Command",
     base_url: str | None = None,
 ) -> None:
-    """Execute an API command and print the result as the JSON envelope.
+    """Execute an API command and print the result as the JSON envelope, or as JSON Lines.
 
-    The result is always written as the `{"data": ..., "metadata": ...}` JSON
-    envelope, so these commands already satisfy `--output json` and are
-    unaffected by `--output text`. A command with a human-readable rendering of
-    its own calls `execute_api_call` instead, and reports the result itself.
+    The result is written as the `{"data": ..., "metadata": ...}` JSON envelope
+    in `--output json` and `--output text` alike, so these commands are
+    unaffected by `text`; `--output jsonl` writes it as records instead. A
+    command with a human-readable rendering of its own calls `execute_api_call`
+    instead, and reports the result itself.
 
     Args:
-        api_call: Callable that executes the API call and returns the result.
+        api_call: Callable that executes the API call and returns the result,
+            or a coroutine function doing so, as `execute_api_call` takes it.
         command_name: Name of the command for error messages.
         base_url: The base URL the call is made against, so an unreachable
             instance is reported by the host the command tried to reach. The
@@ -45,14 +54,14 @@ def execute_api_command(
     """
     execute_api_call(
         api_call=api_call,
-        report=lambda data, metadata: print_envelope(data=data, metadata=metadata),
+        report=lambda data, metadata: print_result(data=data, metadata=metadata),
         command_name=command_name,
         base_url=base_url,
     )
 
 
 def execute_api_call(
-    api_call: Callable[[], tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]],
+    api_call: Callable[[], ApiResult | Awaitable[ApiResult]],
     report: Callable[[dict[str, Any] | list[dict[str, Any]], dict[str, Any]], None],
     command_name: str = "Command",
     base_url: str | None = None,
@@ -67,8 +76,16 @@ def execute_api_call(
     A failed command exits non-zero having printed nothing on stdout, so the
     reporting is only reached once the call has succeeded.
 
+    A command making many requests can pass a coroutine function instead, which
+    is run to completion on an event loop of its own: it opens one `AsyncGitea`
+    for the invocation and fans its requests out as tasks on that one session,
+    rather than on threads each waiting on a connection of a `Gitea` pool. The
+    connection and timeout failures of `aiohttp` are reported as those of
+    `requests` are. The reporting itself stays synchronous, outside the loop.
+
     Args:
-        api_call: Callable that executes the API call and returns the result.
+        api_call: Callable that executes the API call and returns the result,
+            or a coroutine function doing so.
         report: Callable writing the result out, given the data and the
             metadata. It runs inside the same error handling, so a
             `CommandError` raised while reporting is reported like any other.
@@ -79,15 +96,87 @@ def execute_api_call(
             and every command is expected to pass it.
 
     """
-    try:
-        response_data, metadata = api_call()
+    with _reported_failures(command_name, base_url):
+        response_data, metadata = _completed(api_call())
 
         report(response_data, metadata)
+
+
+def execute_api_stream(
+    api_call: Callable[[], Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]],
+    command_name: str = "Command",
+    base_url: str | None = None,
+) -> None:
+    """Walk a paged listing and print it as `execute_api_command` would, each page as it arrives.
+
+    The streaming counterpart of `execute_api_command`, for the `--all-pages` mode of
+    the list commands: `api_call` is a generator yielding the pages, holding the
+    client open for as long as it runs, and each page is written out before the
+    next is asked for. Failures are reported as `execute_api_call` reports them.
+    One before the first page leaves stdout empty; one after leaves the envelope
+    unterminated, or the records without their metadata line, since the pages
+    already written cannot be taken back.
+
+    Args:
+        api_call: Callable returning an iterator over the items and the
+            metadata of each page. It is closed however the walk ends, so the
+            session it holds is closed with it.
+        command_name: Name of the command for error messages.
+        base_url: The base URL the call is made against, so an unreachable
+            instance is reported by the host the command tried to reach.
+
+    """
+    with _reported_failures(command_name, base_url), closing(api_call()) as pages:
+        print_pages(pages)
+
+
+def _completed(result: ApiResult | Awaitable[ApiResult]) -> ApiResult:
+    """Run a coroutine command's call to completion, or pass a synchronous one's result through.
+
+    Args:
+        result: What the command's callable returned.
+
+    Returns:
+        The data and the metadata of the result.
+
+    """
+    if not inspect.isawaitable(result):
+        return result
+
+    async def awaited() -> ApiResult:
+        """Await the call on the loop `asyncio.run` starts.
+
+        Returns:
+            The data and the metadata of the result.
+
+        """
+        return await result
+
+    return asyncio.run(awaited())
+
+
+@contextmanager
+def _reported_failures(command_name: str, base_url: str | None) -> Iterator[None]:
+    """Report a failure of a command's call, and exit non-zero.
+
+    Args:
+        command_name: Name of the command for error messages.
+        base_url: The base URL the call is made against.
+
+    Yields:
+        Control to the block whose failures are reported.
+
+    Raises:
+        typer.Exit: With status 1 when the block raised.
+
+    """
+    try:
+        yield
     except CommandError as e:
         # The message is the whole error the user needs; a traceback would bury it.
         logger.error("%s", e, extra=_AS_TEXT)
         raise typer.Exit(1) from e
-    except (requests.ConnectionError, requests.Timeout) as e:
+    except (requests.ConnectionError, requests.Timeout, ClientConnectionError, TimeoutError) as e:
         # Raised before any response exists, so there is no status to report.
         logger.error("%s", unreachable_message(e, base_url), extra=_AS_TEXT)
         raise typer.Exit(1) from e
@@ -0,0 +1,109 @@
+"""Reading the cards on every column of a board, for the project commands.
+
+`project show` and `project issues` both list a board's columns and then walk
+each column's issues. Walking them one after another costs one round trip per
+page per column, which is what a dashboard polling a dozen-column board waits
+on. `async_read_columns` walks them side by side instead, as tasks on the
+command's `AsyncGitea` session, and hands them back in the order the columns
+were asked for, so the output of a concurrent read is the output of a serial
+one. Both commands read their board through it, so they fail, and time their
+columns, the same way.
+
+How long each column took is handed back with it, for the commands to report in
+their metadata: on a board that is slow to read, it says which column is the
+slow one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from gitea.issue.project_column import BOARD_CONCURRENCY
+from gitea.utils.pagination import async_listing_page_size, collect_all_async_pages
+
+if TYPE_CHECKING:
+    from gitea.client.async_gitea import AsyncGitea
+
+
+async def async_read_columns(
+    *,
+    client: AsyncGitea,
+    owner: str,
+    repository: str | None,
+    project_id: int,
+    column_ids: list[int],
+    concurrency: int = BOARD_CONCURRENCY,
+) -> list[tuple[list[dict[str, Any]], float]]:
+    """Walk the issues of several columns of a board, up to `concurrency` at once.
+
+    A listing that fails fails the read with what it raised - the first failure
+    in column order - and the columns still being walked are cancelled.
+
+    Args:
+        client: The asynchronous Gitea client to walk the listings with.
+        owner: The owner of the repository or organization holding the project.
+        repository: The name of the repository holding the project, or None for
+            an organization project.
+        project_id: The ID of the project.
+        column_ids: The IDs of the columns to walk.
+        concurrency: Most columns to walk at once.
+
+    Returns:
+        Every issue of each column, across all of its pages, and the seconds
+        its walk took, in the order of `column_ids`.
+
+    """
+    slots = asyncio.Semaphore(max(1, concurrency))
+    size = await async_listing_page_size(client)
+
+    async def read(column_id: int) -> tuple[list[dict[str, Any]], float]:
+        """Walk one column's issues, timing the walk once it has a slot.
+
+        Args:
+            column_id: The ID of the column.
+
+        Returns:
+            The column's issues, and the seconds the walk took.
+
+        """
+        async with slots:
+            started = time.perf_counter()
+            issues, _ = await collect_all_async_pages(
+                lambda page: client.project.list_project_column_issues(
+                    owner=owner,
+                    repository=repository,
+                    project_id=project_id,
+                    column_id=column_id,
+                    page=page,
+                    limit=size,
+                )
+            )
+            return issues, time.perf_counter() - started
+
+    tasks = [asyncio.ensure_future(read(column_id)) for column_id in column_ids]
+    try:
+        return [await task for task in tasks]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def column_timings(column_ids: list[int], seconds: list[float]) -> list[dict[str, Any]]:
+    """Describe how long each column took to read, for a command's metadata.
+
+    Args:
+        column_ids: The IDs of the columns, in board order.
+        seconds: The seconds each one took, in the same order.
+
+    Returns:
+        One `{"column_id", "seconds"}` entry per column, in board order, the
+        seconds rounded to the millisecond.
+
+    """
+    return [
+        {"column_id": column_id, "seconds": round(elapsed, 3)}
+        for column_id, elapsed in zip(column_ids, seconds, strict=True)
+    ]
@@ -0,0 +1,39 @@
+"""The response cache every CLI command's client is given."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import typer
+
+if TYPE_CHECKING:
+    from gitea.client.cache import ResponseCache
+
+
+def response_cache(ctx: typer.Context) -> ResponseCache | None:
+    """Open the response cache the global options asked for.
+
+    Each invocation of the CLI is a process of its own, so the cache is kept on
+    disk, in the directory `gitea.client.cache.default_cache_dir` names, where
+    the next invocation finds it. `--cache-ttl` reuses every response for that
+    many seconds without asking the instance; without it, labels and milestones
+    are reused for the times in `DEFAULT_TTLS` and everything else is
+    revalidated on each read, which is only ever as stale as the instance says.
+
+    Args:
+        ctx: The Typer context, carrying the global options.
+
+    Returns:
+        The cache, or None when `--no-cache` turned it off.
+
+    """
+    from gitea.client.cache import DEFAULT_TTLS, DiskResponseCache, default_cache_dir  # noqa: PLC0415
+
+    options = ctx.obj or {}
+    if options.get("no_cache"):
+        return None
+
+    ttl = options.get("cache_ttl")
+    if ttl is None:
+        return DiskResponseCache(default_cache_dir(), ttls=DEFAULT_TTLS)
+    return DiskResponseCache(default_cache_dir(), ttl=ttl)
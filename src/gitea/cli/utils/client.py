@@ -0,0 +1,73 @@
+"""The options every CLI command builds its client with."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import typer
+
+from gitea.cli.utils.cache import response_cache
+
+if TYPE_CHECKING:
+    from gitea.client.limiter import RateLimiter
+    from gitea.client.retry import RetryPolicy
+
+# File, in the response cache directory, the rate limit's bucket is kept in.
+RATE_LIMIT_FILE = "rate-limit.bucket"
+
+
+def retry_policy(ctx: typer.Context) -> RetryPolicy | None:
+    """Build the retry policy the global options asked for.
+
+    Args:
+        ctx: The Typer context, carrying the global options.
+
+    Returns:
+        A policy sending an idempotent request `--retries` more times at most,
+        or None when that is zero.
+
+    """
+    from gitea.client.retry import RetryPolicy  # noqa: PLC0415
+
+    retries = (ctx.obj or {}).get("retries", 0)
+    if not retries:
+        return None
+    return RetryPolicy(max_attempts=retries + 1)
+
+
+def rate_limiter(ctx: typer.Context) -> RateLimiter | None:
+    """Build the rate limiter the global options asked for.
+
+    Invocations run side by side - a script starting several in the background,
+    or a watch with `--concurrency` beside another command - share one bucket,
+    kept in a file beside the response cache, so the rate bounds all of them
+    together rather than each one alone.
+
+    Args:
+        ctx: The Typer context, carrying the global options.
+
+    Returns:
+        A limiter sending `--rate-limit` requests a second at most, or None when
+        no rate, or a rate of zero, was given.
+
+    """
+    from gitea.client.cache import default_cache_dir  # noqa: PLC0415
+    from gitea.client.limiter import RateLimiter  # noqa: PLC0415
+
+    rate = (ctx.obj or {}).get("rate_limit")
+    if not rate:
+        return None
+    return RateLimiter(rate=rate, path=default_cache_dir() / RATE_LIMIT_FILE)
+
+
+def client_options(ctx: typer.Context) -> dict[str, Any]:
+    """Collect the keyword arguments the global options ask a client to be built with.
+
+    Args:
+        ctx: The Typer context, carrying the global options.
+
+    Returns:
+        The `cache`, `retry` and `limiter` arguments of `Gitea`.
+
+    """
+    return {"cache": response_cache(ctx), "retry": retry_policy(ctx), "limiter": rate_limiter(ctx)}
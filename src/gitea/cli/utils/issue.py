@@ -46,19 +46,27 @@ be confirmed" happened rather than collapsing them into one.
 
 from __future__ import annotations
 
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from requests import ConnectionError as RequestsConnectionError
 from requests import HTTPError, RequestException, Timeout
 
 from gitea.cli.utils.errors import CommandError, request_failed_message, unreachable_message
-from gitea.issue.project_column import column_holds_card, find_card_column_id
+from gitea.cli.utils.issue_ids import WARM_MAX_PAGES
+from gitea.issue.project_column import BOARD_CONCURRENCY, BoardIndex, column_holds_card, find_card_column_id
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from gitea.cli.utils.issue_ids import IssueIds
+    from gitea.cli.utils.moves import CardMove
     from gitea.client.gitea import Gitea
 
+logger = logging.getLogger("gitea")
+
 _NOT_FOUND = 404
 
 
@@ -105,7 +113,9 @@ def _describe(status_code: int | None, error: HTTPError | None = None) -> str:
     return f"Gitea returned HTTP {status_code}"
 
 
-def resolve_issue_id(*, client: Gitea, owner: str, repository: str | None, issue_number: int) -> int:
+def resolve_issue_id(
+    *, client: Gitea, owner: str, repository: str | None, issue_number: int, ids: IssueIds | None = None
+) -> int:
     """Resolve a repository issue number to the global issue ID.
 
     When the repository holding the issue is known, `issue_number` is the number
@@ -113,6 +123,9 @@ def resolve_issue_id(*, client: Gitea, owner: str, repository: str | None, issue
     not, there is nothing to look the number up in, so the value is taken to be
     the global ID already and returned unchanged.
 
+    A number the issue ID map holds is resolved from it without a request, and
+    one fetched is added to it, since the answer never changes.
+
     Args:
         client: The Gitea client used for the lookup.
         owner: The owner of the repository.
@@ -120,6 +133,8 @@ def resolve_issue_id(*, client: Gitea, owner: str, repository: str | None, issue
             it is not known.
         issue_number: The issue number of the repository, or the global issue ID
             when `repository` is None.
+        ids: The issue ID map to consult before fetching the issue, and to add
+            its ID to after, or None to always fetch it.
 
     Returns:
         The global issue ID that the project endpoints expect.
@@ -132,6 +147,9 @@ def resolve_issue_id(*, client: Gitea, owner: str, repository: str | None, issue
     """
     if repository is None:
         return issue_number
+    known = ids.get(owner, repository, issue_number) if ids is not None else None
+    if known is not None:
+        return known
 
     try:
         data, metadata = client.issue.get_issue(owner=owner, repository=repository, index=issue_number)
@@ -154,6 +172,8 @@ def resolve_issue_id(*, client: Gitea, owner: str, repository: str | None, issue
     status_code = metadata.get("status_code", 0)
     if not _is_success(status_code) or not isinstance(issue_id, int):
         raise CommandError(_unknown_issue_message(owner, repository, issue_number, status_code))
+    if ids is not None:
+        ids.record(owner, repository, {issue_number: issue_id})
     return issue_id
 
 
@@ -186,6 +206,7 @@ def run_project_issue_call(
     project_id: int,
     issue_number: int,
     issue_repository: str | None,
+    ids: IssueIds | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """Run a project issue call against the issue the user named.
 
@@ -204,6 +225,8 @@ def run_project_issue_call(
         issue_number: The value the user passed as --issue-id.
         issue_repository: The name of the repository holding the issue, or None
             when it is not known and `issue_number` is therefore a global ID.
+        ids: The issue ID map to resolve the issue number from, or None to
+            always fetch the issue.
 
     Returns:
         A tuple containing the payload and the metadata, the latter carrying the
@@ -215,7 +238,9 @@ def run_project_issue_call(
             reaching a response.
 
     """
-    issue_id = resolve_issue_id(client=client, owner=owner, repository=issue_repository, issue_number=issue_number)
+    issue_id = resolve_issue_id(
+        client=client, owner=owner, repository=issue_repository, issue_number=issue_number, ids=ids
+    )
     return _run_resolved_call(
         client=client,
         call=call,
@@ -1009,6 +1034,7 @@ def run_project_issue_move(
     sorting: int | None,
     issue_repository: str | None,
     add_if_missing: bool,
+    ids: IssueIds | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """Move an issue's card to a column of a project, and confirm it arrived.
 
@@ -1042,6 +1068,8 @@ def run_project_issue_move(
             when it is not known and `issue_number` is therefore a global ID.
         add_if_missing: Whether to add the issue to the target column when no
             column of the project holds a card for it.
+        ids: The issue ID map to resolve the issue number from, or None to
+            always fetch the issue.
 
     Returns:
         A tuple containing the payload and the metadata, the latter carrying the
@@ -1055,7 +1083,9 @@ def run_project_issue_move(
             reached, or the request failed without reaching a response.
 
     """
-    issue_id = resolve_issue_id(client=client, owner=owner, repository=issue_repository, issue_number=issue_number)
+    issue_id = resolve_issue_id(
+        client=client, owner=owner, repository=issue_repository, issue_number=issue_number, ids=ids
+    )
     on_board = (
         _card_column_id(
             client=client,
@@ -1156,6 +1186,7 @@ def run_project_issue_remove(
     issue_number: int,
     column_id: int | None,
     issue_repository: str | None,
+    ids: IssueIds | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """Take an issue's card off a project, from the column it is in.
 
@@ -1198,6 +1229,8 @@ def run_project_issue_remove(
         column_id: The column holding the card, or None to find it on the board.
         issue_repository: The name of the repository holding the issue, or None
             when it is not known and `issue_number` is therefore a global ID.
+        ids: The issue ID map to resolve the issue number from, or None to
+            always fetch the issue.
 
     Returns:
         A tuple containing the payload and the metadata, the latter carrying the
@@ -1212,7 +1245,9 @@ def run_project_issue_remove(
             failed without reaching a response.
 
     """
-    issue_id = resolve_issue_id(client=client, owner=owner, repository=issue_repository, issue_number=issue_number)
+    issue_id = resolve_issue_id(
+        client=client, owner=owner, repository=issue_repository, issue_number=issue_number, ids=ids
+    )
     carded_column_id = column_id
     if carded_column_id is None:
         carded_column_id = _card_column_id(
@@ -1274,3 +1309,255 @@ def run_project_issue_remove(
         # the caller unable to put it back.
         return data, {**metadata, "resolved_column_id": carded_column_id}
     return data, metadata
+
+
+def _lookup_failure(e: RequestException, client: Gitea) -> str:
+    """Describe why a read of the board failed, for a message about a card it was to confirm.
+
+    Args:
+        e: The error the read raised.
+        client: The Gitea client, for the address its errors name.
+
+    Returns:
+        The description, worded as `_confirm_card_in_column` words it.
+
+    """
+    if isinstance(e, HTTPError):
+        return _describe(_status_code_of(e), e)
+    if isinstance(e, (RequestsConnectionError, Timeout)):
+        return f"the instance at {client.base_url} could not be reached ({e})"
+    return f"the request did not complete ({type(e).__name__}: {e})"
+
+
+def _board_unreadable(e: RequestException, client: Gitea, owner: str, project_id: int) -> CommandError:
+    """Build the error for a board a batch of moves could not read before starting.
+
+    Args:
+        e: The error the listing raised.
+        client: The Gitea client, for the address its errors name.
+        owner: The owner of the repository or organization holding the project.
+        project_id: The ID of the project.
+
+    Returns:
+        The error to raise.
+
+    """
+    if isinstance(e, HTTPError):
+        return CommandError(
+            f"Could not read the board of project {project_id} of {owner}: {_describe(_status_code_of(e), e)}. "
+            f"Nothing was moved."
+        )
+    if isinstance(e, (RequestsConnectionError, Timeout)):
+        return CommandError(unreachable_message(e, client.base_url))
+    return CommandError(request_failed_message(e, client.base_url))
+
+
+def _warm_issue_ids(*, client: Gitea, owner: str, moves: list[CardMove], ids: IssueIds) -> None:
+    """Fill the issue ID map for a batch from a walk of each repository it is missing issues of.
+
+    Each walk reads at most as many pages as the repository has issues missing
+    from the map, so it never costs more requests than looking those issues up
+    one at a time would, and on a repository of a few hundred issues it costs a
+    handful where the lookups would cost one each. What it does not find is
+    looked up one at a time afterwards, as it would have been.
+
+    Args:
+        client: The Gitea client to walk the listings with.
+        owner: The owner of the repositories.
+        moves: The moves of the batch.
+        ids: The issue ID map to fill.
+
+    """
+    missing = Counter(
+        move.issue_repository
+        for move in moves
+        if move.issue_repository is not None and ids.get(owner, move.issue_repository, move.issue_number) is None
+    )
+    for repository, count in missing.items():
+        if count < 2:  # noqa: PLR2004
+            continue
+        try:
+            ids.warm(client, owner, repository, max_pages=min(count, WARM_MAX_PAGES))
+        except RequestException as e:
+            logger.warning(
+                "Could not list the issues of %s/%s (%s); looking them up one at a time.", owner, repository, e
+            )
+
+
+def run_project_issue_moves(
+    *,
+    client: Gitea,
+    owner: str,
+    repository: str | None,
+    project_id: int,
+    moves: list[CardMove],
+    add_if_missing: bool,
+    ids: IssueIds | None = None,
+    concurrency: int = BOARD_CONCURRENCY,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Move many cards on one project, reading the board once rather than once per card.
+
+    `run_project_issue_move` walks the board to find the card, moves it, and
+    reads the target column back, so a batch of two hundred moves walks the
+    board two hundred times. Here the issues are resolved first - from one walk
+    of their repository's issues where many are missing from the issue ID map -
+    the board is read once into a `BoardIndex`, the moves are made up to
+    `concurrency` at a time, each looking its card up in the index, and the
+    columns they touched are then read once each to confirm every card landed.
+
+    Every move is checked as its single counterpart checks it: a card not on the
+    board is reported rather than moved, unless `add_if_missing` adds it, and a
+    card not seen in its target column afterwards is reported as not having
+    arrived. A move that fails does not stop the others. The board is read
+    before any move is made and the confirming read after all of them, so a
+    card another move in the batch disturbs in between is reported as it was
+    found; the batch lists each issue once, so none of its own moves does.
+
+    Args:
+        client: The Gitea client to call. It is shared between threads.
+        owner: The owner of the repository or organization holding the project.
+        repository: The name of the repository holding the project, or None for
+            an organization project.
+        project_id: The ID of the project.
+        moves: The moves to make, each naming its issue and target column.
+        add_if_missing: Whether to add an issue with no card on the project to
+            its target column, rather than report it.
+        ids: The issue ID map to resolve issue numbers from, or None to always
+            fetch the issues.
+        concurrency: Most moves to make at once.
+
+    Returns:
+        One result per move, in the order of `moves`: the line it was read
+        from, the issue and column it named, the resolved global ID, and a
+        `result` of `moved`, `added` or `failed` - the last with an `error`.
+        The metadata counts the moves and the failed ones.
+
+    Raises:
+        CommandError: If the board could not be read before the first move, in
+            which case nothing was moved.
+
+    """
+    if ids is not None:
+        _warm_issue_ids(client=client, owner=owner, moves=moves, ids=ids)
+
+    board = BoardIndex(
+        client=client, owner=owner, repository=repository, project_id=project_id, concurrency=concurrency
+    )
+    try:
+        board.refresh()
+    except RequestException as e:
+        raise _board_unreadable(e, client, owner, project_id) from e
+
+    def make(move: CardMove) -> dict[str, Any]:
+        """Resolve one move's issue, find its card in the index, and make the call.
+
+        Args:
+            move: The move.
+
+        Returns:
+            Its result, `pending` until the board is read back, or `failed`.
+
+        """
+        result: dict[str, Any] = {"line": move.line, "issue_id": move.issue_number, "column_id": move.column_id}
+        try:
+            issue_id = resolve_issue_id(
+                client=client, owner=owner, repository=move.issue_repository, issue_number=move.issue_number, ids=ids
+            )
+            result["resolved_issue_id"] = issue_id
+            origin_column_id = board.column_of(issue_id)
+            if origin_column_id is None and not add_if_missing:
+                raise CommandError(
+                    _not_on_board_message(
+                        owner,
+                        repository,
+                        project_id,
+                        move.column_id,
+                        move.issue_number,
+                        issue_id,
+                        move.issue_repository,
+                    )
+                )
+            if origin_column_id is None and move.sorting is not None:
+                raise CommandError(
+                    _sorting_unavailable_message(
+                        owner,
+                        repository,
+                        project_id,
+                        move.column_id,
+                        move.issue_number,
+                        issue_id,
+                        move.issue_repository,
+                    )
+                )
+            action = "move" if origin_column_id is not None else "add"
+
+            def call(resolved_issue_id: int) -> tuple[dict[str, Any], dict[str, Any]]:
+                """Move the card the board holds, or add the issue that has none.
+
+                Args:
+                    resolved_issue_id: The global ID of the issue.
+
+                Returns:
+                    A tuple containing the response data and metadata.
+
+                """
+                if action == "move":
+                    return client.project.move_project_issue(
+                        owner=owner,
+                        repository=repository,
+                        project_id=project_id,
+                        issue_id=resolved_issue_id,
+                        column_id=move.column_id,
+                        sorting=move.sorting,
+                    )
+                return client.project.add_issue_to_project_column(
+                    owner=owner,
+                    repository=repository,
+                    project_id=project_id,
+                    column_id=move.column_id,
+                    issue_id=resolved_issue_id,
+                )
+
+            _run_resolved_call(
+                client=client,
+                call=call,
+                action=action,
+                owner=owner,
+                project_id=project_id,
+                issue_number=move.issue_number,
+                issue_id=issue_id,
+                issue_repository=move.issue_repository,
+            )
+        except CommandError as e:
+            return {**result, "result": "failed", "error": str(e)}
+        return {**result, "from_column_id": origin_column_id, "action": action, "result": "pending"}
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="gitea-move") as pool:
+        results = list(pool.map(make, moves))
+
+    made = [(move, result) for move, result in zip(moves, results, strict=True) if result["result"] == "pending"]
+    if made:
+        touched = {result["column_id"] for _, result in made}
+        touched.update(result["from_column_id"] for _, result in made if result["from_column_id"] is not None)
+        board.invalidate(*touched)
+        try:
+            board.refresh()
+            unread = None
+        except RequestException as e:
+            unread = e
+        for move, result in made:
+            action = result.pop("action")
+            issue_id = result["resolved_issue_id"]
+            arguments = (action, owner, repository, project_id, move.column_id, move.issue_number, issue_id)
+            if unread is not None:
+                result.update(
+                    result="failed",
+                    error=_unconfirmed_card_message(_lookup_failure(unread, client), *arguments, move.issue_repository),
+                )
+            elif board.holds(move.column_id, issue_id):
+                result["result"] = "moved" if action == "move" else "added"
+            else:
+                result.update(result="failed", error=_card_absent_message(*arguments, move.issue_repository))
+
+    failed = sum(result["result"] == "failed" for result in results)
+    return results, {"move_count": len(results), "failed_count": failed}
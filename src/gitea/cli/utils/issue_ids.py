@@ -0,0 +1,271 @@
+"""The local map of repository issue numbers to the global IDs the project endpoints expect.
+
+`resolve_issue_id` turns the number shown in the web UI into the global ID by
+fetching the whole issue, and a script moving hundreds of cards pays that fetch
+once per card, on every run. The answer never changes - an issue keeps its
+number and its ID for as long as it exists - so the CLI keeps every answer it
+has had in one JSON document beside the response cache, keyed by instance and
+then by repository:
+
+    {
+      "version": 1,
+      "instances": {
+        "https://gitea.example.com": {
+          "my-org/my-repo": {"15": 1854, "16": 1855}
+        }
+      }
+    }
+
+A number found there is resolved without a request. One that is not is fetched
+as before and added. `IssueIds.record_issues` adds every issue of a listing at
+once, which is how `issue list` fills the map as a side effect, and
+`IssueIds.warm` walks a repository's issues to fill it deliberately, so a batch
+is resolved from one walk rather than one fetch per issue.
+
+The map is a cache, and is treated as one. A missing or unreadable document is
+an empty map, and a write that fails is logged and dropped, since all either
+costs is the fetch the map was saving. Writes re-read the document and add to
+it, and replace it atomically, so invocations running side by side lose at most
+the entries one of them added at the same moment - which the next lookup fetches
+again. Within one invocation the threads sharing a map take turns writing it,
+and a walk over many pages records what it listed once, when it is done. `--no-cache` leaves the map alone, as it does the response cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import typer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from gitea.client.gitea import Gitea
+
+logger = logging.getLogger("gitea")
+
+# File, in the response cache directory, the map is kept in.
+ISSUE_IDS_FILE = "issue-ids.map"
+
+# Version of the document. A document of another version is read as empty.
+ISSUE_IDS_VERSION = 1
+
+# Most pages `IssueIds.warm` reads, so warming a repository with tens of
+# thousands of issues costs a bounded number of requests rather than all of
+# them. The most recently created issues come first, and are the ones a board
+# is most likely to hold.
+WARM_MAX_PAGES = 20
+
+
+def listed_ids(issues: Iterable[Any]) -> dict[int, int]:
+    """Read the global ID of every issue of a listing.
+
+    Args:
+        issues: The issue payloads. Anything without an integer `number` and
+            `id` is skipped.
+
+    Returns:
+        The global ID of each issue, keyed by issue number.
+
+    """
+    ids: dict[int, int] = {}
+    for issue in issues:
+        if not isinstance(issue, dict):
+            continue
+        number, issue_id = issue.get("number"), issue.get("id")
+        if isinstance(number, int) and isinstance(issue_id, int):
+            ids[number] = issue_id
+    return ids
+
+
+def _repository_key(owner: str, repository: str) -> str:
+    """Build the key a repository's issues are kept under.
+
+    Args:
+        owner: The owner of the repository.
+        repository: The name of the repository.
+
+    Returns:
+        `owner/repository`, lowercased, since Gitea matches both
+        case-insensitively.
+
+    """
+    return f"{owner}/{repository}".lower()
+
+
+class IssueIds:
+    """The issue number to global ID map of one instance, kept in a file.
+
+    It is safe to share between threads: `record` reads, changes and replaces
+    the document under a lock, so two threads recording at once both keep what
+    they added.
+    """
+
+    def __init__(self, path: str | Path, base_url: str) -> None:
+        """Initialize the map.
+
+        Args:
+            path: Path of the document.
+            base_url: The base URL of the instance the IDs belong to.
+
+        """
+        self.path = Path(path)
+        self.base_url = base_url.rstrip("/")
+        self._repositories: dict[str, dict[str, int]] | None = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, Any]:
+        """Read the whole document.
+
+        Returns:
+            The document, or an empty one when it is missing, unreadable or of
+            another version.
+
+        """
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"version": ISSUE_IDS_VERSION, "instances": {}}
+        if not isinstance(document, dict) or document.get("version") != ISSUE_IDS_VERSION:
+            return {"version": ISSUE_IDS_VERSION, "instances": {}}
+        if not isinstance(document.get("instances"), dict):
+            document["instances"] = {}
+        return document
+
+    def _instance(self) -> dict[str, dict[str, int]]:
+        """Read this instance's repositories, once.
+
+        Returns:
+            The issue IDs of each repository, keyed by issue number.
+
+        """
+        with self._lock:
+            if self._repositories is None:
+                instance = self._read()["instances"].get(self.base_url)
+                self._repositories = instance if isinstance(instance, dict) else {}
+            return self._repositories
+
+    def get(self, owner: str, repository: str, number: int) -> int | None:
+        """Look up the global ID of an issue.
+
+        Args:
+            owner: The owner of the repository.
+            repository: The name of the repository.
+            number: The issue number within the repository.
+
+        Returns:
+            The global ID, or None when the map does not hold it.
+
+        """
+        issues = self._instance().get(_repository_key(owner, repository))
+        issue_id = issues.get(str(number)) if isinstance(issues, dict) else None
+        return issue_id if isinstance(issue_id, int) and not isinstance(issue_id, bool) else None
+
+    def record(self, owner: str, repository: str, ids: dict[int, int]) -> None:
+        """Add issue IDs to the map, and write it.
+
+        Args:
+            owner: The owner of the repository.
+            repository: The name of the repository.
+            ids: The global ID of each issue, keyed by issue number.
+
+        """
+        if not ids:
+            return
+        key = _repository_key(owner, repository)
+        added = {str(number): issue_id for number, issue_id in ids.items()}
+        with self._lock:
+            self._write(key, added)
+
+    def _write(self, key: str, added: dict[str, int]) -> None:
+        """Add issue IDs to the document as it stands, and replace it.
+
+        Args:
+            key: The key of the repository the issues belong to.
+            added: The global ID of each issue, keyed by issue number.
+
+        """
+        document = self._read()
+        instance = document["instances"].setdefault(self.base_url, {})
+        if not isinstance(instance.get(key), dict):
+            instance[key] = {}
+        instance[key].update(added)
+        self._repositories = instance
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as file:
+                    json.dump(document, file, sort_keys=True)
+                os.replace(temporary, self.path)
+            finally:
+                Path(temporary).unlink(missing_ok=True)
+        except OSError as error:
+            logger.warning(
+                "Could not write the issue ID map at %s (%s); issues will be looked up again.", self.path, error
+            )
+
+    def record_issues(self, owner: str, repository: str, issues: Iterable[Any]) -> None:
+        """Add the IDs of the issues of a listing to the map.
+
+        Args:
+            owner: The owner of the repository.
+            repository: The name of the repository the issues were listed from.
+            issues: The issue payloads. Anything without an integer `number`
+                and `id` is skipped.
+
+        """
+        self.record(owner, repository, listed_ids(issues))
+
+    def warm(self, client: Gitea, owner: str, repository: str, max_pages: int = WARM_MAX_PAGES) -> int:
+        """Add the IDs of a repository's issues to the map from one walk of its listing.
+
+        Pull requests are included, since a board can hold them too and they
+        are numbered alongside the issues.
+
+        Args:
+            client: The Gitea client to walk the listing with.
+            owner: The owner of the repository.
+            repository: The name of the repository.
+            max_pages: Most pages to read.
+
+        Returns:
+            The number of issues added.
+
+        """
+        from gitea.utils.pagination import iter_pages, listing_page_size  # noqa: PLC0415
+
+        pages = iter_pages(
+            lambda page: client.issue.list_issues(
+                owner=owner, repository=repository, state="all", page=page, limit=listing_page_size(client)
+            )
+        )
+        issues = [issue for batch, _ in islice(pages, max_pages) for issue in batch]
+        self.record_issues(owner, repository, issues)
+        return len(issues)
+
+
+def issue_ids(ctx: typer.Context, base_url: str) -> IssueIds | None:
+    """Open the issue ID map the global options allow.
+
+    Args:
+        ctx: The Typer context, carrying the global options.
+        base_url: The base URL of the instance the command talks to.
+
+    Returns:
+        The map of that instance, or None when `--no-cache` turned caching off.
+
+    """
+    from gitea.client.cache import default_cache_dir  # noqa: PLC0415
+
+    if (ctx.obj or {}).get("no_cache"):
+        return None
+    return IssueIds(default_cache_dir() / ISSUE_IDS_FILE, base_url)
@@ -0,0 +1,72 @@
+"""The `--all-pages` mode of the list commands.
+
+A list command fetches the one page `--page` and `--limit` name, which is what a
+person paging through results wants and not what an export does: walking a
+listing a page at a time from a shell loop starts a process, and opens a
+session, per page. `--all-pages` walks every page in one invocation instead, through
+`gitea.utils.pagination.iter_pages`, so the walk ends where the other paginated
+commands' walks end, and writes each page out as it arrives rather than once
+the whole listing is in memory. Without `--limit`, each page is as large as the
+instance serves. `--concurrency` fetches pages ahead once the first one has
+said how many there are.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from gitea.cli.utils.errors import CommandError
+from gitea.utils.pagination import iter_pages, listing_page_size
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from gitea.client.gitea import Gitea
+
+ALL_PAGES_HELP = (
+    "Walk every page of the listing in one session, printing each page as it arrives. --limit sets the page size, "
+    "the largest the instance serves by default."
+)
+# `notification list` had `--all` already, for the notifications marked as read,
+# so there the walk is only `--all-pages` - which every list command accepts.
+NOTIFICATION_ALL_PAGES_HELP = (
+    "Walk every page of the listing in one session, printing each page as it arrives. --limit sets the page size, "
+    "the largest the instance serves by default. Not --all, which includes the notifications marked as read."
+)
+PAGE_CONCURRENCY_HELP = (
+    "Number of pages to fetch at once with --all-pages, once the first page has said how many there are."
+)
+
+
+def walk_listing(
+    list_page: Callable[[int, int], tuple[list[dict[str, Any]], dict[str, Any]]],
+    *,
+    client: Gitea,
+    page: int | None,
+    limit: int | None,
+    concurrency: int,
+    command: str,
+) -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+    """Walk every page of a listing for a command's `--all-pages` mode.
+
+    Args:
+        list_page: Callable fetching one page, given its number and size. With
+            a `concurrency` above one it is called from several threads at once.
+        client: The Gitea client the listing is walked with, asked for the
+            page size its instance serves when --limit is omitted.
+        page: The value passed as --page, which --all-pages has no use for.
+        limit: The value passed as --limit, used as the page size.
+        concurrency: Most pages to have requested at once.
+        command: The command being run, named as the user invoked it.
+
+    Yields:
+        The items and the metadata of each page, in order.
+
+    Raises:
+        CommandError: If --page was passed as well.
+
+    """
+    if page is not None:
+        raise CommandError(f"'{command} --all-pages' walks every page itself; drop --page.")
+    size = limit or listing_page_size(client)
+    yield from iter_pages(lambda number: list_page(number, size), concurrency=concurrency)
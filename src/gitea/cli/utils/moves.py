@@ -0,0 +1,239 @@
+"""Reading the card moves `project issue move --from-file` makes.
+
+A file lists one move per line, either as JSON Lines:
+
+    {"issue_id": 15, "column_id": 9}
+    {"issue_id": 16, "column_id": 9, "sorting": 2}
+    {"issue_id": 1854, "column_id": 10, "issue_repository": null}
+
+or as CSV with a header naming the same fields:
+
+    issue_id,column_id,sorting,issue_repository
+    15,9,,
+    16,9,2,
+
+A file ending in `.csv` is read as CSV and any other as JSON Lines. The fields
+mean what the options of the same names do for a single move: `issue_id` is the
+number shown in the web UI, `column_id` the column the card goes to, `sorting`
+its position there. `issue_repository` names the repository holding the issue
+when it is not the one the command's own `--issue-repository` or
+`--repository` names; a JSON `null` there, or `-` in CSV, says the repository is
+unknown and `issue_id` is the global ID.
+
+The whole file is read, and every line checked, before anything is moved, so a
+mistake on line 150 fails the command before line 1 has touched the board.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from gitea.cli.utils.errors import CommandError
+
+# Fields a line may carry. Anything else is reported, since a misspelt `sorting`
+# would otherwise be a move made without the position it asked for.
+_FIELDS = frozenset({"issue_id", "column_id", "sorting", "issue_repository"})
+
+# What a CSV line says for an issue whose repository is unknown, the empty cell
+# already meaning "the command's own".
+_UNKNOWN_REPOSITORY = "-"
+
+
+class CardMove(NamedTuple):
+    """One move read from a file.
+
+    Attributes:
+        line: The line of the file it was read from, for messages about it.
+        issue_number: The issue number, or the global ID when `issue_repository`
+            is None.
+        column_id: The column to move the card to.
+        sorting: The position within the column, or None for the instance's.
+        issue_repository: The repository holding the issue, or None when it is
+            not known.
+
+    """
+
+    line: int
+    issue_number: int
+    column_id: int
+    sorting: int | None
+    issue_repository: str | None
+
+
+def _integer(value: Any, field: str, path: Path, line: int) -> int | None:
+    """Read an integer field of a line.
+
+    Args:
+        value: The value the line carries, a string when read from CSV.
+        field: The name of the field.
+        path: The file, for the message.
+        line: The line, for the message.
+
+    Returns:
+        The integer, or None when the field is absent or empty.
+
+    Raises:
+        CommandError: If the field is not an integer.
+
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise CommandError(f"{path}:{line}: '{field}' must be an integer, got {value!r}.")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise CommandError(f"{path}:{line}: '{field}' must be an integer, got {value!r}.")
+
+
+def _move(record: dict[str, Any], path: Path, line: int, issue_repository: str | None, *, from_csv: bool) -> CardMove:
+    """Read one move from the fields of one line.
+
+    Args:
+        record: The fields of the line.
+        path: The file, for messages.
+        line: The line, for messages.
+        issue_repository: The repository the command names for issues whose
+            line names none.
+        from_csv: Whether the line was read from CSV, where every value is a
+            string and an unknown repository is written `-`.
+
+    Returns:
+        The move.
+
+    Raises:
+        CommandError: If the line carries an unknown field or a field that is
+            missing or malformed.
+
+    """
+    unknown = sorted(set(record) - _FIELDS)
+    if unknown:
+        raise CommandError(
+            f"{path}:{line}: unknown field {', '.join(repr(field) for field in unknown)}; "
+            f"a move takes {', '.join(sorted(_FIELDS))}."
+        )
+
+    repository = issue_repository
+    if "issue_repository" in record:
+        value = record["issue_repository"]
+        if from_csv:
+            repository = None if value == _UNKNOWN_REPOSITORY else (value or issue_repository)
+        elif value is None or isinstance(value, str):
+            repository = value or None
+        else:
+            raise CommandError(f"{path}:{line}: 'issue_repository' must be a string or null, got {value!r}.")
+
+    issue_number = _integer(record.get("issue_id"), "issue_id", path, line)
+    column_id = _integer(record.get("column_id"), "column_id", path, line)
+    if issue_number is None or column_id is None:
+        missing = "issue_id" if issue_number is None else "column_id"
+        raise CommandError(f"{path}:{line}: '{missing}' is missing.")
+    return CardMove(
+        line=line,
+        issue_number=issue_number,
+        column_id=column_id,
+        sorting=_integer(record.get("sorting"), "sorting", path, line),
+        issue_repository=repository,
+    )
+
+
+def _read_csv(text: str, path: Path, issue_repository: str | None) -> list[CardMove]:
+    """Read the moves of a CSV file.
+
+    Args:
+        text: The contents of the file.
+        path: The file, for messages.
+        issue_repository: The repository for issues whose line names none.
+
+    Returns:
+        The moves, skipping blank lines.
+
+    Raises:
+        CommandError: If a line is malformed.
+
+    """
+    moves: list[CardMove] = []
+    reader = csv.DictReader(text.splitlines())
+    for record in reader:
+        if None in record:
+            raise CommandError(f"{path}:{reader.line_num}: the line has more values than the header has names.")
+        if any(record.values()):
+            moves.append(_move(record, path, reader.line_num, issue_repository, from_csv=True))
+    return moves
+
+
+def _read_json_lines(text: str, path: Path, issue_repository: str | None) -> list[CardMove]:
+    """Read the moves of a JSON Lines file.
+
+    Args:
+        text: The contents of the file.
+        path: The file, for messages.
+        issue_repository: The repository for issues whose line names none.
+
+    Returns:
+        The moves, skipping blank lines.
+
+    Raises:
+        CommandError: If a line is malformed.
+
+    """
+    moves: list[CardMove] = []
+    for line, raw in enumerate(text.splitlines(), start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError as e:
+            raise CommandError(f"{path}:{line}: not a JSON object ({e}).") from e
+        if not isinstance(record, dict):
+            raise CommandError(f"{path}:{line}: not a JSON object.")
+        moves.append(_move(record, path, line, issue_repository, from_csv=False))
+    return moves
+
+
+def read_card_moves(path: str | Path, *, issue_repository: str | None) -> list[CardMove]:
+    """Read the moves a file lists.
+
+    Args:
+        path: The file, JSON Lines unless its name ends in `.csv`.
+        issue_repository: The repository holding the issues whose line names
+            none, or None when those are global IDs.
+
+    Returns:
+        The moves, in the order the file lists them.
+
+    Raises:
+        CommandError: If the file cannot be read, a line is malformed, the
+            file lists no move, or it lists the same issue twice.
+
+    """
+    path = Path(path)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise CommandError(f"Could not read the moves in {path}: {e}.") from e
+
+    read = _read_csv if path.suffix.lower() == ".csv" else _read_json_lines
+    moves = read(text, path, issue_repository)
+    if not moves:
+        raise CommandError(f"{path} lists no moves.")
+
+    # The same card sent to two columns at once ends up in whichever move lands
+    # last, which is no order the file can say anything about.
+    seen: dict[tuple[str | None, int], int] = {}
+    for move in moves:
+        key = (move.issue_repository, move.issue_number)
+        if key in seen:
+            raise CommandError(
+                f"{path}:{move.line}: issue {move.issue_number} is already moved on line {seen[key]}; "
+                f"list each issue once."
+            )
+        seen[key] = move.line
+    return moves
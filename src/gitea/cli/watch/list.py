@@ -12,27 +12,85 @@ updates as part of the run - before the report is written, so that a failure to
 write it is reported as an error with nothing on stdout, as every other failure
 in this CLI is. `--dry-run` leaves the cache exactly as it was, which makes the
 same changes come back on the next run.
+
+A run is one request per page of each scope and per page of comments of each
+issue in it, made one after another by default. `--concurrency N` makes up to N
+of them at once on a pool of threads sharing one client: the scopes are fetched
+side by side, and then the comments of a scope's issues are. Everything is still
+assembled in the order it was asked for, and the changes are sorted before they
+are reported, so the output of a concurrent run is the output of a serial one.
+
+`--incremental` trades one guarantee for most of those requests. An issue whose
+`updated_at` and comment count match its recorded snapshot keeps its recorded
+comments rather than having them walked again, and a repository scope asks only
+for the issues updated since the latest one it recorded - checked against the
+repository's count of open issues, and walked in full whenever the two disagree.
+The guarantee traded is a comment edited in place, which touches neither the
+issue's timestamp nor its count and so is reported only once something else
+about the issue moves.
+
+`--via-notifications` narrows a repository scope further, to the issues the
+token's notifications say changed: the repository's notification threads updated
+since the latest update it recorded, read and unread alike, name the issues and
+pull requests to read again, and every other snapshot is carried over as it
+stands - checked against the repository's count of open issues as `--incremental`
+checks its listing. So a run costs requests in proportion to what happened rather
+than to how much is open. What it trades is what Gitea does not notify about: a
+repository the token's user does not watch, and the user's own changes. Those
+are caught by walking the scope in full again once `--full-scan-interval` has
+passed since it last was, which the cache records per scope.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from http import HTTPStatus
 from typing import Annotated, Any
+from urllib.parse import urlsplit
 
+import requests
 import typer
 
-from gitea.utils.pagination import PAGE_SIZE, collect_all_pages
-from gitea.watch.changes import detect_changes, format_change, issue_key, issue_snapshot, usable_identifier
-from gitea.watch.state import STATE_FILE_ENV, load_state, resolve_state_path, save_scopes, scope_snapshots
+from gitea.utils.pagination import collect_all_pages, listing_page_size
+from gitea.watch.changes import (
+    comments_unchanged,
+    detect_changes,
+    format_change,
+    issue_key,
+    issue_snapshot,
+    usable_identifier,
+)
+from gitea.watch.state import (
+    STATE_FILE_ENV,
+    StateBackend,
+    load_state,
+    resolve_state_path,
+    save_scopes,
+    scope_scanned_at,
+    scope_snapshots,
+    state_backend_for,
+)
 
 logger = logging.getLogger("gitea")
 
 COMMAND_NAME = "gitea-cli watch list"
 
+# The states a notification's subject is in once it has left a scope of open
+# issues, which need no request to drop it.
+_CLOSED_STATES = frozenset({"closed", "merged"})
+
+# How a run maps a fetch over the things to fetch: `map` itself for a serial run,
+# or the `map` of a pool of threads for a concurrent one. Both hand the results
+# back in the order the inputs were given, which is what keeps the two alike.
+type Mapper = Callable[[Callable[[Any], Any], Iterable[Any]], Iterator[Any]]
+
 
 @dataclass(frozen=True)
-class _Scope:
+class Scope:
     """One thing being watched, and the key its snapshots are cached under.
 
     Attributes:
@@ -48,7 +106,7 @@ class _Scope:
     project_id: int | None
 
 
-def build_scopes(owner: str, repositories: list[str], project_ids: list[int]) -> list[_Scope]:
+def build_scopes(owner: str, repositories: list[str], project_ids: list[int]) -> list[Scope]:
     """Work out what a run watches from the options naming it.
 
     Every repository named is a scope of its own, and so is every project, which
@@ -91,9 +149,9 @@ def build_scopes(owner: str, repositories: list[str], project_ids: list[int]) ->
 
     scope_repository = repositories[0] if len(repositories) == 1 else None
 
-    scopes = [_Scope(key=f"repo:{owner}/{name}", repository=name, project_id=None) for name in repositories]
+    scopes = [Scope(key=f"repo:{owner}/{name}", repository=name, project_id=None) for name in repositories]
     scopes += [
-        _Scope(
+        Scope(
             key=f"project:{owner}/{scope_repository}/{identifier}"
             if scope_repository
             else f"project:{owner}/{identifier}",
@@ -103,7 +161,7 @@ def build_scopes(owner: str, repositories: list[str], project_ids: list[int]) ->
         for identifier in project_ids
     ]
 
-    unique: dict[str, _Scope] = {}
+    unique: dict[str, Scope] = {}
     for scope in scopes:
         unique.setdefault(scope.key, scope)
     return list(unique.values())
@@ -159,13 +217,13 @@ def _comments(client: Any, holder: tuple[str, str], number: Any) -> list[dict[st
             repository=holder[1],
             index=issue_number,
             page=page,
-            limit=PAGE_SIZE,
+            limit=listing_page_size(client),
         )
     )
     return comments
 
 
-def _scope_issues(client: Any, owner: str, scope: _Scope) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+def _scope_issues(client: Any, owner: str, scope: Scope) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     """Fetch the issues a scope currently holds, across every page of them.
 
     Args:
@@ -184,7 +242,7 @@ def _scope_issues(client: Any, owner: str, scope: _Scope) -> tuple[list[dict[str
                 repository=scope.repository,
                 state="open",
                 page=page,
-                limit=PAGE_SIZE,
+                limit=listing_page_size(client),
             )
         )
 
@@ -194,7 +252,7 @@ def _scope_issues(client: Any, owner: str, scope: _Scope) -> tuple[list[dict[str
             repository=scope.repository,
             project_id=scope.project_id,
             page=page,
-            limit=PAGE_SIZE,
+            limit=listing_page_size(client),
         )
     )
 
@@ -210,7 +268,7 @@ def _scope_issues(client: Any, owner: str, scope: _Scope) -> tuple[list[dict[str
                 project_id=scope.project_id,
                 column_id=column_id,
                 page=page,
-                limit=PAGE_SIZE,
+                limit=listing_page_size(client),
             )
         )
         issues.extend(column_issues)
@@ -218,7 +276,223 @@ def _scope_issues(client: Any, owner: str, scope: _Scope) -> tuple[list[dict[str
     return issues, metadata
 
 
-def _snapshots(client: Any, owner: str, scope: _Scope, issues: list[Any]) -> dict[str, dict[str, Any]]:
+def _latest_update(snapshots: dict[str, dict[str, Any]]) -> datetime | None:
+    """Find the most recent `updated_at` among the snapshots recorded for a scope.
+
+    Every issue updated since the scope was recorded was updated after this, so
+    it is the `since` a narrowed listing can ask from without missing one - the
+    run's own clock never enters into it, only timestamps the instance wrote.
+
+    Args:
+        snapshots: The snapshots recorded for the scope.
+
+    Returns:
+        The latest timestamp, or None when no snapshot carries a readable one.
+
+    """
+    latest: datetime | None = None
+    for snapshot in snapshots.values():
+        try:
+            updated_at = datetime.fromisoformat(snapshot.get("updated_at", ""))
+        except ValueError:
+            continue
+        if updated_at.tzinfo is not None and (latest is None or updated_at > latest):
+            latest = updated_at
+    return latest
+
+
+def _recent_issues(
+    client: Any, owner: str, scope: Scope, previous: dict[str, dict[str, Any]]
+) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, dict[str, Any]]] | None:
+    """Fetch only the issues of a repository scope updated since it was recorded.
+
+    The listing asks for issues in every state, so an issue closed since the
+    last run comes back and is dropped from the scope rather than kept as it was
+    recorded. The recorded snapshot of every issue not listed is carried over as
+    it stands. What a `since` listing cannot see is an issue that left without
+    being updated - deleted, or transferred elsewhere - so the result is checked
+    against the repository's own count of open issues, and given up on when the
+    two disagree.
+
+    Args:
+        client: The API client.
+        owner: The owner the scope was named with.
+        scope: The repository scope to fetch.
+        previous: The snapshots recorded for the scope.
+
+    Returns:
+        A tuple of the open issues updated since the scope was recorded, the
+        metadata of the last response, and the recorded snapshots carried over
+        for the rest - or None when the scope has to be walked in full: it is a
+        project, nothing recorded carries a timestamp to ask from, the instance
+        did not report its count of open issues, or the count disagrees.
+
+    """
+    since = _latest_update(previous) if scope.project_id is None else None
+    if since is None:
+        return None
+
+    recent, metadata = collect_all_pages(
+        lambda page: client.issue.list_issues(
+            owner=owner,
+            repository=scope.repository,
+            state="all",
+            since=since,
+            page=page,
+            limit=listing_page_size(client),
+        )
+    )
+    _, counted = client.issue.list_issues(owner=owner, repository=scope.repository, state="open", page=1, limit=1)
+
+    listed = {key for issue in recent if isinstance(issue, dict) and (key := issue_key(issue)) is not None}
+    issues = [issue for issue in recent if isinstance(issue, dict) and issue.get("state") == "open"]
+    carried = {key: snapshot for key, snapshot in previous.items() if key not in listed}
+
+    total = counted.get("total_count") if isinstance(counted, dict) else None
+    if not isinstance(total, int) or total != len(carried) + len(issues):
+        return None
+    return issues, metadata, carried
+
+
+def _timestamp(value: Any) -> datetime | None:
+    """Read a timestamp the instance wrote.
+
+    Args:
+        value: The value a payload carries for it.
+
+    Returns:
+        The time, or None when the value is not an ISO 8601 time with a timezone.
+
+    """
+    try:
+        moment = datetime.fromisoformat(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
+    return moment if moment is not None and moment.tzinfo is not None else None
+
+
+def _subject_number(thread: Any) -> int | None:
+    """Read the number of the issue or pull request a notification thread is about.
+
+    Args:
+        thread: The notification thread returned by the API.
+
+    Returns:
+        The number its subject's API URL ends in, or None when the thread is not
+        about an issue or a pull request.
+
+    """
+    subject = thread.get("subject") if isinstance(thread, dict) else None
+    url = subject.get("url") if isinstance(subject, dict) else None
+    if not isinstance(url, str):
+        return None
+    parts = urlsplit(url).path.rstrip("/").split("/")
+    if len(parts) < 2 or parts[-2] not in ("issues", "pulls") or not parts[-1].isdigit():  # noqa: PLR2004
+        return None
+    return int(parts[-1])
+
+
+def _current_issue(client: Any, owner: str, scope: Scope, number: int) -> dict[str, Any] | None:
+    """Fetch one issue of a repository scope as it stands.
+
+    Args:
+        client: The API client.
+        owner: The owner the scope was named with.
+        scope: The repository scope holding the issue.
+        number: The number of the issue.
+
+    Returns:
+        The issue, or None when the repository no longer holds it - deleted, or
+        transferred elsewhere.
+
+    Raises:
+        requests.HTTPError: If the instance refused the request for any other
+            reason.
+
+    """
+    try:
+        issue, _ = client.issue.get_issue(owner=owner, repository=scope.repository, index=number)
+    except requests.HTTPError as error:
+        if error.response is not None and error.response.status_code == HTTPStatus.NOT_FOUND:
+            return None
+        raise
+    return issue if isinstance(issue, dict) else None
+
+
+def _notified_issues(
+    client: Any, owner: str, scope: Scope, previous: dict[str, dict[str, Any]]
+) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, dict[str, Any]]] | None:
+    """Fetch only the issues of a repository scope its notifications say changed.
+
+    The notification threads of the repository updated since the latest update
+    the scope recorded name the issues to read again. A thread whose subject is
+    closed or merged drops its issue without a request, and one no newer than
+    the snapshot recorded for its issue is already accounted for. Every other
+    recorded snapshot is carried over, and the result is checked against the
+    repository's count of open issues, as `_recent_issues` checks its own.
+
+    Args:
+        client: The API client.
+        owner: The owner the scope was named with.
+        scope: The repository scope to fetch.
+        previous: The snapshots recorded for the scope.
+
+    Returns:
+        A tuple of the open issues notified about, the metadata of the last
+        response, and the recorded snapshots carried over for the rest - or None
+        when the scope has to be walked in full: it is a project, nothing
+        recorded carries a timestamp to ask from, or the count disagrees.
+
+    """
+    since = _latest_update(previous) if scope.project_id is None else None
+    if since is None:
+        return None
+
+    threads, metadata = collect_all_pages(
+        lambda page: client.notification.list_repo_notifications(
+            owner=owner,
+            repository=scope.repository,
+            all_notifications=True,
+            subject_type=["issue", "pull"],
+            since=since,
+            page=page,
+            limit=listing_page_size(client),
+        )
+    )
+
+    seen = {snapshot.get("number"): _timestamp(snapshot.get("updated_at")) for snapshot in previous.values()}
+    gone: set[int] = set()
+    to_read: set[int] = set()
+    for thread in threads:
+        number = _subject_number(thread)
+        if number is None:
+            continue
+        updated_at = _timestamp(thread.get("updated_at"))
+        if thread["subject"].get("state") in _CLOSED_STATES:
+            gone.add(number)
+        elif seen.get(number) is None or updated_at is None or updated_at > seen[number]:
+            to_read.add(number)
+    to_read -= gone
+
+    fetched = (_current_issue(client, owner, scope, number) for number in sorted(to_read))
+    issues = [issue for issue in fetched if issue is not None and issue.get("state") == "open"]
+    carried = {key: snapshot for key, snapshot in previous.items() if snapshot.get("number") not in gone | to_read}
+
+    _, counted = client.issue.list_issues(owner=owner, repository=scope.repository, state="open", page=1, limit=1)
+    total = counted.get("total_count") if isinstance(counted, dict) else None
+    if not isinstance(total, int) or total != len(carried) + len(issues):
+        return None
+    return issues, metadata, carried
+
+
+def snapshot_issues(
+    client: Any,
+    owner: str,
+    scope: Scope,
+    issues: list[Any],
+    mapper: Mapper = map,
+    previous: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
     """Reduce the issues of a scope to the snapshots the cache holds.
 
     Args:
@@ -226,6 +500,11 @@ def _snapshots(client: Any, owner: str, scope: _Scope, issues: list[Any]) -> dic
         owner: The owner the scope was named with.
         scope: The scope the issues came from.
         issues: The issues the scope currently holds.
+        mapper: How the comment walks of the issues are run - one after another
+            by default, or at once through the `map` of a pool of threads.
+        previous: The snapshots recorded for the scope, to take the comments of
+            an issue whose comments have not changed from rather than walking
+            them again, or None to walk every issue's comments.
 
     Returns:
         The snapshot of each issue, keyed by its global ID. An entry that is not
@@ -234,7 +513,7 @@ def _snapshots(client: Any, owner: str, scope: _Scope, issues: list[Any]) -> dic
         reporting a change on every run because it never matches.
 
     """
-    snapshots: dict[str, dict[str, Any]] = {}
+    watched: list[tuple[str, dict[str, Any], tuple[str, str] | None]] = []
 
     for issue in issues:
         if not isinstance(issue, dict):
@@ -254,16 +533,125 @@ def _snapshots(client: Any, owner: str, scope: _Scope, issues: list[Any]) -> dic
                 key,
                 scope.key,
             )
+        watched.append((key, issue, holder))
+
+    # An issue whose recorded snapshot holds no comment hashes is walked, as
+    # `comments_unchanged` never trusts such a snapshot.
+    recorded = previous or {}
+    walked = [entry for entry in watched if not comments_unchanged(entry[1], recorded.get(entry[0]))]
+    comments = dict(
+        zip(
+            (key for key, _, _ in walked),
+            mapper(lambda entry: _comments(client, entry[2], entry[1].get("number")) if entry[2] else [], walked),
+            strict=True,
+        )
+    )
 
-        snapshots[key] = issue_snapshot(
+    snapshots: dict[str, dict[str, Any]] = {}
+    for key, issue, holder in watched:
+        snapshot = issue_snapshot(
             issue,
-            _comments(client, holder, issue.get("number")) if holder else [],
+            comments.get(key, []),
             repository=f"{holder[0]}/{holder[1]}" if holder else None,
         )
-
+        if key not in comments:
+            snapshot["comment_hashes"] = list(recorded[key].get("comment_hashes") or [])
+        snapshots[key] = snapshot
     return snapshots
 
 
+def _full_walks_due(state: dict[str, Any], scopes: list[Scope], interval: float, now: datetime) -> set[str]:
+    """Work out which scopes a run narrowed to what changed has to walk in full.
+
+    Args:
+        state: The cache document.
+        scopes: The scopes the run watches.
+        interval: Seconds after which a scope is walked in full again.
+        now: The time of the run.
+
+    Returns:
+        The keys of the scopes last walked in full `interval` seconds ago or
+        more, or never as far as the cache records.
+
+    """
+    due = set()
+    for scope in scopes:
+        scanned_at = scope_scanned_at(state, scope.key)
+        if scanned_at is None or (now - scanned_at).total_seconds() >= interval:
+            due.add(scope.key)
+    return due
+
+
+def fetch_scope(
+    client: Any,
+    owner: str,
+    scope: Scope,
+    previous: dict[str, dict[str, Any]] | None,
+    *,
+    incremental: bool,
+    notifications: bool = False,
+) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, dict[str, Any]] | None]:
+    """Fetch the issues a scope holds, narrowed to the ones that changed when the run asks.
+
+    Args:
+        client: The API client.
+        owner: The owner the scope was named with.
+        scope: The scope to fetch.
+        previous: The snapshots recorded for the scope, or None when it has
+            never been recorded.
+        incremental: Whether to ask only for the issues updated since the scope
+            was recorded.
+        notifications: Whether to ask only for the issues the notifications
+            since the scope was recorded name. Tried before `incremental`.
+
+    Returns:
+        A tuple of the issues fetched, the metadata of the last response, and
+        the recorded snapshots carried over for the issues that were not - or
+        None in their place when the scope was walked in full.
+
+    """
+    narrowed = _notified_issues(client, owner, scope, previous) if notifications and previous else None
+    if narrowed is None and incremental and previous:
+        narrowed = _recent_issues(client, owner, scope, previous)
+    if narrowed is not None:
+        return narrowed
+    issues, metadata = _scope_issues(client, owner, scope)
+    return issues, metadata, None
+
+
+def poll_scope(
+    client: Any,
+    owner: str,
+    scope: Scope,
+    previous: dict[str, dict[str, Any]] | None,
+    *,
+    incremental: bool,
+    mapper: Mapper = map,
+) -> tuple[dict[str, dict[str, Any]], dict[str, Any], bool]:
+    """Fetch one scope and reduce it to the snapshots the cache holds.
+
+    Args:
+        client: The API client.
+        owner: The owner the scope was named with.
+        scope: The scope to poll.
+        previous: The snapshots recorded for the scope, or None when it has
+            never been recorded.
+        incremental: Whether to skip what has not changed since `previous`.
+        mapper: How the comment walks of the issues are run.
+
+    Returns:
+        A tuple of the snapshot of each issue the scope holds, the metadata of
+        the last response, and whether the scope was walked in full rather than
+        narrowed to what changed.
+
+    """
+    issues, metadata, carried = fetch_scope(client, owner, scope, previous, incremental=incremental)
+    snapshots = (carried or {}) | snapshot_issues(
+        client, owner, scope, issues, mapper, previous if incremental else None
+    )
+    return snapshots, metadata, carried is None
+
+
 def list_command(
     ctx: typer.Context,
     owner: Annotated[str, typer.Option("--owner", help="Owner of the repositories and projects to watch.")],
@@ -283,12 +671,56 @@ def list_command(
             help="Path of the cache of issue snapshots. Defaults to the user cache directory.",
         ),
     ] = None,
+    state_backend: Annotated[
+        StateBackend | None,
+        typer.Option(
+            "--state-backend",
+            help="How the cache is stored. Defaults to sqlite for a --state-file ending in .db, .sqlite or "
+            ".sqlite3, sharded - a directory of one file and one lock per scope - for one ending in .d, and json "
+            "otherwise.",
+        ),
+    ] = None,
     dry_run: Annotated[
         bool,
         typer.Option(
             "--dry-run", help="Report the changes without recording them, so the next run reports them again."
         ),
     ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Skip what has not changed since the last run: the comments of an issue whose update time and "
+            "comment count are unchanged, and the issues of a repository not updated since. A comment edited in "
+            "place is then reported only once something else about its issue changes.",
+        ),
+    ] = False,
+    via_notifications: Annotated[
+        bool,
+        typer.Option(
+            "--via-notifications",
+            help="Read again only the issues of a repository that the token's notifications say changed since the "
+            "last run. The token's user has to watch the repository, and its own changes are missed until the scope "
+            "is next walked in full.",
+        ),
+    ] = False,
+    full_scan_interval: Annotated[
+        float,
+        typer.Option(
+            "--full-scan-interval",
+            min=0,
+            help="Seconds after which a --via-notifications run walks a scope in full again, to catch what its "
+            "notifications missed.",
+        ),
+    ] = 3600.0,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            min=1,
+            help="Number of requests to make at once. Defaults to one at a time.",
+        ),
+    ] = 1,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -319,15 +751,23 @@ def list_command(
         repository: The repositories to watch the open issues of.
         project_id: The projects to watch the board of.
         state_file: Path of the cache of issue snapshots.
+        state_backend: How the cache is stored, or None to go by its suffix.
         dry_run: Whether to leave the cache untouched.
+        incremental: Whether to skip what has not changed since the last run.
+        via_notifications: Whether to read again only the issues notified about.
+        full_scan_interval: Seconds after which a scope is walked in full again.
+        concurrency: Number of requests to make at once.
         account_name: Name of the account to use for authentication.
         token: Token for authentication.
         base_url: Base URL of the Gitea platform.
 
     """
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
     from gitea.cli.output import emit  # noqa: PLC0415
     from gitea.cli.utils.api import execute_api_call  # noqa: PLC0415
     from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
     from gitea.cli.utils.errors import CommandError  # noqa: PLC0415
     from gitea.client.gitea import Gitea  # noqa: PLC0415
 
@@ -339,6 +779,7 @@ def list_command(
     )
 
     state_path = resolve_state_path(state_file)
+    backend = state_backend_for(state_path, state_backend)
 
     def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Fetch the current state of every scope and compare it against the cache.
@@ -352,19 +793,50 @@ def list_command(
 
         """
         scopes = build_scopes(owner, list(repository or []), list(project_id or []))
-        state = load_state(state_path)
+        state = load_state(state_path, scopes=[scope.key for scope in scopes], backend=backend)
+        now = datetime.now(UTC)
+        due = _full_walks_due(state, scopes, full_scan_interval, now) if via_notifications else set()
 
         changes: list[dict[str, Any]] = []
         baselined: list[str] = []
         recorded: dict[str, dict[str, dict[str, Any]]] = {}
+        scanned_at: dict[str, str] = {}
         issue_count = 0
         metadata: dict[str, Any] = {}
 
-        with Gitea(token=token, base_url=base_url) as client:
-            for scope in scopes:
-                issues, metadata = _scope_issues(client, owner, scope)
-                snapshots = _snapshots(client, owner, scope, issues)
+        with (
+            Gitea(
+                token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+            ) as client,
+            ThreadPoolExecutor(max_workers=concurrency) as pool,
+        ):
+            mapper: Mapper = pool.map if concurrency > 1 else map
+
+            # The scopes are fetched first and their comments walked after, so
+            # the pool is never waiting on work queued behind its own workers.
+            fetched = list(
+                mapper(
+                    lambda scope: fetch_scope(
+                        client,
+                        owner,
+                        scope,
+                        scope_snapshots(state, scope.key),
+                        incremental=incremental and scope.key not in due,
+                        notifications=via_notifications and scope.key not in due,
+                    ),
+                    scopes,
+                )
+            )
+
+            for scope, scope_result in zip(scopes, fetched, strict=True):
+                issues, metadata, carried = scope_result
                 previous = scope_snapshots(state, scope.key)
+                snapshots = (carried or {}) | snapshot_issues(
+                    client, owner, scope, issues, mapper, previous if incremental else None
+                )
+                last_walk = now if carried is None else scope_scanned_at(state, scope.key)
+                if last_walk is not None:
+                    scanned_at[scope.key] = last_walk.isoformat()
 
                 if previous is None:
                     baselined.append(scope.key)
@@ -377,7 +849,7 @@ def list_command(
             try:
                 # Only the scopes this run watched are replaced, so a run that
                 # finished while this one was fetching keeps what it recorded.
-                save_scopes(state_path, recorded)
+                save_scopes(state_path, recorded, backend=backend, scanned_at=scanned_at)
             except OSError as error:
                 raise CommandError(
                     f"Could not write the watch cache at {state_path}: {error}. The changes reported by this run "
@@ -391,6 +863,7 @@ def list_command(
             "issue_count": issue_count,
             "change_count": len(changes),
             "state_file": str(state_path),
+            "state_backend": str(backend),
             "dry_run": dry_run,
         }
 
@@ -14,8 +14,14 @@ watch_app = typer.Typer(
 def register_commands() -> None:
     """Register watch-related commands to the watch_app."""
     from gitea.cli.watch.list import list_command  # noqa: PLC0415
+    from gitea.cli.watch.run import run_command  # noqa: PLC0415
+    from gitea.cli.watch.serve import serve_command  # noqa: PLC0415
 
     watch_app.command("list", help="Report the issues that changed since the last run.")(list_command)
+    watch_app.command("run", help="Poll for changes until stopped, writing each as a JSON Lines record.")(run_command)
+    watch_app.command(
+        "serve", help="Take Gitea webhook deliveries until stopped, writing each change as a JSON Lines record."
+    )(serve_command)
 
 
 register_commands()
@@ -0,0 +1,454 @@
+"""Watch for changes from one long-running process, reporting each as it is seen.
+
+`watch list` is built for a scheduler, and every tick of one pays for a process:
+the interpreter starting, the CLI importing, the configuration parsed, a TLS
+handshake, the whole cache read and written back. At a tick a minute that is
+most of what the command does. `watch run` pays for it once. It keeps one client
+session open, the snapshots of every scope in memory, and polls each scope again
+every `--interval` seconds, writing each change to stdout as one JSON Lines
+record the moment it is seen - the records `watch list --output jsonl` writes -
+so whatever reads the stream can act on a change without waiting for the run to
+end.
+
+Three choices shape it.
+
+**The first round is the run's to fail.** Every scope is polled once before the
+loop starts, and a failure there fails the command as it fails `watch list`: an
+instance that cannot be reached, or a token it refuses, is a mistake to report
+rather than a condition to wait out. After that a failed poll is logged and the
+scope polled again at its next turn, since an instance restarting for an upgrade
+is no reason for a watcher to stop.
+
+**Each scope keeps its own time, with jitter.** A scope is polled again
+`--interval` seconds after its last poll, give or take `--jitter` of that, so
+scopes that start together drift apart instead of every scope hitting the
+instance in the same second of every minute.
+
+**The cache is written every `--flush-interval` seconds, not every poll** -
+unless that is 0, which writes after every poll instead. Only the scopes whose
+snapshots changed since the last write are written, through `save_scopes`, so
+the other processes sharing the cache see them - and whatever the run saw since
+its last write is written when it stops, on `--ticks` running out, SIGINT or
+SIGTERM. A run killed outright loses what it saw since its last
+write, and the next run reports those changes again rather than missing them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import random
+import signal
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Annotated, Any
+
+import requests
+import typer
+
+from gitea.watch.changes import detect_changes
+from gitea.watch.state import (
+    STATE_FILE_ENV,
+    StateBackend,
+    load_state,
+    resolve_state_path,
+    save_scopes,
+    scope_scanned_at,
+    scope_snapshots,
+    state_backend_for,
+)
+
+if TYPE_CHECKING:
+    from gitea.cli.watch.list import Scope
+
+logger = logging.getLogger("gitea")
+
+COMMAND_NAME = "gitea-cli watch run"
+
+
+def next_poll(now: float, interval: float, jitter: float, rng: random.Random) -> float:
+    """Work out when a scope is polled next.
+
+    Args:
+        now: The time of its last poll, on the monotonic clock.
+        interval: Seconds between two polls of the scope.
+        jitter: Fraction of the interval the next poll may move by, either way.
+        rng: The source of the jitter.
+
+    Returns:
+        The time of the next poll, on the monotonic clock.
+
+    """
+    return now + interval * (1 + rng.uniform(-jitter, jitter))
+
+
+def poll_until_stopped(
+    scopes: list[Scope],
+    poll: Callable[[Scope], None],
+    write_cache: Callable[[], None],
+    *,
+    interval: float,
+    jitter: float,
+    flush_interval: float,
+    ticks: int | None,
+    stopping: threading.Event,
+) -> tuple[int, int]:
+    """Poll every scope once, and then each on its own schedule until stopped.
+
+    Args:
+        scopes: The scopes to poll.
+        poll: Callable polling one scope.
+        write_cache: Callable writing what changed since it was last called.
+        interval: Seconds between two polls of each scope.
+        jitter: Fraction of the interval each poll may move by.
+        flush_interval: Seconds between two calls of `write_cache`, or 0 to
+            call it after every poll.
+        ticks: Polls of each scope to stop after, or None to poll until
+            `stopping` is set.
+        stopping: Event that ends the polling once set.
+
+    Returns:
+        The polls made, and how many of them failed.
+
+    Raises:
+        requests.RequestException: If a poll of the first round fails. A later
+            one is logged, and its scope polled again at its next turn.
+
+    """
+
+    def flush() -> None:
+        """Write the cache, logging a failure for the next write to retry."""
+        try:
+            write_cache()
+        except OSError as error:
+            logger.error("Could not write the watch cache (%s); trying again at the next write.", error)
+
+    # A flush interval of 0 writes after every poll instead of on a clock, which
+    # would otherwise always be due and never let the loop wait.
+    every_poll = flush_interval <= 0
+
+    for scope in scopes:
+        poll(scope)
+    if every_poll:
+        flush()
+
+    rng = random.Random()  # noqa: S311
+    made = dict.fromkeys(range(len(scopes)), 1)
+    failed = 0
+    due = [(next_poll(time.monotonic(), interval, jitter, rng), index) for index in made if ticks is None or ticks > 1]
+    heapq.heapify(due)
+    next_write = math.inf if every_poll else time.monotonic() + flush_interval
+
+    while due and not stopping.is_set():
+        now = time.monotonic()
+        if now >= next_write:
+            flush()
+            next_write = now + flush_interval
+        when, index = due[0]
+        if when > now:
+            stopping.wait(min(when, next_write) - now)
+            continue
+
+        heapq.heappop(due)
+        made[index] += 1
+        try:
+            poll(scopes[index])
+        except requests.RequestException as error:
+            failed += 1
+            logger.warning("Could not poll %s (%s); trying again at its next turn.", scopes[index].key, error)
+        if every_poll:
+            flush()
+        if ticks is None or made[index] < ticks:
+            heapq.heappush(due, (next_poll(time.monotonic(), interval, jitter, rng), index))
+
+    return sum(made.values()), failed
+
+
+@contextmanager
+def stop_on_signals(stopping: threading.Event) -> Iterator[None]:
+    """Turn SIGINT and SIGTERM into a request to stop, for the duration of the block.
+
+    A signal sets `stopping` rather than raising wherever the process happens to
+    be, so the run finishes the poll it is in, writes what it saw, and ends with
+    its metadata line. Handlers can only be installed from the main thread; from
+    any other the signals keep whatever handlers they had.
+
+    Args:
+        stopping: The event a signal sets.
+
+    Yields:
+        Control to the block the handlers are installed for.
+
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def stop(signum: int, frame: Any) -> None:
+        """Ask the run to stop.
+
+        Args:
+            signum: The signal received.
+            frame: The frame it interrupted.
+
+        """
+        stopping.set()
+
+    previous = {signum: signal.signal(signum, stop) for signum in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        yield
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+def run_command(
+    ctx: typer.Context,
+    owner: Annotated[str, typer.Option("--owner", help="Owner of the repositories and projects to watch.")],
+    repository: Annotated[
+        list[str] | None,
+        typer.Option("--repository", help="Name of a repository to watch the open issues of. Repeat to watch several."),
+    ] = None,
+    project_id: Annotated[
+        list[int] | None,
+        typer.Option("--project-id", help="ID of a project to watch the board of. Repeat to watch several."),
+    ] = None,
+    interval: Annotated[
+        float,
+        typer.Option("--interval", min=0, help="Seconds between two polls of each scope."),
+    ] = 60.0,
+    jitter: Annotated[
+        float,
+        typer.Option(
+            "--jitter",
+            min=0,
+            max=1,
+            help="Fraction of --interval each poll may move by either way, so scopes drift apart.",
+        ),
+    ] = 0.1,
+    flush_interval: Annotated[
+        float,
+        typer.Option(
+            "--flush-interval",
+            min=0,
+            help="Seconds between two writes of the cache, or 0 to write after every poll. What changed since the "
+            "last write is written on exit too.",
+        ),
+    ] = 60.0,
+    ticks: Annotated[
+        int | None,
+        typer.Option("--ticks", min=1, help="Stop once every scope has been polled this many times."),
+    ] = None,
+    state_file: Annotated[
+        str | None,
+        typer.Option(
+            "--state-file",
+            envvar=STATE_FILE_ENV,
+            help="Path of the cache of issue snapshots. Defaults to the user cache directory.",
+        ),
+    ] = None,
+    state_backend: Annotated[
+        StateBackend | None,
+        typer.Option(
+            "--state-backend",
+            help="How the cache is stored. Defaults to sqlite for a --state-file ending in .db, .sqlite or "
+            ".sqlite3, sharded - a directory of one file and one lock per scope - for one ending in .d, and json "
+            "otherwise.",
+        ),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Report the changes without ever writing the cache."),
+    ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Skip what has not changed since the last poll, as `watch list --incremental` does.",
+        ),
+    ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            min=1,
+            help="Number of requests to make at once. Defaults to one at a time.",
+        ),
+    ] = 1,
+    account_name: Annotated[
+        str | None,
+        typer.Option(
+            "--account-name",
+            help="Name of the account to use for authentication.",
+        ),
+    ] = None,
+    token: Annotated[
+        str | None,
+        typer.Option(
+            "--token",
+            help="Token for authentication. If not provided, the token from the specified account will be used.",
+        ),
+    ] = None,
+    base_url: Annotated[
+        str | None,
+        typer.Option(
+            "--base-url",
+            help="Base URL of the Gitea platform. If not provided, the base URL from the specified account will be used.",
+        ),
+    ] = None,
+) -> None:
+    """Poll the watched scopes until stopped, writing each change as a JSON Lines record.
+
+    Args:
+        ctx: The Typer context.
+        owner: The owner of the repositories and projects to watch.
+        repository: The repositories to watch the open issues of.
+        project_id: The projects to watch the board of.
+        interval: Seconds between two polls of each scope.
+        jitter: Fraction of the interval each poll may move by.
+        flush_interval: Seconds between two writes of the cache.
+        ticks: Polls of each scope to stop after, or None to run until stopped.
+        state_file: Path of the cache of issue snapshots.
+        state_backend: How the cache is stored, or None to go by its suffix.
+        dry_run: Whether to leave the cache untouched.
+        incremental: Whether to skip what has not changed since the last poll.
+        concurrency: Number of requests to make at once.
+        account_name: Name of the account to use for authentication.
+        token: Token for authentication.
+        base_url: Base URL of the Gitea platform.
+
+    """
+    from requests.adapters import DEFAULT_POOLSIZE  # noqa: PLC0415
+
+    from gitea.cli.output import print_record  # noqa: PLC0415
+    from gitea.cli.utils.api import execute_api_call  # noqa: PLC0415
+    from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.errors import CommandError  # noqa: PLC0415
+    from gitea.cli.watch.list import Mapper, build_scopes, poll_scope  # noqa: PLC0415
+    from gitea.client.gitea import Gitea  # noqa: PLC0415
+
+    token, base_url = get_auth_params(
+        config_path=ctx.obj.get("config_path"),
+        account_name=account_name,
+        token=token,
+        base_url=base_url,
+    )
+
+    state_path = resolve_state_path(state_file)
+    backend = state_backend_for(state_path, state_backend)
+
+    def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Poll every scope until stopped, writing each change as it is seen.
+
+        Returns:
+            An empty list, every change having been written already, and the
+            metadata of the run.
+
+        Raises:
+            CommandError: If the cache cannot be written when the run stops,
+                since the changes it reported would be reported again.
+
+        """
+        scopes = build_scopes(owner, list(repository or []), list(project_id or []))
+        state = load_state(state_path, scopes=[scope.key for scope in scopes], backend=backend)
+        recorded = {scope.key: scope_snapshots(state, scope.key) for scope in scopes}
+        baselined = [key for key, snapshots in recorded.items() if snapshots is None]
+        # When each scope was last walked in full, written back with its
+        # snapshots so `watch list --via-notifications` still knows.
+        scanned_at = {
+            scope.key: moment.isoformat()
+            for scope in scopes
+            if (moment := scope_scanned_at(state, scope.key)) is not None
+        }
+        # The scopes whose snapshots the cache does not hold yet.
+        unwritten: set[str] = set()
+        change_count = 0
+        stopping = threading.Event()
+
+        def write_cache() -> None:
+            """Write the scopes whose snapshots changed since the last write.
+
+            Raises:
+                OSError: If the cache cannot be written. The scopes stay unwritten.
+
+            """
+            if dry_run or not unwritten:
+                return
+            save_scopes(
+                state_path,
+                {key: recorded[key] or {} for key in sorted(unwritten)},
+                backend=backend,
+                scanned_at=scanned_at,
+            )
+            unwritten.clear()
+
+        with (
+            Gitea(
+                token=token, base_url=base_url, pool_maxsize=max(concurrency, DEFAULT_POOLSIZE), **client_options(ctx)
+            ) as client,
+            ThreadPoolExecutor(max_workers=concurrency) as pool,
+            stop_on_signals(stopping),
+        ):
+            mapper: Mapper = pool.map if concurrency > 1 else map
+
+            def poll(scope: Scope) -> None:
+                """Poll one scope, writing each change since its last poll.
+
+                Args:
+                    scope: The scope to poll.
+
+                """
+                nonlocal change_count
+                previous = recorded[scope.key]
+                snapshots, _, full = poll_scope(client, owner, scope, previous, incremental=incremental, mapper=mapper)
+                if full:
+                    scanned_at[scope.key] = datetime.now(UTC).isoformat()
+                for change in detect_changes(snapshots, previous):
+                    print_record({**change, "scope": scope.key})
+                    change_count += 1
+                if snapshots != previous:
+                    unwritten.add(scope.key)
+                recorded[scope.key] = snapshots
+
+            polls, failed_polls = poll_until_stopped(
+                scopes,
+                poll,
+                write_cache,
+                interval=interval,
+                jitter=jitter,
+                flush_interval=flush_interval,
+                ticks=ticks,
+                stopping=stopping,
+            )
+
+        try:
+            write_cache()
+        except OSError as error:
+            raise CommandError(
+                f"Could not write the watch cache at {state_path}: {error}. The changes reported since the last "
+                f"write were not recorded, so check that the directory exists and is writable."
+            ) from error
+
+        return [], {
+            "scopes": [scope.key for scope in scopes],
+            "baselined_scopes": baselined,
+            "polls": polls,
+            "failed_polls": failed_polls,
+            "change_count": change_count,
+            "state_file": str(state_path),
+            "state_backend": str(backend),
+            "dry_run": dry_run,
+        }
+
+    execute_api_call(
+        api_call=api_call,
+        report=lambda data, metadata: print_record({"metadata": metadata}),
+        base_url=base_url,
+        command_name=COMMAND_NAME,
+    )
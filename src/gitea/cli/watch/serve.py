@@ -0,0 +1,557 @@
+"""Watch for changes as Gitea delivers them, instead of polling for them.
+
+`watch list` and `watch run` find a change by listing every open issue of every
+scope and walking their comments, so what a quiet repository costs grows with
+its size rather than with what happens in it. `watch serve` listens for the
+webhook deliveries Gitea makes for the `issues` and `issue_comment` events of
+the repositories it watches, and updates the snapshot of the one issue each
+delivery names. The records it writes are the ones `watch run` writes - the
+change records `format_change` renders, each with its scope - and the cache it
+keeps is the one the other two keep, so the three can take turns on one cache.
+
+Four choices shape it.
+
+**Every delivery is signed.** A delivery is taken only when its
+`X-Gitea-Signature` header is the HMAC-SHA256 of its body under the secret the
+webhook was given, compared in constant time, and answered 403 otherwise. There
+is no unsigned mode: the endpoint rewrites the cache, and anything that can
+reach the port could otherwise write to it.
+
+**A delivery costs one issue, not one scope.** The issue a delivery carries is
+complete but for its comments, which the snapshot hashes. An `issue_comment`
+delivery, or one for an issue with no snapshot yet, has that issue's comments
+walked again, since the edit or deletion it reports cannot be replayed onto the
+recorded hashes from the payload alone. An `issues` delivery for an issue
+already recorded keeps the recorded hashes whenever `comments_unchanged` says
+they still describe it. Either way the request count follows activity, and is
+zero on a quiet day.
+
+**Every scope is polled once when the server starts.** A webhook says nothing
+about what happened while nobody was listening, so each scope is walked in full
+before the first delivery is taken, as the first round of `watch run` walks it:
+a scope with no snapshots is baselined, one recorded earlier reports what
+changed since. The port is bound before that poll, so a delivery made during it
+waits to be taken rather than being refused. Only repository scopes can be
+served, since a delivery does not say which board a card is on.
+
+**Deliveries are taken one at a time, and recorded before they are answered.**
+The server handles one request before accepting the next, so two deliveries for
+the same issue never race, and drops a connection that stalls mid-request so
+that one slow client cannot hold up the rest. A delivery that changed a snapshot has its scope
+written to the cache before Gitea is answered, and a delivery whose write or
+comment walk fails is answered with an error and reports nothing, which leaves
+it for Gitea's redelivery rather than half applied.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from collections import Counter
+from collections.abc import Callable
+from datetime import UTC, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import TYPE_CHECKING, Annotated, Any
+
+import requests
+import typer
+
+from gitea.watch.changes import comments_unchanged, detect_changes, issue_key
+from gitea.watch.state import (
+    STATE_FILE_ENV,
+    StateBackend,
+    load_state,
+    resolve_state_path,
+    save_scopes,
+    scope_scanned_at,
+    scope_snapshots,
+    state_backend_for,
+)
+
+if TYPE_CHECKING:
+    from gitea.cli.watch.list import Scope
+
+logger = logging.getLogger("gitea")
+
+COMMAND_NAME = "gitea-cli watch serve"
+
+WEBHOOK_SECRET_ENV = "PYTHON_GITEA_WEBHOOK_SECRET"  # noqa: S105
+
+# The headers Gitea names a delivery's event and signs its body in.
+EVENT_HEADER = "X-Gitea-Event"
+SIGNATURE_HEADER = "X-Gitea-Signature"
+
+# The events whose payload carries an issue. Gitea names label, assignee and
+# milestone changes `issues` too, telling them apart in `X-Gitea-Event-Type`.
+ISSUE_EVENTS = frozenset({"issues", "issue_comment"})
+
+# Largest body a delivery may carry. An issue payload is a few kilobytes; this
+# only stops a stray client from making the server read without end.
+_MAX_BODY = 10 * 1024 * 1024
+
+# Seconds the server waits for a delivery before looking whether it was asked
+# to stop, which bounds how long a signal goes unanswered.
+_STOP_CHECK = 0.5
+
+# Seconds a delivery's connection may sit idle mid-request before it is dropped.
+# Deliveries are taken one at a time, so a client that announces a body and
+# never sends it would otherwise hold up every delivery after it, and the stop.
+_READ_TIMEOUT = 5.0
+
+
+def signature_matches(secret: bytes, body: bytes, signature: str | None) -> bool:
+    """Check a delivery's signature against the body it came with.
+
+    Args:
+        secret: The secret the webhook was given.
+        body: The body of the delivery, as received.
+        signature: The hex digest the delivery's signature header carried, or
+            None when it carried none.
+
+    Returns:
+        True when the signature is the HMAC-SHA256 of the body under the secret.
+
+    """
+    if not signature:
+        return False
+    expected = hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.strip().lower())
+
+
+class WebhookServer(HTTPServer):
+    """An HTTP server handing each signed delivery to a callable, one at a time.
+
+    It listens from the moment it is bound, so a delivery made before it is
+    first served waits in the listen backlog rather than being refused.
+
+    Attributes:
+        secret: The secret the deliveries are signed with.
+        deliver: Callable taking the event a delivery names and its payload, and
+            returning the status to answer it with.
+        answers: How many deliveries were answered with each status.
+
+    """
+
+    # Connections the listen backlog holds while the server is busy - with the
+    # first poll, or with a delivery - before the system starts refusing them.
+    request_queue_size = 64
+
+    def __init__(
+        self, address: tuple[str, int], secret: bytes, deliver: Callable[[str, dict[str, Any]], HTTPStatus]
+    ) -> None:
+        """Bind the server.
+
+        Args:
+            address: The host and port to listen on. Port 0 picks a free one.
+            secret: The secret the deliveries are signed with.
+            deliver: Callable handling one signed delivery.
+
+        """
+        super().__init__(address, _DeliveryHandler)
+        self.secret = secret
+        self.deliver = deliver
+        self.answers: Counter[HTTPStatus] = Counter()
+
+
+class _DeliveryHandler(BaseHTTPRequestHandler):
+    """Answer one webhook delivery."""
+
+    server: WebhookServer
+    timeout = _READ_TIMEOUT
+
+    def do_POST(self) -> None:
+        """Check the delivery, hand it on, and answer with what came of it."""
+        status = self._handle()
+        self.server.answers[status] += 1
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _read_body(self) -> bytes | HTTPStatus:
+        """Read the body the delivery announces.
+
+        Returns:
+            The body, or the status to refuse the delivery with when it
+            announces none, too much, or stops sending before the end.
+
+        """
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            return HTTPStatus.LENGTH_REQUIRED
+        if not 0 <= length <= _MAX_BODY:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        try:
+            return self.rfile.read(length)
+        except TimeoutError:
+            logger.warning("Dropped a webhook delivery from %s: its body never arrived.", self.client_address[0])
+            return HTTPStatus.REQUEST_TIMEOUT
+
+    def _handle(self) -> HTTPStatus:
+        """Read and check the delivery, and hand it on when it is sound.
+
+        Returns:
+            The status to answer the delivery with.
+
+        """
+        body = self._read_body()
+        if isinstance(body, HTTPStatus):
+            return body
+        if not signature_matches(self.server.secret, body, self.headers.get(SIGNATURE_HEADER)):
+            logger.warning("Refused a webhook delivery from %s: its signature does not match.", self.client_address[0])
+            return HTTPStatus.FORBIDDEN
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST
+        if not isinstance(payload, dict):
+            return HTTPStatus.BAD_REQUEST
+        return self.server.deliver(self.headers.get(EVENT_HEADER, ""), payload)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Log a request through the package logger rather than to stderr.
+
+        Args:
+            format: The message, as a %-format string.
+            *args: The values to format into it.
+
+        """
+        logger.debug(format, *args)
+
+
+def delivered_scope(payload: dict[str, Any], scopes: dict[str, Scope]) -> Scope | None:
+    """Work out which watched scope a delivery is about.
+
+    Args:
+        payload: The payload of the delivery.
+        scopes: The watched scopes, keyed by the full name of their repository
+            folded to lower case, as Gitea names owners and repositories
+            without regard to case.
+
+    Returns:
+        The scope, or None when the delivery is about a repository not watched.
+
+    """
+    repository = payload.get("repository")
+    full_name = repository.get("full_name") if isinstance(repository, dict) else None
+    return scopes.get(full_name.casefold()) if isinstance(full_name, str) else None
+
+
+def apply_delivery(
+    client: Any,
+    owner: str,
+    scope: Scope,
+    previous: dict[str, dict[str, Any]],
+    event: str,
+    payload: dict[str, Any],
+) -> dict[str, dict[str, Any]] | None:
+    """Work out the snapshots of a scope once a delivery about it is applied.
+
+    Args:
+        client: The API client, for the comments of the issue delivered.
+        owner: The owner the scope was named with.
+        scope: The scope the delivery is about.
+        previous: The snapshots recorded for the scope.
+        event: The event the delivery names.
+        payload: The payload of the delivery.
+
+    Returns:
+        The snapshot of each issue the scope holds once the delivery is applied,
+        or None when the delivery is not about an issue the scope could hold.
+
+    Raises:
+        requests.RequestException: If the comments of the issue cannot be read.
+
+    """
+    from gitea.cli.watch.list import snapshot_issues  # noqa: PLC0415
+
+    issue = payload.get("issue")
+    key = issue_key(issue) if isinstance(issue, dict) else None
+    if event not in ISSUE_EVENTS or key is None:
+        return None
+
+    snapshots = {name: snapshot for name, snapshot in previous.items() if name != key}
+    if issue.get("state") != "open" or (event == "issues" and payload.get("action") == "deleted"):
+        return snapshots
+
+    # A comment delivery reports an edit or deletion that the issue's timestamp
+    # and count do not show, so its comments are walked whatever they say.
+    trusted = previous if event == "issues" and comments_unchanged(issue, previous.get(key)) else None
+    return snapshots | snapshot_issues(client, owner, scope, [issue], previous=trusted)
+
+
+def receive_delivery(
+    event: str,
+    payload: dict[str, Any],
+    *,
+    client: Any,
+    owner: str,
+    scopes: dict[str, Scope],
+    recorded: dict[str, dict[str, dict[str, Any]] | None],
+    record: Callable[[Scope, dict[str, dict[str, Any]]], None],
+) -> HTTPStatus:
+    """Apply one signed delivery to the snapshots of its scope, and record them.
+
+    Args:
+        event: The event the delivery names.
+        payload: The payload of the delivery.
+        client: The API client, for the comments of the issue delivered.
+        owner: The owner the scopes were named with.
+        scopes: The watched scopes, keyed as `delivered_scope` reads them.
+        recorded: The snapshots held for each scope, keyed by scope.
+        record: Callable recording the new snapshots of a scope and reporting
+            what changed in it, raising `OSError` if they cannot be written.
+
+    Returns:
+        The status to answer the delivery with: 204 when it was applied, 202
+        when it is about nothing watched, and 502 or 500 when the comments of
+        its issue could not be read or the cache could not be written.
+
+    """
+    scope = delivered_scope(payload, scopes)
+    if scope is None:
+        logger.debug("Ignoring a %r delivery for a repository not watched.", event)
+        return HTTPStatus.ACCEPTED
+
+    try:
+        snapshots = apply_delivery(client, owner, scope, recorded[scope.key] or {}, event, payload)
+    except requests.RequestException as error:
+        logger.warning("Could not read the comments of an issue delivered for %s (%s).", scope.key, error)
+        return HTTPStatus.BAD_GATEWAY
+    if snapshots is None:
+        logger.debug("Ignoring a %r delivery that names no issue of %s.", event, scope.key)
+        return HTTPStatus.ACCEPTED
+
+    try:
+        record(scope, snapshots)
+    except OSError as error:
+        logger.error("Could not write the watch cache (%s); the delivery for %s was not applied.", error, scope.key)
+        return HTTPStatus.INTERNAL_SERVER_ERROR
+    return HTTPStatus.NO_CONTENT
+
+
+def serve_until_stopped(server: WebhookServer, stopping: threading.Event, deliveries: int | None) -> None:
+    """Answer deliveries until stopped.
+
+    Args:
+        server: The server to answer them on.
+        stopping: Event that ends the serving once set.
+        deliveries: Deliveries to stop after, or None to serve until `stopping`
+            is set.
+
+    """
+    server.timeout = _STOP_CHECK
+    while not stopping.is_set() and (deliveries is None or server.answers.total() < deliveries):
+        server.handle_request()
+
+
+def serve_command(
+    ctx: typer.Context,
+    owner: Annotated[str, typer.Option("--owner", help="Owner of the repositories to watch.")],
+    secret: Annotated[
+        str,
+        typer.Option(
+            "--secret",
+            envvar=WEBHOOK_SECRET_ENV,
+            help="Secret the webhook signs its deliveries with. A delivery it did not sign is refused.",
+        ),
+    ],
+    repository: Annotated[
+        list[str] | None,
+        typer.Option("--repository", help="Name of a repository to watch the open issues of. Repeat to watch several."),
+    ] = None,
+    host: Annotated[str, typer.Option("--host", help="Address to listen on.")] = "127.0.0.1",
+    port: Annotated[
+        int, typer.Option("--port", min=0, max=65535, help="Port to listen on. 0 picks a free one.")
+    ] = 8000,
+    deliveries: Annotated[
+        int | None,
+        typer.Option("--deliveries", min=1, help="Stop once this many deliveries have been answered."),
+    ] = None,
+    state_file: Annotated[
+        str | None,
+        typer.Option(
+            "--state-file",
+            envvar=STATE_FILE_ENV,
+            help="Path of the cache of issue snapshots. Defaults to the user cache directory.",
+        ),
+    ] = None,
+    state_backend: Annotated[
+        StateBackend | None,
+        typer.Option(
+            "--state-backend",
+            help="How the cache is stored. Defaults to sqlite for a --state-file ending in .db, .sqlite or "
+            ".sqlite3, sharded - a directory of one file and one lock per scope - for one ending in .d, and json "
+            "otherwise.",
+        ),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Report the changes without ever writing the cache."),
+    ] = False,
+    account_name: Annotated[
+        str | None,
+        typer.Option(
+            "--account-name",
+            help="Name of the account to use for authentication.",
+        ),
+    ] = None,
+    token: Annotated[
+        str | None,
+        typer.Option(
+            "--token",
+            help="Token for authentication. If not provided, the token from the specified account will be used.",
+        ),
+    ] = None,
+    base_url: Annotated[
+        str | None,
+        typer.Option(
+            "--base-url",
+            help="Base URL of the Gitea platform. If not provided, the base URL from the specified account will be used.",
+        ),
+    ] = None,
+) -> None:
+    """Take webhook deliveries until stopped, writing each change as a JSON Lines record.
+
+    Args:
+        ctx: The Typer context.
+        owner: The owner of the repositories to watch.
+        secret: The secret the webhook signs its deliveries with.
+        repository: The repositories to watch the open issues of.
+        host: The address to listen on.
+        port: The port to listen on.
+        deliveries: Deliveries to stop after, or None to serve until stopped.
+        state_file: Path of the cache of issue snapshots.
+        state_backend: How the cache is stored, or None to go by its suffix.
+        dry_run: Whether to leave the cache untouched.
+        account_name: Name of the account to use for authentication.
+        token: Token for authentication.
+        base_url: Base URL of the Gitea platform.
+
+    """
+    from gitea.cli.output import print_record  # noqa: PLC0415
+    from gitea.cli.utils.api import execute_api_call  # noqa: PLC0415
+    from gitea.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from gitea.cli.utils.client import client_options  # noqa: PLC0415
+    from gitea.cli.utils.errors import CommandError  # noqa: PLC0415
+    from gitea.cli.watch.list import build_scopes, poll_scope  # noqa: PLC0415
+    from gitea.cli.watch.run import stop_on_signals  # noqa: PLC0415
+    from gitea.client.gitea import Gitea  # noqa: PLC0415
+
+    token, base_url = get_auth_params(
+        config_path=ctx.obj.get("config_path"),
+        account_name=account_name,
+        token=token,
+        base_url=base_url,
+    )
+
+    state_path = resolve_state_path(state_file)
+    backend = state_backend_for(state_path, state_backend)
+
+    def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Poll every scope once, then take deliveries until stopped.
+
+        Returns:
+            An empty list, every change having been written already, and the
+            metadata of the run.
+
+        Raises:
+            CommandError: If no repository was named, the address cannot be
+                listened on, or the cache cannot be written after the first poll.
+
+        """
+        if not repository:
+            raise CommandError(
+                f"'{COMMAND_NAME}' needs a repository to watch: pass --repository REPOSITORY, repeated to watch "
+                f"several. A project's board cannot be served, since a delivery does not say which board a card is on."
+            )
+        scopes = build_scopes(owner, repository, [])
+        by_name = {f"{owner}/{scope.repository}".casefold(): scope for scope in scopes}
+        state = load_state(state_path, scopes=[scope.key for scope in scopes], backend=backend)
+        recorded = {scope.key: scope_snapshots(state, scope.key) for scope in scopes}
+        baselined = [key for key, snapshots in recorded.items() if snapshots is None]
+        # When each scope was last walked in full, written back with its
+        # snapshots so `watch list --via-notifications` still knows.
+        scanned_at = {
+            scope.key: moment.isoformat()
+            for scope in scopes
+            if (moment := scope_scanned_at(state, scope.key)) is not None
+        }
+        change_count = 0
+        stopping = threading.Event()
+
+        def record(scope: Scope, snapshots: dict[str, dict[str, Any]]) -> None:
+            """Write a scope's new snapshots, then report what changed in it.
+
+            Args:
+                scope: The scope.
+                snapshots: The snapshot of each issue it holds now.
+
+            Raises:
+                OSError: If the cache cannot be written. Nothing is reported,
+                    and the scope keeps its previous snapshots.
+
+            """
+            nonlocal change_count
+            previous = recorded[scope.key]
+            if not dry_run and snapshots != previous:
+                save_scopes(state_path, {scope.key: snapshots}, backend=backend, scanned_at=scanned_at)
+            recorded[scope.key] = snapshots
+            for change in detect_changes(snapshots, previous):
+                print_record({**change, "scope": scope.key})
+                change_count += 1
+
+        with Gitea(token=token, base_url=base_url, **client_options(ctx)) as client:
+            # The server is bound before the first poll, so a delivery Gitea
+            # makes while it runs waits in the backlog instead of being refused.
+            try:
+                server = WebhookServer(
+                    (host, port),
+                    secret.encode("utf-8"),
+                    lambda event, payload: receive_delivery(
+                        event, payload, client=client, owner=owner, scopes=by_name, recorded=recorded, record=record
+                    ),
+                )
+            except OSError as error:
+                raise CommandError(f"Could not listen on {host}:{port}: {error}.") from error
+
+            with server:
+                for scope in scopes:
+                    snapshots, _, _ = poll_scope(client, owner, scope, recorded[scope.key], incremental=False)
+                    scanned_at[scope.key] = datetime.now(UTC).isoformat()
+                    try:
+                        record(scope, snapshots)
+                    except OSError as error:
+                        raise CommandError(
+                            f"Could not write the watch cache at {state_path}: {error}. Check that the directory "
+                            f"exists and is writable."
+                        ) from error
+
+                with stop_on_signals(stopping):
+                    logger.info("Listening for webhook deliveries on http://%s:%d/.", *server.server_address[:2])
+                    serve_until_stopped(server, stopping, deliveries)
+
+        return [], {
+            "scopes": [scope.key for scope in scopes],
+            "baselined_scopes": baselined,
+            "deliveries": server.answers.total(),
+            "applied_deliveries": server.answers[HTTPStatus.NO_CONTENT],
+            "ignored_deliveries": server.answers[HTTPStatus.ACCEPTED],
+            "rejected_deliveries": sum(count for status, count in server.answers.items() if status.is_client_error),
+            "failed_deliveries": sum(count for status, count in server.answers.items() if status.is_server_error),
+            "change_count": change_count,
+            "state_file": str(state_path),
+            "state_backend": str(backend),
+            "dry_run": dry_run,
+        }
+
+    execute_api_call(
+        api_call=api_call,
+        report=lambda data, metadata: print_record({"metadata": metadata}),
+        base_url=base_url,
+        command_name=COMMAND_NAME,
+    )
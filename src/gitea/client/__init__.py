@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from gitea.client.async_gitea import AsyncGitea
+from gitea.client.cache import ResponseCache
 from gitea.client.gitea import Gitea
+from gitea.client.limiter import RateLimiter
+from gitea.client.retry import RetryPolicy
 
-__all__ = ["AsyncGitea", "Gitea"]
+__all__ = ["AsyncGitea", "Gitea", "RateLimiter", "ResponseCache", "RetryPolicy"]
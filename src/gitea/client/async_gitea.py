@@ -2,22 +2,70 @@
 
 from __future__ import annotations
 
-from typing import Any, Self
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any, Self, cast
 
-from aiohttp import ClientResponse, ClientSession, ClientTimeout
+from aiohttp import ClientConnectionError, ClientResponse, ClientSession, ClientTimeout, TCPConnector
 
 from gitea.client.base import Client
+from gitea.client.cache import ReplayedResponse
+from gitea.client.flight import AsyncSingleFlight, flight_key
+from gitea.client.retry import mark_retries
+
+if TYPE_CHECKING:
+    from gitea.client.cache import ResponseCache
+    from gitea.client.limiter import RateLimiter
+    from gitea.client.retry import RetryPolicy
 
 
 class AsyncGitea(Client):  # pylint: disable=too-few-public-methods
     """Asynchronous Gitea API client."""
 
-    def __init__(self, token: str | None = None, base_url: str = "https://gitea.com") -> None:
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str = "https://gitea.com",
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        limiter: RateLimiter | None = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: int | None = 10,
+        keepalive_timeout: float = 15.0,
+        session: ClientSession | None = None,
+        coalesce: bool = True,
+    ) -> None:
         """Initialize the asynchronous Gitea client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the Gitea instance.
+            cache: Cache to answer `GET` requests from while they are fresh, and
+                to revalidate them against once they are not, answering a `304`
+                with the body it holds. None sends every request afresh.
+            retry: Policy to send a request again under when the connection
+                fails or the instance answers with a transient error. None sends
+                each request once.
+            limiter: Rate limit and bound on requests in flight that every
+                request, and every retry of one, waits under. None sends each
+                as soon as it is made.
+            limit: Connections open at once, across every host. 0 leaves them
+                unbounded.
+            limit_per_host: Connections open at once to one host. 0 leaves
+                them bounded by `limit` alone.
+            ttl_dns_cache: Seconds to reuse a resolved address for before
+                resolving the host again. None reuses it for the life of the
+                session.
+            keepalive_timeout: Seconds an idle connection is kept open for the
+                next request to reuse.
+            session: Session to send requests through instead of one the
+                client opens. It is used as it was configured - the connector
+                options above do not apply to it - and is left open when the
+                client exits, for its owner to close.
+            coalesce: Whether a `GET` made while an identical one is in flight
+                on another task waits for that one's response rather than being
+                sent itself.
 
         """
         from gitea.comment.async_comment import AsyncComment  # noqa: PLC0415
@@ -29,10 +77,22 @@ class AsyncGitea(Client):  # pylint: disable=too-few-public-methods
         from gitea.project.async_project import AsyncProject  # noqa: PLC0415
         from gitea.pull_request.async_pull_request import AsyncPullRequest  # noqa: PLC0415
         from gitea.repository import AsyncRepository  # noqa: PLC0415
+        from gitea.settings.async_settings import AsyncSettings  # noqa: PLC0415
         from gitea.user.async_user import AsyncUser  # noqa: PLC0415
 
         super().__init__(token=token, base_url=base_url)
         self.session: ClientSession | None = None
+        self.cache = cache
+        self.retry = retry
+        self.limiter = limiter
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self._external_session = session
+        self._timeouts: dict[int, ClientTimeout] = {}
+        self.coalesce = coalesce
+        self._flights = AsyncSingleFlight()
 
         # Resource handlers
         self.issue = AsyncIssue(client=self)
@@ -45,6 +105,7 @@ class AsyncGitea(Client):  # pylint: disable=too-few-public-methods
         self.notification = AsyncNotification(client=self)
         self.project = AsyncProject(client=self)
         self.organization = AsyncOrganization(client=self)
+        self.settings = AsyncSettings(client=self)
 
     def __str__(self) -> str:
         """Return a string representation of the AsyncGitea client.
@@ -64,7 +125,16 @@ class AsyncGitea(Client):  # pylint: disable=too-few-public-methods
         """
         if self.session is not None and not self.session.closed:
             raise RuntimeError("AsyncGitea session already open; do not re-enter context manager.")
-        self.session = ClientSession(headers=self.headers)
+        if self._external_session is not None:
+            self.session = self._external_session
+            return self
+        connector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self.session = ClientSession(headers=self.headers, connector=connector)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -77,7 +147,8 @@ class AsyncGitea(Client):  # pylint: disable=too-few-public-methods
 
         """
         if self.session:
-            await self.session.close()
+            if self.session is not self._external_session:
+                await self.session.close()
             self.session = None
 
     def _get_session(self, headers: dict | None = None, **kwargs: Any) -> ClientSession:
@@ -114,16 +185,95 @@ class AsyncGitea(Client):  # pylint: disable=too-few-public-methods
                 "AsyncGitea must be used as an async context manager. "
                 + "Use 'async with AsyncGitea(...) as client:' to ensure proper resource cleanup."
             )
-
         url = self._build_url(endpoint=endpoint)
         request_headers = {**self.headers, **(headers or {})}
-        timeout_obj = ClientTimeout(total=timeout)
-        response = await self.session.request(
-            method=method, url=url, headers=request_headers, timeout=timeout_obj, **kwargs
+        session = self.session
+
+        flight = flight_key(method, url, request_headers, **kwargs) if self.coalesce else None
+        if flight is None:
+            return await self._fetch(session, method, url, request_headers, timeout, **kwargs)
+        return await self._flights.do(
+            flight,
+            lambda: self._fetch(session, method, url, request_headers, timeout, **kwargs),
+            share=lambda response: response.read(),
         )
+
+    async def _fetch(
+        self, session: ClientSession, method: str, url: str, request_headers: dict, timeout: int, **kwargs: Any
+    ) -> ClientResponse:
+        """Answer a request from the cache, or send it and keep what it is answered with.
+
+        Args:
+            session: The session to send it on.
+            method: The HTTP method.
+            url: The full URL.
+            request_headers: The headers to send, credentials included.
+            timeout: Request timeout in seconds.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The aiohttp ClientResponse object.
+
+        """
+        cache = self.cache
+        key = cache.key(method, url, kwargs.get("params"), request_headers) if cache is not None else None
+        cached = cache.get(key) if cache is not None and key is not None else None
+        if cache is not None and cached is not None:
+            if cache.is_fresh(cached):
+                return cast(ClientResponse, ReplayedResponse(cached, url))
+            request_headers = {**request_headers, **cached.validators()}
+
+        timeout_obj = self._timeouts.get(timeout)
+        if timeout_obj is None:
+            timeout_obj = self._timeouts[timeout] = ClientTimeout(total=timeout)
+        response = await self._send(session, method, url, headers=request_headers, timeout=timeout_obj, **kwargs)
+        if cache is not None and cached is not None and key is not None and response.status == 304:  # noqa: PLR2004
+            response.release()
+            cache.revalidated(key, cached)
+            return cast(ClientResponse, ReplayedResponse(cached, url))
         try:
             response.raise_for_status()
         except Exception:
             response.release()
             raise
+        if cache is not None:
+            if key is not None and response.status == 200:  # noqa: PLR2004
+                cache.store(key, url, await response.read(), response.headers)
+            elif method.upper() != "GET":
+                cache.invalidate(url)
         return response
+
+    async def _send(self, session: ClientSession, method: str, url: str, **kwargs: Any) -> ClientResponse:
+        """Send a request, and send it again for as long as the retry policy allows.
+
+        Args:
+            session: The session to send it on.
+            method: The HTTP method.
+            url: The URL.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The last response, carrying the number of retries it took.
+
+        """
+        retry = self.retry
+        limiter = self.limiter
+        attempt = 1
+        while True:
+            try:
+                async with limiter.async_slot() if limiter is not None else contextlib.nullcontext():
+                    response = await session.request(method=method, url=url, **kwargs)
+            except (ClientConnectionError, TimeoutError):
+                if retry is None or not retry.allows(method, attempt):
+                    raise
+                wait = retry.delay(attempt)
+            else:
+                wait = None
+                if retry is not None and retry.retries_status(method, response.status, attempt):
+                    wait = retry.delay(attempt, response.headers.get("Retry-After"))
+                if wait is None:
+                    mark_retries(response, attempt - 1)
+                    return response
+                response.release()
+            await asyncio.sleep(wait)
+            attempt += 1
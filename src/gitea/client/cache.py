@@ -0,0 +1,656 @@
+"""Response cache shared by the synchronous and asynchronous clients.
+
+A client given a `ResponseCache` remembers the body of every successful `GET`
+together with the validators the server sent with it - `ETag` and
+`Last-Modified` - and asks the next identical request with them as
+`If-None-Match` and `If-Modified-Since`. A server that has nothing new answers
+`304 Not Modified` with no body, and the client hands back the remembered body
+in its place, as a `200` carrying the headers it was first served with, so
+`process_response`, `process_async_response` and `pagination_metadata` read it
+exactly as they read a fresh one.
+
+A cache may also be given a time to live, as one figure for every endpoint or as
+`fnmatch` patterns matched against the endpoint's path. A response younger than
+the time to live of its endpoint is handed back without asking the server at
+all, which is what spares a script reading the same labels a dozen times a
+minute; one older than that is revalidated as above. The default is zero: every
+response is revalidated, so a cache costs nothing in freshness unless a time to
+live is asked for.
+
+Four decisions bound what it does:
+
+* **Only `GET` is cached, and only a `200` is stored.** Every other method
+  changes something, and a `204` or a redirect has no body worth replaying.
+* **A write drops what it may have changed.** A successful request of any other
+  method drops every response held for the same owner - `repos/{owner}/...`,
+  `orgs/{owner}/...` and `users/{owner}/...` alike, since a card moved on an
+  organization's board changes what a repository's issues say - or everything
+  held, for a write to a path naming no owner. A time to live can then only
+  serve something stale that changed elsewhere, never something this process
+  changed itself.
+* **A request is identified by its URL, its query parameters and its
+  credentials.** Two accounts reading the same URL can be shown different
+  things, so the `Authorization` header is part of the key - hashed, so the
+  token itself is never held as a key.
+* **A caller's own validators win.** A request that already carries
+  `If-None-Match` or `If-Modified-Since` is sent as it is and its answer is not
+  replaced, since the caller asked to see the `304` itself.
+
+`ResponseCache` holds its responses in memory for the life of the object, which
+may outlive a client. `DiskResponseCache` holds them as files in a directory, so
+that they outlive the process too - one per response, bounded in total size and
+evicting the least recently used first - which is what the CLI uses, since each
+of its invocations is a process of its own.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import platformdirs
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger("gitea")
+
+# Environment variable naming the directory the CLI keeps its responses in, for
+# a caller - a test suite, a container with a read-only home - that needs them
+# somewhere other than the user cache directory.
+CACHE_DIR_ENV = "PYTHON_GITEA_CACHE_DIR"
+
+# Times to live the CLI gives endpoints whose answers change rarely and are read
+# over and over by scripts resolving names to IDs: labels and milestones. Every
+# other endpoint is revalidated on each read unless a time to live is asked for.
+DEFAULT_TTLS: dict[str, float] = {
+    "repos/*/*/labels": 60.0,
+    "orgs/*/labels": 60.0,
+    "repos/*/*/milestones": 60.0,
+}
+
+# Total size the CLI lets its responses grow to before evicting the least
+# recently used, in bytes.
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# The headers kept with a cached body: the validators, and what the response
+# processors read from a replayed response - the content type, and the counts
+# `pagination_metadata` carries into a listing's metadata.
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link", "X-HasMore", "X-PageCount", "X-Total-Count")
+
+# The headers a caller sends to validate a request itself.
+_VALIDATOR_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+# The first segment of a path naming an owner as its second.
+_OWNER_SCOPES = ("repos", "orgs", "users")
+
+# The scope prefixed to the key of a response whose endpoint names no owner,
+# which every write drops.
+_UNSCOPED = "any"
+
+
+def default_cache_dir() -> Path:
+    """Build the path of the directory the CLI keeps its responses in.
+
+    Returns:
+        The directory named by `CACHE_DIR_ENV`, or a `responses` directory in
+        the user's cache directory for this application - beside the watch
+        cache described in `gitea.watch.state`.
+
+    """
+    named = os.getenv(CACHE_DIR_ENV)
+    if named:
+        return Path(named).expanduser()
+    return Path(platformdirs.user_cache_dir(appname="gitea")) / "responses"
+
+
+def _endpoint(url: str) -> str:
+    """Read the endpoint a URL addresses, as the client was asked for it.
+
+    Args:
+        url: The full URL of a request.
+
+    Returns:
+        The path under the API root, without surrounding slashes.
+
+    """
+    path = urlsplit(url).path
+    _, marker, endpoint = path.partition("/api/v1/")
+    return (endpoint if marker else path).strip("/")
+
+
+def _owner_scope(url: str) -> tuple[str, str] | None:
+    """Read the owner a URL's endpoint belongs to.
+
+    Args:
+        url: The full URL of a request.
+
+    Returns:
+        The host and the owner named by the endpoint, or None for an endpoint
+        that names none.
+
+    """
+    segments = _endpoint(url).split("/")
+    if len(segments) >= 2 and segments[0] in _OWNER_SCOPES:  # noqa: PLR2004
+        return urlsplit(url).netloc, segments[1]
+    return None
+
+
+def _scope_tag(url: str) -> str:
+    """Build the tag a URL's owner is named by at the start of a key.
+
+    Args:
+        url: The full URL of a request.
+
+    Returns:
+        A digest of the host and owner the endpoint names, or `_UNSCOPED` for
+        an endpoint that names none.
+
+    """
+    scope = _owner_scope(url)
+    if scope is None:
+        return _UNSCOPED
+    return hashlib.sha256("\n".join(scope).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """The body of a successful response and the headers needed to revalidate and replay it.
+
+    Attributes:
+        body: The body, as the server sent it.
+        headers: The headers in `_KEPT_HEADERS` the server sent with it.
+        url: The URL it was sent for.
+        stored_at: When it was sent, or last revalidated, in seconds since the
+            epoch.
+
+    """
+
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    url: str = ""
+    stored_at: float = 0.0
+
+    def validators(self) -> dict[str, str]:
+        """Build the headers asking the server whether this body is still current.
+
+        Returns:
+            `If-None-Match` for an `ETag` and `If-Modified-Since` for a
+            `Last-Modified`, whichever the response carried.
+
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        validators: dict[str, str] = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+
+class ResponseCache:
+    """In-memory store of the responses a client can revalidate, or reuse, instead of refetching.
+
+    It is safe to share between threads, and so between the threads of a
+    concurrent walk through one client. The storage itself is four methods -
+    `_read`, `_write`, `_remove` and `_keys` - which a subclass keeping the
+    responses elsewhere replaces. A key starts with a tag of the owner its URL
+    names, so a write finds what it made stale from the keys alone, without
+    reading a single response.
+    """
+
+    def __init__(self, ttl: float = 0.0, ttls: Mapping[str, float] | None = None) -> None:
+        """Start a cache holding nothing.
+
+        Args:
+            ttl: Seconds a response is reused for without asking the server, for
+                an endpoint no pattern of `ttls` matches. Zero revalidates every
+                response.
+            ttls: Seconds a response is reused for, keyed by an `fnmatch`
+                pattern matched against the endpoint's path under the API root,
+                such as `repos/*/*/labels`. The first pattern matching wins.
+
+        """
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self._entries: dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Count the responses held.
+
+        Returns:
+            The number of responses held.
+
+        """
+        return sum(1 for _ in self._keys())
+
+    @staticmethod
+    def key(method: str, url: str, params: Any, headers: dict[str, Any]) -> str | None:
+        """Build the key a request is cached under.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The full URL of the request.
+            params: The query parameters of the request, as passed to the session.
+            headers: The headers the request is sent with.
+
+        Returns:
+            The key - the tag of the owner the URL names, a dash and a digest of
+            the request - or None when the request is not one to cache: it is
+            not a `GET`, or the caller is validating it itself.
+
+        """
+        if method.upper() != "GET":
+            return None
+        requested = CaseInsensitiveDict(headers)
+        if any(name in requested for name in _VALIDATOR_HEADERS):
+            return None
+
+        authorization = str(requested.get("Authorization", ""))
+        identity = [
+            url,
+            json.dumps(params, sort_keys=True, default=str),
+            hashlib.sha256(authorization.encode("utf-8")).hexdigest(),
+        ]
+        return f"{_scope_tag(url)}-{hashlib.sha256(json.dumps(identity).encode('utf-8')).hexdigest()}"
+
+    def ttl_for(self, url: str) -> float:
+        """Find how long a response for a URL is reused without asking the server.
+
+        Args:
+            url: The full URL of the request.
+
+        Returns:
+            The time to live of the first pattern of `ttls` matching the
+            endpoint, or `ttl` when none does.
+
+        """
+        endpoint = _endpoint(url)
+        for pattern, seconds in self.ttls.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return seconds
+        return self.ttl
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Report whether a response can be reused without asking the server.
+
+        Args:
+            entry: The response held.
+
+        Returns:
+            True while the response is younger than its endpoint's time to live.
+
+        """
+        return time.time() - entry.stored_at < self.ttl_for(entry.url)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up the response held for a request.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The response held for it, or None when there is none.
+
+        """
+        return self._read(key)
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Hold a response for a request, replacing any held before.
+
+        Args:
+            key: The key of the request.
+            entry: The response to hold.
+
+        """
+        self._write(key, entry)
+
+    def store(self, key: str, url: str, body: bytes, headers: Any) -> None:
+        """Hold a fresh response, when there is a way to use it again.
+
+        A response is held when it carries a validator to ask about it with, or
+        when its endpoint has a time to live to reuse it for. One with neither
+        could never be used again, so holding it would only cost space.
+
+        Args:
+            key: The key of the request.
+            url: The URL of the request.
+            body: The body the server sent.
+            headers: The headers the server sent, as a case-insensitive mapping.
+
+        """
+        kept = {name: str(headers[name]) for name in _KEPT_HEADERS if name in headers}
+        if "ETag" in kept or "Last-Modified" in kept or self.ttl_for(url) > 0:
+            self.put(key, CachedResponse(body=body, headers=kept, url=url, stored_at=time.time()))
+
+    def revalidated(self, key: str, entry: CachedResponse) -> None:
+        """Record that the server confirmed a held response is still current.
+
+        Its time to live then runs again from now.
+
+        Args:
+            key: The key of the request.
+            entry: The response the server confirmed.
+
+        """
+        self.put(key, replace(entry, stored_at=time.time()))
+
+    def invalidate(self, url: str) -> None:
+        """Drop what a successful write to a URL may have changed.
+
+        Args:
+            url: The full URL the write was made to.
+
+        """
+        tag = _scope_tag(url)
+        for key in list(self._keys()):
+            held, _, _ = key.partition("-")
+            if tag == _UNSCOPED or held in (tag, _UNSCOPED):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every response held."""
+        for key in list(self._keys()):
+            self._remove(key)
+
+    def _read(self, key: str) -> CachedResponse | None:
+        """Read the response held under a key.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The response, or None when there is none.
+
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        """Write a response under a key.
+
+        Args:
+            key: The key of the request.
+            entry: The response to hold.
+
+        """
+        with self._lock:
+            self._entries[key] = entry
+
+    def _remove(self, key: str) -> None:
+        """Remove the response held under a key, if there is one.
+
+        Args:
+            key: The key of the request.
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _keys(self) -> Iterator[str]:
+        """List the keys responses are held under.
+
+        Returns:
+            The keys, as they stood when asked.
+
+        """
+        with self._lock:
+            return iter(list(self._entries))
+
+
+class DiskResponseCache(ResponseCache):
+    """Store of responses kept as files, so that they outlive the process holding them.
+
+    Each response is one JSON file in the directory, named by its key and
+    written by renaming a temporary file over it, so a reader - in this process
+    or another - never sees half of one. Reading a response touches its file, and
+    writing one evicts the least recently touched files once the directory holds
+    more than `max_bytes`, so the directory cannot grow without bound. The size
+    held is counted from the directory once and then kept as a running total, so
+    only a write that takes it over the bound looks at every file again.
+
+    A file that cannot be read as a response is treated as no response and
+    removed, and a directory that cannot be written to is logged and otherwise
+    ignored: the cache only ever saves requests, so failing to keep one costs a
+    request rather than the command.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl: float = 0.0,
+        ttls: Mapping[str, float] | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Open a cache in a directory, which is created when first written to.
+
+        Args:
+            directory: Directory to keep the responses in.
+            ttl: Seconds a response is reused for without asking the server, for
+                an endpoint no pattern of `ttls` matches.
+            ttls: Seconds a response is reused for, keyed by an `fnmatch`
+                pattern matched against the endpoint's path under the API root.
+            max_bytes: Total size of the files kept before the least recently
+                used are evicted.
+
+        """
+        super().__init__(ttl=ttl, ttls=ttls)
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # Bytes the directory holds, or None until a write first counts them.
+        self._total: int | None = None
+
+    def _path(self, key: str) -> Path:
+        """Build the path of the file a response is kept in.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The path of its file.
+
+        """
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> CachedResponse | None:
+        """Read the response kept under a key, and mark it as recently used.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The response, or None when there is none or its file is unreadable.
+
+        """
+        path = self._path(key)
+        try:
+            document = json.loads(path.read_text(encoding="utf-8"))
+            entry = CachedResponse(
+                body=base64.b64decode(document["body"]),
+                headers={str(name): str(value) for name, value in document["headers"].items()},
+                url=str(document["url"]),
+                stored_at=float(document["stored_at"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.debug("Dropping the unreadable cached response at %s.", path)
+            with contextlib.suppress(OSError):
+                path.unlink(missing_ok=True)
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        """Write a response under a key, then evict down to the size bound.
+
+        Args:
+            key: The key of the request.
+            entry: The response to keep.
+
+        """
+        document = {
+            "url": entry.url,
+            "stored_at": entry.stored_at,
+            "headers": entry.headers,
+            "body": base64.b64encode(entry.body).decode("ascii"),
+        }
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=self.directory, prefix=f"{key}.", suffix=".tmp")
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as file:
+                    json.dump(document, file)
+                replaced = self._size(path)
+                os.replace(temporary, path)
+            finally:
+                Path(temporary).unlink(missing_ok=True)
+        except OSError as error:
+            logger.debug("Could not keep a response in %s: %s", self.directory, error)
+            return
+        if self._count(self._size(path) - replaced):
+            self._evict()
+
+    def _remove(self, key: str) -> None:
+        """Remove the file of the response kept under a key, if there is one.
+
+        Args:
+            key: The key of the request.
+
+        """
+        path = self._path(key)
+        size = self._size(path)
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+            with self._lock:
+                if self._total is not None:
+                    self._total = max(self._total - size, 0)
+
+    def _keys(self) -> Iterator[str]:
+        """List the keys responses are kept under.
+
+        Returns:
+            The keys of the files in the directory.
+
+        """
+        try:
+            return iter([path.stem for path in self.directory.glob("*.json")])
+        except OSError:
+            return iter([])
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        """Read the size of a file.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            Its size in bytes, or zero when there is no file to read it from.
+
+        """
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _files(self) -> list[tuple[float, int, Path]]:
+        """List the files the directory holds.
+
+        Returns:
+            The time each was last used, its size and its path.
+
+        """
+        files: list[tuple[float, int, Path]] = []
+        with contextlib.suppress(OSError):
+            for path in self.directory.glob("*.json"):
+                with contextlib.suppress(OSError):
+                    status = path.stat()
+                    files.append((status.st_mtime, status.st_size, path))
+        return files
+
+    def _count(self, change: int) -> bool:
+        """Add a change in size to the running total of the bytes held.
+
+        The first call counts the directory instead, which already holds the
+        change. A total then drifts only by what other processes write, and
+        `_evict` counts afresh whenever it runs.
+
+        Args:
+            change: Bytes added, or removed when negative.
+
+        Returns:
+            True when the directory now holds more than `max_bytes`.
+
+        """
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._files())
+            else:
+                self._total = max(self._total + change, 0)
+            return self._total > self.max_bytes
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until the rest fit in `max_bytes`."""
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink(missing_ok=True)
+                total -= size
+        with self._lock:
+            self._total = total
+
+
+class ReplayedResponse:
+    """A cached body handed back by the asynchronous client in place of asking the server.
+
+    It carries the parts of an `aiohttp` response that `process_async_response`,
+    `pagination_metadata` and the client read - the status, the headers and the
+    body - so the resource methods cannot tell it from the response it replays.
+    """
+
+    def __init__(self, entry: CachedResponse, url: str) -> None:
+        """Hold the cached response being replayed.
+
+        Args:
+            entry: The cached response.
+            url: The URL it is replayed for.
+
+        """
+        self.status = 200
+        self.url = url
+        self.headers = CaseInsensitiveDict(entry.headers)
+        self._body = entry.body
+
+    async def read(self) -> bytes:
+        """Read the cached body.
+
+        Returns:
+            The body the server first sent.
+
+        """
+        return self._body
+
+    def raise_for_status(self) -> None:
+        """Raise nothing: only a successful response is ever cached."""
+
+    def release(self) -> None:
+        """Release nothing: the replayed body holds no connection."""
@@ -0,0 +1,167 @@
+"""Merging identical requests that are in flight at the same time into one.
+
+Work fanned out over one client asks for the same thing several times at once:
+resolving where each of a dozen issues sits on a board lists the board's
+columns a dozen times, all before the first listing has come back. The client
+sends the first of those requests and makes every identical one that arrives
+while it is still in flight wait for its answer, instead of sending the same
+request again - a single flight.
+
+Only requests that read are merged, keyed as `gitea.client.cache.ResponseCache`
+keys them: the same `GET` of the same URL, with the same query parameters and
+the same credentials. A request arriving once the flight has landed is sent
+afresh, so this never serves anything older than the requests it merges. When
+the request fails, every request waiting on it fails with the same error.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+from gitea.client.cache import ResponseCache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# Arguments carrying a request body, which the key does not cover, so that a
+# request carrying one is always sent itself.
+_BODY_ARGUMENTS = frozenset({"data", "files", "json"})
+
+
+def flight_key(method: str, url: str, headers: dict[str, Any], **kwargs: Any) -> str | None:
+    """Build the key a request is merged with identical ones under.
+
+    Args:
+        method: The HTTP method of the request.
+        url: The full URL of the request.
+        headers: The headers the request is sent with.
+        **kwargs: The other arguments it is sent with.
+
+    Returns:
+        The key, or None when the request is not one to merge: it is not a
+        `GET`, it carries a body, or the caller is validating it itself.
+
+    """
+    if _BODY_ARGUMENTS & kwargs.keys():
+        return None
+    return ResponseCache.key(method, url, kwargs.get("params"), headers)
+
+
+class _Flight:
+    """One request in flight, and what the requests waiting on it are handed."""
+
+    def __init__(self) -> None:
+        """Start a flight with nothing landed yet."""
+        self.landed = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe merging of identical requests made from several threads."""
+
+    def __init__(self) -> None:
+        """Start with nothing in flight."""
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+
+    def do[T](self, key: str, call: Callable[[], T]) -> T:
+        """Make a call, or wait for the identical one already in flight.
+
+        Args:
+            key: What identifies the call; calls with equal keys are merged.
+            call: Makes the call, when no identical one is in flight.
+
+        Returns:
+            What the call returned, to this caller and to every one merged
+            with it.
+
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leading = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leading:
+            flight.landed.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = call()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.landed.set()
+        return flight.result
+
+
+class AsyncSingleFlight:
+    """Merging of identical requests made from several tasks on one event loop."""
+
+    def __init__(self) -> None:
+        """Start with nothing in flight."""
+        self._flights: dict[str, asyncio.Future[Any]] = {}
+        self._waiting: dict[str, int] = {}
+
+    async def do[T](
+        self, key: str, call: Callable[[], Awaitable[T]], share: Callable[[T], Awaitable[Any]] | None = None
+    ) -> T:
+        """Make a call, or wait for the identical one already in flight.
+
+        A task leading a flight that is cancelled cancels only itself: the
+        tasks waiting on it find the flight cancelled, and the first of them
+        leads a new one.
+
+        Args:
+            key: What identifies the call; calls with equal keys are merged.
+            call: Makes the call, when no identical one is in flight.
+            share: Readies what the call returned to be handed to more than one
+                task - an `aiohttp` response has its body read, which only one
+                task may do. Awaited only when some task is waiting.
+
+        Returns:
+            What the call returned, to this task and to every one merged with
+            it.
+
+        """
+        while (pending := self._flights.get(key)) is not None:
+            self._waiting[key] = self._waiting.get(key, 0) + 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+            finally:
+                self._waiting[key] -= 1
+                if not self._waiting[key]:
+                    del self._waiting[key]
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._flights[key] = future
+        try:
+            result = await call()
+            if share is not None and self._waiting.get(key):
+                await share(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Retrieve it here, so a flight no task was waiting on is not
+            # reported as an exception nobody retrieved.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._flights[key]
+        return result
@@ -2,23 +2,64 @@
 
 from __future__ import annotations
 
-from typing import Any, Self
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any, Self
 
 import requests
 from requests import Response
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 from gitea.client.base import Client
+from gitea.client.flight import SingleFlight, flight_key
+from gitea.client.retry import mark_retries
+
+if TYPE_CHECKING:
+    from gitea.client.cache import CachedResponse, ResponseCache
+    from gitea.client.limiter import RateLimiter
+    from gitea.client.retry import RetryPolicy
 
 
 class Gitea(Client):  # pylint: disable=too-few-public-methods
     """Synchronous Gitea API client."""
 
-    def __init__(self, token: str | None = None, base_url: str = "https://gitea.com") -> None:
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str = "https://gitea.com",
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        limiter: RateLimiter | None = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        coalesce: bool = True,
+    ) -> None:
         """Initialize the Gitea client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the Gitea instance.
+            cache: Cache to answer `GET` requests from while they are fresh, and
+                to revalidate them against once they are not, answering a `304`
+                with the body it holds. None sends every request afresh.
+            retry: Policy to send a request again under when the connection
+                fails or the instance answers with a transient error. None sends
+                each request once.
+            limiter: Rate limit and bound on requests in flight that every
+                request, and every retry of one, waits under. None sends each
+                as soon as it is made.
+            pool_connections: Hosts to keep a pool of connections to. The
+                client only ever talks to one, but a redirect may add another.
+            pool_maxsize: Connections kept alive to each host for reuse. A
+                client shared by more threads than this opens a new connection,
+                and pays its TCP and TLS handshake, for every request past it.
+            pool_block: Whether a thread finding every pooled connection in use
+                waits for one to be returned rather than opening another.
+            coalesce: Whether a `GET` made while an identical one is in flight
+                on another thread waits for that one's response rather than
+                being sent itself.
 
         """
         from gitea.comment.comment import Comment  # noqa: PLC0415
@@ -30,10 +71,19 @@ class Gitea(Client):  # pylint: disable=too-few-public-methods
         from gitea.project.project import Project  # noqa: PLC0415
         from gitea.pull_request.pull_request import PullRequest  # noqa: PLC0415
         from gitea.repository.repository import Repository  # noqa: PLC0415
+        from gitea.settings.settings import Settings  # noqa: PLC0415
         from gitea.user.user import User  # noqa: PLC0415
 
         super().__init__(token=token, base_url=base_url)
         self.session: requests.Session | None = None
+        self.cache = cache
+        self.retry = retry
+        self.limiter = limiter
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.coalesce = coalesce
+        self._flights = SingleFlight()
 
         # Resource handlers
         self.issue = Issue(client=self)
@@ -46,6 +96,7 @@ class Gitea(Client):  # pylint: disable=too-few-public-methods
         self.notification = Notification(client=self)
         self.project = Project(client=self)
         self.organization = Organization(client=self)
+        self.settings = Settings(client=self)
 
     def __str__(self) -> str:
         """Return a string representation of the Gitea client.
@@ -66,6 +117,11 @@ class Gitea(Client):  # pylint: disable=too-few-public-methods
         if self.session is not None:
             raise RuntimeError("Gitea session already open; do not re-enter context manager.")
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -103,12 +159,106 @@ class Gitea(Client):  # pylint: disable=too-few-public-methods
                 + "Use 'with Gitea(...) as client:' to ensure proper resource cleanup."
             )
         url = self._build_url(endpoint=endpoint)
-        response = self.session.request(
-            method, url, headers={**self.headers, **(headers or {})}, timeout=timeout, **kwargs
-        )
+        request_headers = {**self.headers, **(headers or {})}
+        session = self.session
+
+        flight = flight_key(method, url, request_headers, **kwargs) if self.coalesce else None
+        if flight is None:
+            return self._fetch(session, method, url, request_headers, timeout, **kwargs)
+        return self._flights.do(flight, lambda: self._fetch(session, method, url, request_headers, timeout, **kwargs))
+
+    def _fetch(
+        self, session: requests.Session, method: str, url: str, request_headers: dict, timeout: int, **kwargs: Any
+    ) -> Response:
+        """Answer a request from the cache, or send it and keep what it is answered with.
+
+        Args:
+            session: The session to send it on.
+            method: The HTTP method.
+            url: The full URL.
+            request_headers: The headers to send, credentials included.
+            timeout: Timeout for the request in seconds.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The HTTP response object.
+
+        """
+        cache = self.cache
+        key = cache.key(method, url, kwargs.get("params"), request_headers) if cache is not None else None
+        cached = cache.get(key) if cache is not None and key is not None else None
+        if cache is not None and cached is not None:
+            if cache.is_fresh(cached):
+                return self._replay(cached, url)
+            request_headers = {**request_headers, **cached.validators()}
+
+        response = self._send(session, method, url, headers=request_headers, timeout=timeout, **kwargs)
+        if cache is not None and cached is not None and key is not None and response.status_code == 304:  # noqa: PLR2004
+            response.close()
+            cache.revalidated(key, cached)
+            return self._replay(cached, url)
         try:
             response.raise_for_status()
         except Exception:
             response.close()
             raise
+        if cache is not None:
+            if key is not None and response.status_code == 200:  # noqa: PLR2004
+                cache.store(key, url, response.content, response.headers)
+            elif method.upper() != "GET":
+                cache.invalidate(url)
+        return response
+
+    def _send(self, session: requests.Session, method: str, url: str, **kwargs: Any) -> Response:
+        """Send a request, and send it again for as long as the retry policy allows.
+
+        Args:
+            session: The session to send it on.
+            method: The HTTP method.
+            url: The URL.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The last response, carrying the number of retries it took.
+
+        """
+        retry = self.retry
+        limiter = self.limiter
+        attempt = 1
+        while True:
+            try:
+                with limiter.slot() if limiter is not None else contextlib.nullcontext():
+                    response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if retry is None or not retry.allows(method, attempt):
+                    raise
+                wait = retry.delay(attempt)
+            else:
+                wait = None
+                if retry is not None and retry.retries_status(method, response.status_code, attempt):
+                    wait = retry.delay(attempt, response.headers.get("Retry-After"))
+                if wait is None:
+                    mark_retries(response, attempt - 1)
+                    return response
+                response.close()
+            time.sleep(wait)
+            attempt += 1
+
+    @staticmethod
+    def _replay(cached: CachedResponse, url: str) -> Response:
+        """Build the response handed back from the body the cache holds, in place of the server's.
+
+        Args:
+            cached: The cached response.
+            url: The URL it is replayed for.
+
+        Returns:
+            A `200` response carrying the cached body and headers.
+
+        """
+        response = Response()
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response._content = cached.body
         return response
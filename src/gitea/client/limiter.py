@@ -0,0 +1,207 @@
+"""Client-side bound on how fast, and how many at once, requests are sent.
+
+A walk fetching pages concurrently, or a watch fetching the comments of every
+issue in a pool, sends requests as fast as the instance answers them, and an
+instance with throttling of its own answers the excess with `429`. A client
+given a `RateLimiter` keeps under a budget instead:
+
+* **A rate.** A token bucket holding up to `burst` tokens, refilled at `rate`
+  a second, gives each request one. A request finding the bucket empty takes
+  its token anyway and waits for as long as the bucket needs to pay it back,
+  so requests queued behind an empty bucket leave it at the rate, in order,
+  rather than all retrying together once it refills.
+* **A number in flight.** At most `max_in_flight` requests are waiting on the
+  instance at any time. This is counted per limiter, separately for the
+  threads of synchronous clients and the tasks of asynchronous ones.
+
+Every resource handler of a client sends through the client, so one limiter
+covers all of them; handing the same limiter to several clients covers those
+too. A limiter given a `path` keeps its bucket in that file instead of in
+memory, read and written under the advisory lock of `gitea.utils.locks` that
+guards the watch cache too, so processes sharing the file share the rate. The number in flight
+is never shared between processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from gitea.utils.locks import drop_lock, lock_path_for, take_lock
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+logger = logging.getLogger("gitea")
+
+
+def _draw(tokens: float, elapsed: float, rate: float, burst: float) -> tuple[float, float]:
+    """Refill a token bucket and take one token from it.
+
+    Args:
+        tokens: Tokens the bucket held, negative while it is paying back a debt.
+        elapsed: Seconds since it last held that many.
+        rate: Tokens it refills by each second.
+        burst: Tokens it holds at most.
+
+    Returns:
+        The tokens it holds after the draw, and the seconds the request drawing
+        has to wait for the token it took.
+
+    """
+    tokens = min(burst, tokens + max(0.0, elapsed) * rate) - 1
+    return tokens, (-tokens / rate if tokens < 0 else 0.0)
+
+
+class RateLimiter:
+    """Token-bucket rate limit, and bound on requests in flight, for one or more clients."""
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        max_in_flight: int | None = None,
+        path: str | Path | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Requests a second, sustained. None leaves the rate unbounded.
+            burst: Requests sent back to back before the rate applies. Defaults
+                to one second's worth, and never less than one.
+            max_in_flight: Requests waiting on the instance at once. None
+                leaves the number unbounded.
+            path: File to keep the bucket in, shared with every process
+                limiting through the same file. None keeps it in memory.
+
+        Raises:
+            ValueError: If the rate or the number in flight is not positive.
+
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}.")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}.")
+
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else (rate or 1.0))
+        self.max_in_flight = max_in_flight
+        self.path = Path(path) if path is not None else None
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        self._async_in_flight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def reserve(self) -> float:
+        """Take a token for one request.
+
+        Returns:
+            Seconds the request has to wait before it is sent, zero when the
+            bucket had a token to spare.
+
+        """
+        if self.rate is None:
+            return 0.0
+        if self.path is not None:
+            return self._reserve_shared(self.path, self.rate)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _draw(self._tokens, now - self._stamp, self.rate, self.burst)
+            self._stamp = now
+            return wait
+
+    def _reserve_shared(self, path: Path, rate: float) -> float:
+        """Take a token from the bucket kept in a file, under its lock.
+
+        A bucket file that is missing or unreadable is a full bucket, so losing
+        it costs one burst rather than stopping every process sharing it.
+
+        Args:
+            path: The file the bucket is kept in.
+            rate: Tokens it refills by each second.
+
+        Returns:
+            Seconds the request has to wait before it is sent.
+
+        """
+        now = time.time()
+        lock = lock_path_for(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = os.open(lock, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as error:
+            logger.warning("Could not open the rate limit lock at %s (%s); limiting this process alone.", lock, error)
+            self.path = None
+            return self.reserve()
+
+        held = False
+        try:
+            with contextlib.suppress(OSError):
+                held = take_lock(handle)
+            try:
+                bucket = json.loads(path.read_text(encoding="utf-8"))
+                tokens, elapsed = float(bucket["tokens"]), now - float(bucket["stamp"])
+            except (OSError, ValueError, TypeError, KeyError):
+                tokens, elapsed = self.burst, 0.0
+            tokens, wait = _draw(tokens, elapsed, rate, self.burst)
+            with contextlib.suppress(OSError):
+                path.write_text(json.dumps({"tokens": tokens, "stamp": now}), encoding="utf-8")
+            return wait
+        finally:
+            if held:
+                with contextlib.suppress(OSError):
+                    drop_lock(handle)
+            os.close(handle)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Wait for a token and a free slot, and hold the slot for the block.
+
+        Yields:
+            Once the request may be sent.
+
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        if self._in_flight is None:
+            yield
+            return
+        with self._in_flight:
+            yield
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait for a token and a free slot without blocking the event loop.
+
+        Yields:
+            Once the request may be sent.
+
+        """
+        # A bucket kept in a file is reserved under a blocking file lock, which
+        # is waited for on a thread rather than on the event loop.
+        wait = await asyncio.to_thread(self.reserve) if self.path is not None else self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        if self.max_in_flight is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_in_flight.get(loop)
+        if semaphore is None:
+            semaphore = self._async_in_flight[loop] = asyncio.Semaphore(self.max_in_flight)
+        async with semaphore:
+            yield
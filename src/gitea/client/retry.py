@@ -0,0 +1,165 @@
+"""Retry policy shared by the synchronous and asynchronous clients.
+
+An instance under load answers some requests with `429 Too Many Requests`,
+`502 Bad Gateway`, `503 Service Unavailable` or `504 Gateway Timeout`, or drops
+the connection, and the same request a moment later succeeds. A client given a
+`RetryPolicy` sends such a request again rather than failing it, which is what
+lets a walk over hundreds of pages survive one bad second instead of starting
+over from page 1.
+
+Three decisions bound it:
+
+* **Only idempotent methods are retried by default.** A `GET`, `PUT` or
+  `DELETE` sent twice leaves the instance as sending it once does. A `POST` or
+  `PATCH` that failed on the way back may already have been applied, and
+  sending it again would create a second comment or apply an edit twice, so
+  those are retried only when the policy names them.
+* **The wait grows, and is spread.** Each retry waits twice as long as the one
+  before, up to `max_backoff`, less a random share of up to `jitter` of it, so
+  that several clients failing together do not come back together.
+* **The server's `Retry-After` wins.** A `429` or `503` saying how long to wait
+  is waited for - up to `max_retry_after`, past which the request is failed
+  rather than left hanging for as long as the server asks.
+
+How many times a response was retried is recorded on it, and read back by
+`retries_of`, so a resource method can report it in the metadata it returns.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+# Attribute a response carries the number of times it was retried under.
+_RETRIES_ATTRIBUTE = "gitea_retries"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When a failed request is sent again, and how long to wait before it is.
+
+    Attributes:
+        max_attempts: Times a request is sent at most, the first included. One
+            never retries.
+        backoff: Seconds waited before the first retry, doubled before each one
+            after it.
+        max_backoff: Seconds no wait computed from `backoff` grows past.
+        jitter: Share of each computed wait, from 0 to 1, that is taken off it
+            at random.
+        max_retry_after: Seconds of `Retry-After` honoured at most. A response
+            asking for longer is not retried.
+        statuses: Status codes that are retried.
+        methods: HTTP methods that are retried.
+
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: float = 0.5
+    max_retry_after: float = 60.0
+    statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 502, 503, 504}))
+    methods: frozenset[str] = field(default_factory=lambda: frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}))
+
+    def allows(self, method: str, attempt: int) -> bool:
+        """Report whether a request may be sent again after a failed attempt.
+
+        Args:
+            method: The HTTP method of the request.
+            attempt: The number of the attempt that failed, the first being 1.
+
+        Returns:
+            True when the method is retried and attempts remain.
+
+        """
+        return method.upper() in self.methods and attempt < self.max_attempts
+
+    def retries_status(self, method: str, status: int, attempt: int) -> bool:
+        """Report whether a response is one to send the request again for.
+
+        Args:
+            method: The HTTP method of the request.
+            status: The status code of the response.
+            attempt: The number of the attempt answered, the first being 1.
+
+        Returns:
+            True when the status is retried and `allows` the request again.
+
+        """
+        return status in self.statuses and self.allows(method, attempt)
+
+    def delay(self, attempt: int, retry_after: Any = None) -> float | None:
+        """Work out how long to wait before sending a request again.
+
+        Args:
+            attempt: The number of the attempt that failed, the first being 1.
+            retry_after: The `Retry-After` header of the response, if it had one.
+
+        Returns:
+            Seconds to wait, or None when the server asked for longer than
+            `max_retry_after` and the request should be failed instead.
+
+        """
+        asked = parse_retry_after(retry_after)
+        if asked is not None:
+            return asked if asked <= self.max_retry_after else None
+
+        computed = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return computed * (1 - self.jitter * random.random())  # noqa: S311
+
+
+def parse_retry_after(value: Any, now: datetime | None = None) -> float | None:
+    """Read a `Retry-After` header, in either of the forms HTTP allows.
+
+    Args:
+        value: The header: a number of seconds, or an HTTP date.
+        now: The time to measure a date against. Defaults to the current time.
+
+    Returns:
+        Seconds to wait, never negative, or None when the header is absent or
+        is neither form.
+
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    text = value.strip()
+    if text.isdigit():
+        return float(text)
+
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - (now or datetime.now(UTC))).total_seconds())
+
+
+def mark_retries(response: Any, retries: int) -> None:
+    """Record on a response how many times its request was retried.
+
+    Args:
+        response: The response finally handed back.
+        retries: Times the request was sent again before it.
+
+    """
+    setattr(response, _RETRIES_ATTRIBUTE, retries)
+
+
+def retries_of(response: Any) -> int:
+    """Read how many times a response's request was retried.
+
+    Args:
+        response: The response.
+
+    Returns:
+        The count recorded by `mark_retries`, or zero for a response without
+        one.
+
+    """
+    retries = getattr(response, _RETRIES_ATTRIBUTE, 0)
+    return retries if isinstance(retries, int) and not isinstance(retries, bool) else 0
@@ -8,7 +8,7 @@ from aiohttp import ClientResponse
 
 from gitea.comment.base import BaseComment
 from gitea.resource.async_resource import AsyncResource
-from gitea.utils.response import process_async_response
+from gitea.utils.response import pagination_metadata, process_async_response, response_metadata
 
 
 class AsyncComment(BaseComment, AsyncResource):
@@ -78,7 +78,10 @@ class AsyncComment(BaseComment, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _create_comment(
         self,
@@ -138,7 +141,7 @@ class AsyncComment(BaseComment, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _edit_comment(
         self,
@@ -198,7 +201,7 @@ class AsyncComment(BaseComment, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _delete_comment(
         self,
@@ -248,4 +251,4 @@ class AsyncComment(BaseComment, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
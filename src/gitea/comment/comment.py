@@ -8,7 +8,7 @@ from requests import Response
 
 from gitea.comment.base import BaseComment
 from gitea.resource.resource import Resource
-from gitea.utils.response import process_response
+from gitea.utils.response import pagination_metadata, process_response, response_metadata
 
 
 class Comment(BaseComment, Resource):
@@ -78,7 +78,10 @@ class Comment(BaseComment, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     def _create_comment(
         self,
@@ -138,7 +141,7 @@ class Comment(BaseComment, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _edit_comment(
         self,
@@ -198,7 +201,7 @@ class Comment(BaseComment, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _delete_comment(
         self,
@@ -248,4 +251,4 @@ class Comment(BaseComment, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from gitea.issue.async_issue import AsyncIssue
 from gitea.issue.issue import Issue
 from gitea.issue.project_column import (
+    AsyncBoardIndex,
+    BoardIndex,
     async_column_holds_card,
     column_holds_card,
     find_async_card_column_id,
@@ -14,7 +16,9 @@ from gitea.issue.project_column import (
 )
 
 __all__ = [
+    "AsyncBoardIndex",
     "AsyncIssue",
+    "BoardIndex",
     "Issue",
     "async_column_holds_card",
     "column_holds_card",
@@ -9,7 +9,7 @@ from requests import Response
 
 from gitea.issue.base import BaseIssue
 from gitea.resource.resource import Resource
-from gitea.utils.response import process_response
+from gitea.utils.response import pagination_metadata, process_response, response_metadata
 
 
 class Issue(BaseIssue, Resource):
@@ -133,7 +133,10 @@ class Issue(BaseIssue, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     def _get_issue(self, owner: str, repository: str, index: int, **kwargs: Any) -> Response:
         """Get a single issue by its index.
@@ -168,7 +171,7 @@ class Issue(BaseIssue, Resource):
         """
         response = self._get_issue(owner=owner, repository=repository, index=index, **kwargs)
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _edit_issue(
         self,
@@ -276,7 +279,7 @@ class Issue(BaseIssue, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _create_issue(
         self,
@@ -378,7 +381,7 @@ class Issue(BaseIssue, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _list_issue_dependencies(
         self,
@@ -444,7 +447,10 @@ class Issue(BaseIssue, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     def _create_issue_dependency(
         self,
@@ -516,7 +522,7 @@ class Issue(BaseIssue, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _remove_issue_dependency(
         self,
@@ -588,4 +594,4 @@ class Issue(BaseIssue, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
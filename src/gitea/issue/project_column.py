@@ -34,17 +34,37 @@ lists the issue. It is the answer to "has this issue a card on this project, and
 where" wherever that has to be told apart from "the board could not be read" -
 the project issue commands ask it before moving a card, because Gitea's move
 endpoint reports success without doing anything when there is no card to move.
+
+Each of those walks answers one question about one issue, so resolving twenty
+issues on one board walks the board twenty times. ``BoardIndex`` walks it once
+instead: it lists the columns, reads every column's issues - several columns at
+a time, on threads, or on tasks for ``AsyncBoardIndex`` - and answers where any
+issue sits from a map of the whole board. That walk never stops early, so it
+costs more than one walk finding a card in the first column, and is the one to
+use for more than one issue. The map is exactly as fresh as the walk. A caller
+that changes the board names the columns it changed with
+``BoardIndex.invalidate``, and those columns alone are read again at the next
+lookup.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import ClientError
 from requests import RequestException
 
-from gitea.utils.pagination import PAGE_SIZE, iter_async_pages, iter_pages
+from gitea.utils.pagination import (
+    async_listing_page_size,
+    collect_all_async_pages,
+    collect_all_pages,
+    iter_async_pages,
+    iter_pages,
+    listing_page_size,
+)
 
 if TYPE_CHECKING:
     from gitea.client.async_gitea import AsyncGitea
@@ -52,6 +72,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("gitea")
 
+# Most columns of a board a `BoardIndex` reads at once.
+BOARD_CONCURRENCY = 8
+
 
 def _lists_projects(issue: Any) -> bool:
     """Report whether an issue payload has projects to attach a column to.
@@ -123,6 +146,44 @@ def _holds_issue(issues: list[Any], issue_id: int) -> bool:
     return any(_identifier(issue) == issue_id for issue in issues)
 
 
+def _locate(columns: list[int], cards: dict[int, frozenset[int]]) -> dict[int, int]:
+    """Build the map of where each card on a board sits.
+
+    An issue listed by two columns - a board edited while it was read - is
+    placed in the first of them in board order, the column a walk stopping at
+    the first column holding it would have answered with.
+
+    Args:
+        columns: The IDs of the board's columns, in board order.
+        cards: The global IDs of the issues each column read lists, keyed by
+            column ID. Columns read without being among `columns` come last.
+
+    Returns:
+        The column ID of each issue on the board, keyed by its global ID.
+
+    """
+    listed = set(columns)
+    locations: dict[int, int] = {}
+    for column_id in [*columns, *(column_id for column_id in cards if column_id not in listed)]:
+        for issue_id in cards.get(column_id, ()):
+            locations.setdefault(issue_id, column_id)
+    return locations
+
+
+def _card_ids(issues: list[Any]) -> frozenset[int]:
+    """Collect the global IDs of the issues of a column's listing.
+
+    Args:
+        issues: The issues of the listing. An entry that is not an issue object
+            is skipped.
+
+    Returns:
+        The IDs.
+
+    """
+    return frozenset(issue_id for issue in issues if (issue_id := _identifier(issue)) is not None)
+
+
 _LOOKUP_FAILED = "Could not resolve the column of issue %s on project %s, reporting it as null: %s"
 
 # aiohttp raises its total timeout as a bare asyncio.TimeoutError, which is the
@@ -217,7 +278,7 @@ def find_card_column_id(
             repository=repository,
             project_id=project_id,
             page=page,
-            limit=PAGE_SIZE,
+            limit=listing_page_size(client),
         )
     ):
         for column in columns:
@@ -271,7 +332,7 @@ def column_holds_card(
             project_id=project_id,
             column_id=column_id,
             page=page,
-            limit=PAGE_SIZE,
+            limit=listing_page_size(client),
         )
     ):
         if _holds_issue(issues, issue_id):
@@ -279,6 +340,184 @@ def column_holds_card(
     return False
 
 
+class BoardIndex:
+    """Where every card on one project's board sits, from one walk of the board.
+
+    Nothing is read until the first lookup. That lookup lists the columns and
+    reads the issues of all of them, up to `concurrency` columns at a time on a
+    pool of threads, so the client has to be safe to share between threads -
+    `Gitea` is. After that, every lookup is answered from the map, without a
+    request, until `invalidate` marks part of the board as changed.
+
+    A lookup that fails raises what the listing raised and leaves the columns it
+    did not read marked for reading, so the next lookup tries them again.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Gitea,
+        owner: str,
+        repository: str | None,
+        project_id: int,
+        concurrency: int = BOARD_CONCURRENCY,
+    ) -> None:
+        """Initialize the index of a board not read yet.
+
+        Args:
+            client: The Gitea client used for the listings.
+            owner: The owner of the repository or organization holding the project.
+            repository: The name of the repository holding the project, or None
+                for an organization project.
+            project_id: The ID of the project.
+            concurrency: Most columns to read at once.
+
+        """
+        self.client = client
+        self.owner = owner
+        self.repository = repository
+        self.project_id = project_id
+        self.concurrency = max(1, concurrency)
+        self._columns: list[int] | None = None
+        self._cards: dict[int, frozenset[int]] = {}
+        self._stale: set[int] = set()
+        self._locations: dict[int, int] = {}
+
+    @property
+    def columns(self) -> list[int]:
+        """The IDs of the board's columns, in board order, reading the board if need be."""
+        self._refresh()
+        return list(self._columns or ())
+
+    def column_of(self, issue_id: int) -> int | None:
+        """Look up the column holding an issue's card.
+
+        Args:
+            issue_id: The global ID of the issue.
+
+        Returns:
+            The ID of the column holding the card, or None when no column of
+            the board holds one.
+
+        """
+        self._refresh()
+        return self._locations.get(issue_id)
+
+    def holds(self, column_id: int, issue_id: int) -> bool:
+        """Report whether one column holds an issue's card.
+
+        Only this column is read, when it is marked as changed or has not been
+        read yet, which is what reading a card back after a move costs. A
+        column the board does not list is read all the same, and kept alongside
+        the board's own.
+
+        Args:
+            column_id: The ID of the column.
+            issue_id: The global ID of the issue.
+
+        Returns:
+            True when a card for the issue is in that column.
+
+        """
+        if column_id in self._stale or column_id not in self._cards:
+            self._cards[column_id] = self._read_column(column_id)
+            self._stale.discard(column_id)
+            self._locations = _locate(self._columns or [], self._cards)
+        return issue_id in self._cards[column_id]
+
+    def refresh(self) -> None:
+        """Read now what the next lookup would: the board, or the columns marked as changed.
+
+        A caller sharing the index between threads reads it here first, so the
+        lookups those threads make are answered from the map alone.
+        """
+        self._refresh()
+
+    def invalidate(self, *column_ids: int) -> None:
+        """Mark part of the board as changed, to be read again at the next lookup.
+
+        Args:
+            *column_ids: The columns that changed - the one a card left and the
+                one it went to. None marks the whole board, its list of columns
+                included.
+
+        """
+        if column_ids:
+            self._stale.update(column_ids)
+            return
+        self._columns = None
+        self._cards.clear()
+        self._stale.clear()
+        self._locations = {}
+
+    def _list_column_ids(self) -> list[int]:
+        """List the IDs of the board's columns.
+
+        Returns:
+            The IDs, in board order.
+
+        """
+        columns, _ = collect_all_pages(
+            lambda page: self.client.project.list_project_columns(
+                owner=self.owner,
+                repository=self.repository,
+                project_id=self.project_id,
+                page=page,
+                limit=listing_page_size(self.client),
+            )
+        )
+        return [column_id for column in columns if (column_id := _identifier(column)) is not None]
+
+    def _read_column(self, column_id: int) -> frozenset[int]:
+        """Read which issues one column holds cards for.
+
+        Args:
+            column_id: The ID of the column.
+
+        Returns:
+            The global IDs of the issues.
+
+        """
+        issues, _ = collect_all_pages(
+            lambda page: self.client.project.list_project_column_issues(
+                owner=self.owner,
+                repository=self.repository,
+                project_id=self.project_id,
+                column_id=column_id,
+                page=page,
+                limit=listing_page_size(self.client),
+            )
+        )
+        return _card_ids(issues)
+
+    def _refresh(self) -> None:
+        """Read the columns not read yet, and the ones marked as changed."""
+        if self._columns is None:
+            self._columns = self._list_column_ids()
+            self._stale.update(self._columns)
+        if not self._stale:
+            return
+
+        stale = sorted(self._stale)
+        if self.concurrency == 1 or len(stale) == 1:
+            for column_id in stale:
+                self._cards[column_id] = self._read_column(column_id)
+                self._stale.discard(column_id)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.concurrency, len(stale)), thread_name_prefix="gitea-board"
+            ) as pool:
+                futures = {column_id: pool.submit(self._read_column, column_id) for column_id in stale}
+                try:
+                    for column_id, future in futures.items():
+                        self._cards[column_id] = future.result()
+                        self._stale.discard(column_id)
+                finally:
+                    for future in futures.values():
+                        future.cancel()
+        self._locations = _locate(self._columns, self._cards)
+
+
 async def resolve_async_project_column_ids(
     *,
     client: AsyncGitea,
@@ -355,13 +594,14 @@ async def find_async_card_column_id(
         project lists it.
 
     """
+    size = await async_listing_page_size(client)
     async for columns, _ in iter_async_pages(
         lambda page: client.project.list_project_columns(
             owner=owner,
             repository=repository,
             project_id=project_id,
             page=page,
-            limit=PAGE_SIZE,
+            limit=size,
         )
     ):
         for column in columns:
@@ -404,6 +644,7 @@ async def async_column_holds_card(
         True when a card for the issue is in that column.
 
     """
+    size = await async_listing_page_size(client)
     async for issues, _ in iter_async_pages(
         lambda page: client.project.list_project_column_issues(
             owner=owner,
@@ -411,9 +652,176 @@ async def async_column_holds_card(
             project_id=project_id,
             column_id=column_id,
             page=page,
-            limit=PAGE_SIZE,
+            limit=size,
         )
     ):
         if _holds_issue(issues, issue_id):
             return True
     return False
+
+
+class AsyncBoardIndex:
+    """Where every card on one project's board sits, from one walk of the board.
+
+    The asynchronous twin of `BoardIndex`, reading up to `concurrency` columns
+    at a time on tasks. A lookup that fails cancels the columns still being
+    read, and leaves them marked for reading.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncGitea,
+        owner: str,
+        repository: str | None,
+        project_id: int,
+        concurrency: int = BOARD_CONCURRENCY,
+    ) -> None:
+        """Initialize the index of a board not read yet.
+
+        Args:
+            client: The asynchronous Gitea client used for the listings.
+            owner: The owner of the repository or organization holding the project.
+            repository: The name of the repository holding the project, or None
+                for an organization project.
+            project_id: The ID of the project.
+            concurrency: Most columns to read at once.
+
+        """
+        self.client = client
+        self.owner = owner
+        self.repository = repository
+        self.project_id = project_id
+        self.concurrency = max(1, concurrency)
+        self._columns: list[int] | None = None
+        self._cards: dict[int, frozenset[int]] = {}
+        self._stale: set[int] = set()
+        self._locations: dict[int, int] = {}
+
+    async def columns(self) -> list[int]:
+        """List the IDs of the board's columns, reading the board if need be.
+
+        Returns:
+            The IDs, in board order.
+
+        """
+        await self._refresh()
+        return list(self._columns or ())
+
+    async def column_of(self, issue_id: int) -> int | None:
+        """Look up the column holding an issue's card.
+
+        Args:
+            issue_id: The global ID of the issue.
+
+        Returns:
+            The ID of the column holding the card, or None when no column of
+            the board holds one.
+
+        """
+        await self._refresh()
+        return self._locations.get(issue_id)
+
+    async def holds(self, column_id: int, issue_id: int) -> bool:
+        """Report whether one column holds an issue's card.
+
+        Only this column is read, as `BoardIndex.holds` reads it.
+
+        Args:
+            column_id: The ID of the column.
+            issue_id: The global ID of the issue.
+
+        Returns:
+            True when a card for the issue is in that column.
+
+        """
+        if column_id in self._stale or column_id not in self._cards:
+            self._cards[column_id] = await self._read_column(column_id, asyncio.Semaphore(1))
+            self._stale.discard(column_id)
+            self._locations = _locate(self._columns or [], self._cards)
+        return issue_id in self._cards[column_id]
+
+    async def refresh(self) -> None:
+        """Read now what the next lookup would: the board, or the columns marked as changed."""
+        await self._refresh()
+
+    def invalidate(self, *column_ids: int) -> None:
+        """Mark part of the board as changed, to be read again at the next lookup.
+
+        Args:
+            *column_ids: The columns that changed. None marks the whole board,
+                its list of columns included.
+
+        """
+        if column_ids:
+            self._stale.update(column_ids)
+            return
+        self._columns = None
+        self._cards.clear()
+        self._stale.clear()
+        self._locations = {}
+
+    async def _list_column_ids(self) -> list[int]:
+        """List the IDs of the board's columns.
+
+        Returns:
+            The IDs, in board order.
+
+        """
+        size = await async_listing_page_size(self.client)
+        columns, _ = await collect_all_async_pages(
+            lambda page: self.client.project.list_project_columns(
+                owner=self.owner,
+                repository=self.repository,
+                project_id=self.project_id,
+                page=page,
+                limit=size,
+            )
+        )
+        return [column_id for column in columns if (column_id := _identifier(column)) is not None]
+
+    async def _read_column(self, column_id: int, slots: asyncio.Semaphore) -> frozenset[int]:
+        """Read which issues one column holds cards for.
+
+        Args:
+            column_id: The ID of the column.
+            slots: The semaphore bounding the columns read at once.
+
+        Returns:
+            The global IDs of the issues.
+
+        """
+        size = await async_listing_page_size(self.client)
+        async with slots:
+            issues, _ = await collect_all_async_pages(
+                lambda page: self.client.project.list_project_column_issues(
+                    owner=self.owner,
+                    repository=self.repository,
+                    project_id=self.project_id,
+                    column_id=column_id,
+                    page=page,
+                    limit=size,
+                )
+            )
+        return _card_ids(issues)
+
+    async def _refresh(self) -> None:
+        """Read the columns not read yet, and the ones marked as changed."""
+        if self._columns is None:
+            self._columns = await self._list_column_ids()
+            self._stale.update(self._columns)
+        if not self._stale:
+            return
+
+        stale = sorted(self._stale)
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks = {column_id: asyncio.ensure_future(self._read_column(column_id, slots)) for column_id in stale}
+        try:
+            for column_id, task in tasks.items():
+                self._cards[column_id] = await task
+                self._stale.discard(column_id)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        self._locations = _locate(self._columns, self._cards)
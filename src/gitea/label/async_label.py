@@ -8,7 +8,7 @@ from aiohttp import ClientResponse
 
 from gitea.label.base import BaseLabel
 from gitea.resource.async_resource import AsyncResource
-from gitea.utils.response import process_async_response
+from gitea.utils.response import pagination_metadata, process_async_response, response_metadata
 
 
 class AsyncLabel(BaseLabel, AsyncResource):
@@ -72,7 +72,10 @@ class AsyncLabel(BaseLabel, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _create_label(
         self,
@@ -138,7 +141,7 @@ class AsyncLabel(BaseLabel, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _edit_label(
         self,
@@ -210,7 +213,7 @@ class AsyncLabel(BaseLabel, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _delete_label(
         self,
@@ -260,4 +263,4 @@ class AsyncLabel(BaseLabel, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -8,7 +8,7 @@ from requests import Response
 
 from gitea.label.base import BaseLabel
 from gitea.resource.resource import Resource
-from gitea.utils.response import process_response
+from gitea.utils.response import pagination_metadata, process_response, response_metadata
 
 
 class Label(BaseLabel, Resource):
@@ -72,7 +72,10 @@ class Label(BaseLabel, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     def _create_label(
         self,
@@ -138,7 +141,7 @@ class Label(BaseLabel, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _edit_label(
         self,
@@ -210,7 +213,7 @@ class Label(BaseLabel, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _delete_label(
         self,
@@ -260,4 +263,4 @@ class Label(BaseLabel, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -9,7 +9,7 @@ from aiohttp import ClientResponse
 
 from gitea.milestone.base import BaseMilestone
 from gitea.resource.async_resource import AsyncResource
-from gitea.utils.response import process_async_response
+from gitea.utils.response import pagination_metadata, process_async_response, response_metadata
 
 
 class AsyncMilestone(BaseMilestone, AsyncResource):
@@ -85,7 +85,10 @@ class AsyncMilestone(BaseMilestone, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _create_milestone(
         self,
@@ -157,4 +160,4 @@ class AsyncMilestone(BaseMilestone, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
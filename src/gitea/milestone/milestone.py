@@ -9,7 +9,7 @@ from requests import Response
 
 from gitea.milestone.base import BaseMilestone
 from gitea.resource.resource import Resource
-from gitea.utils.response import process_response
+from gitea.utils.response import pagination_metadata, process_response, response_metadata
 
 
 class Milestone(BaseMilestone, Resource):
@@ -85,7 +85,10 @@ class Milestone(BaseMilestone, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     def _create_milestone(
         self,
@@ -157,4 +160,4 @@ class Milestone(BaseMilestone, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -9,7 +9,7 @@ from aiohttp import ClientResponse
 
 from gitea.notification.base import BaseNotification
 from gitea.resource.async_resource import AsyncResource
-from gitea.utils.response import process_async_response
+from gitea.utils.response import pagination_metadata, process_async_response, response_metadata
 
 
 class AsyncNotification(BaseNotification, AsyncResource):
@@ -91,7 +91,10 @@ class AsyncNotification(BaseNotification, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _list_repo_notifications(
         self,
@@ -181,7 +184,10 @@ class AsyncNotification(BaseNotification, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _read_notifications(
         self,
@@ -241,7 +247,7 @@ class AsyncNotification(BaseNotification, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), response_metadata(response, status_code)
 
     async def _read_repo_notifications(
         self,
@@ -313,7 +319,7 @@ class AsyncNotification(BaseNotification, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), response_metadata(response, status_code)
 
     async def _get_notification_thread(
         self,
@@ -350,7 +356,7 @@ class AsyncNotification(BaseNotification, AsyncResource):
         """
         response = await self._get_notification_thread(thread_id=thread_id, **kwargs)
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _read_notification_thread(
         self,
@@ -398,7 +404,7 @@ class AsyncNotification(BaseNotification, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _new_notifications(
         self,
@@ -431,4 +437,4 @@ class AsyncNotification(BaseNotification, AsyncResource):
         """
         response = await self._new_notifications(**kwargs)
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
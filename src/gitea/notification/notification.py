@@ -9,7 +9,7 @@ from requests import Response
 
 from gitea.notification.base import BaseNotification
 from gitea.resource.resource import Resource
-from gitea.utils.response import process_response
+from gitea.utils.response import pagination_metadata, process_response, response_metadata
 
 
 class Notification(BaseNotification, Resource):
@@ -91,7 +91,10 @@ class Notification(BaseNotification, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     def _list_repo_notifications(
         self,
@@ -181,7 +184,10 @@ class Notification(BaseNotification, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     def _read_notifications(
         self,
@@ -241,7 +247,7 @@ class Notification(BaseNotification, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), response_metadata(response, status_code)
 
     def _read_repo_notifications(
         self,
@@ -313,7 +319,7 @@ class Notification(BaseNotification, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), response_metadata(response, status_code)
 
     def _get_notification_thread(
         self,
@@ -350,7 +356,7 @@ class Notification(BaseNotification, Resource):
         """
         response = self._get_notification_thread(thread_id=thread_id, **kwargs)
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _read_notification_thread(
         self,
@@ -398,7 +404,7 @@ class Notification(BaseNotification, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _new_notifications(
         self,
@@ -431,4 +437,4 @@ class Notification(BaseNotification, Resource):
         """
         response = self._new_notifications(**kwargs)
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -8,7 +8,7 @@ from requests import Response
 
 from gitea.organization.base import BaseOrganization
 from gitea.resource.resource import Resource
-from gitea.utils.response import process_response
+from gitea.utils.response import pagination_metadata, process_response, response_metadata
 
 
 class Organization(Resource, BaseOrganization):
@@ -66,4 +66,7 @@ class Organization(Resource, BaseOrganization):
             **kwargs,
         )
         data, status_code = process_response(response=response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
@@ -9,7 +9,7 @@ from aiohttp import ClientResponse
 from gitea.project.base import BaseProject
 from gitea.resource.async_resource import AsyncResource
 from gitea.utils.fields import ProjectColumn, as_records
-from gitea.utils.response import process_async_response
+from gitea.utils.response import pagination_metadata, process_async_response, response_metadata
 
 
 class AsyncProject(BaseProject, AsyncResource):
@@ -79,7 +79,10 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _get_project(
         self,
@@ -133,7 +136,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _create_project(
         self,
@@ -205,7 +208,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _edit_project(
         self,
@@ -283,7 +286,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _delete_project(
         self,
@@ -337,7 +340,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _list_project_columns(
         self,
@@ -405,7 +408,10 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], as_records(data, ProjectColumn)), {"status_code": status_code}
+        return cast(list[dict[str, Any]], as_records(data, ProjectColumn)), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _create_project_column(
         self,
@@ -473,7 +479,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], as_records(data, ProjectColumn)), {"status_code": status_code}
+        return cast(dict[str, Any], as_records(data, ProjectColumn)), response_metadata(response, status_code)
 
     async def _get_project_column(
         self,
@@ -535,7 +541,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], as_records(data, ProjectColumn)), {"status_code": status_code}
+        return cast(dict[str, Any], as_records(data, ProjectColumn)), response_metadata(response, status_code)
 
     async def _edit_project_column(
         self,
@@ -615,7 +621,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], as_records(data, ProjectColumn)), {"status_code": status_code}
+        return cast(dict[str, Any], as_records(data, ProjectColumn)), response_metadata(response, status_code)
 
     async def _delete_project_column(
         self,
@@ -675,7 +681,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _set_default_project_column(
         self,
@@ -735,7 +741,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _move_project_columns(
         self,
@@ -795,7 +801,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _list_project_column_issues(
         self,
@@ -867,7 +873,10 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
 
     async def _add_issue_to_project_column(
         self,
@@ -933,7 +942,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _remove_issue_from_project_column(
         self,
@@ -999,7 +1008,7 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _move_project_issue(
         self,
@@ -1071,4 +1080,4 @@ class AsyncProject(BaseProject, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
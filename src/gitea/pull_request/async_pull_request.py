@@ -8,7 +8,7 @@ from aiohttp import ClientResponse
 
 from gitea.pull_request.base import BasePullRequest
 from gitea.resource.async_resource import AsyncResource
-from gitea.utils.response import process_async_response
+from gitea.utils.response import pagination_metadata, process_async_response, response_metadata
 
 
 class AsyncPullRequest(BasePullRequest, AsyncResource):
@@ -117,4 +117,7 @@ class AsyncPullRequest(BasePullRequest, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
@@ -8,7 +8,7 @@ from aiohttp import ClientResponse
 
 from gitea.repository.base import BaseRepository
 from gitea.resource.async_resource import AsyncResource
-from gitea.utils.response import process_async_response
+from gitea.utils.response import pagination_metadata, process_async_response, response_metadata
 
 
 class AsyncRepository(AsyncResource, BaseRepository):
@@ -72,4 +72,7 @@ class AsyncRepository(AsyncResource, BaseRepository):
             **kwargs,
         )
         data, status_code = await process_async_response(response=response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
@@ -8,7 +8,7 @@ from requests import Response
 
 from gitea.repository.base import BaseRepository
 from gitea.resource.resource import Resource
-from gitea.utils.response import process_response
+from gitea.utils.response import pagination_metadata, process_response, response_metadata
 
 
 class Repository(Resource, BaseRepository):
@@ -72,4 +72,7 @@ class Repository(Resource, BaseRepository):
             **kwargs,
         )
         data, status_code = process_response(response=response, default=[])
-        return cast(list[dict[str, Any]], data), {"status_code": status_code}
+        return cast(list[dict[str, Any]], data), {
+            **response_metadata(response, status_code),
+            **pagination_metadata(response),
+        }
@@ -0,0 +1,8 @@
+"""Settings package."""
+
+from __future__ import annotations
+
+from gitea.settings.async_settings import AsyncSettings
+from gitea.settings.settings import Settings
+
+__all__ = ["AsyncSettings", "Settings"]
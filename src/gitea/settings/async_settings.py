@@ -0,0 +1,44 @@
+"""Asynchronous Gitea Settings resource."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from aiohttp import ClientResponse
+
+from gitea.resource.async_resource import AsyncResource
+from gitea.settings.base import BaseSettings
+from gitea.utils.response import process_async_response, response_metadata
+
+
+class AsyncSettings(AsyncResource, BaseSettings):
+    """Asynchronous Gitea Settings resource."""
+
+    async def _get_api_settings(self, **kwargs: Any) -> ClientResponse:
+        """Get the API settings of the instance.
+
+        Args:
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The HTTP response object.
+
+        """
+        endpoint = self._get_api_settings_endpoint()
+        return await self._get(endpoint=endpoint, **kwargs)
+
+    async def get_api_settings(self, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Get the API settings of the instance.
+
+        Args:
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A tuple containing the settings - `max_response_items`,
+            `default_paging_num`, `default_git_trees_per_page` and
+            `default_max_blob_size` - and a dictionary with metadata.
+
+        """
+        response = await self._get_api_settings(**kwargs)
+        data, status_code = await process_async_response(response, default={})
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -0,0 +1,23 @@
+"""Base class for Gitea Settings resource.
+
+An instance reports the limits its API serves listings under at
+`/settings/api`: `max_response_items`, the most items one page may hold however
+large a `limit` is asked for, and `default_paging_num`, the size of a page asked
+for with no `limit` at all. Both are set in the instance's `app.ini`, so they
+differ from one instance to the next.
+"""
+
+from __future__ import annotations
+
+
+class BaseSettings:
+    """Base class for Gitea Settings resource."""
+
+    def _get_api_settings_endpoint(self) -> str:
+        """Get the endpoint for the API settings of the instance.
+
+        Returns:
+            The API endpoint for the API settings.
+
+        """
+        return "/settings/api"
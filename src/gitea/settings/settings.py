@@ -0,0 +1,44 @@
+"""Gitea Settings resource."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from requests import Response
+
+from gitea.resource.resource import Resource
+from gitea.settings.base import BaseSettings
+from gitea.utils.response import process_response, response_metadata
+
+
+class Settings(Resource, BaseSettings):
+    """Gitea Settings resource."""
+
+    def _get_api_settings(self, **kwargs: Any) -> Response:
+        """Get the API settings of the instance.
+
+        Args:
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The HTTP response object.
+
+        """
+        endpoint = self._get_api_settings_endpoint()
+        return self._get(endpoint=endpoint, **kwargs)
+
+    def get_api_settings(self, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Get the API settings of the instance.
+
+        Args:
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A tuple containing the settings - `max_response_items`,
+            `default_paging_num`, `default_git_trees_per_page` and
+            `default_max_blob_size` - and a dictionary with metadata.
+
+        """
+        response = self._get_api_settings(**kwargs)
+        data, status_code = process_response(response, default={})
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -8,7 +8,7 @@ from aiohttp import ClientResponse
 
 from gitea.resource.async_resource import AsyncResource
 from gitea.user.base import BaseUser
-from gitea.utils.response import process_async_response
+from gitea.utils.response import process_async_response, response_metadata
 
 
 class AsyncUser(BaseUser, AsyncResource):
@@ -41,7 +41,7 @@ class AsyncUser(BaseUser, AsyncResource):
         """
         response = await self._get_user(username=username, **kwargs)
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     async def _update_user_settings(
         self,
@@ -126,4 +126,4 @@ class AsyncUser(BaseUser, AsyncResource):
             **kwargs,
         )
         data, status_code = await process_async_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
@@ -8,7 +8,7 @@ from requests import Response
 
 from gitea.resource.resource import Resource
 from gitea.user.base import BaseUser
-from gitea.utils.response import process_response
+from gitea.utils.response import process_response, response_metadata
 
 
 class User(BaseUser, Resource):
@@ -41,7 +41,7 @@ class User(BaseUser, Resource):
         """
         response = self._get_user(username=username, **kwargs)
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
 
     def _update_user_settings(
         self,
@@ -109,4 +109,4 @@ class User(BaseUser, Resource):
             **kwargs,
         )
         data, status_code = process_response(response, default={})
-        return cast(dict[str, Any], data), {"status_code": status_code}
+        return cast(dict[str, Any], data), response_metadata(response, status_code)
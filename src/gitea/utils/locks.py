@@ -0,0 +1,91 @@
+"""Advisory file locks shared by everything the package keeps on disk.
+
+The watch cache and a rate limiter's shared bucket are both read, changed and
+written back by processes that may run at once, and both guard that with an
+exclusive advisory lock taken through the operating system on a lock file kept
+beside the file they guard.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# The advisory-lock call differs by platform and neither module exists on the
+# other, so both are imported for whichever is here. A platform offering
+# neither leaves the critical section unlocked rather than unusable.
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - POSIX has no msvcrt
+    msvcrt = None  # type: ignore[assignment]
+
+
+def lock_path_for(path: str | Path) -> Path:
+    """Build the path of the lock file guarding one file.
+
+    The lock is taken on a file of its own rather than on the file it guards,
+    because that file is replaced by a rename: a lock held on the file that was
+    there is not held on the file that replaces it, and two processes would end
+    up locking two different files while believing they had the same one.
+
+    Args:
+        path: Path of the file to guard.
+
+    Returns:
+        Path of the lock file beside it.
+
+    """
+    path = Path(path)
+    return path.with_name(f"{path.name}.lock")
+
+
+def take_lock(handle: int) -> bool:
+    """Take the exclusive advisory lock on an open lock file, waiting for it.
+
+    Args:
+        handle: File descriptor of the open lock file.
+
+    Returns:
+        True when the lock was taken, and False when this build of Python offers
+        no call to take one with - which is reported rather than pretended,
+        since a caller told the lock is held would believe the critical section
+        is guarded.
+
+    Raises:
+        OSError: If the lock cannot be taken - the filesystem does not support
+            locking, or the wait ran out on Windows.
+
+    """
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        return True
+    if msvcrt is not None:
+        # Windows locks a byte range rather than the file, and from the current
+        # position, so the range is pinned to the first byte of an empty file.
+        os.lseek(handle, 0, os.SEEK_SET)
+        msvcrt.locking(handle, msvcrt.LK_LOCK, 1)
+        return True
+    return False
+
+
+def drop_lock(handle: int) -> None:
+    """Release the exclusive advisory lock on an open lock file.
+
+    Closing the descriptor releases it too, on both platforms and when the
+    process dies without closing anything, so this only makes the release
+    explicit.
+
+    Args:
+        handle: File descriptor of the open lock file.
+
+    """
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        os.lseek(handle, 0, os.SEEK_SET)
+        msvcrt.locking(handle, msvcrt.LK_UNLCK, 1)
@@ -28,9 +28,10 @@ items do belong to the listing:
   the yardstick rather than the requested limit, because an instance may cap the
   page size below what was asked for.
 * **The response says so.** `page_count` and `has_more` in a page's metadata are
-  honoured when a caller reports them - Gitea sends the equivalent as headers on
-  every page - and ignored when it does not, so this costs nothing to the
-  callers that report neither. A page count has to be positive to be read as
+  honoured when a caller reports them - every `list_*` method carries them over
+  from the headers Gitea sends with each page, through
+  `gitea.utils.response.pagination_metadata` - and ignored when it does not, so
+  this costs nothing to a caller or an instance that reports neither. A page count has to be positive to be read as
   one: zero describes no listing at all, and taking it at its word would end a
   walk on a first page that came back full.
 * **The page limit.** A backstop for an instance that does none of the above:
@@ -43,21 +44,67 @@ Only the empty-or-short rule is a judgement about the data; the rest are about
 the instance being wrong, which is why they live here and not in each caller -
 every paginated command is walked through these, so none of them can be the one
 that still hangs.
+
+A walk asks for one page at a time by default, which makes a long listing cost
+one round trip per page however fast the link is. Given a `concurrency` above
+one, a walker asks for later pages before the earlier ones have been judged -
+but only once the first page has said how long the listing is, through the
+same `page_count` as above or a `total_count` of items, because a walk that
+does not know where the listing ends has nothing to fetch ahead of except
+guesses. The pages are still judged one by one and in order, by the same
+`_end_of_listing`, so fetching ahead changes when a page is asked for and never
+what the walk hands back. What it does cost is the pages asked for beyond the
+one that turned out to end the listing - at most `concurrency - 1` of them, and
+only when the listing came out shorter than it said it was.
+
+`gather_pages` makes those guesses, for an asynchronous caller that would
+rather spend requests than round trips: it keeps `concurrency` pages in flight
+from the first page on, whether or not any page has said how many there are,
+and cancels the ones past the end once a verdict has found it. The guesses cost
+up to `concurrency - 1` requests for pages that turn out to be past the end of
+every listing, not only of one that misreported its length, so it is worth it
+on a listing known to be long and a link known to be slow, and is not what the
+other walkers do.
+
+How large a page to ask for is the instance's to say: it serves at most
+`max_response_items` items a page, as `/settings/api` reports, and an instance
+configured for pages of 100 walks a listing in half the requests `PAGE_SIZE`
+takes. `listing_page_size` asks once per client and remembers the answer for
+as long as the client lives, and the walkers' callers pass it as the `limit` of
+every page. An instance that will not say is asked for `PAGE_SIZE`.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, closing
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+import requests
+from aiohttp import ClientResponseError
+
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+    from concurrent.futures import Future
+
+    from gitea.client.async_gitea import AsyncGitea
+    from gitea.client.gitea import Gitea
 
 logger = logging.getLogger("gitea")
 
-# Number of items requested per page when paging through a listing.
+# Number of items requested per page when paging through a listing of an
+# instance that does not report the most it serves.
 PAGE_SIZE = 50
 
+# The page size each client's instance reported, kept for as long as the client
+# is, so a session asks its instance once and a new session asks afresh.
+_page_sizes: weakref.WeakKeyDictionary[Any, int] = weakref.WeakKeyDictionary()
+
 # Most pages any one listing is walked over. At `PAGE_SIZE` a page, this is far
 # more than the endpoints wrapped here return - the comments of one issue, the
 # columns of one board, the issues of one column - so a walk reaching it has met
@@ -132,10 +179,10 @@ def _positive_count(value: Any) -> int | None:
 def _reports_last_page(metadata: dict[str, Any], page: int) -> bool:
     """Report whether the response itself said this page was the last.
 
-    Gitea reports the shape of a listing in the headers of every page, and a
-    caller that carries them into the metadata gets termination from the
-    server's own count rather than from the shape of the page it happened to
-    send. Two keys are read, both optional:
+    Gitea reports the shape of a listing in the headers of every page, and the
+    `list_*` methods carry them into the metadata, so a walk gets termination
+    from the server's own count rather than from the shape of the page it
+    happened to send. Two keys are read, both optional:
 
     * `page_count` - the number of pages the listing has, as `X-PageCount`.
     * `has_more` - whether another page follows, as `X-HasMore`.
@@ -161,6 +208,39 @@ def _reports_last_page(metadata: dict[str, Any], page: int) -> bool:
     return metadata.get("has_more") is False
 
 
+def _reported_page_count(metadata: dict[str, Any], page_size: int) -> int | None:
+    """Read how many pages a listing has from the metadata of its first page.
+
+    `page_count` answers it outright. `total_count` - the number of items, as
+    `X-Total-Count` - answers it once divided by the size of the first page,
+    which is the page size the instance is really serving rather than the one
+    asked for. A first page that came back empty says nothing about the size of
+    the others, so a total cannot be divided by it.
+
+    This plans how far ahead a walk may fetch; it decides nothing about where
+    the walk ends, which is still `_end_of_listing`'s to say page by page.
+
+    Args:
+        metadata: The metadata of the first page.
+        page_size: The number of items on the first page.
+
+    Returns:
+        The number of pages, or None when the metadata does not say.
+
+    """
+    if not isinstance(metadata, dict):
+        return None
+
+    page_count = _positive_count(metadata.get("page_count"))
+    if page_count is not None:
+        return page_count
+
+    total_count = metadata.get("total_count")
+    if not isinstance(total_count, int) or isinstance(total_count, bool) or total_count < 0 or page_size < 1:
+        return None
+    return math.ceil(total_count / page_size)
+
+
 def _repeats_previous(batch: list[dict[str, Any]], previous: list[dict[str, Any]] | None) -> bool:
     """Report whether a page is the page before it over again.
 
@@ -242,74 +322,373 @@ def _end_of_listing(
     return _Verdict(None, include=True)
 
 
+def _served_page_size(answer: Any) -> int:
+    """Read the page size an instance serves from what its API settings answered.
+
+    Args:
+        answer: The settings and the metadata `get_api_settings` returned.
+
+    Returns:
+        The instance's `max_response_items`, or `PAGE_SIZE` when the answer
+        does not carry a positive one.
+
+    """
+    if isinstance(answer, tuple) and answer and isinstance(answer[0], dict):
+        size = _positive_count(answer[0].get("max_response_items"))
+        if size is not None:
+            return size
+    return PAGE_SIZE
+
+
+def listing_page_size(client: Gitea) -> int:
+    """Look up how many items a page of a listing should ask the client's instance for.
+
+    The instance is asked once per client. One that refuses the request - one
+    too old to serve `/settings/api`, or one that answers it only to an
+    administrator - is walked with pages of `PAGE_SIZE`, as is one answering
+    without a usable `max_response_items`. Failing to reach it is not refused:
+    the listing would fail the same way a request later.
+
+    Args:
+        client: The Gitea client the listing is walked with.
+
+    Returns:
+        The page size.
+
+    """
+    size = _page_sizes.get(client)
+    if size is None:
+        try:
+            size = _served_page_size(client.settings.get_api_settings())
+        except requests.HTTPError as e:
+            logger.debug("The instance did not report its API settings (%s); asking for pages of %s.", e, PAGE_SIZE)
+            size = PAGE_SIZE
+        _page_sizes[client] = size
+    return size
+
+
+async def async_listing_page_size(client: AsyncGitea) -> int:
+    """Look up how many items a page of a listing should ask the client's instance for.
+
+    The asynchronous twin of `listing_page_size`.
+
+    Args:
+        client: The asynchronous Gitea client the listing is walked with.
+
+    Returns:
+        The page size.
+
+    """
+    size = _page_sizes.get(client)
+    if size is None:
+        try:
+            size = _served_page_size(await client.settings.get_api_settings())
+        except ClientResponseError as e:
+            logger.debug("The instance did not report its API settings (%s); asking for pages of %s.", e, PAGE_SIZE)
+            size = PAGE_SIZE
+        _page_sizes[client] = size
+    return size
+
+
+def _pages_in_order(
+    fetch_page: Callable[[int], tuple[list[dict[str, Any]], dict[str, Any]]],
+    concurrency: int,
+) -> Iterator[tuple[int, tuple[list[dict[str, Any]], dict[str, Any]]]]:
+    """Fetch the pages of a listing in order, fetching ahead where the length is known.
+
+    The first page is always fetched on its own, since only it can say how long
+    the listing is. When it does and `concurrency` allows, the pages up to the
+    reported last one are fetched on a pool of that many threads, never more
+    than `concurrency` of them outstanding at once, and handed over in page
+    order as each one's turn comes. Past the reported last page - a listing that
+    grew while it was walked, or a last page that happened to come back full -
+    the pages are fetched one at a time, as they are without a count.
+
+    Closing the generator cancels the pages not yet started and waits for the
+    ones in flight, so a walk that has ended leaves no request running against
+    a session its caller is about to close.
+
+    Args:
+        fetch_page: Callable returning the items and metadata of the given page number.
+        concurrency: Most pages to have outstanding at once.
+
+    Yields:
+        The number of each page, and its items and metadata.
+
+    """
+    first = fetch_page(1)
+    yield 1, first
+
+    page = 2
+    last = _reported_page_count(first[1], len(first[0])) if concurrency > 1 else None
+    if last is not None and last >= page:
+        pending: deque[Future[tuple[list[dict[str, Any]], dict[str, Any]]]] = deque()
+        pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gitea-page")
+        try:
+            ahead = page
+            while True:
+                while len(pending) < concurrency and ahead <= last:
+                    pending.append(pool.submit(fetch_page, ahead))
+                    ahead += 1
+                if not pending:
+                    break
+                yield page, pending.popleft().result()
+                page += 1
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    while True:
+        yield page, fetch_page(page)
+        page += 1
+
+
+async def _async_pages_in_order(
+    fetch_page: Callable[[int], Awaitable[tuple[list[dict[str, Any]], dict[str, Any]]]],
+    concurrency: int,
+) -> AsyncIterator[tuple[int, tuple[list[dict[str, Any]], dict[str, Any]]]]:
+    """Fetch the pages of a listing in order, fetching ahead where the length is known.
+
+    The asynchronous twin of `_pages_in_order`, fetching ahead on tasks rather
+    than threads. Closing it cancels the tasks still outstanding and waits for
+    them to unwind.
+
+    Args:
+        fetch_page: Callable returning the items and metadata of the given page number.
+        concurrency: Most pages to have outstanding at once.
+
+    Yields:
+        The number of each page, and its items and metadata.
+
+    """
+    first = await fetch_page(1)
+    yield 1, first
+
+    page = 2
+    last = _reported_page_count(first[1], len(first[0])) if concurrency > 1 else None
+    if last is not None and last >= page:
+        pending: deque[asyncio.Task[tuple[list[dict[str, Any]], dict[str, Any]]]] = deque()
+        try:
+            ahead = page
+            while True:
+                while len(pending) < concurrency and ahead <= last:
+                    pending.append(asyncio.ensure_future(fetch_page(ahead)))
+                    ahead += 1
+                if not pending:
+                    break
+                yield page, await pending.popleft()
+                page += 1
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    while True:
+        yield page, await fetch_page(page)
+        page += 1
+
+
 def iter_pages(
     fetch_page: Callable[[int], tuple[list[dict[str, Any]], dict[str, Any]]],
+    *,
+    concurrency: int = 1,
 ) -> Iterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
-    """Yield the pages of a paginated listing, one request at a time.
+    """Yield the pages of a paginated listing, in order.
 
     Pages are requested lazily, so a caller that stops early stops the
-    requests with it.
+    requests with it - all of them with the default `concurrency`, and all but
+    the ones already in flight with a higher one.
 
     Args:
         fetch_page: Callable returning the items and metadata of the given page number.
+            With a `concurrency` above one it is called from several threads at
+            once, so it has to be safe to.
+        concurrency: Most pages to have requested at once. One asks for each page
+            only once the page before it has been judged; more fetches ahead on a
+            pool of threads once the first page has reported how many there are.
 
     Yields:
         A tuple containing the items and the metadata of each page, in order.
 
     """
-    page = 1
     page_size = 0
     previous: list[dict[str, Any]] | None = None
-    while True:
-        batch, metadata = fetch_page(page)
+    with closing(_pages_in_order(fetch_page, concurrency)) as pages:
+        for page, (batch, metadata) in pages:
+            verdict = _end_of_listing(batch=batch, metadata=metadata, previous=previous, page=page, page_size=page_size)
+            if verdict.include:
+                yield batch, metadata
+            if verdict.reason is not None:
+                return
 
-        verdict = _end_of_listing(batch=batch, metadata=metadata, previous=previous, page=page, page_size=page_size)
-        if verdict.include:
-            yield batch, metadata
-        if verdict.reason is not None:
-            return
-
-        previous = batch
-        page_size = page_size or len(batch)
-        page += 1
+            previous = batch
+            page_size = page_size or len(batch)
 
 
-async def iter_async_pages(
+async def _async_pages_guessed_ahead(
     fetch_page: Callable[[int], Awaitable[tuple[list[dict[str, Any]], dict[str, Any]]]],
-) -> AsyncIterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
-    """Yield the pages of a paginated listing, one request at a time.
+    concurrency: int,
+) -> AsyncIterator[tuple[int, tuple[list[dict[str, Any]], dict[str, Any]]]]:
+    """Fetch the pages of a listing in order, keeping `concurrency` in flight from the first.
+
+    Unlike `_async_pages_in_order`, it does not wait for the first page to say
+    how many there are before fetching ahead. Once one has said, nothing past
+    the last page it reported is asked for until the pages up to it have been
+    handed over; a listing that turns out longer is walked on one page at a
+    time. Closing it cancels the tasks still outstanding and waits for them to
+    unwind.
 
     Args:
         fetch_page: Callable returning the items and metadata of the given page number.
+        concurrency: Most pages to have outstanding at once.
+
+    Yields:
+        The number of each page, and its items and metadata.
+
+    """
+    pending: deque[asyncio.Task[tuple[list[dict[str, Any]], dict[str, Any]]]] = deque()
+    last: int | None = None
+    page = ahead = 1
+    try:
+        while True:
+            # One page is always in flight: past a reported last page that came
+            # back full, the listing is followed a page at a time.
+            while not pending or (len(pending) < concurrency and (last is None or ahead <= last)):
+                pending.append(asyncio.ensure_future(fetch_page(ahead)))
+                ahead += 1
+            result = await pending.popleft()
+            if page == 1:
+                last = _reported_page_count(result[1], len(result[0]))
+            yield page, result
+            page += 1
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _judged_async_pages(
+    pages: AsyncIterator[tuple[int, tuple[list[dict[str, Any]], dict[str, Any]]]],
+) -> AsyncIterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+    """Hand over the pages of an asynchronous walk until a verdict ends it.
+
+    Args:
+        pages: The number of each page, and its items and metadata, in order. It
+            is closed however the walk ends.
 
     Yields:
         A tuple containing the items and the metadata of each page, in order.
 
     """
-    page = 1
     page_size = 0
     previous: list[dict[str, Any]] | None = None
-    while True:
-        batch, metadata = await fetch_page(page)
+    async with aclosing(pages):
+        async for page, (batch, metadata) in pages:
+            verdict = _end_of_listing(batch=batch, metadata=metadata, previous=previous, page=page, page_size=page_size)
+            if verdict.include:
+                yield batch, metadata
+            if verdict.reason is not None:
+                return
 
-        verdict = _end_of_listing(batch=batch, metadata=metadata, previous=previous, page=page, page_size=page_size)
-        if verdict.include:
+            previous = batch
+            page_size = page_size or len(batch)
+
+
+async def iter_async_pages(
+    fetch_page: Callable[[int], Awaitable[tuple[list[dict[str, Any]], dict[str, Any]]]],
+    *,
+    concurrency: int = 1,
+) -> AsyncIterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+    """Yield the pages of a paginated listing, in order.
+
+    A caller stopping early should close the walk - `contextlib.aclosing` does -
+    rather than only break out of it: an asynchronous generator left behind is
+    closed whenever it is collected, and the pages it fetched ahead stay in
+    flight until then.
+
+    Args:
+        fetch_page: Callable returning the items and metadata of the given page number.
+        concurrency: Most pages to have requested at once. One asks for each page
+            only once the page before it has been judged; more fetches ahead on
+            tasks once the first page has reported how many there are.
+
+    Yields:
+        A tuple containing the items and the metadata of each page, in order.
+
+    """
+    async with aclosing(_judged_async_pages(_async_pages_in_order(fetch_page, concurrency))) as pages:
+        async for batch, metadata in pages:
             yield batch, metadata
-        if verdict.reason is not None:
-            return
 
-        previous = batch
-        page_size = page_size or len(batch)
-        page += 1
+
+async def gather_pages(
+    fetch_page: Callable[[int], Awaitable[tuple[list[dict[str, Any]], dict[str, Any]]]],
+    *,
+    concurrency: int,
+) -> AsyncIterator[tuple[list[dict[str, Any]], dict[str, Any]]]:
+    """Yield the pages of a paginated listing, in order, guessing ahead from the first.
+
+    `iter_async_pages` fetches ahead only once the first page has said how many
+    there are. This keeps `concurrency` pages in flight from the start, so a
+    listing that reports no length - or a first page that is slow to say -
+    costs a round trip per `concurrency` pages rather than per page. The pages
+    are judged in order by the same verdicts, so what is handed over is what
+    `iter_async_pages` hands over; the pages asked for past the end are
+    cancelled once it is found. A caller stopping early should close the walk,
+    as `iter_async_pages` asks.
+
+    Args:
+        fetch_page: Callable returning the items and metadata of the given page number.
+        concurrency: Most pages to have requested at once. One asks for each
+            page only once the page before it has been judged.
+
+    Yields:
+        A tuple containing the items and the metadata of each page, in order.
+
+    """
+    async with aclosing(_judged_async_pages(_async_pages_guessed_ahead(fetch_page, max(1, concurrency)))) as pages:
+        async for batch, metadata in pages:
+            yield batch, metadata
 
 
 def collect_all_pages(
     fetch_page: Callable[[int], tuple[list[dict[str, Any]], dict[str, Any]]],
+    *,
+    concurrency: int = 1,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Fetch every page of a paginated listing.
+
+    Args:
+        fetch_page: Callable returning the items and metadata of the given page number.
+        concurrency: Most pages to have requested at once, as `iter_pages` takes it.
+
+    Returns:
+        A tuple containing every item across all pages and the metadata of the last response.
+
+    """
+    items: list[dict[str, Any]] = []
+    metadata: dict[str, Any] = {}
+    for batch, page_metadata in iter_pages(fetch_page, concurrency=concurrency):
+        items.extend(batch)
+        metadata = page_metadata
+    return items, metadata
+
+
+async def collect_all_async_pages(
+    fetch_page: Callable[[int], Awaitable[tuple[list[dict[str, Any]], dict[str, Any]]]],
+    *,
+    concurrency: int = 1,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     """Fetch every page of a paginated listing.
 
+    The asynchronous twin of `collect_all_pages`. The pages are walked by
+    `gather_pages`, so a `concurrency` above one guesses ahead from the first
+    page rather than waiting for it to say how many there are.
+
     Args:
         fetch_page: Callable returning the items and metadata of the given page number.
+        concurrency: Most pages to have requested at once, as `gather_pages` takes it.
 
     Returns:
         A tuple containing every item across all pages and the metadata of the last response.
@@ -317,7 +696,7 @@ def collect_all_pages(
     """
     items: list[dict[str, Any]] = []
     metadata: dict[str, Any] = {}
-    for batch, page_metadata in iter_pages(fetch_page):
+    async for batch, page_metadata in gather_pages(fetch_page, concurrency=concurrency):
         items.extend(batch)
         metadata = page_metadata
     return items, metadata
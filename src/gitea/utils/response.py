@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+from collections.abc import Mapping
 from typing import Any, cast
+from urllib.parse import parse_qs, urlsplit
 
 from aiohttp import ClientResponse
 from requests import Response
 
+from gitea.client.retry import retries_of
+
 logger = logging.getLogger("gitea")
 
+# One `<url>; rel="name"` entry of a Link header. Gitea quotes the relation, and
+# the pattern accepts it unquoted too rather than depending on that.
+_LINK_ENTRY = re.compile(r'<(?P<url>[^>]*)>\s*;\s*rel="?(?P<rel>[^";,]+)"?')
+
 
 def process_response[T](response: Response, default: T | None = None) -> tuple[Any, int]:
     """Process a synchronous HTTP response.
@@ -67,3 +76,119 @@ async def process_async_response[T](response: ClientResponse, default: T | None
     else:
         data = default
     return data, status_code
+
+
+def response_metadata(response: Any, status_code: int) -> dict[str, Any]:
+    """Build the metadata every resource method returns alongside its data.
+
+    It always carries the response's `status_code`, and carries `retries` -
+    the number of times the request was sent again before this response was
+    had - only when there were any, so the metadata of a request that
+    succeeded first time is what it was before retries existed.
+
+    Args:
+        response: The HTTP response, synchronous or asynchronous.
+        status_code: The status code read from it.
+
+    Returns:
+        The metadata.
+
+    """
+    metadata: dict[str, Any] = {"status_code": status_code}
+    retries = retries_of(response)
+    if retries:
+        metadata["retries"] = retries
+    return metadata
+
+
+def _header_count(headers: Mapping[str, Any], name: str) -> int | None:
+    """Read a header carrying a whole, non-negative number.
+
+    Args:
+        headers: The headers of the response.
+        name: The name of the header.
+
+    Returns:
+        The number, or None when the header is absent or does not carry one.
+
+    """
+    value = headers.get(name)
+    if not isinstance(value, str) or not value.strip().isdigit():
+        return None
+    return int(value.strip())
+
+
+def _link_pages(headers: Mapping[str, Any]) -> dict[str, int | None] | None:
+    """Read the relations of a Link header, and the page each of them points at.
+
+    Args:
+        headers: The headers of the response.
+
+    Returns:
+        The page number each relation links to, keyed by relation - None for a
+        link carrying no readable page - or None when there is no Link header.
+
+    """
+    value = headers.get("Link")
+    if not isinstance(value, str):
+        return None
+
+    pages: dict[str, int | None] = {}
+    for entry in _LINK_ENTRY.finditer(value):
+        page = parse_qs(urlsplit(entry.group("url")).query).get("page", [""])[0]
+        pages[entry.group("rel").strip()] = int(page) if page.isdigit() else None
+    return pages
+
+
+def pagination_metadata(response: Any) -> dict[str, Any]:
+    """Read the shape of a listing from the headers Gitea sends with each page of it.
+
+    Gitea answers every paginated endpoint with the listing's size in its
+    headers, and these are carried into the metadata a `list_*` method returns
+    so that a walk can stop on the last page rather than on the empty one after
+    it, and a caller can know the size of a listing before it has read it all:
+
+    * `total_count` - the number of items in the listing, from `X-Total-Count`.
+    * `page_count` - the number of pages, from `X-PageCount`, or from the page
+      the `last` link points at when that header is absent.
+    * `has_more` - whether another page follows, from `X-HasMore`, or from
+      whether the Link header has a `next` relation when that one is absent.
+      A response carrying no Link header at all says nothing either way.
+
+    Each key is present only when the response carried what it is read from,
+    so the metadata of an endpoint that sends none of them is what it was
+    before any of this, and a walk reading it falls back to its other signals.
+
+    Args:
+        response: The HTTP response, synchronous or asynchronous: both carry
+            their headers under `headers`, case-insensitively.
+
+    Returns:
+        The keys above that the response's headers supported.
+
+    """
+    headers = getattr(response, "headers", None)
+    if not isinstance(headers, Mapping):
+        return {}
+
+    metadata: dict[str, Any] = {}
+
+    total_count = _header_count(headers, "X-Total-Count")
+    if total_count is not None:
+        metadata["total_count"] = total_count
+
+    links = _link_pages(headers)
+
+    page_count = _header_count(headers, "X-PageCount")
+    if page_count is None and links is not None:
+        page_count = links.get("last")
+    if page_count is not None:
+        metadata["page_count"] = page_count
+
+    has_more = headers.get("X-HasMore")
+    if isinstance(has_more, str) and has_more.strip().lower() in {"true", "false"}:
+        metadata["has_more"] = has_more.strip().lower() == "true"
+    elif links is not None:
+        metadata["has_more"] = "next" in links
+
+    return metadata
@@ -8,7 +8,9 @@ property that lets the command be run from cron without producing output, and so
 without producing work, on a quiet tick.
 
 `gitea.watch.changes` holds the comparison and the snapshot it compares;
-`gitea.watch.state` holds the cache the snapshots are kept in.
+`gitea.watch.state` holds the cache the snapshots are kept in, as one JSON
+document, as a SQLite database through `gitea.watch.sqlite_state`, or as a
+directory of one document per scope through `gitea.watch.sharded_state`.
 """
 
 from __future__ import annotations
@@ -22,8 +24,11 @@ from gitea.watch.changes import (
     usable_identifier,
 )
 from gitea.watch.state import (
+    SHARDED_SUFFIX,
+    SQLITE_SUFFIXES,
     STATE_FILE_ENV,
     STATE_VERSION,
+    StateBackend,
     cache_lock,
     default_state_path,
     load_state,
@@ -31,12 +36,17 @@ from gitea.watch.state import (
     resolve_state_path,
     save_scopes,
     save_state,
+    scope_scanned_at,
     scope_snapshots,
+    state_backend_for,
 )
 
 __all__ = [
+    "SHARDED_SUFFIX",
+    "SQLITE_SUFFIXES",
     "STATE_FILE_ENV",
     "STATE_VERSION",
+    "StateBackend",
     "cache_lock",
     "comment_hash",
     "default_state_path",
@@ -49,6 +59,8 @@ __all__ = [
     "resolve_state_path",
     "save_scopes",
     "save_state",
+    "scope_scanned_at",
     "scope_snapshots",
+    "state_backend_for",
     "usable_identifier",
 ]
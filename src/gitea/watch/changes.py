@@ -166,6 +166,44 @@ def issue_snapshot(
     }
 
 
+def comments_unchanged(issue: dict[str, Any], snapshot: dict[str, Any] | None) -> bool:
+    """Report whether an issue's comments can be taken from its recorded snapshot.
+
+    Gitea bumps an issue's `updated_at` whenever a comment is added to it, and
+    counts its comments under `comments`, so an issue answering with the same
+    timestamp and as many comments as its snapshot recorded hashes for has had
+    none added or deleted since. Walking its comments again would only hash the
+    ones already recorded.
+
+    What this cannot see is a comment edited in place: editing a comment leaves
+    the issue's timestamp and count alone, so a run trusting this reports the
+    edit only once something else about the issue moves. A snapshot recording
+    no comment hashes at all, as one written by hand or damaged may, has none
+    to take, so its issue's comments are walked.
+
+    Args:
+        issue: The issue data returned by the API.
+        snapshot: The snapshot recorded for the issue, or None when it has none.
+
+    Returns:
+        True when the recorded comment hashes still describe the issue.
+
+    """
+    if snapshot is None:
+        return False
+
+    updated_at, count = issue.get("updated_at"), issue.get("comments")
+    return (
+        isinstance(updated_at, str)
+        and bool(updated_at)
+        and updated_at == snapshot.get("updated_at")
+        and isinstance(count, int)
+        and not isinstance(count, bool)
+        and isinstance(hashes := snapshot.get("comment_hashes"), list)
+        and count == len(hashes)
+    )
+
+
 def _change(snapshot: dict[str, Any], kind: str, detail: str, added: list[str], removed: list[str]) -> dict[str, Any]:
     """Build one change record.
 
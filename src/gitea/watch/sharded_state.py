@@ -0,0 +1,124 @@
+"""The watch cache kept as a directory of one JSON cache per scope.
+
+Every run writing the JSON cache described in `gitea.watch.state` takes the one
+lock beside it, so two cron jobs watching unrelated repositories still wait on
+each other, and each re-reads and rewrites the scopes of the other. Sharded, the
+cache is a directory holding one file per scope, each with its own lock:
+
+    watch-state.d/
+      repo%3Amy-org%2Fapi.json
+      repo%3Amy-org%2Fapi.json.lock
+      project%3Amy-org%2F29.json
+      project%3Amy-org%2F29.json.lock
+
+A shard is a JSON cache holding a single scope, named by its key quoted into a
+file name, and is read and written through the very functions that read and
+write the single-document cache. So everything `gitea.watch.state` says of that
+cache holds for each shard - an atomic rename, a re-read under an advisory lock
+that a killed run releases, an unreadable shard read as no shard, a shard from
+an older version recorded afresh - and it holds per scope: runs on different
+scopes never take the same lock, and a run reads and writes the shards of the
+scopes it watches and no others. A run watching several scopes takes their
+locks one after another, never two at once, so no two runs can each hold a lock
+the other is waiting for.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote, unquote
+
+from gitea.watch.state import StateBackend, empty_state, load_state, save_scopes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Suffix of a shard, and of nothing else in the directory: a shard's lock and
+# the temporary file a write renames over it both carry a suffix of their own.
+_SHARD_SUFFIX = ".json"
+
+
+def shard_path(directory: str | Path, scope: str) -> Path:
+    """Build the path of the shard holding one scope.
+
+    The key is quoted whole, so the `/` and `:` every key carries become part
+    of one file name rather than directories or a drive.
+
+    Args:
+        directory: The directory holding the shards.
+        scope: Key of the scope.
+
+    Returns:
+        Path of the scope's shard.
+
+    """
+    return Path(directory) / f"{quote(scope, safe='')}{_SHARD_SUFFIX}"
+
+
+def _recorded_scopes(directory: Path) -> list[str]:
+    """List the scopes a directory holds a shard for.
+
+    Args:
+        directory: The directory holding the shards.
+
+    Returns:
+        The key of each scope, sorted, or none when the directory is missing.
+
+    """
+    if not directory.is_dir():
+        return []
+    return sorted(unquote(shard.name.removesuffix(_SHARD_SUFFIX)) for shard in directory.glob(f"*{_SHARD_SUFFIX}"))
+
+
+def load_sharded_state(directory: str | Path, *, scopes: Iterable[str] | None = None) -> dict[str, Any]:
+    """Read the shards of a cache into one cache document.
+
+    Each shard is read as a JSON cache on its own, so one that is unreadable or
+    was written by an older version costs its own scope and no other.
+
+    Args:
+        directory: The directory holding the shards.
+        scopes: The scopes to read, or None to read every shard there is.
+
+    Returns:
+        The cache document holding every scope read.
+
+    """
+    directory = Path(directory)
+    document = empty_state()
+    for scope in _recorded_scopes(directory) if scopes is None else scopes:
+        entry = load_state(shard_path(directory, scope), backend=StateBackend.JSON)["scopes"].get(scope)
+        if entry is not None:
+            document["scopes"][scope] = entry
+    return document
+
+
+def save_sharded_scopes(
+    directory: str | Path,
+    scopes: dict[str, dict[str, dict[str, Any]]],
+    *,
+    scanned_at: dict[str, str] | None = None,
+) -> None:
+    """Record the scopes a run watched, each in its own shard under its own lock.
+
+    Args:
+        directory: The directory holding the shards.
+        scopes: The snapshots to record, keyed by scope.
+        scanned_at: When each scope was last walked in full. A scope given
+            without one records none.
+
+    Raises:
+        OSError: If a shard cannot be written. The shards written before it
+            keep what they were given, and it and the ones after it are left
+            as they were.
+
+    """
+    scanned_at = scanned_at or {}
+    for scope, snapshots in scopes.items():
+        save_scopes(
+            shard_path(directory, scope),
+            {scope: snapshots},
+            backend=StateBackend.JSON,
+            scanned_at={scope: scanned_at[scope]} if scope in scanned_at else None,
+        )
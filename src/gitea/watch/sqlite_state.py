@@ -0,0 +1,267 @@
+"""The watch cache kept as a SQLite database rather than as one JSON document.
+
+The JSON cache described in `gitea.watch.state` is rewritten whole on every run:
+`save_scopes` re-reads the document, parses every scope anyone ever watched
+through it, and renames a full copy over it, so a run watching one repository
+pays for all the others. Kept in SQLite, each issue of each scope is a row of
+its own, a run reads only the rows of the scopes it watches, and a write
+replaces those rows and nothing else:
+
+    meta(key, value)                          -- "version" -> 2
+    scopes(scope, scanned_at)                 -- one row per scope recorded
+    snapshots(scope, issue, snapshot)         -- one row per issue, as JSON
+
+A scope recorded with no issues is a row in `scopes` and none in `snapshots`,
+which is what keeps it apart from a scope never recorded at all.
+
+What a caller sees is what the JSON cache gives it: `load_sqlite_state` answers
+the same document, which `scope_snapshots` reads as leniently as ever, and
+`save_sqlite_scopes` replaces only the scopes it is given. The four decisions
+`gitea.watch.state` states hold here too, with the mechanism each rests on
+changed:
+
+- **Writes are atomic** because each one is a single transaction, and the
+  database is in WAL mode, so a run reading the cache is never blocked by one
+  writing it and never sees half a write.
+- **The lock is SQLite's own.** A write begins with `BEGIN IMMEDIATE`, which
+  waits for any other writer to finish, so two runs saving at once both keep
+  their scopes without a `.lock` file beside the cache. As with any SQLite
+  database, that lock is only as good as the filesystem's, which on a network
+  share it often is not.
+- **An unreadable cache is no cache.** A file that is not a database, or a
+  database that is not a cache, reads as empty and is logged. A file that is not
+  a database at all is replaced by the next write, as a corrupt JSON cache is.
+- **A cache written by an older version is discarded.** The version is a row of
+  `meta`, and a database declaring an older one reads as empty and has every
+  scope cleared by the next write, for the reason the JSON cache does.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from gitea.watch.state import STATE_VERSION, empty_state
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger("gitea")
+
+# Seconds a write waits for a concurrent one to commit before giving up. A run
+# saving its scopes holds the database for milliseconds, so this is only ever
+# reached by a writer that is wedged.
+BUSY_TIMEOUT = 30.0
+
+# The first bytes of every SQLite database, which is how a file that is not one
+# is told apart from a database that is merely locked or damaged.
+_HEADER = b"SQLite format 3\x00"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS scopes (scope TEXT PRIMARY KEY, scanned_at TEXT)",
+    (
+        "CREATE TABLE IF NOT EXISTS snapshots ("
+        "scope TEXT NOT NULL, issue TEXT NOT NULL, snapshot TEXT NOT NULL, PRIMARY KEY (scope, issue))"
+    ),
+)
+
+
+def _is_database(path: Path) -> bool:
+    """Tell whether a file is a SQLite database, or could become one.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        True for a file starting with the SQLite header, and for an empty or
+        missing one, which SQLite turns into a database on the first write.
+
+    Raises:
+        OSError: If the file exists but cannot be read.
+
+    """
+    try:
+        with path.open("rb") as file:
+            header = file.read(len(_HEADER))
+    except FileNotFoundError:
+        return True
+    return header in (b"", _HEADER)
+
+
+@contextlib.contextmanager
+def _connect(path: Path) -> Iterator[sqlite3.Connection]:
+    """Open the database in WAL mode, closing it when the block ends.
+
+    Transactions are begun explicitly rather than by the module, so a write is
+    exactly the statements between its `BEGIN` and its `COMMIT`.
+
+    Args:
+        path: Path of the database.
+
+    Yields:
+        The open connection.
+
+    """
+    connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        yield connection
+    finally:
+        connection.close()
+
+
+def _stored_version(connection: sqlite3.Connection) -> int | None:
+    """Read the version a database declares.
+
+    Args:
+        connection: The open connection.
+
+    Returns:
+        The version, or None when the database declares none that is usable.
+
+    """
+    row = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    try:
+        return int(row[0]) if row is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_rows(connection: sqlite3.Connection, scopes: Iterable[str] | None) -> dict[str, Any]:
+    """Read the scopes a database records into a cache document.
+
+    Args:
+        connection: The open connection.
+        scopes: The scopes to read, or None to read every one.
+
+    Returns:
+        The cache document holding them.
+
+    """
+    query = "SELECT scope, scanned_at FROM scopes"
+    if scopes is None:
+        recorded = list(connection.execute(query))
+    else:
+        recorded = [
+            row for scope in scopes if (row := connection.execute(query + " WHERE scope = ?", (scope,)).fetchone())
+        ]
+
+    document = empty_state()
+    for scope, scanned_at in recorded:
+        issues: dict[str, Any] = {}
+        for issue, raw in connection.execute("SELECT issue, snapshot FROM snapshots WHERE scope = ?", (scope,)):
+            try:
+                issues[issue] = json.loads(raw)
+            except (TypeError, ValueError):
+                # One unreadable row is one issue `scope_snapshots` drops, as it
+                # drops an entry of the JSON cache that is not a snapshot.
+                issues[issue] = None
+        document["scopes"][scope] = {"issues": issues}
+        if scanned_at is not None:
+            document["scopes"][scope]["scanned_at"] = scanned_at
+    return document
+
+
+def load_sqlite_state(path: str | Path, *, scopes: Iterable[str] | None = None) -> dict[str, Any]:
+    """Read the cache, treating anything unreadable as an absent one.
+
+    Args:
+        path: Path of the database.
+        scopes: The scopes to read, or None to read every one. A run names the
+            scopes it watches, which are then the only rows it reads.
+
+    Returns:
+        The cache document, or an empty one when there is nothing to read.
+
+    """
+    path = Path(path)
+    if not path.exists():
+        return empty_state()
+
+    try:
+        if not _is_database(path):
+            logger.warning("The watch cache at %s is not a SQLite database; every scope will be recorded afresh.", path)
+            return empty_state()
+        with _connect(path) as connection:
+            version = _stored_version(connection)
+            if version is None or version < STATE_VERSION:
+                logger.warning(
+                    "The watch cache at %s was written by an older version of python-gitea; every scope will be "
+                    "recorded afresh, and this run reports nothing. Reading it would compare comment digests taken "
+                    "over something else and announce every comment on every watched issue as rewritten.",
+                    path,
+                )
+                return empty_state()
+            return _read_rows(connection, scopes)
+    except (OSError, sqlite3.Error) as error:
+        logger.warning("Could not read the watch cache at %s (%s); every scope will be recorded afresh.", path, error)
+        return empty_state()
+
+
+def save_sqlite_scopes(
+    path: str | Path,
+    scopes: dict[str, dict[str, dict[str, Any]]],
+    *,
+    scanned_at: dict[str, str] | None = None,
+) -> None:
+    """Record the scopes a run watched, leaving every other scope as it is.
+
+    The scopes are replaced in one transaction, begun with `BEGIN IMMEDIATE` so
+    a concurrent writer is waited for rather than raced, and the rows of the
+    other scopes are never read, let alone rewritten.
+
+    Args:
+        path: Path of the database.
+        scopes: The snapshots to record, keyed by scope.
+        scanned_at: When each scope was last walked in full. A scope given
+            without one records none.
+
+    Raises:
+        OSError: If the cache cannot be written. It is left as it was.
+
+    """
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not _is_database(path):
+            logger.warning("Replacing the watch cache at %s, which is not a SQLite database.", path)
+            path.unlink()
+        with _connect(path) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                version = _stored_version(connection)
+                if version is None or version < STATE_VERSION:
+                    # Snapshots an older version recorded are never compared
+                    # against, so the scopes not watched now go with them.
+                    connection.execute("DELETE FROM snapshots")
+                    connection.execute("DELETE FROM scopes")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(STATE_VERSION),)
+                )
+                for scope, snapshots in scopes.items():
+                    connection.execute("DELETE FROM snapshots WHERE scope = ?", (scope,))
+                    connection.execute(
+                        "INSERT OR REPLACE INTO scopes (scope, scanned_at) VALUES (?, ?)",
+                        (scope, (scanned_at or {}).get(scope)),
+                    )
+                    connection.executemany(
+                        "INSERT INTO snapshots (scope, issue, snapshot) VALUES (?, ?, ?)",
+                        [
+                            (scope, str(issue), json.dumps(snapshot, sort_keys=True))
+                            for issue, snapshot in snapshots.items()
+                        ],
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                with contextlib.suppress(sqlite3.Error):
+                    connection.execute("ROLLBACK")
+                raise
+    except sqlite3.Error as error:
+        raise OSError(f"the SQLite database could not be written ({error})") from error
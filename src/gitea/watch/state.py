@@ -7,11 +7,16 @@ and boards - in one invocation or in several - keeps their deltas apart:
     {
       "version": 2,
       "scopes": {
-        "repo:my-org/my-repo": {"issues": {"1854": {...}}},
+        "repo:my-org/my-repo": {"issues": {"1854": {...}}, "scanned_at": "2026-08-02T10:00:00+00:00"},
         "project:my-org/29":   {"issues": {"1854": {...}}}
       }
     }
 
+`scanned_at` is when a run last walked the scope in full, recorded by the runs
+that did and dropped by any that did not say, which is what lets a run narrowed
+to what changed - see `watch list --via-notifications` - tell when it is due to
+walk everything again. A scope without one is always due.
+
 Four decisions about it are worth stating, because each one is a trade the
 caller inherits.
 
@@ -56,36 +61,38 @@ recorded afresh: the comment digests version 1 wrote were taken over a different
 identity, so every one of them would compare unequal, and reading them would
 announce every comment on every watched issue as removed and written again. One
 silent run costs less than that.
+
+Everything above describes the JSON cache, which is rewritten whole on every
+run and so costs more with every scope anyone has watched through it. A path
+ending in one of `SQLITE_SUFFIXES` - or any path, with `StateBackend.SQLITE` -
+keeps the same snapshots in a SQLite database instead, one row per issue, which
+a run reads and replaces only the scopes of; see `gitea.watch.sqlite_state`. A
+path ending in `SHARDED_SUFFIX` - or any path, with `StateBackend.SHARDED` - is
+a directory of one JSON cache per scope, each under a lock of its own, so runs
+watching different scopes never wait on each other; see
+`gitea.watch.sharded_state`. `load_state` and `save_scopes` take any of them,
+and answer the same document.
 """
 
 from __future__ import annotations
 
 import contextlib
+import enum
 import json
 import logging
 import os
 import tempfile
 from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import platformdirs
 
-if TYPE_CHECKING:
-    from collections.abc import Iterator
+from gitea.utils.locks import drop_lock, lock_path_for, take_lock
 
-# The advisory-lock call differs by platform and neither module exists on the
-# other, so both are imported for whichever is here. A platform offering
-# neither leaves the critical section unlocked rather than unusable.
-try:
-    import fcntl
-except ImportError:  # pragma: no cover - Windows has no fcntl
-    fcntl = None  # type: ignore[assignment]
-
-try:
-    import msvcrt
-except ImportError:  # pragma: no cover - POSIX has no msvcrt
-    msvcrt = None  # type: ignore[assignment]
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 logger = logging.getLogger("gitea")
 
@@ -99,10 +106,46 @@ STATE_FILE_ENV = "PYTHON_GITEA_WATCH_STATE_FILE"
 # against - see `load_state`.
 STATE_VERSION = 2
 
+# Suffixes of a cache path that keep the cache in SQLite unless a backend is named.
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Suffix of a cache path that keeps the cache sharded, one file per scope in a
+# directory of that name, unless a backend is named.
+SHARDED_SUFFIX = ".d"
+
 # Fields of a snapshot that hold a list of strings, and are read as one.
 _STRING_LISTS = ("assignees", "labels", "comment_hashes")
 
 
+class StateBackend(enum.StrEnum):
+    """How the watch cache is stored."""
+
+    JSON = "json"
+    SQLITE = "sqlite"
+    SHARDED = "sharded"
+
+
+def state_backend_for(path: str | Path, backend: StateBackend | str | None = None) -> StateBackend:
+    """Choose how the cache at a path is stored.
+
+    Args:
+        path: Path of the cache.
+        backend: The backend named by the caller, or None to go by the suffix.
+
+    Returns:
+        The backend named, or SQLite for a path ending in one of
+        `SQLITE_SUFFIXES`, sharded for one ending in `SHARDED_SUFFIX`, and JSON
+        for any other.
+
+    """
+    if backend is not None:
+        return StateBackend(backend)
+    suffix = Path(path).suffix.lower()
+    if suffix in SQLITE_SUFFIXES:
+        return StateBackend.SQLITE
+    return StateBackend.SHARDED if suffix == SHARDED_SUFFIX else StateBackend.JSON
+
+
 def default_state_path() -> Path:
     """Build the path of the cache used when none is named.
 
@@ -137,9 +180,37 @@ def empty_state() -> dict[str, Any]:
     return {"version": STATE_VERSION, "scopes": {}}
 
 
-def load_state(path: str | Path) -> dict[str, Any]:
+def load_state(
+    path: str | Path, *, scopes: Iterable[str] | None = None, backend: StateBackend | str | None = None
+) -> dict[str, Any]:
     """Read the cache, treating anything unreadable as an absent one.
 
+    Args:
+        path: Path of the cache.
+        scopes: The scopes the caller is going to read, or None for every one.
+            The SQLite and sharded caches read only these; the JSON one is
+            parsed whole either way, and answers every scope it holds.
+        backend: How the cache is stored, or None to go by its suffix.
+
+    Returns:
+        The cache document, or an empty one when there is nothing to read.
+
+    """
+    chosen = state_backend_for(path, backend)
+    if chosen is StateBackend.SQLITE:
+        from gitea.watch.sqlite_state import load_sqlite_state  # noqa: PLC0415
+
+        return load_sqlite_state(path, scopes=scopes)
+    if chosen is StateBackend.SHARDED:
+        from gitea.watch.sharded_state import load_sharded_state  # noqa: PLC0415
+
+        return load_sharded_state(path, scopes=scopes)
+    return _load_json_state(Path(path))
+
+
+def _load_json_state(path: Path) -> dict[str, Any]:
+    """Read the JSON cache, treating anything unreadable as an absent one.
+
     A missing file is the ordinary first run and is not reported. A file that
     exists but cannot be read as a cache document is reported as a warning,
     because it means the scopes in it are about to be baselined again and the
@@ -158,7 +229,6 @@ def load_state(path: str | Path) -> dict[str, Any]:
         The cache document, or an empty one when there is nothing to read.
 
     """
-    path = Path(path)
     try:
         raw = path.read_text(encoding="utf-8")
     except FileNotFoundError:
@@ -296,86 +366,47 @@ def scope_snapshots(state: dict[str, Any], scope: str) -> dict[str, dict[str, An
     return snapshots
 
 
-def record_scope(state: dict[str, Any], scope: str, snapshots: dict[str, dict[str, Any]]) -> None:
-    """Replace what the cache records for one scope.
-
-    Only that scope's entry is touched, so the scopes a run did not watch - and
-    any key of the document this version does not know about - survive the write.
+def scope_scanned_at(state: dict[str, Any], scope: str) -> datetime | None:
+    """Read when a scope was last walked in full.
 
     Args:
-        state: The cache document, modified in place.
+        state: The cache document.
         scope: Key of the scope.
-        snapshots: The snapshot of each issue currently in the scope.
-
-    """
-    scopes = state.setdefault("scopes", {})
-    scopes[scope] = {"issues": dict(snapshots)}
-
-
-def lock_path_for(path: str | Path) -> Path:
-    """Build the path of the lock file guarding one cache.
-
-    The lock is taken on a file of its own rather than on the cache, because the
-    cache is replaced by a rename: a lock held on the file that was there is not
-    held on the file that replaces it, and two runs would end up locking two
-    different files while believing they had the same one.
-
-    Args:
-        path: Path of the cache.
-
-    Returns:
-        Path of the lock file beside it.
-
-    """
-    path = Path(path)
-    return path.with_name(f"{path.name}.lock")
-
-
-def _take_lock(handle: int) -> bool:
-    """Take the exclusive advisory lock on an open lock file, waiting for it.
-
-    Args:
-        handle: File descriptor of the open lock file.
 
     Returns:
-        True when the lock was taken, and False when this build of Python offers
-        no call to take one with - which is reported rather than pretended,
-        since a caller told the lock is held would believe the critical section
-        is guarded.
-
-    Raises:
-        OSError: If the lock cannot be taken - the filesystem does not support
-            locking, or the wait ran out on Windows.
+        The time, or None when the scope records none that is readable and
+        carries a timezone - which makes it due to be walked in full.
 
     """
-    if fcntl is not None:
-        fcntl.flock(handle, fcntl.LOCK_EX)
-        return True
-    if msvcrt is not None:
-        # Windows locks a byte range rather than the file, and from the current
-        # position, so the range is pinned to the first byte of an empty file.
-        os.lseek(handle, 0, os.SEEK_SET)
-        msvcrt.locking(handle, msvcrt.LK_LOCK, 1)
-        return True
-    return False
+    entry = state.get("scopes", {}).get(scope)
+    raw = entry.get("scanned_at") if isinstance(entry, dict) else None
+    try:
+        scanned_at = datetime.fromisoformat(raw) if isinstance(raw, str) else None
+    except ValueError:
+        return None
+    return scanned_at if scanned_at is not None and scanned_at.tzinfo is not None else None
 
 
-def _drop_lock(handle: int) -> None:
-    """Release the exclusive advisory lock on an open lock file.
+def record_scope(
+    state: dict[str, Any], scope: str, snapshots: dict[str, dict[str, Any]], scanned_at: str | None = None
+) -> None:
+    """Replace what the cache records for one scope.
 
-    Closing the descriptor releases it too, on both platforms and when the
-    process dies without closing anything, so this only makes the release
-    explicit.
+    Only that scope's entry is touched, so the scopes a run did not watch - and
+    any key of the document this version does not know about - survive the write.
 
     Args:
-        handle: File descriptor of the open lock file.
+        state: The cache document, modified in place.
+        scope: Key of the scope.
+        snapshots: The snapshot of each issue currently in the scope.
+        scanned_at: When the scope was last walked in full, as an ISO 8601
+            timestamp, or None to record no such time.
 
     """
-    if fcntl is not None:
-        fcntl.flock(handle, fcntl.LOCK_UN)
-    elif msvcrt is not None:
-        os.lseek(handle, 0, os.SEEK_SET)
-        msvcrt.locking(handle, msvcrt.LK_UNLCK, 1)
+    scopes = state.setdefault("scopes", {})
+    scopes[scope] = {"issues": dict(snapshots)}
+    if scanned_at is not None:
+        scopes[scope]["scanned_at"] = scanned_at
 
 
 @contextmanager
@@ -416,7 +447,7 @@ def cache_lock(path: str | Path) -> Iterator[bool]:
     held = False
     try:
         try:
-            held = _take_lock(handle)
+            held = take_lock(handle)
             if not held:
                 logger.warning(
                     "This build of Python offers no way to lock the watch cache at %s; this run may overwrite what "
@@ -433,11 +464,17 @@ def cache_lock(path: str | Path) -> Iterator[bool]:
     finally:
         if held:
             with contextlib.suppress(OSError):
-                _drop_lock(handle)
+                drop_lock(handle)
         os.close(handle)
 
 
-def save_scopes(path: str | Path, scopes: dict[str, dict[str, dict[str, Any]]]) -> None:
+def save_scopes(
+    path: str | Path,
+    scopes: dict[str, dict[str, dict[str, Any]]],
+    *,
+    backend: StateBackend | str | None = None,
+    scanned_at: dict[str, str] | None = None,
+) -> None:
     """Record the scopes a run watched, leaving every other scope as it is.
 
     A run is authoritative only for the scopes it was asked to watch, so the
@@ -453,16 +490,36 @@ def save_scopes(path: str | Path, scopes: dict[str, dict[str, dict[str, Any]]])
     the first wrote. A cache that cannot be locked is still written, and is back
     to being racy rather than unusable.
 
+    The SQLite cache needs neither the re-read nor this lock: its scopes are
+    replaced row by row in one transaction, which SQLite serialises itself. The
+    sharded cache goes through both once per scope, on that scope's shard.
+
     Args:
         path: Path of the cache.
         scopes: The snapshots to record, keyed by scope.
+        backend: How the cache is stored, or None to go by its suffix.
+        scanned_at: When each scope was last walked in full, as `record_scope`
+            takes it. A scope given without one records none.
 
     Raises:
         OSError: If the cache cannot be written. It is left as it was.
 
     """
+    scanned_at = scanned_at or {}
+    chosen = state_backend_for(path, backend)
+    if chosen is StateBackend.SQLITE:
+        from gitea.watch.sqlite_state import save_sqlite_scopes  # noqa: PLC0415
+
+        save_sqlite_scopes(path, scopes, scanned_at=scanned_at)
+        return
+    if chosen is StateBackend.SHARDED:
+        from gitea.watch.sharded_state import save_sharded_scopes  # noqa: PLC0415
+
+        save_sharded_scopes(path, scopes, scanned_at=scanned_at)
+        return
+
     with cache_lock(path):
-        state = load_state(path)
+        state = _load_json_state(Path(path))
         for scope, snapshots in scopes.items():
-            record_scope(state, scope, snapshots)
+            record_scope(state, scope, snapshots, scanned_at.get(scope))
         save_state(path, state)
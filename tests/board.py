@@ -65,6 +65,21 @@ def make_client(columns_by_project, issues_by_column):
     return client
 
 
+def make_bare_async_client():
+    """Build an asynchronous client for a test to describe the board of.
+
+    The instance answers `/settings/api` without a page size, so every listing
+    is walked at `PAGE_SIZE`, as the tests' page layouts assume.
+
+    Returns:
+        The mock client.
+
+    """
+    client = MagicMock()
+    client.settings.get_api_settings = AsyncMock(return_value=({}, {"status_code": 200}))
+    return client
+
+
 def make_async_client(columns_by_project, issues_by_column):
     """Build an asynchronous client whose board is described by the given columns and issues.
 
@@ -76,7 +91,7 @@ def make_async_client(columns_by_project, issues_by_column):
         The mock client.
 
     """
-    client = MagicMock()
+    client = make_bare_async_client()
     client.project.list_project_columns = AsyncMock(side_effect=paged_columns(columns_by_project))
     client.project.list_project_column_issues = AsyncMock(side_effect=paged_issues(issues_by_column))
     return client
@@ -1,4 +1,4 @@
-"""Assertion helper for the CLI's `{"data": ..., "metadata": ...}` JSON envelope."""
+"""Assertion helpers for the CLI's `{"data": ..., "metadata": ...}` JSON envelope, and its JSON Lines form."""
 
 from __future__ import annotations
 
@@ -47,3 +47,29 @@ def parse_envelope(stdout: str, *, allow_prefix: str = "") -> dict[str, Any]:
         raise AssertionError(f"stdout is not an object keyed by {sorted(ENVELOPE_KEYS)}: {stdout!r}")
 
     return payload
+
+
+def parse_records(stdout: str) -> tuple[list[Any], dict[str, Any]]:
+    """Parse standard output as JSON Lines records, ending in the metadata record.
+
+    Args:
+        stdout: Captured standard output of an `--output jsonl` invocation.
+
+    Returns:
+        The records before the last line, and the metadata the last one carries.
+
+    Raises:
+        AssertionError: If a line is not JSON, or the last line is not an
+            object keyed by `metadata` alone.
+
+    """
+    lines = stdout.splitlines()
+    try:
+        records = [json.loads(line) for line in lines]
+    except json.JSONDecodeError as error:
+        raise AssertionError(f"stdout is not JSON Lines alone: {stdout!r}") from error
+
+    if not records or not isinstance(records[-1], dict) or set(records[-1]) != {"metadata"}:
+        raise AssertionError(f"stdout does not end in a metadata record: {stdout!r}")
+
+    return records[:-1], records[-1]["metadata"]
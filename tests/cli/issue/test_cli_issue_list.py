@@ -76,3 +76,98 @@ def test_list_command_calls_execute_and_wires_params(mock_gitea, mock_get_auth_p
         page=2,
         limit=5,
     )
+
+
+@patch("gitea.cli.utils.api.execute_api_command")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.gitea.Gitea")
+def test_list_command_records_the_listed_issue_ids(mock_gitea, mock_get_auth_params, mock_execute):
+    """Listing issues should keep their IDs, so later project commands resolve them without a request."""
+    from gitea.cli.utils.issue_ids import ISSUE_IDS_FILE, IssueIds
+    from gitea.client.cache import default_cache_dir
+
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+    client = MagicMock()
+    client.issue.list_issues.return_value = ([{"number": 15, "id": 1854}], {"status_code": 200})
+    mock_gitea.return_value.__enter__.return_value = client
+
+    list_command(ctx=make_ctx(), owner="owner", repository="repo", account_name=None, token=None, base_url=None)
+    mock_execute.call_args[1]["api_call"]()
+
+    ids = IssueIds(default_cache_dir() / ISSUE_IDS_FILE, "https://gitea.example.com")
+    assert ids.get("owner", "repo", 15) == 1854
+
+
+@patch("gitea.cli.utils.api.execute_api_stream")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.gitea.Gitea")
+def test_list_command_all_walks_every_page_and_records_each(mock_gitea, mock_get_auth_params, mock_stream):
+    """list_command --all should stream every page of issues, keeping the IDs of each."""
+    from gitea.cli.utils.issue_ids import ISSUE_IDS_FILE, IssueIds
+    from gitea.client.cache import default_cache_dir
+
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+    client = MagicMock()
+    client.issue.list_issues.side_effect = [
+        ([{"number": 16, "id": 1855}, {"number": 15, "id": 1854}], {"status_code": 200}),
+        ([{"number": 14, "id": 1853}], {"status_code": 200}),
+    ]
+    mock_gitea.return_value.__enter__.return_value = client
+
+    list_command(
+        ctx=make_ctx(),
+        owner="owner",
+        repository="repo",
+        limit=2,
+        all_pages=True,
+        concurrency=1,
+        account_name=None,
+        token=None,
+        base_url=None,
+    )
+    pages = list(mock_stream.call_args[1]["api_call"]())
+
+    assert [issue["number"] for batch, _ in pages for issue in batch] == [16, 15, 14]
+    assert [call.kwargs["page"] for call in client.issue.list_issues.call_args_list] == [1, 2]
+    ids = IssueIds(default_cache_dir() / ISSUE_IDS_FILE, "https://gitea.example.com")
+    assert [ids.get("owner", "repo", number) for number in (14, 15, 16)] == [1853, 1854, 1855]
+
+
+@patch("gitea.cli.utils.api.execute_api_stream")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.gitea.Gitea")
+def test_list_command_all_records_the_ids_once_after_the_walk(mock_gitea, mock_get_auth_params, mock_stream):
+    """Pages fetched on worker threads should not each rewrite the ID map."""
+    from gitea.cli.utils.issue_ids import IssueIds
+
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+    client = MagicMock()
+    sizes = {1: 2, 2: 2, 3: 1}
+    client.issue.list_issues.side_effect = lambda **kwargs: (
+        [
+            {"number": number, "id": 1000 + number}
+            for number in range(kwargs["page"] * 10, kwargs["page"] * 10 + sizes.get(kwargs["page"], 0))
+        ],
+        {"status_code": 200},
+    )
+    mock_gitea.return_value.__enter__.return_value = client
+
+    list_command(
+        ctx=make_ctx(),
+        owner="owner",
+        repository="repo",
+        limit=2,
+        all_pages=True,
+        concurrency=3,
+        account_name=None,
+        token=None,
+        base_url=None,
+    )
+    with patch.object(IssueIds, "record", autospec=True) as record:
+        stream = mock_stream.call_args[1]["api_call"]()
+        next(stream)
+        record.assert_not_called()
+        list(stream)
+
+    record.assert_called_once()
+    assert record.call_args.args[1:] == ("owner", "repo", {10: 1010, 11: 1011, 20: 1020, 21: 1021, 30: 1030})
@@ -310,6 +310,17 @@ class TestNotificationScopeThroughTheCli:
         assert result.exit_code == 0, result.output
         assert session.urls == [f"{_BASE_URL}/api/v1/repos/owner/repo/notifications"]
 
+    def test_all_still_asks_for_read_notifications_and_all_pages_walks_them(self, tmp_path: Path) -> None:
+        """`--all` should keep meaning the notifications marked as read, and `--all-pages` walk the pages."""
+        session = RecordingSession(payload=[{"id": 1}])
+
+        with patch("gitea.client.gitea.requests.Session", return_value=session):
+            result = runner.invoke(app, _invocation(tmp_path, "list", "--all", "--all-pages", "--limit", "1"))
+
+        assert result.exit_code == 0, result.output
+        assert [params["page"] for params in session.params] == [1, 2]
+        assert all(params["all"] is True for params in session.params)
+
     @pytest.mark.parametrize("command", ["list", "read"])
     @pytest.mark.parametrize("half", [["--owner", "owner"], ["--repository", "repo"]])
     def test_half_a_scope_is_refused_before_any_request(self, tmp_path: Path, command: str, half: list[str]) -> None:
@@ -329,3 +340,36 @@ class TestNotificationScopeThroughTheCli:
         assert "--repository" in message
         assert "together" in message
         assert session.requests == []
+
+
+@patch("gitea.cli.utils.api.execute_api_stream")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.gitea.Gitea")
+def test_list_command_all_walks_every_page(mock_gitea, mock_get_auth_params, mock_stream):
+    """list_command --all should stream every page of notifications, at --limit items a page."""
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+    client = MagicMock()
+    client.notification.list_repo_notifications.side_effect = [
+        ([{"id": 1}, {"id": 2}], {"status_code": 200}),
+        ([{"id": 3}], {"status_code": 200}),
+    ]
+    mock_gitea.return_value.__enter__.return_value = client
+
+    list_command(
+        ctx=make_ctx(),
+        owner="owner",
+        repository="repo",
+        page=None,
+        limit=2,
+        all_pages=True,
+        account_name="acct",
+        token=None,
+        base_url=None,
+    )
+
+    call_kwargs = mock_stream.call_args[1]
+    assert call_kwargs["command_name"] == "gitea-cli notification list"
+    pages = list(call_kwargs["api_call"]())
+    assert [item["id"] for batch, _ in pages for item in batch] == [1, 2, 3]
+    assert [call.kwargs["page"] for call in client.notification.list_repo_notifications.call_args_list] == [1, 2]
+    assert {call.kwargs["limit"] for call in client.notification.list_repo_notifications.call_args_list} == {2}
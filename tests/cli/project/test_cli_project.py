@@ -1944,3 +1944,76 @@ def test_move_issue_command_sorting_refusal_keeps_both_repositories(mock_gitea,
     )
     # The issue is named as it was addressed, not as a bare number.
     assert "#100 of owner/other-repo" in message
+
+
+@patch("gitea.cli.utils.api.execute_api_call")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.gitea.Gitea")
+def test_move_issue_command_from_file_moves_every_listed_card(mock_gitea, mock_get_auth_params, mock_execute, tmp_path):
+    """move_issue_command --from-file should make every move the file lists, and report each one."""
+    ctx = make_ctx()
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+
+    client = MagicMock()
+    board = FakeBoard({CARDED_COLUMN: [1854, 1855], TARGET_COLUMN: []}).attach(client)
+    mock_gitea.return_value.__enter__.return_value = client
+    path = tmp_path / "moves.jsonl"
+    path.write_text(
+        f'{{"issue_id": 1854, "column_id": {TARGET_COLUMN}}}\n{{"issue_id": 1855, "column_id": {TARGET_COLUMN}}}\n',
+        encoding="utf-8",
+    )
+
+    move_issue_command(
+        ctx=ctx,
+        owner="owner",
+        project_id=1,
+        from_file=path,
+        concurrency=2,
+        account_name="acct",
+        token=None,
+        base_url=None,
+    )
+
+    call_kwargs = mock_execute.call_args[1]
+    assert call_kwargs["command_name"] == "gitea-cli project issue move"
+    data, metadata = call_kwargs["api_call"]()
+
+    assert board.cards == {CARDED_COLUMN: [], TARGET_COLUMN: [1854, 1855]}
+    assert [(entry["issue_id"], entry["result"]) for entry in data] == [(1854, "moved"), (1855, "moved")]
+    assert metadata == {"move_count": 2, "failed_count": 0}
+    assert mock_gitea.call_args.kwargs["pool_maxsize"] >= 2
+    client.issue.get_issue.assert_not_called()
+
+    with patch("gitea.cli.output.print_result"):
+        call_kwargs["report"](data, metadata)
+        with pytest.raises(CommandError, match="1 of 2 moves failed"):
+            call_kwargs["report"](data, {"move_count": 2, "failed_count": 1})
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"from_file": "moves.jsonl", "issue_id": 100}, "--from-file lists the moves itself"),
+        ({"from_file": "moves.jsonl", "sorting": 1}, "--from-file lists the moves itself"),
+        ({"issue_id": 100}, "both --issue-id and --column-id"),
+        ({}, "both --issue-id and --column-id"),
+    ],
+)
+@patch("gitea.cli.utils.api.execute_api_call")
+@patch("gitea.cli.utils.api.execute_api_command")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.gitea.Gitea")
+def test_move_issue_command_refuses_a_move_named_twice_or_not_at_all(
+    mock_gitea, mock_get_auth_params, mock_execute_command, mock_execute_call, options, message
+):
+    """move_issue_command should take the move from --from-file or from the options, never both or neither."""
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+
+    move_issue_command(
+        ctx=make_ctx(), owner="owner", project_id=1, account_name="acct", token=None, base_url=None, **options
+    )
+
+    mock_execute = mock_execute_call if "from_file" in options else mock_execute_command
+    with pytest.raises(CommandError, match=message):
+        mock_execute.call_args[1]["api_call"]()
+    mock_gitea.assert_not_called()
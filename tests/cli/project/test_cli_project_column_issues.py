@@ -1,8 +1,9 @@
 """Unit tests for the project column-issue listing CLI commands."""
 
+import asyncio
 import json
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -24,6 +25,23 @@ def make_ctx():
     return SimpleNamespace(obj={"config_path": "/tmp/config"})
 
 
+def without_timings(metadata):
+    """Drop the per-column timings from a command's metadata, which vary from run to run.
+
+    Args:
+        metadata: The metadata the command reported.
+
+    Returns:
+        The metadata without `column_timings`, once those have been checked to
+        hold one non-negative duration per column.
+
+    """
+    timings = metadata["column_timings"]
+    assert all(entry["seconds"] >= 0 for entry in timings)
+    assert len(timings) == metadata["column_count"]
+    return {key: value for key, value in metadata.items() if key != "column_timings"}
+
+
 def paged_columns(*pages):
     """Build a side effect serving one page of columns per requested page number.
 
@@ -61,6 +79,21 @@ def paged_issues(pages_by_column):
     return _side_effect
 
 
+def make_async_board_client():
+    """Build an asynchronous client whose board listings are set by the test.
+
+    Returns:
+        A mock client whose column and column-issue listings are awaitable, on
+        an instance that does not report the page size it serves.
+
+    """
+    client = MagicMock()
+    client.settings.get_api_settings = AsyncMock(return_value=({}, {"status_code": 200}))
+    client.project.list_project_columns = AsyncMock()
+    client.project.list_project_column_issues = AsyncMock()
+    return client
+
+
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
 @patch("gitea.client.gitea.Gitea")
@@ -146,18 +179,18 @@ def test_list_column_issues_output_envelope(mock_gitea, mock_get_auth_params):
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_list_project_issues_command(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_list_project_issues_command(mock_async_gitea, mock_get_auth_params, mock_execute):
     """list_project_issues_command should group each column's issues under that column."""
     ctx = make_ctx()
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
 
-    client = MagicMock()
+    client = make_async_board_client()
     client.project.list_project_columns.side_effect = paged_columns(
         [{"id": 5, "title": "Todo"}, {"id": 6, "title": "Done"}]
     )
     client.project.list_project_column_issues.side_effect = paged_issues({5: [ISSUES[:1]], 6: [ISSUES[1:]]})
-    mock_gitea.return_value.__enter__.return_value = client
+    mock_async_gitea.return_value.__aenter__.return_value = client
 
     list_project_issues_command(
         ctx=ctx,
@@ -173,7 +206,7 @@ def test_list_project_issues_command(mock_gitea, mock_get_auth_params, mock_exec
     call_kwargs = mock_execute.call_args[1]
     assert call_kwargs["command_name"] == "gitea-cli project issues"
 
-    data, metadata = call_kwargs["api_call"]()
+    data, metadata = asyncio.run(call_kwargs["api_call"]())
     assert client.project.list_project_columns.call_args_list[0].kwargs == {
         "owner": "owner",
         "repository": "repo",
@@ -181,15 +214,16 @@ def test_list_project_issues_command(mock_gitea, mock_get_auth_params, mock_exec
         "page": 1,
         "limit": PAGE_SIZE,
     }
-    assert client.project.list_project_column_issues.call_args_list[0].kwargs == {
+    assert {
         "owner": "owner",
         "repository": "repo",
         "project_id": 1,
         "column_id": 5,
         "page": 1,
         "limit": PAGE_SIZE,
-    }
-    assert [call.kwargs["column_id"] for call in client.project.list_project_column_issues.call_args_list] == [
+    } in [call.kwargs for call in client.project.list_project_column_issues.call_args_list]
+    # The columns are walked side by side, so only each column's own requests are in order.
+    assert sorted(call.kwargs["column_id"] for call in client.project.list_project_column_issues.call_args_list) == [
         5,
         5,
         6,
@@ -199,26 +233,26 @@ def test_list_project_issues_command(mock_gitea, mock_get_auth_params, mock_exec
         {"column": {"id": 5, "title": "Todo"}, "issues": ISSUES[:1]},
         {"column": {"id": 6, "title": "Done"}, "issues": ISSUES[1:]},
     ]
-    assert metadata == {"status_code": 200, "column_count": 2, "issue_count": 2}
+    assert without_timings(metadata) == {"status_code": 200, "column_count": 2, "issue_count": 2}
 
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_list_project_issues_command_organization_project(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_list_project_issues_command_organization_project(mock_async_gitea, mock_get_auth_params, mock_execute):
     """Omitting the repository should list an organization project's issues."""
     ctx = make_ctx()
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
 
-    client = MagicMock()
+    client = make_async_board_client()
     client.project.list_project_columns.side_effect = paged_columns([{"id": 5, "title": "Todo"}])
     client.project.list_project_column_issues.side_effect = paged_issues({5: [ISSUES]})
-    mock_gitea.return_value.__enter__.return_value = client
+    mock_async_gitea.return_value.__aenter__.return_value = client
 
     list_project_issues_command(ctx=ctx, owner="my-org", project_id=1)
 
     call_kwargs = mock_execute.call_args[1]
-    call_kwargs["api_call"]()
+    asyncio.run(call_kwargs["api_call"]())
     assert client.project.list_project_columns.call_args_list[0].kwargs == {
         "owner": "my-org",
         "repository": None,
@@ -226,31 +260,32 @@ def test_list_project_issues_command_organization_project(mock_gitea, mock_get_a
         "page": 1,
         "limit": PAGE_SIZE,
     }
-    assert client.project.list_project_column_issues.call_args_list[0].kwargs == {
+    assert {
         "owner": "my-org",
         "repository": None,
         "project_id": 1,
         "column_id": 5,
         "page": 1,
         "limit": PAGE_SIZE,
-    }
+    } in [call.kwargs for call in client.project.list_project_column_issues.call_args_list]
 
 
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_list_project_issues_output_envelope(mock_gitea, mock_get_auth_params):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_list_project_issues_output_envelope(mock_async_gitea, mock_get_auth_params):
     """`project issues` should print the grouped cards in the standard JSON envelope."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
 
-    client = MagicMock()
+    client = make_async_board_client()
     client.project.list_project_columns.side_effect = paged_columns([{"id": 5, "title": "Todo"}])
     client.project.list_project_column_issues.side_effect = paged_issues({5: [ISSUES]})
-    mock_gitea.return_value.__enter__.return_value = client
+    mock_async_gitea.return_value.__aenter__.return_value = client
 
     result = runner.invoke(app, ["project", "issues", "--owner", "my-org", "--project-id", "1"])
 
     assert result.exit_code == 0
     payload = json.loads(result.stdout)
+    payload["metadata"] = without_timings(payload["metadata"])
     assert payload == {
         "data": [{"column": {"id": 5, "title": "Todo"}, "issues": ISSUES}],
         "metadata": {"status_code": 200, "column_count": 1, "issue_count": 2},
@@ -258,8 +293,8 @@ def test_list_project_issues_output_envelope(mock_gitea, mock_get_auth_params):
 
 
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_list_project_issues_spans_every_page(mock_gitea, mock_get_auth_params):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_list_project_issues_spans_every_page(mock_async_gitea, mock_get_auth_params):
     """`project issues` should aggregate every page of columns and of each column's issues."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
 
@@ -268,7 +303,7 @@ def test_list_project_issues_spans_every_page(mock_gitea, mock_get_auth_params):
     todo_issues = [{"number": n, "title": f"Issue {n}", "state": "open"} for n in (1, 2, 3)]
     doing_issues = [{"number": 4, "title": "Issue 4", "state": "open"}]
 
-    client = MagicMock()
+    client = make_async_board_client()
     client.project.list_project_columns.side_effect = paged_columns(columns_page_1, columns_page_2)
     client.project.list_project_column_issues.side_effect = paged_issues(
         {
@@ -277,7 +312,7 @@ def test_list_project_issues_spans_every_page(mock_gitea, mock_get_auth_params):
             7: [],
         }
     )
-    mock_gitea.return_value.__enter__.return_value = client
+    mock_async_gitea.return_value.__aenter__.return_value = client
 
     result = runner.invoke(app, ["project", "issues", "--owner", "my-org", "--project-id", "1"])
 
@@ -288,24 +323,24 @@ def test_list_project_issues_spans_every_page(mock_gitea, mock_get_auth_params):
         {"column": {"id": 6, "title": "Doing"}, "issues": doing_issues},
         {"column": {"id": 7, "title": "Done"}, "issues": []},
     ]
-    assert payload["metadata"] == {"status_code": 200, "column_count": 3, "issue_count": 4}
+    assert without_timings(payload["metadata"]) == {"status_code": 200, "column_count": 3, "issue_count": 4}
     assert [call.kwargs["page"] for call in client.project.list_project_columns.call_args_list] == [1, 2]
-    assert [
+    assert sorted(
         (call.kwargs["column_id"], call.kwargs["page"])
         for call in client.project.list_project_column_issues.call_args_list
-    ] == [(5, 1), (5, 2), (6, 1), (6, 2), (7, 1)]
+    ) == [(5, 1), (5, 2), (6, 1), (6, 2), (7, 1)]
 
 
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_list_project_issues_spans_several_continuation_pages(mock_gitea, mock_get_auth_params):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_list_project_issues_spans_several_continuation_pages(mock_async_gitea, mock_get_auth_params):
     """Full pages should keep being followed until a short one ends the listing."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
 
     columns = [{"id": column_id, "title": f"Column {column_id}"} for column_id in (5, 6, 7, 8, 9)]
     todo_issues = [{"number": n, "title": f"Issue {n}", "state": "open"} for n in (1, 2, 3, 4, 5)]
 
-    client = MagicMock()
+    client = make_async_board_client()
     # Three pages of columns, of lengths 2, 2 and 1: two continuations, then a short page.
     client.project.list_project_columns.side_effect = paged_columns(columns[:2], columns[2:4], columns[4:])
     # Column 5 likewise holds three pages of issues, of lengths 2, 2 and 1.
@@ -318,7 +353,7 @@ def test_list_project_issues_spans_several_continuation_pages(mock_gitea, mock_g
             9: [],
         }
     )
-    mock_gitea.return_value.__enter__.return_value = client
+    mock_async_gitea.return_value.__aenter__.return_value = client
 
     result = runner.invoke(app, ["project", "issues", "--owner", "my-org", "--project-id", "1"])
 
@@ -331,17 +366,46 @@ def test_list_project_issues_spans_several_continuation_pages(mock_gitea, mock_g
         {"column": {"id": 8, "title": "Column 8"}, "issues": []},
         {"column": {"id": 9, "title": "Column 9"}, "issues": []},
     ]
-    assert payload["metadata"] == {"status_code": 200, "column_count": 5, "issue_count": 5}
+    assert without_timings(payload["metadata"]) == {"status_code": 200, "column_count": 5, "issue_count": 5}
 
     # Both listings stop on the short page, without requesting the page after it.
     assert [call.kwargs["page"] for call in client.project.list_project_columns.call_args_list] == [1, 2, 3]
-    assert [
+    assert sorted(
         (call.kwargs["column_id"], call.kwargs["page"])
         for call in client.project.list_project_column_issues.call_args_list
-    ] == [(5, 1), (5, 2), (5, 3), (6, 1), (7, 1), (8, 1), (9, 1)]
+    ) == [(5, 1), (5, 2), (5, 3), (6, 1), (7, 1), (8, 1), (9, 1)]
 
     # Every request, continuation or not, asks for a full page.
     calls = (
         client.project.list_project_columns.call_args_list + client.project.list_project_column_issues.call_args_list
     )
     assert [call.kwargs["limit"] for call in calls] == [PAGE_SIZE] * len(calls)
+
+
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_list_project_issues_reads_columns_side_by_side(mock_async_gitea, mock_get_auth_params):
+    """The columns should be walked as tasks on the one session, not one after another."""
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+    started = {}
+
+    async def list_column_issues(**kwargs):
+        # The first column's walk only finishes once the second's has begun,
+        # which a walk reading the columns in turn never lets happen.
+        started.setdefault(kwargs["column_id"], asyncio.Event()).set()
+        if kwargs["column_id"] == 5:
+            await asyncio.wait_for(started.setdefault(6, asyncio.Event()).wait(), timeout=5)
+        return [], {"status_code": 200}
+
+    client = make_async_board_client()
+    client.project.list_project_columns.side_effect = paged_columns([{"id": 5, "title": "Todo"}, {"id": 6}])
+    client.project.list_project_column_issues.side_effect = list_column_issues
+    mock_async_gitea.return_value.__aenter__.return_value = client
+
+    result = runner.invoke(app, ["project", "issues", "--owner", "my-org", "--project-id", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert [entry["column"] for entry in json.loads(result.stdout)["data"]] == [
+        {"id": 5, "title": "Todo"},
+        {"id": 6, "title": None},
+    ]
@@ -1,8 +1,9 @@
 """Unit tests for `project show`, the board in one call."""
 
+import asyncio
 import json
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -41,6 +42,23 @@ def make_ctx():
     return SimpleNamespace(obj={"config_path": "/tmp/config"})
 
 
+def without_timings(metadata):
+    """Drop the per-column timings from a command's metadata, which vary from run to run.
+
+    Args:
+        metadata: The metadata the command reported.
+
+    Returns:
+        The metadata without `column_timings`, once those have been checked to
+        hold one non-negative duration per column.
+
+    """
+    timings = metadata["column_timings"]
+    assert all(entry["seconds"] >= 0 for entry in timings)
+    assert len(timings) == metadata["column_count"]
+    return {key: value for key, value in metadata.items() if key != "column_timings"}
+
+
 def paged_columns(*pages, metadata=None):
     """Build a side effect serving one page of columns per requested page number.
 
@@ -80,42 +98,43 @@ def paged_issues(pages_by_column):
     return _side_effect
 
 
-def make_client(mock_gitea, *, columns=None, issues_by_column=None, project_metadata=None):
-    """Build the client a `project show` invocation is answered by.
+def make_client(mock_async_gitea, *, columns=None, issues_by_column=None, project_metadata=None):
+    """Build the asynchronous client a `project show` invocation is answered by.
 
     Args:
-        mock_gitea: The patched client class, whose context manager is wired to
-            the client built here.
+        mock_async_gitea: The patched client class, whose context manager is
+            wired to the client built here.
         columns: The single page of columns the board holds. Defaults to `COLUMNS`.
         issues_by_column: Mapping of column ID to that column's pages of issues.
             Defaults to one issue on the first column and one on the second.
         project_metadata: The metadata the project fetch answers with.
 
     Returns:
-        The mock client.
+        The mock client, on an instance that does not report the page size it
+        serves.
 
     """
     client = MagicMock()
-    client.project.get_project.return_value = (
-        PROJECT,
-        {"status_code": 200} if project_metadata is None else project_metadata,
+    client.settings.get_api_settings = AsyncMock(return_value=({}, {"status_code": 200}))
+    client.project.get_project = AsyncMock(
+        return_value=(PROJECT, {"status_code": 200} if project_metadata is None else project_metadata)
     )
-    client.project.list_project_columns.side_effect = paged_columns(COLUMNS if columns is None else columns)
-    client.project.list_project_column_issues.side_effect = paged_issues(
-        {5: [ISSUES[:1]], 6: [ISSUES[1:]]} if issues_by_column is None else issues_by_column
+    client.project.list_project_columns = AsyncMock(side_effect=paged_columns(COLUMNS if columns is None else columns))
+    client.project.list_project_column_issues = AsyncMock(
+        side_effect=paged_issues({5: [ISSUES[:1]], 6: [ISSUES[1:]]} if issues_by_column is None else issues_by_column)
     )
-    mock_gitea.return_value.__enter__.return_value = client
+    mock_async_gitea.return_value.__aenter__.return_value = client
     return client
 
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_command(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command(mock_async_gitea, mock_get_auth_params, mock_execute):
     """`project show` should report the project, its columns, and each column's cards."""
     ctx = make_ctx()
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    client = make_client(mock_gitea)
+    client = make_client(mock_async_gitea)
 
     show_command(
         ctx=ctx,
@@ -131,7 +150,7 @@ def test_show_command(mock_gitea, mock_get_auth_params, mock_execute):
     call_kwargs = mock_execute.call_args[1]
     assert call_kwargs["command_name"] == "gitea-cli project show"
 
-    data, metadata = call_kwargs["api_call"]()
+    data, metadata = asyncio.run(call_kwargs["api_call"]())
 
     client.project.get_project.assert_called_once_with(owner="owner", repository="repo", project_id=1)
     assert client.project.list_project_columns.call_args_list[0].kwargs == {
@@ -141,14 +160,14 @@ def test_show_command(mock_gitea, mock_get_auth_params, mock_execute):
         "page": 1,
         "limit": PAGE_SIZE,
     }
-    assert client.project.list_project_column_issues.call_args_list[0].kwargs == {
+    assert {
         "owner": "owner",
         "repository": "repo",
         "project_id": 1,
         "column_id": 5,
         "page": 1,
         "limit": PAGE_SIZE,
-    }
+    } in [call.kwargs for call in client.project.list_project_column_issues.call_args_list]
 
     assert data == {
         "project": PROJECT,
@@ -157,20 +176,20 @@ def test_show_command(mock_gitea, mock_get_auth_params, mock_execute):
             {**COLUMNS[1], "issue_count": 1, "issue_ids": [1874]},
         ],
     }
-    assert metadata == {"status_code": 200, "column_count": 2, "issue_count": 2}
+    assert without_timings(metadata) == {"status_code": 200, "column_count": 2, "issue_count": 2}
 
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_command_without_full_omits_the_issues_themselves(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command_without_full_omits_the_issues_themselves(mock_async_gitea, mock_get_auth_params, mock_execute):
     """Without `--full` a column should carry the IDs of its cards and not the cards."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    make_client(mock_gitea)
+    make_client(mock_async_gitea)
 
     show_command(ctx=make_ctx(), owner="my-org", project_id=1)
 
-    data, _ = mock_execute.call_args[1]["api_call"]()
+    data, _ = asyncio.run(mock_execute.call_args[1]["api_call"]())
 
     for column in data["columns"]:
         assert "issues" not in column
@@ -178,15 +197,15 @@ def test_show_command_without_full_omits_the_issues_themselves(mock_gitea, mock_
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_command_full_includes_every_card(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command_full_includes_every_card(mock_async_gitea, mock_get_auth_params, mock_execute):
     """`--full` should add each column's issues, as the API returned them."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    make_client(mock_gitea)
+    make_client(mock_async_gitea)
 
     show_command(ctx=make_ctx(), owner="my-org", project_id=1, full=True)
 
-    data, metadata = mock_execute.call_args[1]["api_call"]()
+    data, metadata = asyncio.run(mock_execute.call_args[1]["api_call"]())
 
     assert data == {
         "project": PROJECT,
@@ -195,20 +214,20 @@ def test_show_command_full_includes_every_card(mock_gitea, mock_get_auth_params,
             {**COLUMNS[1], "issue_count": 1, "issue_ids": [1874], "issues": ISSUES[1:]},
         ],
     }
-    assert metadata == {"status_code": 200, "column_count": 2, "issue_count": 2}
+    assert without_timings(metadata) == {"status_code": 200, "column_count": 2, "issue_count": 2}
 
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_command_organization_project(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command_organization_project(mock_async_gitea, mock_get_auth_params, mock_execute):
     """Omitting the repository should ask for the owner's own project throughout."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    client = make_client(mock_gitea)
+    client = make_client(mock_async_gitea)
 
     show_command(ctx=make_ctx(), owner="my-org", project_id=1)
 
-    mock_execute.call_args[1]["api_call"]()
+    asyncio.run(mock_execute.call_args[1]["api_call"]())
 
     client.project.get_project.assert_called_once_with(owner="my-org", repository=None, project_id=1)
     calls = (
@@ -220,8 +239,8 @@ def test_show_command_organization_project(mock_gitea, mock_get_auth_params, moc
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_command_reports_the_project_calls_status(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command_reports_the_project_calls_status(mock_async_gitea, mock_get_auth_params, mock_execute):
     """The status code reported should be the project fetch's, not a listing's.
 
     The project is what the command was asked for; the columns and their issues
@@ -229,13 +248,13 @@ def test_show_command_reports_the_project_calls_status(mock_gitea, mock_get_auth
     command reporting the wrong call's status is visible.
     """
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    make_client(mock_gitea, project_metadata={"status_code": 203, "url": "https://gitea.example.com/projects/1"})
+    make_client(mock_async_gitea, project_metadata={"status_code": 203, "url": "https://gitea.example.com/projects/1"})
 
     show_command(ctx=make_ctx(), owner="my-org", project_id=1)
 
-    _, metadata = mock_execute.call_args[1]["api_call"]()
+    _, metadata = asyncio.run(mock_execute.call_args[1]["api_call"]())
 
-    assert metadata == {
+    assert without_timings(metadata) == {
         "status_code": 203,
         "url": "https://gitea.example.com/projects/1",
         "column_count": 2,
@@ -245,32 +264,32 @@ def test_show_command_reports_the_project_calls_status(mock_gitea, mock_get_auth
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_command_empty_board(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command_empty_board(mock_async_gitea, mock_get_auth_params, mock_execute):
     """A board without columns should report no columns and no cards."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    client = make_client(mock_gitea, columns=[], issues_by_column={})
+    client = make_client(mock_async_gitea, columns=[], issues_by_column={})
 
     show_command(ctx=make_ctx(), owner="my-org", project_id=1)
 
-    data, metadata = mock_execute.call_args[1]["api_call"]()
+    data, metadata = asyncio.run(mock_execute.call_args[1]["api_call"]())
 
     assert data == {"project": PROJECT, "columns": []}
-    assert metadata == {"status_code": 200, "column_count": 0, "issue_count": 0}
+    assert without_timings(metadata) == {"status_code": 200, "column_count": 0, "issue_count": 0}
     client.project.list_project_column_issues.assert_not_called()
 
 
 @patch("gitea.cli.utils.api.execute_api_command")
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_command_empty_column(mock_gitea, mock_get_auth_params, mock_execute):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command_empty_column(mock_async_gitea, mock_get_auth_params, mock_execute):
     """A column holding no cards should report a count of zero and no IDs."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    make_client(mock_gitea, issues_by_column={5: [ISSUES], 6: []})
+    make_client(mock_async_gitea, issues_by_column={5: [ISSUES], 6: []})
 
     show_command(ctx=make_ctx(), owner="my-org", project_id=1)
 
-    data, metadata = mock_execute.call_args[1]["api_call"]()
+    data, metadata = asyncio.run(mock_execute.call_args[1]["api_call"]())
 
     assert data["columns"] == [
         {**COLUMNS[0], "issue_count": 2, "issue_ids": [1873, 1874]},
@@ -280,16 +299,17 @@ def test_show_command_empty_column(mock_gitea, mock_get_auth_params, mock_execut
 
 
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_output_envelope(mock_gitea, mock_get_auth_params):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_output_envelope(mock_async_gitea, mock_get_auth_params):
     """`project show` should print the board in the standard JSON envelope."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    make_client(mock_gitea)
+    make_client(mock_async_gitea)
 
     result = runner.invoke(app, ["project", "show", "--owner", "my-org", "--project-id", "31"])
 
     assert result.exit_code == 0
     payload = json.loads(result.stdout)
+    payload["metadata"] = without_timings(payload["metadata"])
     assert payload == {
         "data": {
             "project": PROJECT,
@@ -303,11 +323,11 @@ def test_show_output_envelope(mock_gitea, mock_get_auth_params):
 
 
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_full_flag_is_accepted_on_the_command_line(mock_gitea, mock_get_auth_params):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_full_flag_is_accepted_on_the_command_line(mock_async_gitea, mock_get_auth_params):
     """`--full` should be a flag, and should widen what each column carries."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
-    make_client(mock_gitea)
+    make_client(mock_async_gitea)
 
     result = runner.invoke(app, ["project", "show", "--owner", "my-org", "--project-id", "31", "--full"])
 
@@ -317,8 +337,8 @@ def test_show_full_flag_is_accepted_on_the_command_line(mock_gitea, mock_get_aut
 
 
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_spans_every_page(mock_gitea, mock_get_auth_params):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_spans_every_page(mock_async_gitea, mock_get_auth_params):
     """Every page of columns, and of each column's issues, should be counted."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
 
@@ -326,13 +346,10 @@ def test_show_spans_every_page(mock_gitea, mock_get_auth_params):
     todo_issues = [{"id": 100 + n, "number": n, "title": f"Issue {n}"} for n in (1, 2, 3)]
     doing_issues = [{"id": 104, "number": 4, "title": "Issue 4"}]
 
-    client = MagicMock()
-    client.project.get_project.return_value = (PROJECT, {"status_code": 200})
-    client.project.list_project_columns.side_effect = paged_columns(columns[:2], columns[2:])
-    client.project.list_project_column_issues.side_effect = paged_issues(
-        {5: [todo_issues[:2], todo_issues[2:]], 6: [doing_issues], 7: []}
+    client = make_client(
+        mock_async_gitea, issues_by_column={5: [todo_issues[:2], todo_issues[2:]], 6: [doing_issues], 7: []}
     )
-    mock_gitea.return_value.__enter__.return_value = client
+    client.project.list_project_columns.side_effect = paged_columns(columns[:2], columns[2:])
 
     result = runner.invoke(app, ["project", "show", "--owner", "my-org", "--project-id", "31"])
 
@@ -343,25 +360,62 @@ def test_show_spans_every_page(mock_gitea, mock_get_auth_params):
         {**columns[1], "issue_count": 1, "issue_ids": [104]},
         {**columns[2], "issue_count": 0, "issue_ids": []},
     ]
-    assert payload["metadata"] == {"status_code": 200, "column_count": 3, "issue_count": 4}
+    assert without_timings(payload["metadata"]) == {"status_code": 200, "column_count": 3, "issue_count": 4}
     assert [call.kwargs["page"] for call in client.project.list_project_columns.call_args_list] == [1, 2]
-    assert [
+    # The columns are walked side by side, so only each column's own requests are in order.
+    assert sorted(
         (call.kwargs["column_id"], call.kwargs["page"])
         for call in client.project.list_project_column_issues.call_args_list
-    ] == [(5, 1), (5, 2), (6, 1), (6, 2), (7, 1)]
+    ) == [(5, 1), (5, 2), (6, 1), (6, 2), (7, 1)]
 
 
 @patch("gitea.cli.utils.auth.get_auth_params")
-@patch("gitea.client.gitea.Gitea")
-def test_show_reports_a_failure_without_a_traceback(mock_gitea, mock_get_auth_params):
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_reports_a_failure_without_a_traceback(mock_async_gitea, mock_get_auth_params):
     """A refused call should exit non-zero having printed nothing on stdout."""
     mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
 
-    client = MagicMock()
+    client = make_client(mock_async_gitea)
     client.project.get_project.side_effect = RuntimeError("refused")
-    mock_gitea.return_value.__enter__.return_value = client
 
     result = runner.invoke(app, ["project", "show", "--owner", "my-org", "--project-id", "31"])
 
     assert result.exit_code == 1
     assert result.stdout == ""
+
+
+@patch("gitea.cli.utils.api.execute_api_command")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.async_gitea.AsyncGitea")
+def test_show_command_reads_the_columns_side_by_side_in_board_order(
+    mock_async_gitea, mock_get_auth_params, mock_execute
+):
+    """Columns should be read concurrently, and reported in board order whichever finished first."""
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+    columns = [{"id": column_id, "title": f"Column {column_id}"} for column_id in (5, 6, 7)]
+    client = make_client(
+        mock_async_gitea, columns=columns, issues_by_column={5: [[ISSUES[0]]], 6: [[]], 7: [[ISSUES[1]]]}
+    )
+    listing = client.project.list_project_column_issues.side_effect
+    inside = 0
+    most = 0
+
+    async def slow_listing(**kwargs):
+        nonlocal inside, most
+        inside += 1
+        most = max(most, inside)
+        # The first column is the slowest, so finishing order is not board order.
+        await asyncio.sleep(0.05 if kwargs["column_id"] == 5 else 0.01)
+        inside -= 1
+        return listing(**kwargs)
+
+    client.project.list_project_column_issues.side_effect = slow_listing
+
+    show_command(ctx=make_ctx(), owner="my-org", project_id=31, concurrency=2)
+    data, metadata = asyncio.run(mock_execute.call_args[1]["api_call"]())
+
+    assert [column["id"] for column in data["columns"]] == [5, 6, 7]
+    assert [column["issue_count"] for column in data["columns"]] == [1, 0, 1]
+    assert [entry["column_id"] for entry in metadata["column_timings"]] == [5, 6, 7]
+    assert metadata["column_timings"][0]["seconds"] >= 0.05
+    assert most == 2
@@ -65,3 +65,36 @@ def test_list_command_calls_execute_and_delegates(mock_gitea, mock_get_auth_para
         page=3,
         limit=15,
     )
+
+
+@patch("gitea.cli.utils.api.execute_api_stream")
+@patch("gitea.cli.utils.auth.get_auth_params")
+@patch("gitea.client.gitea.Gitea")
+def test_list_command_all_walks_every_page(mock_gitea, mock_get_auth_params, mock_stream):
+    """list_command --all should stream every page of pull requests, at --limit items a page."""
+    mock_get_auth_params.return_value = ("tok", "https://gitea.example.com")
+    client = MagicMock()
+    client.pull_request.list_pull_requests.side_effect = [
+        ([{"id": 1}, {"id": 2}], {"status_code": 200}),
+        ([{"id": 3}], {"status_code": 200}),
+    ]
+    mock_gitea.return_value.__enter__.return_value = client
+
+    list_command(
+        ctx=make_ctx(),
+        owner="owner",
+        repository="repo",
+        page=None,
+        limit=2,
+        all_pages=True,
+        account_name="acct",
+        token=None,
+        base_url=None,
+    )
+
+    call_kwargs = mock_stream.call_args[1]
+    assert call_kwargs["command_name"] == "gitea-cli pull-request list"
+    pages = list(call_kwargs["api_call"]())
+    assert [item["id"] for batch, _ in pages for item in batch] == [1, 2, 3]
+    assert [call.kwargs["page"] for call in client.pull_request.list_pull_requests.call_args_list] == [1, 2]
+    assert {call.kwargs["limit"] for call in client.pull_request.list_pull_requests.call_args_list} == {2}
@@ -265,3 +265,24 @@ def test_pagination_options_reach_the_request(arguments: tuple[str, ...], expect
 
     assert result.exit_code == 0, result.output
     assert session.params == [expected]
+
+
+def test_all_walks_every_page_in_one_session_and_prints_one_envelope():
+    """`--all` should page through the listing and print every repository in a single envelope."""
+    result, session = run("--owner", "my-org", "--all", "--limit", "1")
+
+    assert result.exit_code == 0, result.output
+    assert parse_envelope(result.stdout)["data"] == [REPOSITORY]
+    # Page 2 repeats page 1, which is how an instance answering every page alike
+    # ends a walk; the repeated items are not printed twice.
+    assert [params["page"] for params in session.params] == [1, 2]
+    assert {params["limit"] for params in session.params} == {1}
+
+
+def test_all_refuses_a_page_number():
+    """`--all` should refuse --page rather than pick one of them, printing nothing."""
+    result, session = run("--owner", "my-org", "--all", "--page", "2")
+
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert session.requests == []
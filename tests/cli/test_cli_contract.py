@@ -25,6 +25,8 @@ well. Nothing here reaches the network or reads the user's configuration.
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -37,9 +39,10 @@ from typer.testing import CliRunner
 
 from gitea.cli.main import app
 from gitea.watch.state import STATE_FILE_ENV
-from tests.cli.envelope import parse_envelope
+from tests.cli.envelope import parse_envelope, parse_records
 from tests.cli.tree import leaf_commands
-from tests.transport import NO_CONTENT, RoutedSession
+from tests.cli.webhook import SECRET, free_port, post_delivery
+from tests.transport import NO_CONTENT, AsyncRoutedSession, RoutedSession
 
 runner = CliRunner()
 
@@ -214,6 +217,9 @@ BOARD_ROUTES = (
 # a consumer reads `added` and `removed` without first asking what happened.
 WATCH_SCOPE = "repo:o/r"
 
+# The port `watch serve` listens on, and is posted a delivery at.
+WEBHOOK_PORT = free_port()
+
 
 def _change(issue: dict[str, Any], kind: str, detail: str) -> dict[str, Any]:
     """Build the change record a watch reports for one issue.
@@ -265,6 +271,12 @@ class Contract:
             nothing to report on a first one.
         api: Whether the command reaches the API at all. The `config` commands do
             not; they act on the configuration file.
+        records: Whether the command writes JSON Lines records whatever
+            `--output` says, as a stream with no end does. Its records are then
+            its `data`, and its last line its `metadata`.
+        alongside: Callable run on a thread of its own while the command runs,
+            for a command waiting on something besides the API: `watch serve`
+            is posted the delivery it reports on.
 
     """
 
@@ -276,6 +288,8 @@ class Contract:
     metadata: tuple[str, ...] = ("status_code",)
     warmup: tuple[tuple[str, Any], ...] | None = None
     api: bool = True
+    records: bool = False
+    alongside: Callable[[], Any] | None = None
 
 
 # The options addressing a repository, an issue on it, and a project of the
@@ -395,7 +409,7 @@ CONTRACTS = (
         # names it `title`, as the API does; `name` here would be the rename the
         # convention exists to prevent.
         data=[{"column": {"id": COLUMN["id"], "title": COLUMN["title"]}, "issues": [ISSUE_ON_BOARD]}],
-        metadata=("status_code", "column_count", "issue_count"),
+        metadata=("status_code", "column_count", "issue_count", "column_timings"),
     ),
     Contract(
         path=("project", "show"),
@@ -410,7 +424,7 @@ CONTRACTS = (
             "project": PROJECT,
             "columns": [{**COLUMN, "issue_count": 1, "issue_ids": [ISSUE_ON_BOARD["id"]]}],
         },
-        metadata=("status_code", "column_count", "issue_count"),
+        metadata=("status_code", "column_count", "issue_count", "column_timings"),
     ),
     Contract(path=("project", "column", "create"), args=(*BOARD, "--title", "Working"), payload=COLUMN),
     Contract(path=("project", "column", "list"), args=BOARD, payload=[COLUMN]),
@@ -452,8 +466,50 @@ CONTRACTS = (
             "issue_count",
             "change_count",
             "state_file",
+            "state_backend",
+            "dry_run",
+        ),
+    ),
+    Contract(
+        path=("watch", "run"),
+        args=(*REPO, "--ticks", "1"),
+        warmup=(("/comments", [COMMENT]), ("", [ISSUE])),
+        routes=(("/comments", [COMMENT]), ("", [OTHER_ISSUE])),
+        data=[_change(OTHER_ISSUE, "new", "new issue"), _change(ISSUE, "gone", "no longer listed")],
+        metadata=(
+            "scopes",
+            "baselined_scopes",
+            "polls",
+            "failed_polls",
+            "change_count",
+            "state_file",
+            "state_backend",
+            "dry_run",
+        ),
+        records=True,
+    ),
+    Contract(
+        path=("watch", "serve"),
+        args=(*REPO, "--secret", SECRET, "--port", str(WEBHOOK_PORT), "--deliveries", "1"),
+        routes=(("/comments", [COMMENT]), ("", [ISSUE])),
+        alongside=lambda: post_delivery(
+            WEBHOOK_PORT, "issues", {"action": "opened", "issue": OTHER_ISSUE, "repository": REPOSITORY}
+        ),
+        data=[_change(OTHER_ISSUE, "new", "new issue")],
+        metadata=(
+            "scopes",
+            "baselined_scopes",
+            "deliveries",
+            "applied_deliveries",
+            "ignored_deliveries",
+            "rejected_deliveries",
+            "failed_deliveries",
+            "change_count",
+            "state_file",
+            "state_backend",
             "dry_run",
         ),
+        records=True,
     ),
 )
 
@@ -497,10 +553,13 @@ def invoke(
         auth: How the command is told which instance to talk to.
 
     Returns:
-        The result of the invocation, and the session recording what it asked for.
+        The result of the invocation, and the session recording what it asked for:
+        the `aiohttp` one for a command running on `AsyncGitea`, the `requests`
+        one otherwise.
 
     """
     session = RoutedSession(routes, payload=contract.payload)
+    async_session = AsyncRoutedSession(routes, payload=contract.payload)
     arguments = [
         "--config-path",
         str(config_path),
@@ -511,8 +570,17 @@ def invoke(
         *auth,
     ]
 
-    with patch("gitea.client.gitea.requests.Session", return_value=session):
-        return runner.invoke(app, arguments), session
+    alongside = threading.Thread(target=contract.alongside, daemon=True) if contract.alongside else None
+    if alongside is not None:
+        alongside.start()
+    with (
+        patch("gitea.client.gitea.requests.Session", return_value=session),
+        patch("gitea.client.async_gitea.ClientSession", return_value=async_session),
+    ):
+        result = runner.invoke(app, arguments)
+    if alongside is not None:
+        alongside.join(timeout=10)
+    return result, async_session if async_session.requests else session
 
 
 def contract_cases() -> list[Any]:
@@ -551,11 +619,15 @@ def test_subcommand_emits_the_declared_data(
     result, session = invoke(contract, contract.routes, config_path, auth)
 
     assert result.exit_code == 0, result.output
-    envelope = parse_envelope(result.stdout)
+    if contract.records:
+        data, metadata = parse_records(result.stdout)
+    else:
+        envelope = parse_envelope(result.stdout)
+        data, metadata = envelope["data"], envelope["metadata"]
 
     expected = contract.payload if isinstance(contract.data, Unchanged) else contract.data
-    assert envelope["data"] == expected
-    assert set(envelope["metadata"]) == set(contract.metadata)
+    assert data == expected
+    assert set(metadata) == set(contract.metadata)
 
     assert_requests_were_addressed(contract, session)
 
@@ -2,6 +2,7 @@
 
 import importlib
 import inspect
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Self
 from unittest.mock import MagicMock, patch
@@ -10,6 +11,7 @@ import pytest
 import requests
 import typer
 import yaml
+from aiohttp import ClientConnectionError
 from typer.main import get_command
 from typer.testing import CliRunner
 
@@ -17,7 +19,7 @@ from gitea.cli.main import LoggingLevel, app, main, register_commands, setup_log
 from gitea.cli.output import OutputFormat, get_output_format
 from gitea.version import __version__
 from gitea.watch.state import STATE_FILE_ENV
-from tests.cli.envelope import parse_envelope
+from tests.cli.envelope import parse_envelope, parse_records
 from tests.cli.rendering import unrendered
 from tests.cli.tree import leaf_command_paths, leaf_commands
 from tests.transport import RecordingSession
@@ -30,10 +32,15 @@ runner = CliRunner()
 _STUB = "stub"
 
 # Leaf commands for which no harmless no-op invocation exists - one that could
-# not get past argument validation without a live server, say. Empty today; add
-# a path here together with the reason rather than weakening the assertions in
+# not get past argument validation without a live server, say. Add a path here
+# together with the reason rather than weakening the assertions in
 # `test_json_mode_routes_every_subcommand_through_a_structured_path`.
-_NO_NOOP_INVOCATION: frozenset[tuple[str, ...]] = frozenset()
+#
+# `watch run` polls until it is stopped, and `watch serve` listens until it is,
+# so invoking either with only its required options never returns; their records
+# and their unreachable-instance messages are asserted in their own tests, with
+# `--ticks` and `--deliveries` bounding the run.
+_NO_NOOP_INVOCATION: frozenset[tuple[str, ...]] = frozenset({("watch", "run"), ("watch", "serve")})
 
 # Options the CLI's naming convention declares optional at the parser level so
 # that omitting one asks for the owner-wide target, and which a command whose
@@ -42,8 +49,9 @@ _NO_NOOP_INVOCATION: frozenset[tuple[str, ...]] = frozenset()
 # without a repository and see the rejection rather than an envelope, so these
 # are supplied whenever the leaf declares them. Passing them is harmless where
 # they really are optional: it names a repository target instead of an
-# owner-wide one.
-_SCOPE_OPTIONS = frozenset({"--owner", "--repository", "--issue-id", "--dependency-issue-id"})
+# owner-wide one. `project issue move` is the same case for `--column-id`, which
+# it leaves optional only so `--from-file` can stand in for it.
+_SCOPE_OPTIONS = frozenset({"--owner", "--repository", "--issue-id", "--dependency-issue-id", "--column-id"})
 
 # The helpers a command routes its result and its failures through. A command
 # with a human-readable rendering of its own calls `execute_api_call` and reports
@@ -379,6 +387,119 @@ class _UnreachableGitea(_StubGitea):
         return self(*args, **kwargs)
 
 
+class _StubAsyncGitea:
+    """Stand-in for the asynchronous API client, answering as `_StubGitea` does.
+
+    For the commands whose call is a coroutine, opening an `AsyncGitea` rather
+    than a `Gitea`. Every endpoint is awaited and answers what the synchronous
+    stub's endpoint of the same name answers, so the board the walk's commands
+    see is one board whichever client they read it with.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Accept whatever credentials the command passes and ignore them.
+
+        Args:
+            *args: Ignored.
+            **kwargs: Ignored.
+
+        """
+        self._stub = _StubGitea()
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve a resource name to this stub, and an endpoint to an awaitable one.
+
+        Args:
+            name: Attribute requested by the command.
+
+        Returns:
+            This stub, or a coroutine function answering as the synchronous
+            stub's endpoint does.
+
+        """
+        endpoint = getattr(self._stub, name)
+        if endpoint is self._stub:
+            return self
+
+        async def answer(*args: Any, **kwargs: Any) -> Any:
+            """Answer as the synchronous endpoint does.
+
+            Args:
+                *args: Passed on to the endpoint.
+                **kwargs: Passed on to the endpoint.
+
+            Returns:
+                What the endpoint answers.
+
+            """
+            return endpoint(*args, **kwargs)
+
+        return answer
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Return the `(data, metadata)` pair every endpoint is expected to return.
+
+        Args:
+            *args: Passed on to the synchronous stub.
+            **kwargs: Passed on to the synchronous stub.
+
+        Returns:
+            An empty listing and its metadata.
+
+        """
+        return self._stub(*args, **kwargs)
+
+    async def __aenter__(self) -> Self:
+        """Enter the client context manager.
+
+        Returns:
+            This stub.
+
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> bool:
+        """Leave the client context manager without suppressing exceptions.
+
+        Args:
+            *exc_info: Ignored exception information.
+
+        Returns:
+            False, so exceptions propagate.
+
+        """
+        return False
+
+
+class _UnreachableAsyncGitea(_StubAsyncGitea):
+    """Stand-in for the asynchronous API client of an instance that cannot be reached."""
+
+    def __getattr__(self, name: str) -> Self:
+        """Resolve every resource and endpoint name to this stub, which fails when called.
+
+        Args:
+            name: Attribute requested by the command.
+
+        Returns:
+            This stub.
+
+        """
+        return self
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Fail as an endpoint does when the connection cannot be established.
+
+        Args:
+            *args: Ignored.
+            **kwargs: Ignored.
+
+        Raises:
+            ClientConnectionError: Always, in the form `aiohttp` raises it.
+
+        """
+        raise ClientConnectionError("Cannot connect to host gitea.invalid:443 ssl:default [Connection refused]")
+
+
 class TestLoggingLevel:
     """Test cases for LoggingLevel enum."""
 
@@ -469,10 +590,11 @@ class TestOutputOption:
             result = runner.invoke(app, ["--output", "json", *path, "--help"])
             assert result.exit_code == 0, f"{path}: {result.output}"
 
+    @pytest.mark.parametrize(("output_format", "parse"), [("json", parse_envelope), ("jsonl", parse_records)])
     def test_json_mode_routes_every_subcommand_through_a_structured_path(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, output_format: str, parse: Callable[[str], Any]
     ) -> None:
-        """Every leaf subcommand should emit the envelope, and nothing else, in JSON mode.
+        """Every leaf subcommand should emit the envelope, or its records, and nothing else, in JSON modes.
 
         Strategy: walk the command tree and actually run each leaf, rather than
         only asking it for `--help`. Arguments are synthesized from the leaf's
@@ -495,7 +617,10 @@ class TestOutputOption:
         config_path = tmp_path / "config.yaml"
         emitted = 0
 
-        with patch("gitea.client.gitea.Gitea", _StubGitea):
+        with (
+            patch("gitea.client.gitea.Gitea", _StubGitea),
+            patch("gitea.client.async_gitea.AsyncGitea", _StubAsyncGitea),
+        ):
             for path, command in leaves:
                 # Re-seed per command so an earlier `config` command's write
                 # cannot decide whether a later one succeeds.
@@ -503,11 +628,11 @@ class TestOutputOption:
 
                 result = runner.invoke(
                     app,
-                    ["--config-path", str(config_path), "--output", "json", *path, *_noop_invocation(command)],
+                    ["--config-path", str(config_path), "--output", output_format, *path, *_noop_invocation(command)],
                 )
 
                 if result.exit_code == 0:
-                    parse_envelope(result.stdout)
+                    parse(result.stdout)
                     emitted += 1
                 else:
                     # A failed command emits no envelope, but it must not leak a
@@ -646,7 +771,14 @@ class TestOutputOption:
 
         main(ctx, config_path=None, verbose=LoggingLevel.INFO, output=OutputFormat.TEXT, version=False)
 
-        assert ctx.obj == {"config_path": None, "output": OutputFormat.TEXT}
+        assert ctx.obj == {
+            "config_path": None,
+            "output": OutputFormat.TEXT,
+            "no_cache": False,
+            "cache_ttl": None,
+            "retries": 2,
+            "rate_limit": None,
+        }
 
 
 class TestUnreachableInstance:
@@ -687,6 +819,7 @@ class TestUnreachableInstance:
         for path, command in leaves:
             with (
                 patch("gitea.client.gitea.Gitea", _UnreachableGitea),
+                patch("gitea.client.async_gitea.AsyncGitea", _UnreachableAsyncGitea),
                 patch("gitea.cli.utils.api.logger") as mock_logger,
             ):
                 result = runner.invoke(
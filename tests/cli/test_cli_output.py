@@ -4,8 +4,20 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
-from gitea.cli.output import OutputFormat, emit, get_output_format, print_envelope
-from tests.cli.envelope import parse_envelope
+import pytest
+import typer
+
+from gitea.cli.output import (
+    OutputFormat,
+    emit,
+    get_output_format,
+    print_envelope,
+    print_envelope_pages,
+    print_pages,
+    print_records,
+    print_result,
+)
+from tests.cli.envelope import parse_envelope, parse_records
 
 
 class TestOutputFormat:
@@ -15,6 +27,7 @@ class TestOutputFormat:
         """Test that OutputFormat has the documented values."""
         assert OutputFormat.TEXT == "text"
         assert OutputFormat.JSON == "json"
+        assert OutputFormat.JSONL == "jsonl"
 
 
 class TestGetOutputFormat:
@@ -80,6 +93,17 @@ class TestEmit:
         out = parse_envelope(capsys.readouterr().out)
         assert out == {"data": {"a": 1}, "metadata": {"b": 2}}
 
+    def test_jsonl_format_prints_records(self, capsys) -> None:
+        """Should print the records and skip the text renderer in JSON Lines mode."""
+        ctx = MagicMock()
+        ctx.obj = {"output": OutputFormat.JSONL}
+        render_text = MagicMock()
+
+        emit(ctx, data=[{"a": 1}, {"a": 2}], metadata={"b": 2}, render_text=render_text)
+
+        render_text.assert_not_called()
+        assert parse_records(capsys.readouterr().out) == ([{"a": 1}, {"a": 2}], {"b": 2})
+
     def test_text_format_calls_renderer(self, capsys) -> None:
         """Should call the text renderer and print no envelope in text mode."""
         ctx = MagicMock()
@@ -99,3 +123,143 @@ class TestEmit:
         emit(ctx, data={"a": 1}, metadata={"b": 2})
 
         assert capsys.readouterr().out == ""
+
+
+class TestPrintEnvelopePages:
+    """Tests for print_envelope_pages."""
+
+    @pytest.mark.parametrize(
+        "pages",
+        [
+            [([{"id": 1}, {"id": 2, "labels": ["bug"]}], {"page": 1}), ([{"id": 3}], {"page": 2, "has_more": False})],
+            [([], {"status_code": 200})],
+            [],
+            [([{"id": 1}], {}), ([], {"nested": {"count": 1}})],
+        ],
+    )
+    def test_writes_what_print_envelope_writes_for_the_whole_listing(self, capsys, pages) -> None:
+        """Should write the envelope of every item and the last metadata, byte for byte."""
+        print_envelope_pages(iter(pages))
+        streamed = capsys.readouterr().out
+
+        print_envelope(data=[item for batch, _ in pages for item in batch], metadata=pages[-1][1] if pages else {})
+        assert streamed == capsys.readouterr().out
+
+    def test_writes_each_page_before_the_next_is_fetched(self, capsys) -> None:
+        """Should have the first page's items on stdout by the time the second page is asked for."""
+
+        def pages():
+            yield [{"id": 1}], {}
+            assert '"id": 1' in capsys.readouterr().out
+            yield [{"id": 2}], {}
+
+        print_envelope_pages(pages())
+
+    def test_writes_nothing_when_the_walk_fails_before_its_first_page(self, capsys) -> None:
+        """Should leave stdout empty when no page arrived."""
+
+        def pages():
+            raise RuntimeError("unreachable")
+            yield
+
+        with pytest.raises(RuntimeError):
+            print_envelope_pages(pages())
+        assert capsys.readouterr().out == ""
+
+
+_probe = typer.Typer()
+
+
+@_probe.command()
+def _probe_command() -> None:
+    """Stand in for the command an invocation runs."""
+
+
+def invocation(output_format):
+    """Build the context of an invocation run with the given output format.
+
+    Args:
+        output_format: The format the root callback would have stored.
+
+    Returns:
+        A context, to enter for the duration of a call.
+
+    """
+    return typer.Context(typer.main.get_command(_probe), obj={"output": output_format})
+
+
+class TestPrintRecords:
+    """Tests for print_records."""
+
+    def test_prints_one_compact_line_per_item_then_the_metadata(self, capsys) -> None:
+        """Should print each item of a list on a line of its own, and the metadata last."""
+        print_records(data=[{"id": 1, "labels": ["bug"]}, {"id": 2}], metadata={"status_code": 200})
+
+        assert capsys.readouterr().out == ('{"id":1,"labels":["bug"]}\n{"id":2}\n{"metadata":{"status_code":200}}\n')
+
+    def test_prints_a_single_object_as_one_record(self, capsys) -> None:
+        """Should print a payload that is not a list as one record."""
+        print_records(data={"id": 1}, metadata={})
+
+        assert parse_records(capsys.readouterr().out) == ([{"id": 1}], {})
+
+
+class TestPrintResult:
+    """Tests for print_result."""
+
+    @pytest.mark.parametrize("output_format", [OutputFormat.TEXT, OutputFormat.JSON])
+    def test_prints_the_envelope_unless_jsonl_was_asked_for(self, capsys, output_format) -> None:
+        """Should print the envelope in text and JSON mode alike."""
+        with invocation(output_format):
+            print_result(data=[{"id": 1}], metadata={"status_code": 200})
+
+        assert parse_envelope(capsys.readouterr().out) == {"data": [{"id": 1}], "metadata": {"status_code": 200}}
+
+    def test_prints_records_in_jsonl_mode(self, capsys) -> None:
+        """Should print records when the invocation asked for JSON Lines."""
+        with invocation(OutputFormat.JSONL):
+            print_result(data=[{"id": 1}], metadata={"status_code": 200})
+
+        assert parse_records(capsys.readouterr().out) == ([{"id": 1}], {"status_code": 200})
+
+    def test_prints_the_envelope_outside_an_invocation(self, capsys) -> None:
+        """Should print the envelope when no invocation is running."""
+        print_result(data={"id": 1}, metadata={})
+
+        assert parse_envelope(capsys.readouterr().out) == {"data": {"id": 1}, "metadata": {}}
+
+
+class TestPrintPages:
+    """Tests for print_pages."""
+
+    def test_writes_each_item_as_its_page_arrives_and_the_last_metadata_at_the_end(self, capsys) -> None:
+        """Should have the first page's records on stdout by the time the second page is asked for."""
+
+        def pages():
+            yield [{"id": 1}, {"id": 2}], {"page": 1}
+            assert capsys.readouterr().out == '{"id":1}\n{"id":2}\n'
+            yield [{"id": 3}], {"page": 2}
+
+        with invocation(OutputFormat.JSONL):
+            print_pages(pages())
+
+        assert capsys.readouterr().out == '{"id":3}\n{"metadata":{"page":2}}\n'
+
+    def test_leaves_out_the_metadata_when_the_walk_fails_part_way(self, capsys) -> None:
+        """Should leave the records it got and no metadata line, so a reader can tell the output was cut short."""
+
+        def pages():
+            yield [{"id": 1}], {"page": 1}
+            raise RuntimeError("dropped")
+
+        with invocation(OutputFormat.JSONL), pytest.raises(RuntimeError):
+            print_pages(pages())
+
+        assert capsys.readouterr().out == '{"id":1}\n'
+
+    def test_writes_the_envelope_in_json_mode(self, capsys) -> None:
+        """Should write the envelope of the whole listing in JSON mode."""
+        with invocation(OutputFormat.JSON):
+            print_pages(iter([([{"id": 1}], {}), ([{"id": 2}], {"page": 2})]))
+
+        assert parse_envelope(capsys.readouterr().out) == {"data": [{"id": 1}, {"id": 2}], "metadata": {"page": 2}}
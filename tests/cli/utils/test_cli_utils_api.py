@@ -1,14 +1,16 @@
 """Unit tests for the CLI API utils."""
 
+import asyncio
 import json
 from unittest.mock import MagicMock
 
 import pytest
 import typer
+from aiohttp import ClientConnectionError, ClientConnectorError, ServerDisconnectedError
 from requests import ConnectionError as RequestsConnectionError
 from requests import ConnectTimeout, HTTPError, ReadTimeout, Timeout
 
-from gitea.cli.utils.api import execute_api_command
+from gitea.cli.utils.api import execute_api_call, execute_api_command
 from gitea.cli.utils.errors import CommandError
 
 BASE_URL = "https://gitea.example.com"
@@ -180,3 +182,75 @@ def test_execute_api_command_logs_errors_as_literal_text(monkeypatch, error):
         execute_api_command(api_call, command_name="MyCmd")
 
     assert mock_logger.error.call_args.kwargs["extra"] == {"markup": False}
+
+
+def test_execute_api_command_runs_a_coroutine_call(capsys):
+    """Should run a coroutine function's call on an event loop and print its result."""
+
+    async def api_call():
+        await asyncio.sleep(0)
+        return {"key": "value"}, {"meta": 1}
+
+    execute_api_command(api_call, command_name="MyCmd")
+
+    assert json.loads(capsys.readouterr().out) == {"data": {"key": "value"}, "metadata": {"meta": 1}}
+
+
+def test_execute_api_call_reports_a_coroutine_call_outside_its_loop():
+    """Should hand the report the result once the loop the call ran on is done."""
+    reported = []
+
+    async def api_call():
+        return [{"id": 1}], {"status_code": 200}
+
+    def report(data, metadata):
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        reported.append((data, metadata))
+
+    execute_api_call(api_call, report, command_name="MyCmd")
+
+    assert reported == [([{"id": 1}], {"status_code": 200})]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ClientConnectionError("Cannot connect to host gitea.example.com:443"),
+        ClientConnectorError(MagicMock(host="gitea.example.com", port=443, ssl="default"), OSError(111, "refused")),
+        ServerDisconnectedError(),
+        TimeoutError(),
+    ],
+    ids=["connection", "connector", "disconnected", "timeout"],
+)
+def test_execute_api_command_coroutine_unreachable_instance(monkeypatch, error):
+    """Should report the connection and timeout failures of `aiohttp` as those of `requests`."""
+
+    async def api_call():
+        raise error
+
+    mock_logger = MagicMock()
+    monkeypatch.setattr("gitea.cli.utils.api.logger", mock_logger)
+
+    with pytest.raises(typer.Exit):
+        execute_api_command(api_call, command_name="MyCmd", base_url=BASE_URL)
+
+    mock_logger.exception.assert_not_called()
+    mock_logger.error.assert_called_once()
+    assert f"Could not reach the Gitea API at {BASE_URL}" in str(mock_logger.error.call_args[0][1])
+
+
+def test_execute_api_command_coroutine_command_error(monkeypatch):
+    """Should report a `CommandError` raised on the loop as its message alone."""
+
+    async def api_call():
+        raise CommandError("No issue #15 in owner/repo")
+
+    mock_logger = MagicMock()
+    monkeypatch.setattr("gitea.cli.utils.api.logger", mock_logger)
+
+    with pytest.raises(typer.Exit):
+        execute_api_command(api_call, command_name="MyCmd")
+
+    mock_logger.exception.assert_not_called()
+    assert str(mock_logger.error.call_args[0][1]) == "No issue #15 in owner/repo"
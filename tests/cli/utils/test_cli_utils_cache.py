@@ -0,0 +1,105 @@
+"""Unit tests for the response cache the CLI gives every command's client."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from gitea.cli.main import app
+from gitea.cli.utils.cache import response_cache
+from gitea.client.cache import DEFAULT_TTLS, DiskResponseCache
+from tests.cli.envelope import parse_envelope
+from tests.transport import RecordingSession
+
+runner = CliRunner()
+
+AUTH = ["--token", "tok", "--base-url", "https://gitea.invalid"]
+LABEL = {"id": 1, "name": "bug", "color": "ee0701"}
+
+
+def list_labels(session: RecordingSession, *options: str):
+    """Run `label list` through a recording session, with global options in front.
+
+    Args:
+        session: The session answering the request.
+        *options: Global options to pass before the command.
+
+    Returns:
+        The result of the invocation.
+
+    """
+    with patch("gitea.client.gitea.requests.Session", return_value=session):
+        return runner.invoke(
+            app, ["--output", "json", *options, "label", "list", "--owner", "o", "--repository", "r", *AUTH]
+        )
+
+
+class TestResponseCache:
+    """Tests for the cache the global options open."""
+
+    def test_the_default_reuses_labels_and_revalidates_the_rest(self) -> None:
+        """Without `--cache-ttl` only the endpoints read over and over are reused."""
+        cache = response_cache(SimpleNamespace(obj={}))
+
+        assert isinstance(cache, DiskResponseCache)
+        assert cache.ttl == 0
+        assert cache.ttls == DEFAULT_TTLS
+
+    def test_a_time_to_live_applies_to_every_endpoint(self) -> None:
+        """`--cache-ttl` replaces the per-endpoint defaults with one figure."""
+        cache = response_cache(SimpleNamespace(obj={"cache_ttl": 30.0}))
+
+        assert cache.ttl == 30
+        assert cache.ttls == {}
+
+    def test_no_cache_opens_none(self) -> None:
+        """`--no-cache` leaves every client without one."""
+        assert response_cache(SimpleNamespace(obj={"no_cache": True})) is None
+
+    def test_the_cache_lives_where_the_environment_says(self, tmp_path: Path, monkeypatch) -> None:
+        """The directory is the one `PYTHON_GITEA_CACHE_DIR` names."""
+        monkeypatch.setenv("PYTHON_GITEA_CACHE_DIR", str(tmp_path))
+
+        assert response_cache(SimpleNamespace(obj=None)).directory == tmp_path
+
+
+class TestAcrossInvocations:
+    """Tests for a response kept by one invocation and reused by the next."""
+
+    def test_a_second_invocation_reuses_the_labels(self) -> None:
+        """A script listing the same labels in a loop asks the instance once."""
+        session = RecordingSession(payload=[LABEL])
+
+        first = list_labels(session)
+        second = list_labels(session)
+
+        assert first.exit_code == 0
+        assert parse_envelope(second.stdout)["data"] == [LABEL]
+        assert len(session.requests) == 1
+
+    def test_no_cache_asks_every_time(self) -> None:
+        """With the cache off, every invocation reaches the instance."""
+        session = RecordingSession(payload=[LABEL])
+
+        list_labels(session, "--no-cache")
+        list_labels(session, "--no-cache")
+
+        assert len(session.requests) == 2
+
+    def test_a_zero_time_to_live_asks_every_time(self) -> None:
+        """`--cache-ttl 0` revalidates even the endpoints reused by default."""
+        session = RecordingSession(payload=[LABEL])
+
+        list_labels(session, "--cache-ttl", "0")
+        list_labels(session, "--cache-ttl", "0")
+
+        assert len(session.requests) == 2
+
+    def test_a_negative_time_to_live_is_refused(self) -> None:
+        """A time to live below zero means nothing."""
+        result = list_labels(RecordingSession(payload=[LABEL]), "--cache-ttl", "-1")
+
+        assert result.exit_code == 2
@@ -0,0 +1,51 @@
+"""Unit tests for the options the CLI builds every command's client with."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from gitea.cli.utils.client import RATE_LIMIT_FILE, client_options, rate_limiter, retry_policy
+from gitea.client.cache import DiskResponseCache, default_cache_dir
+from gitea.client.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Tests for the retry policy the global options ask for."""
+
+    def test_retries_are_attempts_after_the_first(self) -> None:
+        """`--retries 2` sends a request three times at most."""
+        assert retry_policy(SimpleNamespace(obj={"retries": 2})) == RetryPolicy(max_attempts=3)
+
+    def test_zero_retries_is_no_policy(self) -> None:
+        """`--retries 0` sends every request once, as the library does by default."""
+        assert retry_policy(SimpleNamespace(obj={"retries": 0})) is None
+        assert retry_policy(SimpleNamespace(obj=None)) is None
+
+
+class TestRateLimiter:
+    """Tests for the rate limiter the global options ask for."""
+
+    def test_a_rate_is_shared_through_the_cache_directory(self) -> None:
+        """Concurrent invocations draw from one bucket, beside the response cache."""
+        limiter = rate_limiter(SimpleNamespace(obj={"rate_limit": 5.0}))
+
+        assert limiter is not None
+        assert limiter.rate == 5
+        assert limiter.path == default_cache_dir() / RATE_LIMIT_FILE
+
+    def test_no_rate_is_no_limiter(self) -> None:
+        """Without `--rate-limit` requests are sent as they always were."""
+        assert rate_limiter(SimpleNamespace(obj={})) is None
+        assert rate_limiter(SimpleNamespace(obj={"rate_limit": 0.0})) is None
+
+
+class TestClientOptions:
+    """Tests for the keyword arguments every command's client is built with."""
+
+    def test_the_cache_and_the_policy_are_both_passed(self) -> None:
+        """One call collects every option a client takes from the global ones."""
+        options = client_options(SimpleNamespace(obj={"retries": 1}))
+
+        assert set(options) == {"cache", "retry", "limiter"}
+        assert isinstance(options["cache"], DiskResponseCache)
+        assert options["retry"] == RetryPolicy(max_attempts=2)
@@ -408,3 +408,217 @@ def test_run_project_issue_call_missing_status_code_fails_closed():
             issue_number=15,
             issue_repository="example-repo",
         )
+
+
+def test_resolve_issue_id_found_in_the_map_is_not_looked_up(tmp_path):
+    """Should answer from the issue ID map without asking the instance."""
+    from gitea.cli.utils.issue_ids import IssueIds
+
+    ids = IssueIds(tmp_path / "issue-ids.map", BASE_URL)
+    ids.record("example-org", "example-repo", {15: 1854})
+    client = make_client()
+
+    resolved = resolve_issue_id(client=client, owner="example-org", repository="example-repo", issue_number=15, ids=ids)
+
+    assert resolved == 1854
+    client.issue.get_issue.assert_not_called()
+
+
+def test_resolve_issue_id_missing_from_the_map_is_looked_up_and_recorded(tmp_path):
+    """Should fetch the issue once, and keep its ID for the next invocation."""
+    from gitea.cli.utils.issue_ids import IssueIds
+
+    path = tmp_path / "issue-ids.map"
+    client = make_client(({"id": 1854, "number": 15}, {"status_code": 200}))
+
+    resolved = resolve_issue_id(
+        client=client,
+        owner="example-org",
+        repository="example-repo",
+        issue_number=15,
+        ids=IssueIds(path, BASE_URL),
+    )
+
+    assert resolved == 1854
+    client.issue.get_issue.assert_called_once()
+    assert IssueIds(path, BASE_URL).get("example-org", "example-repo", 15) == 1854
+
+
+def make_board_client(cards):
+    """Create a mock client holding a two-column board whose moves change it.
+
+    Args:
+        cards: The pages of cards of columns 107 and 108, changed in place by
+            every move and add.
+
+    Returns:
+        The mock client.
+
+    """
+    from tests.board import paged_columns, paged_issues
+
+    def move(*, issue_id, column_id, **kwargs):
+        for pages in cards.values():
+            pages[0] = [card for card in pages[0] if card["id"] != issue_id]
+        cards[column_id][0] = [*cards[column_id][0], {"id": issue_id}]
+        return {}, {"status_code": 200}
+
+    client = make_client()
+    client.project.list_project_columns.side_effect = paged_columns({29: [[{"id": 107}, {"id": 108}]]})
+    client.project.list_project_column_issues.side_effect = paged_issues(cards)
+    client.project.move_project_issue.side_effect = move
+    client.project.add_issue_to_project_column.side_effect = move
+    return client
+
+
+def column_walks(client):
+    """List the columns a client's board was walked for, one entry per walk.
+
+    Args:
+        client: The mock client.
+
+    Returns:
+        The column of each walk, in the order they started.
+
+    """
+    return [
+        call.kwargs["column_id"]
+        for call in client.project.list_project_column_issues.call_args_list
+        if call.kwargs["page"] == 1
+    ]
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_run_project_issue_moves_reads_the_board_once_and_each_touched_column_once_after(concurrency):
+    """Should move every card from one read of the board, and confirm them from one read of each column."""
+    from gitea.cli.utils.issue import run_project_issue_moves
+    from gitea.cli.utils.moves import CardMove
+
+    cards = {107: [[{"id": 1}, {"id": 2}, {"id": 3}]], 108: [[]]}
+    client = make_board_client(cards)
+    moves = [CardMove(line, issue_id, 108, None, None) for line, issue_id in enumerate((1, 2, 3), start=1)]
+
+    results, metadata = run_project_issue_moves(
+        client=client,
+        owner="example-org",
+        repository=None,
+        project_id=29,
+        moves=moves,
+        add_if_missing=False,
+        concurrency=concurrency,
+    )
+
+    assert [(result["issue_id"], result["result"], result["from_column_id"]) for result in results] == [
+        (1, "moved", 107),
+        (2, "moved", 107),
+        (3, "moved", 107),
+    ]
+    assert metadata == {"move_count": 3, "failed_count": 0}
+    assert client.project.move_project_issue.call_count == 3
+    assert sorted(column_walks(client)) == [107, 107, 108, 108]
+
+
+def test_run_project_issue_moves_reports_each_failure_and_makes_the_other_moves():
+    """Should report a card that is not on the board, or did not arrive, without stopping the batch."""
+    from gitea.cli.utils.issue import run_project_issue_moves
+    from gitea.cli.utils.moves import CardMove
+
+    cards = {107: [[{"id": 1}, {"id": 2}]], 108: [[]]}
+    client = make_board_client(cards)
+    refused = client.project.move_project_issue.side_effect
+
+    def move(*, issue_id, column_id, **kwargs):
+        if issue_id == 2:
+            return {}, {"status_code": 200}
+        return refused(issue_id=issue_id, column_id=column_id, **kwargs)
+
+    client.project.move_project_issue.side_effect = move
+    moves = [CardMove(1, 1, 108, None, None), CardMove(2, 2, 108, None, None), CardMove(3, 9, 108, None, None)]
+
+    results, metadata = run_project_issue_moves(
+        client=client,
+        owner="example-org",
+        repository=None,
+        project_id=29,
+        moves=moves,
+        add_if_missing=False,
+        concurrency=1,
+    )
+
+    assert [result["result"] for result in results] == ["moved", "failed", "failed"]
+    assert "108" in results[1]["error"]
+    assert "project issue add" in results[2]["error"]
+    assert metadata == {"move_count": 3, "failed_count": 2}
+
+
+def test_run_project_issue_moves_adds_the_issues_with_no_card_when_asked():
+    """Should add an issue with no card on the board to its target column under add_if_missing."""
+    from gitea.cli.utils.issue import run_project_issue_moves
+    from gitea.cli.utils.moves import CardMove
+
+    cards = {107: [[{"id": 1}]], 108: [[]]}
+    client = make_board_client(cards)
+
+    results, _ = run_project_issue_moves(
+        client=client,
+        owner="example-org",
+        repository=None,
+        project_id=29,
+        moves=[CardMove(1, 1, 108, None, None), CardMove(2, 9, 108, None, None)],
+        add_if_missing=True,
+        concurrency=1,
+    )
+
+    assert [result["result"] for result in results] == ["moved", "added"]
+    assert results[1]["from_column_id"] is None
+    client.project.add_issue_to_project_column.assert_called_once()
+
+
+def test_run_project_issue_moves_moves_nothing_when_the_board_cannot_be_read():
+    """Should fail the batch before the first move when the board cannot be read."""
+    from gitea.cli.utils.issue import run_project_issue_moves
+    from gitea.cli.utils.moves import CardMove
+
+    client = make_board_client({107: [[]], 108: [[]]})
+    client.project.list_project_columns.side_effect = http_error(500)
+
+    with pytest.raises(CommandError, match="Nothing was moved"):
+        run_project_issue_moves(
+            client=client,
+            owner="example-org",
+            repository=None,
+            project_id=29,
+            moves=[CardMove(1, 1, 108, None, None)],
+            add_if_missing=False,
+        )
+    client.project.move_project_issue.assert_not_called()
+
+
+def test_run_project_issue_moves_warms_the_map_from_one_walk_of_the_repository(tmp_path):
+    """Should resolve the issue numbers of a batch from one walk of their repository."""
+    from gitea.cli.utils.issue import run_project_issue_moves
+    from gitea.cli.utils.issue_ids import IssueIds
+    from gitea.cli.utils.moves import CardMove
+
+    cards = {107: [[{"id": 1854}, {"id": 1855}]], 108: [[]]}
+    client = make_board_client(cards)
+    client.issue.list_issues.side_effect = [
+        ([{"number": 15, "id": 1854}, {"number": 16, "id": 1855}], {"status_code": 200}),
+        ([], {"status_code": 200}),
+    ]
+    ids = IssueIds(tmp_path / "issue-ids.map", BASE_URL)
+
+    results, _ = run_project_issue_moves(
+        client=client,
+        owner="example-org",
+        repository=None,
+        project_id=29,
+        moves=[CardMove(1, 15, 108, None, "example-repo"), CardMove(2, 16, 108, None, "example-repo")],
+        add_if_missing=False,
+        ids=ids,
+        concurrency=1,
+    )
+
+    assert [result["resolved_issue_id"] for result in results] == [1854, 1855]
+    assert [result["result"] for result in results] == ["moved", "moved"]
+    client.issue.get_issue.assert_not_called()
@@ -0,0 +1,137 @@
+"""Unit tests for the map of issue numbers to global IDs the CLI keeps on disk."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from gitea.cli.utils.issue_ids import ISSUE_IDS_FILE, IssueIds, issue_ids
+from gitea.client.cache import default_cache_dir
+
+BASE_URL = "https://gitea.example.com"
+
+
+class TestIssueIds:
+    """Tests for reading and writing the map."""
+
+    def test_a_recorded_id_is_found_by_a_later_invocation(self, tmp_path: Path) -> None:
+        """The map outlives the process that wrote it."""
+        path = tmp_path / ISSUE_IDS_FILE
+        IssueIds(path, BASE_URL).record("Example-Org", "example-repo", {15: 1854})
+
+        ids = IssueIds(path, f"{BASE_URL}/")
+
+        assert ids.get("example-org", "Example-Repo", 15) == 1854
+        assert ids.get("example-org", "example-repo", 16) is None
+        assert ids.get("example-org", "other-repo", 15) is None
+
+    def test_instances_are_kept_apart(self, tmp_path: Path) -> None:
+        """Issue 15 of the same repository name is another issue on another instance."""
+        path = tmp_path / ISSUE_IDS_FILE
+        IssueIds(path, BASE_URL).record("o", "r", {15: 1854})
+
+        assert IssueIds(path, "https://other.example.com").get("o", "r", 15) is None
+
+    def test_writes_add_to_what_other_invocations_wrote(self, tmp_path: Path) -> None:
+        """A map opened before another invocation wrote does not drop its entries."""
+        path = tmp_path / ISSUE_IDS_FILE
+        first = IssueIds(path, BASE_URL)
+        second = IssueIds(path, BASE_URL)
+        first.get("o", "r", 1)
+
+        second.record("o", "r", {1: 101})
+        first.record("o", "r", {2: 102})
+
+        assert IssueIds(path, BASE_URL).get("o", "r", 1) == 101
+        assert IssueIds(path, BASE_URL).get("o", "r", 2) == 102
+
+    def test_threads_recording_at_once_keep_every_entry(self, tmp_path: Path) -> None:
+        """Threads sharing a map take turns at the read, change and replace of the document."""
+        path = tmp_path / ISSUE_IDS_FILE
+        ids = IssueIds(path, BASE_URL)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda number: ids.record("o", "r", {number: 100 + number}), range(1, 41)))
+
+        reread = IssueIds(path, BASE_URL)
+        assert [reread.get("o", "r", number) for number in range(1, 41)] == [100 + number for number in range(1, 41)]
+
+    def test_an_unreadable_map_is_an_empty_one(self, tmp_path: Path) -> None:
+        """A damaged file costs the lookups it was saving, and is replaced."""
+        path = tmp_path / ISSUE_IDS_FILE
+        path.write_text("not json", encoding="utf-8")
+        ids = IssueIds(path, BASE_URL)
+
+        assert ids.get("o", "r", 1) is None
+        ids.record("o", "r", {1: 101})
+        assert IssueIds(path, BASE_URL).get("o", "r", 1) == 101
+
+    def test_a_map_of_another_version_is_discarded(self, tmp_path: Path) -> None:
+        """Entries in a layout this version does not know are not trusted."""
+        path = tmp_path / ISSUE_IDS_FILE
+        path.write_text(json.dumps({"version": 0, "instances": {BASE_URL: {"o/r": {"1": 101}}}}), encoding="utf-8")
+
+        assert IssueIds(path, BASE_URL).get("o", "r", 1) is None
+
+    def test_a_map_that_cannot_be_written_is_left_alone(self, tmp_path: Path) -> None:
+        """Failing to save the map never fails the command."""
+        blocker = tmp_path / "file"
+        blocker.write_text("", encoding="utf-8")
+        ids = IssueIds(blocker / ISSUE_IDS_FILE, BASE_URL)
+
+        ids.record("o", "r", {1: 101})
+
+        assert ids.get("o", "r", 1) == 101
+
+    def test_a_listing_records_every_issue_in_it(self, tmp_path: Path) -> None:
+        """Payloads without an integer number and ID are skipped."""
+        path = tmp_path / ISSUE_IDS_FILE
+        IssueIds(path, BASE_URL).record_issues(
+            "o", "r", [{"number": 1, "id": 101}, {"number": 2}, {"number": "3", "id": 103}, "junk"]
+        )
+
+        ids = IssueIds(path, BASE_URL)
+        assert [ids.get("o", "r", number) for number in (1, 2, 3)] == [101, None, None]
+
+    def test_warming_walks_the_listing_once(self, tmp_path: Path) -> None:
+        """Every page up to the last, or the cap, is read and recorded."""
+        client = MagicMock()
+        client.issue.list_issues.side_effect = [
+            ([{"number": number, "id": 100 + number} for number in range(1, 51)], {"status_code": 200}),
+            ([{"number": 51, "id": 151}], {"status_code": 200}),
+        ]
+        ids = IssueIds(tmp_path / ISSUE_IDS_FILE, BASE_URL)
+
+        assert ids.warm(client, "o", "r") == 51
+        assert ids.get("o", "r", 51) == 151
+        assert client.issue.list_issues.call_args.kwargs["state"] == "all"
+        assert client.issue.list_issues.call_count == 2
+
+    def test_warming_stops_at_the_page_cap(self, tmp_path: Path) -> None:
+        """A repository with more issues than the cap costs the cap."""
+        client = MagicMock()
+        client.issue.list_issues.side_effect = lambda page, **kwargs: (
+            [{"number": page * 100 + index, "id": index} for index in range(50)],
+            {"status_code": 200},
+        )
+
+        assert IssueIds(tmp_path / ISSUE_IDS_FILE, BASE_URL).warm(client, "o", "r", max_pages=2) == 100
+        assert client.issue.list_issues.call_count == 2
+
+
+class TestIssueIdsOption:
+    """Tests for the map the global options open."""
+
+    def test_the_map_is_kept_beside_the_response_cache(self) -> None:
+        """It lives, and is isolated, wherever the response cache does."""
+        ids = issue_ids(SimpleNamespace(obj={}), BASE_URL)
+
+        assert ids is not None
+        assert ids.path == default_cache_dir() / ISSUE_IDS_FILE
+
+    def test_no_cache_opens_no_map(self) -> None:
+        """`--no-cache` looks every issue up, as it sends every request."""
+        assert issue_ids(SimpleNamespace(obj={"no_cache": True}), BASE_URL) is None
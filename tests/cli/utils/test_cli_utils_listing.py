@@ -0,0 +1,87 @@
+"""Unit tests for the `--all` mode of the list commands."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from gitea.cli.utils.errors import CommandError
+from gitea.cli.utils.listing import walk_listing
+from gitea.utils.pagination import PAGE_SIZE
+
+
+def make_client(settings):
+    """Build a client whose instance reports the given API settings.
+
+    Args:
+        settings: The settings `/settings/api` answers with.
+
+    Returns:
+        The mock client.
+
+    """
+    client = MagicMock()
+    client.settings.get_api_settings.return_value = (settings, {"status_code": 200})
+    return client
+
+
+def test_walk_listing_walks_every_page_at_the_limit_given():
+    """Should ask for page after page at --limit items each, until a short page ends the listing."""
+    calls = []
+
+    def list_page(number, size):
+        calls.append((number, size))
+        return ([{"id": number}] * (size if number < 3 else 1), {"page": number})
+
+    pages = list(
+        walk_listing(
+            list_page, client=make_client({}), page=None, limit=2, concurrency=1, command="gitea-cli label list"
+        )
+    )
+
+    assert calls == [(1, 2), (2, 2), (3, 2)]
+    assert [metadata for _, metadata in pages] == [{"page": 1}, {"page": 2}, {"page": 3}]
+
+
+def test_walk_listing_defaults_to_the_page_size_the_instance_serves():
+    """Should ask for as many items a page as the instance serves when --limit is omitted."""
+    calls = []
+    client = make_client({"max_response_items": 100, "default_paging_num": 30})
+
+    def list_page(number, size):
+        calls.append((number, size))
+        return [], {}
+
+    list(walk_listing(list_page, client=client, page=None, limit=None, concurrency=1, command="gitea-cli label list"))
+
+    assert calls == [(1, 100)]
+
+
+def test_walk_listing_defaults_to_the_page_size_of_the_other_walks():
+    """Should ask for PAGE_SIZE items a page when the instance does not say how many it serves."""
+    calls = []
+
+    def list_page(number, size):
+        calls.append((number, size))
+        return [], {}
+
+    list(
+        walk_listing(
+            list_page, client=make_client({}), page=None, limit=None, concurrency=1, command="gitea-cli label list"
+        )
+    )
+
+    assert calls == [(1, PAGE_SIZE)]
+
+
+def test_walk_listing_refuses_a_page_number():
+    """Should refuse --page alongside --all before asking for anything."""
+
+    def list_page(number, size):
+        pytest.fail("no page should be asked for")
+
+    with pytest.raises(CommandError, match="drop --page"):
+        list(
+            walk_listing(
+                list_page, client=make_client({}), page=2, limit=None, concurrency=1, command="gitea-cli label list"
+            )
+        )
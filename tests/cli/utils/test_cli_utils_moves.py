@@ -0,0 +1,73 @@
+"""Unit tests for reading the card moves of a file."""
+
+import pytest
+
+from gitea.cli.utils.errors import CommandError
+from gitea.cli.utils.moves import CardMove, read_card_moves
+
+
+def test_read_card_moves_reads_json_lines(tmp_path):
+    """Should read one move per JSON line, skipping blank lines."""
+    path = tmp_path / "moves.jsonl"
+    path.write_text(
+        '{"issue_id": 15, "column_id": 9}\n'
+        "\n"
+        '{"issue_id": 16, "column_id": 9, "sorting": 2, "issue_repository": "other-repo"}\n'
+        '{"issue_id": 1854, "column_id": 10, "issue_repository": null}\n',
+        encoding="utf-8",
+    )
+
+    assert read_card_moves(path, issue_repository="example-repo") == [
+        CardMove(1, 15, 9, None, "example-repo"),
+        CardMove(3, 16, 9, 2, "other-repo"),
+        CardMove(4, 1854, 10, None, None),
+    ]
+
+
+def test_read_card_moves_reads_csv(tmp_path):
+    """Should read one move per CSV row, an empty repository being the command's and '-' an unknown one."""
+    path = tmp_path / "moves.csv"
+    path.write_text("issue_id,column_id,sorting,issue_repository\n15,9,,\n16,9,2,other-repo\n1854,10,,-\n")
+
+    assert read_card_moves(path, issue_repository="example-repo") == [
+        CardMove(2, 15, 9, None, "example-repo"),
+        CardMove(3, 16, 9, 2, "other-repo"),
+        CardMove(4, 1854, 10, None, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ('{"issue_id": 15, "column": 9}\n', "unknown field 'column'"),
+        ('{"issue_id": 15}\n', "'column_id' is missing"),
+        ('{"issue_id": "fifteen", "column_id": 9}\n', "'issue_id' must be an integer"),
+        ('{"issue_id": true, "column_id": 9}\n', "'issue_id' must be an integer"),
+        ("[15, 9]\n", "not a JSON object"),
+        ("{15\n", "not a JSON object"),
+        ("\n", "lists no moves"),
+        ('{"issue_id": 15, "column_id": 9}\n{"issue_id": 15, "column_id": 10}\n', "already moved on line 1"),
+    ],
+)
+def test_read_card_moves_reports_a_malformed_file(tmp_path, content, message):
+    """Should refuse a file with a malformed line, no moves, or an issue moved twice."""
+    path = tmp_path / "moves.jsonl"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(CommandError, match=message):
+        read_card_moves(path, issue_repository="example-repo")
+
+
+def test_read_card_moves_reports_a_csv_row_longer_than_its_header(tmp_path):
+    """Should refuse a CSV row carrying more values than the header names."""
+    path = tmp_path / "moves.csv"
+    path.write_text("issue_id,column_id\n15,9,2\n")
+
+    with pytest.raises(CommandError, match=r"moves.csv:2: the line has more values"):
+        read_card_moves(path, issue_repository="example-repo")
+
+
+def test_read_card_moves_reports_a_missing_file(tmp_path):
+    """Should report a file that cannot be read."""
+    with pytest.raises(CommandError, match="Could not read the moves"):
+        read_card_moves(tmp_path / "missing.jsonl", issue_repository="example-repo")
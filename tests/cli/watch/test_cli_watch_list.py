@@ -3,122 +3,28 @@
 from __future__ import annotations
 
 import json
+import threading
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from typer.testing import CliRunner
 
 from gitea.cli.main import app
-from gitea.cli.watch.list import build_scopes
+from gitea.cli.watch.list import build_scopes, snapshot_issues
 from gitea.utils.pagination import PAGE_SIZE
 from gitea.watch.changes import comment_hash
 from gitea.watch.state import STATE_FILE_ENV, empty_state, record_scope, save_state
 from tests.cli.envelope import parse_envelope
 from tests.cli.rendering import unrendered
+from tests.cli.watch.listings import AUTH, COMMENT, ISSUE, OTHER_ISSUE, logged_error, make_client, paged
 from tests.transport import RecordingSession
 
 runner = CliRunner()
 
-AUTH = ["--token", "tok", "--base-url", "https://gitea.invalid"]
-
-ISSUE = {
-    "id": 1854,
-    "number": 15,
-    "title": "Fix the docs",
-    "updated_at": "2026-08-02T10:00:00Z",
-    "assignees": [{"login": "alice"}],
-    "labels": [{"name": "bug"}],
-    "repository": {"owner": "my-org", "name": "my-repo"},
-}
-
-OTHER_ISSUE = {
-    "id": 1900,
-    "number": 16,
-    "title": "Ship the release",
-    "updated_at": "2026-08-02T11:00:00Z",
-    "assignees": [],
-    "labels": [],
-    "repository": {"owner": "my-org", "name": "my-repo"},
-}
-
-COMMENT = {
-    "id": 7,
-    "body": "Looks right to me",
-    "user": {"id": 3, "login": "alice"},
-    "created_at": "2026-08-01T09:00:00Z",
-    "updated_at": "2026-08-01T09:00:00Z",
-}
-
-
-def paged(*pages: list[dict[str, Any]]):
-    """Build a side effect serving one page of a listing per requested page number.
-
-    Args:
-        *pages: The items of each page, in order.
-
-    Returns:
-        A side effect returning the requested page, or an empty page beyond the last one.
-
-    """
-
-    def _side_effect(**kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        page = kwargs.get("page", 1)
-        return (list(pages[page - 1]) if page <= len(pages) else [], {"status_code": 200})
-
-    return _side_effect
-
-
-def paged_by(key: str, pages_by_value: dict[Any, list[list[dict[str, Any]]]]):
-    """Build a side effect serving the pages recorded for one value of an argument.
-
-    Args:
-        key: The keyword argument selecting which listing is being paged.
-        pages_by_value: Mapping of that argument's value to that listing's pages.
-
-    Returns:
-        A side effect returning the requested page, or an empty page beyond the last one.
-
-    """
-
-    def _side_effect(**kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        pages = pages_by_value.get(kwargs[key], [])
-        page = kwargs.get("page", 1)
-        return (list(pages[page - 1]) if page <= len(pages) else [], {"status_code": 200})
-
-    return _side_effect
-
-
-def make_client(
-    issues: list[dict[str, Any]] | None = None,
-    comments: dict[int, list[dict[str, Any]]] | None = None,
-    columns: list[dict[str, Any]] | None = None,
-    column_issues: dict[int, list[dict[str, Any]]] | None = None,
-) -> MagicMock:
-    """Build a client answering the listings a watch run walks.
-
-    Args:
-        issues: The open issues of every repository.
-        comments: The comments of each issue, keyed by issue number.
-        columns: The columns of every project.
-        column_issues: The issues of each column, keyed by column ID.
-
-    Returns:
-        The client.
-
-    """
-    client = MagicMock()
-    client.issue.list_issues.side_effect = paged(issues or [])
-    client.comment.list_comments.side_effect = paged_by(
-        "index", {number: [page] for number, page in (comments or {}).items()}
-    )
-    client.project.list_project_columns.side_effect = paged(columns or [])
-    client.project.list_project_column_issues.side_effect = paged_by(
-        "column_id", {column_id: [page] for column_id, page in (column_issues or {}).items()}
-    )
-    return client
-
 
 def run(*arguments: str, client: MagicMock | None = None):
     """Invoke the CLI against a stubbed client.
@@ -164,24 +70,6 @@ def watch(state_path: Path, *extra: str, output: str | None = None) -> list[str]
     ]
 
 
-def logged_error(logger: MagicMock) -> str:
-    """Read the message of the single error a failed run logged.
-
-    Asserting on the rendered stderr would make the assertion depend on the
-    terminal, since `RichHandler` lays a record out as a table and appends the
-    emitting frame to it; the record itself is what the CLI wrote.
-
-    Args:
-        logger: The patched logger of the module reporting the failure.
-
-    Returns:
-        The logged message with its arguments interpolated.
-
-    """
-    template, *arguments = logger.error.call_args.args
-    return str(template) % tuple(arguments)
-
-
 class TestBuildScopes:
     """Tests for working out what a run watches from the options naming it."""
 
@@ -437,6 +325,7 @@ class TestReportedChanges:
             "issue_count": 2,
             "change_count": 1,
             "state_file": str(state_path),
+            "state_backend": "json",
             "dry_run": False,
         }
 
@@ -494,6 +383,71 @@ class TestIdempotence:
         assert not state_path.exists()
 
 
+class TestSqliteCache:
+    """Tests for a run keeping its cache in SQLite."""
+
+    def test_a_database_suffix_keeps_the_cache_in_sqlite(self, tmp_path: Path) -> None:
+        """A run against a `.db` cache should report what a JSON one does."""
+        state_path = tmp_path / "watch.db"
+        run(*watch(state_path), client=make_client([ISSUE]))
+
+        result = run(*watch(state_path, output="json"), client=make_client([ISSUE, OTHER_ISSUE]))
+
+        payload = parse_envelope(result.stdout)
+        assert [change["number"] for change in payload["data"]] == [16]
+        assert payload["metadata"]["state_backend"] == "sqlite"
+        assert state_path.read_bytes().startswith(b"SQLite format 3\x00")
+
+    def test_the_option_keeps_any_path_in_sqlite(self, tmp_path: Path) -> None:
+        """`--state-backend` should win over a suffix that says JSON."""
+        state_path = tmp_path / "watch-state.json"
+        run(*watch(state_path, "--state-backend", "sqlite"), client=make_client([ISSUE]))
+
+        result = run(*watch(state_path, "--state-backend", "sqlite"), client=make_client([ISSUE, OTHER_ISSUE]))
+
+        assert result.stdout == "my-org/my-repo#16 new: new issue · Ship the release\n"
+        assert state_path.read_bytes().startswith(b"SQLite format 3\x00")
+
+    def test_a_dry_run_leaves_the_database_alone(self, tmp_path: Path) -> None:
+        """Reading a database should not create one."""
+        state_path = tmp_path / "watch.db"
+
+        run(*watch(state_path, "--dry-run"), client=make_client([ISSUE]))
+
+        assert not state_path.exists()
+
+
+class TestShardedCache:
+    """Tests for a run keeping its cache as one file per scope."""
+
+    def test_a_directory_suffix_keeps_each_scope_in_a_shard(self, tmp_path: Path) -> None:
+        """A run against a `.d` cache should report what a JSON one does."""
+        state_path = tmp_path / "watch-state.d"
+        run(*watch(state_path), client=make_client([ISSUE]))
+
+        result = run(*watch(state_path, output="json"), client=make_client([ISSUE, OTHER_ISSUE]))
+
+        payload = parse_envelope(result.stdout)
+        assert [change["number"] for change in payload["data"]] == [16]
+        assert payload["metadata"]["state_backend"] == "sharded"
+        assert sorted(path.name for path in state_path.iterdir()) == [
+            "repo%3Amy-org%2Fmy-repo.json",
+            "repo%3Amy-org%2Fmy-repo.json.lock",
+        ]
+
+    def test_a_run_leaves_the_shards_of_other_scopes_alone(self, tmp_path: Path) -> None:
+        """A job watching one repository should not rewrite another job's shard."""
+        state_path = tmp_path / "shards"
+        other = [*watch(state_path, "--state-backend", "sharded")]
+        other[other.index("my-repo")] = "other-repo"
+        run(*other, client=make_client([OTHER_ISSUE]))
+        recorded = (state_path / "repo%3Amy-org%2Fother-repo.json").read_bytes()
+
+        run(*watch(state_path, "--state-backend", "sharded"), client=make_client([ISSUE]))
+
+        assert (state_path / "repo%3Amy-org%2Fother-repo.json").read_bytes() == recorded
+
+
 class TestSeveralScopes:
     """Tests for watching more than one thing in one invocation."""
 
@@ -663,6 +617,427 @@ class TestSeveralScopes:
         assert payload["metadata"]["scopes"] == ["repo:my-org/one", "project:my-org/one/29"]
 
 
+class TestConcurrency:
+    """Tests for making a run's requests several at a time."""
+
+    def test_a_concurrent_run_reports_what_a_serial_one_does(self, tmp_path: Path) -> None:
+        """Fetching side by side may change when a request is made, never what is reported."""
+        answered = {**COMMENT, "id": 8, "body": "On it", "user": {"login": "bob"}}
+        reassigned = {**OTHER_ISSUE, "assignees": [{"login": "bob"}]}
+        outputs = []
+        for concurrency in ("1", "4"):
+            state_path = tmp_path / f"watch-state-{concurrency}.json"
+            arguments = [
+                "watch",
+                "list",
+                "--owner",
+                "my-org",
+                "--repository",
+                "one",
+                "--repository",
+                "two",
+                "--state-file",
+                str(state_path),
+                "--concurrency",
+                concurrency,
+                *AUTH,
+            ]
+            run(*arguments, client=make_client([ISSUE, OTHER_ISSUE], comments={15: [COMMENT], 16: []}))
+            result = run(*arguments, client=make_client([ISSUE, reassigned], comments={15: [COMMENT, answered]}))
+            assert result.exit_code == 0
+            outputs.append(result.stdout)
+
+        assert outputs[0] == outputs[1]
+        assert outputs[0].count("\n") == 4
+
+    def test_the_comments_of_a_scope_are_walked_at_once(self, tmp_path: Path) -> None:
+        """Each issue's comment walk starts before the others have finished."""
+        barrier = threading.Barrier(2, timeout=5)
+        client = make_client([ISSUE, OTHER_ISSUE])
+
+        def list_comments(**kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            barrier.wait()
+            return [], {"status_code": 200}
+
+        client.comment.list_comments.side_effect = list_comments
+
+        result = run(*watch(tmp_path / "watch-state.json", "--concurrency", "2"), client=client)
+
+        assert result.exit_code == 0
+        assert not barrier.broken
+
+    def test_the_scopes_are_fetched_at_once(self, tmp_path: Path) -> None:
+        """Each scope's issue listing starts before the others have finished."""
+        barrier = threading.Barrier(2, timeout=5)
+        client = make_client()
+
+        def list_issues(**kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            barrier.wait()
+            return [], {"status_code": 200}
+
+        client.issue.list_issues.side_effect = list_issues
+        arguments = ["watch", "list", "--owner", "my-org", "--repository", "one", "--repository", "two"]
+
+        result = run(
+            *arguments, "--state-file", str(tmp_path / "watch-state.json"), "--concurrency", "2", *AUTH, client=client
+        )
+
+        assert result.exit_code == 0
+        assert not barrier.broken
+
+    def test_the_connection_pool_holds_every_worker(self, tmp_path: Path) -> None:
+        """A pool smaller than the workers would reconnect for every request past it."""
+        with patch("gitea.client.gitea.Gitea") as gitea:
+            gitea.return_value.__enter__.return_value = make_client()
+            result = runner.invoke(app, watch(tmp_path / "watch-state.json", "--concurrency", "32"))
+
+        assert result.exit_code == 0
+        assert gitea.call_args.kwargs["pool_maxsize"] == 32
+
+    def test_a_concurrency_below_one_is_refused(self, tmp_path: Path) -> None:
+        """Zero requests at a time would make none at all."""
+        result = run(*watch(tmp_path / "watch-state.json", "--concurrency", "0"))
+
+        assert result.exit_code == 2
+        assert not (tmp_path / "watch-state.json").exists()
+
+
+# The issues as a listing in every state answers with them: their state and
+# their comment count, which an incremental run reads, included.
+OPEN_ISSUE = {**ISSUE, "state": "open", "comments": 1}
+OPEN_OTHER_ISSUE = {**OTHER_ISSUE, "state": "open", "comments": 0}
+
+
+def narrowed_client(
+    recent: list[dict[str, Any]], open_count: int | None, full: list[dict[str, Any]] | None = None
+) -> MagicMock:
+    """Build a client answering the listings an incremental run narrows a repository to.
+
+    Args:
+        recent: The issues updated since the time asked for, in every state.
+        open_count: The count of open issues the instance reports, or None for
+            an instance that reports none.
+        full: The open issues a full walk lists.
+
+    Returns:
+        The client.
+
+    """
+    client = make_client(full or [], comments={15: [COMMENT], 16: []})
+    walk = paged(full or [])
+
+    def list_issues(**kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        if kwargs.get("since") is not None:
+            return paged(recent)(**kwargs)
+        if kwargs.get("limit") == 1:
+            counted = {} if open_count is None else {"total_count": open_count}
+            return [], {"status_code": 200, **counted}
+        return walk(**kwargs)
+
+    client.issue.list_issues.side_effect = list_issues
+    return client
+
+
+class TestIncremental:
+    """Tests for skipping what has not changed since the last run."""
+
+    def test_unchanged_comments_are_not_walked_again(self, tmp_path: Path) -> None:
+        """An issue with the timestamp and count it was recorded with keeps its recorded comments."""
+        state_path = tmp_path / "watch-state.json"
+        run(*watch(state_path), client=make_client([OPEN_ISSUE], comments={15: [COMMENT]}))
+
+        client = make_client([OPEN_ISSUE], comments={15: [COMMENT]})
+        result = run(*watch(state_path, "--incremental"), client=client)
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+        client.comment.list_comments.assert_not_called()
+        recorded = json.loads(state_path.read_text(encoding="utf-8"))["scopes"]["repo:my-org/my-repo"]["issues"]
+        assert recorded["1854"]["comment_hashes"] == [comment_hash(COMMENT)]
+
+    def test_a_snapshot_without_comment_hashes_walks_the_comments(self) -> None:
+        """A recorded snapshot holding no hashes has none to carry over, so the comments are walked."""
+        # Without comments, the count agrees with the empty list a missing field
+        # would read as, which is the case that must not be trusted.
+        (scope,) = build_scopes("my-org", ["my-repo"], [])
+        quiet = {**OPEN_ISSUE, "comments": 0}
+        client = make_client(comments={15: []})
+        recorded = snapshot_issues(client, "my-org", scope, [quiet])["1854"]
+        del recorded["comment_hashes"]
+        client.comment.list_comments.reset_mock()
+
+        snapshots = snapshot_issues(client, "my-org", scope, [quiet], previous={"1854": recorded})
+
+        client.comment.list_comments.assert_called()
+        assert snapshots["1854"]["comment_hashes"] == []
+
+    def test_an_issue_that_was_commented_on_is_walked(self, tmp_path: Path) -> None:
+        """A comment added bumps the issue, so its comments are walked and the new one reported."""
+        state_path = tmp_path / "watch-state.json"
+        run(*watch(state_path), client=make_client([OPEN_ISSUE], comments={15: [COMMENT]}))
+
+        answered = {**COMMENT, "id": 8, "body": "On it", "user": {"login": "bob"}}
+        bumped = {**OPEN_ISSUE, "updated_at": "2026-08-03T10:00:00Z", "comments": 2}
+        result = run(
+            *watch(state_path, "--incremental"), client=make_client([bumped], comments={15: [COMMENT, answered]})
+        )
+
+        assert result.stdout == "my-org/my-repo#15 comments: 1 new · Fix the docs\n"
+
+    def test_without_the_option_every_issue_is_walked(self, tmp_path: Path) -> None:
+        """An edit in place is only seen by walking the comments, which stays the default."""
+        state_path = tmp_path / "watch-state.json"
+        run(*watch(state_path), client=make_client([OPEN_ISSUE], comments={15: [COMMENT]}))
+
+        edited = {**COMMENT, "body": "Looks wrong to me", "updated_at": "2026-08-03T09:00:00Z"}
+        result = run(*watch(state_path), client=make_client([OPEN_ISSUE], comments={15: [edited]}))
+
+        assert result.stdout == "my-org/my-repo#15 comments: 1 new, 1 removed · Fix the docs\n"
+
+    def test_a_repository_asks_only_for_what_was_updated_since(self, tmp_path: Path) -> None:
+        """The issues not updated since the latest one recorded are carried over rather than listed."""
+        state_path = tmp_path / "watch-state.json"
+        run(*watch(state_path), client=make_client([OPEN_ISSUE, OPEN_OTHER_ISSUE], comments={15: [COMMENT]}))
+
+        reassigned = {**OPEN_OTHER_ISSUE, "assignees": [{"login": "bob"}], "updated_at": "2026-08-02T12:00:00Z"}
+        client = narrowed_client([reassigned], open_count=2)
+        result = run(*watch(state_path, "--incremental", output="json"), client=client)
+
+        payload = parse_envelope(result.stdout)
+        assert [change["kind"] for change in payload["data"]] == ["assignees"]
+        assert payload["metadata"]["issue_count"] == 2
+        listed = [call.kwargs for call in client.issue.list_issues.call_args_list]
+        assert listed[0]["state"] == "all"
+        assert listed[0]["since"] == datetime(2026, 8, 2, 11, 0, tzinfo=UTC)
+        assert all(call.get("since") is not None or call["limit"] == 1 for call in listed)
+        client.comment.list_comments.assert_called_once()
+
+    def test_an_issue_closed_since_is_reported_gone(self, tmp_path: Path) -> None:
+        """A closed issue comes back from a listing in every state, and leaves the scope."""
+        state_path = tmp_path / "watch-state.json"
+        run(*watch(state_path), client=make_client([OPEN_ISSUE, OPEN_OTHER_ISSUE], comments={15: [COMMENT]}))
+
+        closed = {**OPEN_OTHER_ISSUE, "state": "closed", "updated_at": "2026-08-02T12:00:00Z"}
+        result = run(*watch(state_path, "--incremental"), client=narrowed_client([closed], open_count=1))
+
+        assert result.stdout == "my-org/my-repo#16 gone: no longer listed · Ship the release\n"
+
+    @pytest.mark.parametrize("open_count", [1, None])
+    def test_a_count_that_disagrees_walks_the_repository_in_full(self, tmp_path: Path, open_count: int | None) -> None:
+        """An issue deleted without an update is invisible to a narrowed listing, but not to the count."""
+        state_path = tmp_path / "watch-state.json"
+        run(*watch(state_path), client=make_client([OPEN_ISSUE, OPEN_OTHER_ISSUE], comments={15: [COMMENT]}))
+
+        client = narrowed_client([], open_count=open_count, full=[OPEN_ISSUE])
+        result = run(*watch(state_path, "--incremental"), client=client)
+
+        assert result.stdout == "my-org/my-repo#16 gone: no longer listed · Ship the release\n"
+        assert client.issue.list_issues.call_args_list[-1].kwargs["state"] == "open"
+
+
+def thread(number: int, updated_at: str, state: str = "open", kind: str = "issues") -> dict[str, Any]:
+    """Build a notification thread about one issue of the watched repository.
+
+    Args:
+        number: The number of the issue the thread is about.
+        updated_at: When the thread was last updated.
+        state: The state of the issue the thread reports.
+        kind: The collection the subject's URL names, `issues` or `pulls`.
+
+    Returns:
+        The thread, as the API returns it.
+
+    """
+    return {
+        "id": number * 100,
+        "updated_at": updated_at,
+        "subject": {
+            "type": "Issue" if kind == "issues" else "Pull",
+            "state": state,
+            "url": f"https://gitea.invalid/api/v1/repos/my-org/my-repo/{kind}/{number}",
+        },
+    }
+
+
+def notified_client(
+    threads: list[dict[str, Any]],
+    current: dict[int, dict[str, Any] | Exception],
+    open_count: int | None,
+    full: list[dict[str, Any]] | None = None,
+) -> MagicMock:
+    """Build a client answering what a run narrowed to its notifications asks.
+
+    Args:
+        threads: The notification threads of the repository.
+        current: What fetching each issue answers, keyed by number, or raises.
+        open_count: The count of open issues the instance reports, or None for
+            an instance that reports none.
+        full: The open issues a full walk lists.
+
+    Returns:
+        The client.
+
+    """
+    client = narrowed_client([], open_count, full)
+    client.notification.list_repo_notifications.side_effect = paged(threads)
+
+    def get_issue(**kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        answer = current[kwargs["index"]]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer, {"status_code": 200}
+
+    client.issue.get_issue.side_effect = get_issue
+    return client
+
+
+def recorded_scope(state_path: Path) -> dict[str, Any]:
+    """Read what the JSON cache records for the watched repository.
+
+    Args:
+        state_path: Path of the cache.
+
+    Returns:
+        The scope's entry.
+
+    """
+    return json.loads(state_path.read_text(encoding="utf-8"))["scopes"]["repo:my-org/my-repo"]
+
+
+class TestViaNotifications:
+    """Tests for reading again only the issues the notifications name."""
+
+    def baseline(self, state_path: Path) -> None:
+        """Record both issues with a full walk.
+
+        Args:
+            state_path: Path of the cache to record to.
+
+        """
+        run(*watch(state_path), client=make_client([OPEN_ISSUE, OPEN_OTHER_ISSUE], comments={15: [COMMENT]}))
+
+    def test_a_full_walk_records_when_it_was_made(self, tmp_path: Path) -> None:
+        """A scope walked in full should not be due again until the interval passes."""
+        state_path = tmp_path / "watch-state.json"
+        before = datetime.now(UTC)
+
+        self.baseline(state_path)
+
+        scanned_at = datetime.fromisoformat(recorded_scope(state_path)["scanned_at"])
+        assert before <= scanned_at <= datetime.now(UTC)
+
+    def test_a_scope_never_walked_in_full_is_walked_first(self, tmp_path: Path) -> None:
+        """Without a full walk recorded there is nothing to narrow from."""
+        state_path = tmp_path / "watch-state.json"
+        client = make_client([OPEN_ISSUE], comments={15: [COMMENT]})
+
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.exit_code == 0
+        client.notification.list_repo_notifications.assert_not_called()
+        assert "scanned_at" in recorded_scope(state_path)
+
+    def test_only_the_notified_issue_is_read_again(self, tmp_path: Path) -> None:
+        """An issue named by a newer thread is fetched, and every other one carried over."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+        scanned_at = recorded_scope(state_path)["scanned_at"]
+
+        reassigned = {**OPEN_OTHER_ISSUE, "assignees": [{"login": "bob"}], "updated_at": "2026-08-02T12:00:00Z"}
+        client = notified_client([thread(16, "2026-08-02T12:00:00Z")], {16: reassigned}, open_count=2)
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.stdout == "my-org/my-repo#16 assignees: +bob · Ship the release\n"
+        asked = client.notification.list_repo_notifications.call_args.kwargs
+        assert asked["all_notifications"] is True
+        assert asked["since"] == datetime(2026, 8, 2, 11, 0, tzinfo=UTC)
+        client.issue.get_issue.assert_called_once_with(owner="my-org", repository="my-repo", index=16)
+        assert all(call.kwargs["limit"] == 1 for call in client.issue.list_issues.call_args_list)
+        assert recorded_scope(state_path)["scanned_at"] == scanned_at
+        assert sorted(recorded_scope(state_path)["issues"]) == ["1854", "1900"]
+
+    def test_a_new_pull_request_is_reported(self, tmp_path: Path) -> None:
+        """A subject URL naming a pull request reads as the issue it is."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+
+        opened = {**OPEN_OTHER_ISSUE, "id": 1950, "number": 17, "title": "Bump the version"}
+        client = notified_client([thread(17, "2026-08-02T12:00:00Z", kind="pulls")], {17: opened}, open_count=3)
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.stdout == "my-org/my-repo#17 new: new issue · Bump the version\n"
+
+    def test_a_closed_subject_is_dropped_without_a_request(self, tmp_path: Path) -> None:
+        """The thread already says the issue left the scope."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+
+        client = notified_client([thread(16, "2026-08-02T12:00:00Z", state="closed")], {}, open_count=1)
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.stdout == "my-org/my-repo#16 gone: no longer listed · Ship the release\n"
+        client.issue.get_issue.assert_not_called()
+
+    def test_a_thread_no_newer_than_the_snapshot_is_not_read(self, tmp_path: Path) -> None:
+        """A notification the last run already saw the effect of costs no request."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+
+        client = notified_client([thread(16, "2026-08-02T11:00:00Z")], {}, open_count=2)
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.stdout == ""
+        client.issue.get_issue.assert_not_called()
+
+    def test_an_issue_the_repository_no_longer_holds_is_reported_gone(self, tmp_path: Path) -> None:
+        """A deleted or transferred issue answers 404, which is its leaving the scope."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+
+        missing = requests.HTTPError("404 Client Error", response=MagicMock(status_code=404))
+        client = notified_client([thread(16, "2026-08-02T12:00:00Z")], {16: missing}, open_count=1)
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.stdout == "my-org/my-repo#16 gone: no longer listed · Ship the release\n"
+
+    def test_a_count_that_disagrees_walks_the_repository_in_full(self, tmp_path: Path) -> None:
+        """An issue opened by the token's own user is notified to no one, but is counted."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+
+        opened = {**OPEN_OTHER_ISSUE, "id": 1950, "number": 17, "title": "Bump the version"}
+        client = notified_client([], {}, open_count=3, full=[OPEN_ISSUE, OPEN_OTHER_ISSUE, opened])
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.stdout == "my-org/my-repo#17 new: new issue · Bump the version\n"
+        assert client.issue.list_issues.call_args_list[-1].kwargs["state"] == "open"
+
+    def test_a_scope_is_walked_in_full_once_the_interval_has_passed(self, tmp_path: Path) -> None:
+        """The periodic full walk catches what the notifications never named."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+        scanned_at = recorded_scope(state_path)["scanned_at"]
+
+        client = make_client([OPEN_ISSUE], comments={15: [COMMENT]})
+        result = run(*watch(state_path, "--via-notifications", "--full-scan-interval", "0"), client=client)
+
+        assert result.stdout == "my-org/my-repo#16 gone: no longer listed · Ship the release\n"
+        client.notification.list_repo_notifications.assert_not_called()
+        assert recorded_scope(state_path)["scanned_at"] > scanned_at
+
+    def test_a_failed_notification_listing_fails_the_run(self, tmp_path: Path) -> None:
+        """A token without access to notifications is reported, as any refused request is."""
+        state_path = tmp_path / "watch-state.json"
+        self.baseline(state_path)
+
+        client = notified_client([], {}, open_count=2)
+        client.notification.list_repo_notifications.side_effect = requests.ConnectionError("Connection refused")
+        result = run(*watch(state_path, "--via-notifications"), client=client)
+
+        assert result.exit_code == 1
+        assert result.stdout == ""
+
+
 class TestProjectScope:
     """Tests for watching a board rather than a repository."""
 
@@ -840,7 +1215,9 @@ class TestRequests:
             )
 
         assert result.exit_code == 0, result.output
+        # The page size is asked of the instance once, before the first listing.
         assert session.requests == [
+            ("GET", "https://gitea.invalid/api/v1/settings/api"),
             ("GET", "https://gitea.invalid/api/v1/repos/my-org/my-repo/issues"),
             ("GET", "https://gitea.invalid/api/v1/repos/my-org/my-repo/projects/29/columns"),
         ]
@@ -866,7 +1243,10 @@ class TestRequests:
             )
 
         assert result.exit_code == 0, result.output
-        assert session.requests == [("GET", "https://gitea.invalid/api/v1/orgs/my-org/projects/29/columns")]
+        assert session.requests == [
+            ("GET", "https://gitea.invalid/api/v1/settings/api"),
+            ("GET", "https://gitea.invalid/api/v1/orgs/my-org/projects/29/columns"),
+        ]
 
     def test_a_repository_scope_lists_its_open_issues_and_their_comments(self, tmp_path: Path) -> None:
         """Watching every issue ever closed would make the listing grow forever."""
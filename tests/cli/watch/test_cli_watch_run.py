@@ -0,0 +1,388 @@
+"""Unit tests for the `gitea-cli watch run` command."""
+
+from __future__ import annotations
+
+import json
+import random
+import signal
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from typer.testing import CliRunner
+
+from gitea.cli.main import app
+from gitea.cli.watch.list import build_scopes
+from gitea.cli.watch.run import next_poll, poll_until_stopped, stop_on_signals
+from gitea.watch.changes import issue_snapshot
+from gitea.watch.state import save_scopes
+from tests.cli.envelope import parse_records
+from tests.cli.watch.listings import AUTH, ISSUE, OTHER_ISSUE, logged_error, make_client
+
+runner = CliRunner()
+
+
+def polled(*rounds: list[dict[str, Any]] | Exception) -> MagicMock:
+    """Build a client whose issue listing answers each poll in turn.
+
+    Args:
+        *rounds: What each poll of the repository lists, or raises. The last
+            one is repeated for any poll after it.
+
+    Returns:
+        The client.
+
+    """
+    client = make_client()
+    answers = iter(rounds)
+    last: list[Any] = []
+
+    def list_issues(**kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Answer the first page of the next poll, and the empty page ending it.
+
+        Args:
+            **kwargs: The listing's arguments.
+
+        Returns:
+            The issues of this poll and their metadata.
+
+        Raises:
+            Exception: The one this poll was given to raise.
+
+        """
+        nonlocal last
+        if kwargs["page"] > 1:
+            return [], {"status_code": 200}
+        answer = next(answers, last)
+        if isinstance(answer, Exception):
+            raise answer
+        last = answer
+        return list(answer), {"status_code": 200}
+
+    client.issue.list_issues.side_effect = list_issues
+    return client
+
+
+def run(state_path: Path, *extra: str, client: MagicMock):
+    """Run the daemon against one repository, for a few ticks and without waiting.
+
+    Args:
+        state_path: Path of the cache the run reads and writes.
+        *extra: Further arguments to append.
+        client: The client the run talks to.
+
+    Returns:
+        The result of the invocation.
+
+    """
+    with patch("gitea.client.gitea.Gitea") as gitea:
+        gitea.return_value.__enter__.return_value = client
+        return runner.invoke(
+            app,
+            [
+                "watch",
+                "run",
+                "--owner",
+                "my-org",
+                "--repository",
+                "my-repo",
+                "--state-file",
+                str(state_path),
+                "--interval",
+                "0",
+                "--jitter",
+                "0",
+                *AUTH,
+                *extra,
+            ],
+        )
+
+
+class TestRecords:
+    """Tests for what the run writes to stdout."""
+
+    def test_a_change_is_written_as_a_record_when_it_is_seen(self, tmp_path: Path) -> None:
+        """The first poll baselines and the next one reports, as `watch list` does."""
+        result = run(tmp_path / "watch-state.json", "--ticks", "2", client=polled([ISSUE], [ISSUE, OTHER_ISSUE]))
+
+        assert result.exit_code == 0, result.output
+        records, metadata = parse_records(result.stdout)
+        assert [(record["scope"], record["kind"], record["number"]) for record in records] == [
+            ("repo:my-org/my-repo", "new", 16)
+        ]
+        assert metadata["polls"] == 2
+        assert metadata["change_count"] == 1
+        assert metadata["baselined_scopes"] == ["repo:my-org/my-repo"]
+
+    def test_the_records_are_written_whatever_the_output_format(self, tmp_path: Path) -> None:
+        """A stream with no end has no envelope to close, so it is always JSON Lines."""
+        with patch("gitea.client.gitea.Gitea") as gitea:
+            gitea.return_value.__enter__.return_value = polled([ISSUE], [ISSUE, OTHER_ISSUE])
+            result = runner.invoke(
+                app,
+                [
+                    "--output",
+                    "json",
+                    "watch",
+                    "run",
+                    "--owner",
+                    "my-org",
+                    "--repository",
+                    "my-repo",
+                    "--state-file",
+                    str(tmp_path / "watch-state.json"),
+                    "--interval",
+                    "0",
+                    "--ticks",
+                    "2",
+                    *AUTH,
+                ],
+            )
+
+        records, _ = parse_records(result.stdout)
+        assert [record["number"] for record in records] == [16]
+
+    def test_a_quiet_run_writes_only_its_metadata(self, tmp_path: Path) -> None:
+        """Nothing changed is nothing to write, until the run says how it went."""
+        result = run(tmp_path / "watch-state.json", "--ticks", "3", client=polled([ISSUE]))
+
+        records, metadata = parse_records(result.stdout)
+        assert records == []
+        assert metadata["polls"] == 3
+
+
+class TestCache:
+    """Tests for when the snapshots the run holds are written."""
+
+    def test_what_the_run_saw_is_written_when_it_stops(self, tmp_path: Path) -> None:
+        """The next run should start from where this one stopped."""
+        state_path = tmp_path / "watch-state.json"
+        run(state_path, "--ticks", "2", client=polled([ISSUE], [ISSUE, OTHER_ISSUE]))
+
+        recorded = json.loads(state_path.read_text(encoding="utf-8"))["scopes"]["repo:my-org/my-repo"]["issues"]
+        assert sorted(recorded) == ["1854", "1900"]
+
+    def test_the_cache_is_written_every_flush_interval(self, tmp_path: Path) -> None:
+        """A run killed outright should lose only what it saw since its last write."""
+        with patch("gitea.cli.watch.run.save_scopes", wraps=save_scopes) as write:
+            run(
+                tmp_path / "watch-state.json",
+                "--ticks",
+                "2",
+                "--flush-interval",
+                "0",
+                client=polled([ISSUE], [ISSUE, OTHER_ISSUE]),
+            )
+
+        written = [sorted(call.args[1]["repo:my-org/my-repo"]) for call in write.call_args_list]
+        assert written == [["1854"], ["1854", "1900"]]
+
+    def test_a_narrowed_poll_keeps_the_last_full_walk(self, tmp_path: Path) -> None:
+        """A write should not cost `watch list --via-notifications` the time of the last full walk."""
+        state_path = tmp_path / "watch-state.json"
+        walked = "2026-08-01T09:00:00+00:00"
+        save_scopes(state_path, {"repo:my-org/my-repo": {}}, scanned_at={"repo:my-org/my-repo": walked})
+        narrowed = ({"1854": issue_snapshot(ISSUE, [], repository="my-org/my-repo")}, {"status_code": 200}, False)
+
+        with patch("gitea.cli.watch.list.poll_scope", return_value=narrowed):
+            run(state_path, "--ticks", "1", "--incremental", client=make_client())
+
+        scope = json.loads(state_path.read_text(encoding="utf-8"))["scopes"]["repo:my-org/my-repo"]
+        assert sorted(scope["issues"]) == ["1854"]
+        assert scope["scanned_at"] == walked
+
+    def test_a_full_poll_records_when_it_walked(self, tmp_path: Path) -> None:
+        """A poll that lists the whole scope is a full walk, and is recorded as one."""
+        state_path = tmp_path / "watch-state.json"
+        save_scopes(
+            state_path, {"repo:my-org/my-repo": {}}, scanned_at={"repo:my-org/my-repo": "2026-08-01T09:00:00+00:00"}
+        )
+        before = datetime.now(UTC)
+
+        run(state_path, "--ticks", "1", client=polled([ISSUE]))
+
+        scope = json.loads(state_path.read_text(encoding="utf-8"))["scopes"]["repo:my-org/my-repo"]
+        assert before <= datetime.fromisoformat(scope["scanned_at"]) <= datetime.now(UTC)
+
+    def test_a_scope_that_did_not_change_is_not_written_again(self, tmp_path: Path) -> None:
+        """A quiet poll should cost the cache nothing."""
+        state_path = tmp_path / "watch-state.json"
+        run(state_path, "--ticks", "1", client=polled([ISSUE]))
+
+        with patch("gitea.cli.watch.run.save_scopes") as write:
+            run(state_path, "--ticks", "3", "--flush-interval", "0", client=polled([ISSUE]))
+
+        assert write.call_count == 0
+
+    def test_a_dry_run_never_writes_the_cache(self, tmp_path: Path) -> None:
+        """`--dry-run` leaves the cache as `watch list --dry-run` does."""
+        state_path = tmp_path / "watch-state.json"
+        run(state_path, "--ticks", "2", "--dry-run", "--flush-interval", "0", client=polled([ISSUE], [OTHER_ISSUE]))
+
+        assert not state_path.exists()
+
+
+class TestFailures:
+    """Tests for a poll that fails."""
+
+    def test_a_failed_poll_after_the_first_round_is_retried(self, tmp_path: Path) -> None:
+        """An instance restarting should not stop the watcher."""
+        client = polled([ISSUE], requests.ConnectionError("Connection refused"), [ISSUE, OTHER_ISSUE])
+
+        with patch("gitea.cli.watch.run.logger") as logger:
+            result = run(tmp_path / "watch-state.json", "--ticks", "3", client=client)
+
+        assert result.exit_code == 0, result.output
+        records, metadata = parse_records(result.stdout)
+        assert [record["number"] for record in records] == [16]
+        assert metadata["failed_polls"] == 1
+        assert (
+            "Could not poll repo:my-org/my-repo" in logger.warning.call_args.args[0] % logger.warning.call_args.args[1:]
+        )
+
+    def test_a_failed_first_round_fails_the_run(self, tmp_path: Path) -> None:
+        """An instance that cannot be reached at all is a mistake to report, not to wait out."""
+        client = polled(requests.ConnectionError("Connection refused"))
+
+        with patch("gitea.cli.utils.api.logger") as logger:
+            result = run(tmp_path / "watch-state.json", client=client)
+
+        assert result.exit_code == 1
+        assert result.stdout == ""
+        assert "Could not reach the Gitea API at https://gitea.invalid" in logged_error(logger)
+
+    def test_naming_nothing_to_watch_is_refused(self, tmp_path: Path) -> None:
+        """The scopes are named as `watch list` names them."""
+        with patch("gitea.cli.utils.api.logger") as logger:
+            result = runner.invoke(app, ["watch", "run", "--owner", "my-org", "--ticks", "1", *AUTH])
+
+        assert result.exit_code == 1
+        assert "needs something to watch" in logged_error(logger)
+
+
+class TestSchedule:
+    """Tests for when each scope is polled."""
+
+    def test_the_jitter_stays_within_its_fraction(self) -> None:
+        """A poll moves by at most the jitter asked for, either way."""
+        rng = random.Random(7)  # noqa: S311
+
+        times = [next_poll(100.0, 60.0, 0.1, rng) for _ in range(200)]
+
+        assert all(154.0 <= when <= 166.0 for when in times)
+        assert len(set(times)) > 1
+
+    def test_no_jitter_polls_on_the_interval(self) -> None:
+        """Without jitter every scope keeps exact time."""
+        assert next_poll(100.0, 60.0, 0.0, random.Random()) == 160.0  # noqa: S311
+
+    def test_each_scope_is_polled_the_number_of_ticks(self) -> None:
+        """`--ticks` bounds every scope's polls, not the run's."""
+        scopes = build_scopes("my-org", ["api", "web"], [])
+        seen: list[str] = []
+
+        polls, failed = poll_until_stopped(
+            scopes,
+            lambda scope: seen.append(scope.key),
+            lambda: None,
+            interval=0,
+            jitter=0,
+            flush_interval=60,
+            ticks=3,
+            stopping=threading.Event(),
+        )
+
+        assert (polls, failed) == (6, 0)
+        assert sorted(seen) == ["repo:my-org/api"] * 3 + ["repo:my-org/web"] * 3
+
+    def test_a_stopped_run_polls_only_the_first_round(self) -> None:
+        """Once asked to stop, the run stops at the next turn."""
+        scopes = build_scopes("my-org", ["api"], [])
+        stopping = threading.Event()
+        stopping.set()
+
+        polls, _ = poll_until_stopped(
+            scopes,
+            lambda scope: None,
+            lambda: None,
+            interval=0,
+            jitter=0,
+            flush_interval=60,
+            ticks=None,
+            stopping=stopping,
+        )
+
+        assert polls == 1
+
+    def test_a_flush_interval_of_zero_writes_after_every_poll(self) -> None:
+        """Zero writes once per poll, rather than spinning on a write that is always due."""
+        scopes = build_scopes("my-org", ["api", "web"], [])
+        writes = MagicMock()
+
+        polls, _ = poll_until_stopped(
+            scopes,
+            lambda scope: None,
+            writes,
+            interval=0.2,
+            jitter=0,
+            flush_interval=0,
+            ticks=2,
+            stopping=threading.Event(),
+        )
+
+        assert polls == 4
+        assert writes.call_count == 3
+
+    def test_a_failure_in_the_first_round_is_raised(self) -> None:
+        """The first round is the run's to fail."""
+        scopes = build_scopes("my-org", ["api"], [])
+
+        def fail(scope: Any) -> None:
+            """Fail as an unreachable instance does.
+
+            Args:
+                scope: The scope polled.
+
+            Raises:
+                requests.ConnectionError: Always.
+
+            """
+            raise requests.ConnectionError("Connection refused")
+
+        with pytest.raises(requests.ConnectionError):
+            poll_until_stopped(
+                scopes,
+                fail,
+                lambda: None,
+                interval=0,
+                jitter=0,
+                flush_interval=60,
+                ticks=None,
+                stopping=threading.Event(),
+            )
+
+
+class TestSignals:
+    """Tests for stopping the run."""
+
+    def test_sigterm_asks_the_run_to_stop(self) -> None:
+        """A service manager stopping the run should get its metadata line, not a traceback."""
+        stopping = threading.Event()
+
+        with stop_on_signals(stopping):
+            signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+
+        assert stopping.is_set()
+
+    def test_the_previous_handlers_are_put_back(self) -> None:
+        """The handlers belong to the run only while it runs."""
+        before = signal.getsignal(signal.SIGINT)
+
+        with stop_on_signals(threading.Event()):
+            assert signal.getsignal(signal.SIGINT) is not before
+
+        assert signal.getsignal(signal.SIGINT) is before
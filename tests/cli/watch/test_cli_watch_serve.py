@@ -0,0 +1,456 @@
+"""Unit tests for the `gitea-cli watch serve` command."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from datetime import datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import requests
+from typer.testing import CliRunner
+
+from gitea.cli.main import app
+from gitea.cli.watch.list import build_scopes
+from gitea.cli.watch.serve import (
+    WebhookServer,
+    _DeliveryHandler,
+    apply_delivery,
+    serve_until_stopped,
+    signature_matches,
+)
+from gitea.watch.changes import comment_hash, issue_snapshot
+from gitea.watch.state import save_scopes
+from tests.cli.envelope import parse_records
+from tests.cli.watch.listings import AUTH, COMMENT, ISSUE, OTHER_ISSUE, logged_error, make_client
+from tests.cli.webhook import SECRET, delivery_request, free_port, post_delivery, sign
+
+runner = CliRunner()
+
+REPOSITORY = {"name": "my-repo", "owner": {"login": "my-org"}, "full_name": "my-org/my-repo"}
+
+
+def delivery(issue: dict[str, Any], action: str = "edited", **fields: Any) -> dict[str, Any]:
+    """Build the payload of a delivery about one issue of the watched repository.
+
+    Args:
+        issue: The issue, as the listing answers it.
+        action: What happened to it.
+        **fields: Fields to set on the issue the payload carries.
+
+    Returns:
+        The payload.
+
+    """
+    return {"action": action, "issue": {**issue, "state": "open", **fields}, "repository": REPOSITORY}
+
+
+def serve(
+    state_path: Path,
+    *deliveries: tuple[Any, ...],
+    client: MagicMock,
+    extra: tuple[str, ...] = (),
+    port: int | None = None,
+    expected: int | None = None,
+) -> tuple[Any, list[int]]:
+    """Run the server against one repository, post deliveries to it, and let it stop.
+
+    Args:
+        state_path: Path of the cache the server reads and writes.
+        *deliveries: The arguments of `post_delivery` after the port, one tuple
+            per delivery, posted in order once the server listens.
+        client: The client the server talks to.
+        extra: Further arguments to append.
+        port: The port to serve on, or None for a free one.
+        expected: Deliveries the server answers before it stops, or None for
+            as many as are posted here.
+
+    Returns:
+        The result of the invocation, and the status each delivery was answered with.
+
+    """
+    port = free_port() if port is None else port
+    statuses: list[int] = []
+
+    def post_all() -> None:
+        """Post every delivery, one after the other."""
+        for arguments in deliveries:
+            statuses.append(post_delivery(port, *arguments))
+
+    poster = threading.Thread(target=post_all, daemon=True)
+    poster.start()
+    with patch("gitea.client.gitea.Gitea") as gitea:
+        gitea.return_value.__enter__.return_value = client
+        result = runner.invoke(
+            app,
+            [
+                "watch",
+                "serve",
+                "--owner",
+                "my-org",
+                "--repository",
+                "my-repo",
+                "--secret",
+                SECRET,
+                "--port",
+                str(port),
+                "--deliveries",
+                str(len(deliveries) if expected is None else expected),
+                "--state-file",
+                str(state_path),
+                *AUTH,
+                *extra,
+            ],
+        )
+    poster.join(timeout=10)
+    return result, statuses
+
+
+def listening(deliver: Any, deliveries: int) -> tuple[WebhookServer, threading.Thread]:
+    """Start a server on a free port, answering a number of deliveries on a thread.
+
+    Args:
+        deliver: The callable handed each signed delivery.
+        deliveries: Deliveries to answer before the thread ends.
+
+    Returns:
+        The server and the thread answering for it.
+
+    """
+    server = WebhookServer(("127.0.0.1", 0), SECRET.encode("utf-8"), deliver)
+    thread = threading.Thread(target=serve_until_stopped, args=(server, threading.Event(), deliveries), daemon=True)
+    thread.start()
+    return server, thread
+
+
+class TestSignature:
+    """Tests for checking what signed a delivery."""
+
+    def test_the_signature_gitea_sends_matches(self) -> None:
+        """The HMAC-SHA256 of the body under the secret is what a genuine delivery carries."""
+        assert signature_matches(SECRET.encode("utf-8"), b"{}", sign(b"{}"))
+
+    def test_a_body_signed_with_another_secret_does_not_match(self) -> None:
+        """A delivery from another webhook, or forged, should be refused."""
+        assert not signature_matches(SECRET.encode("utf-8"), b"{}", sign(b"{}", secret="other"))
+
+    def test_a_body_changed_after_signing_does_not_match(self) -> None:
+        """The signature covers the body, byte for byte."""
+        assert not signature_matches(SECRET.encode("utf-8"), b'{"a": 1}', sign(b"{}"))
+
+    def test_a_missing_signature_does_not_match(self) -> None:
+        """An unsigned delivery is refused, whatever it carries."""
+        assert not signature_matches(SECRET.encode("utf-8"), b"{}", None)
+        assert not signature_matches(SECRET.encode("utf-8"), b"{}", "")
+
+
+class TestServer:
+    """Tests for how the server answers what is posted to it."""
+
+    def test_a_signed_delivery_is_handed_on_with_its_event(self) -> None:
+        """What the callable answers is what the delivery is answered with."""
+        deliver = MagicMock(return_value=HTTPStatus.NO_CONTENT)
+        server, thread = listening(deliver, 1)
+
+        with server:
+            status = post_delivery(server.server_address[1], "issues", {"action": "opened"})
+            thread.join(timeout=10)
+
+        assert status == 204
+        deliver.assert_called_once_with("issues", {"action": "opened"})
+        assert server.answers == {HTTPStatus.NO_CONTENT: 1}
+
+    def test_a_delivery_with_a_wrong_signature_is_refused_unread(self) -> None:
+        """A forged delivery never reaches the cache."""
+        deliver = MagicMock()
+        server, thread = listening(deliver, 1)
+
+        with server, patch("gitea.cli.watch.serve.logger"):
+            status = post_delivery(server.server_address[1], "issues", {}, signature=sign(b"{}", secret="other"))
+            thread.join(timeout=10)
+
+        assert status == 403
+        deliver.assert_not_called()
+
+    def test_a_body_that_is_not_an_object_is_refused(self) -> None:
+        """A signed body that is not a JSON object names no issue to update."""
+        deliver = MagicMock()
+        server, thread = listening(deliver, 1)
+
+        with server:
+            status = post_delivery(server.server_address[1], "issues", ["not", "an", "object"])
+            thread.join(timeout=10)
+
+        assert status == 400
+        deliver.assert_not_called()
+
+    def test_a_client_that_stalls_mid_body_does_not_hold_up_the_next(self) -> None:
+        """A body announced and never sent is dropped once the read times out."""
+        deliver = MagicMock(return_value=HTTPStatus.NO_CONTENT)
+        server, thread = listening(deliver, 2)
+
+        with server, patch.object(_DeliveryHandler, "timeout", 0.2), patch("gitea.cli.watch.serve.logger"):
+            stalled = socket.create_connection(server.server_address[:2])
+            stalled.sendall(b"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Length: 100\r\n\r\n")
+            status = post_delivery(server.server_address[1], "issues", {"action": "opened"})
+            thread.join(timeout=10)
+            stalled.close()
+
+        assert status == 204
+        assert server.answers == {HTTPStatus.REQUEST_TIMEOUT: 1, HTTPStatus.NO_CONTENT: 1}
+        deliver.assert_called_once_with("issues", {"action": "opened"})
+
+
+class TestApplyDelivery:
+    """Tests for how a delivery updates the snapshots of its scope."""
+
+    scope = build_scopes("my-org", ["my-repo"], [])[0]
+
+    def recorded(self, *issues: dict[str, Any], comments: list[dict[str, Any]] = ()) -> dict[str, dict[str, Any]]:
+        """Build the snapshots recorded for the scope.
+
+        Args:
+            *issues: The issues recorded.
+            comments: The comments recorded on each of them.
+
+        Returns:
+            The snapshots, keyed by issue.
+
+        """
+        return {
+            str(issue["id"]): issue_snapshot(issue, list(comments), repository="my-org/my-repo") for issue in issues
+        }
+
+    def test_an_issue_delivery_updates_only_its_issue(self) -> None:
+        """The other issues of the scope are carried over as recorded."""
+        previous = self.recorded(ISSUE, OTHER_ISSUE)
+        payload = delivery(ISSUE, "label_updated", labels=[{"name": "bug"}, {"name": "docs"}])
+
+        snapshots = apply_delivery(make_client(), "my-org", self.scope, previous, "issues", payload)
+
+        assert snapshots["1854"]["labels"] == ["bug", "docs"]
+        assert snapshots["1900"] == previous["1900"]
+
+    def test_an_issue_delivery_keeps_comments_it_does_not_touch(self) -> None:
+        """An issue whose timestamp and count still match is not walked again."""
+        previous = self.recorded(ISSUE, comments=[COMMENT])
+        client = make_client()
+        payload = delivery(ISSUE, "assigned", comments=1, assignees=[{"login": "bob"}])
+
+        snapshots = apply_delivery(client, "my-org", self.scope, previous, "issues", payload)
+
+        assert snapshots["1854"]["comment_hashes"] == [comment_hash(COMMENT)]
+        assert snapshots["1854"]["assignees"] == ["bob"]
+        client.comment.list_comments.assert_not_called()
+
+    def test_a_comment_delivery_walks_the_comments_of_its_issue(self) -> None:
+        """An edited comment moves neither the timestamp nor the count, so the hashes are read afresh."""
+        edited = {**COMMENT, "body": "Edited", "updated_at": "2026-08-03T09:00:00Z"}
+        previous = self.recorded(ISSUE, comments=[COMMENT])
+        client = make_client(comments={15: [edited]})
+
+        snapshots = apply_delivery(
+            client, "my-org", self.scope, previous, "issue_comment", {**delivery(ISSUE, comments=1), "comment": edited}
+        )
+
+        assert snapshots["1854"]["comment_hashes"] == [comment_hash(edited)]
+        assert client.comment.list_comments.call_args.kwargs["index"] == 15
+
+    def test_a_closed_issue_leaves_the_scope(self) -> None:
+        """The scope holds open issues, as its listing does."""
+        previous = self.recorded(ISSUE, OTHER_ISSUE)
+
+        snapshots = apply_delivery(
+            make_client(), "my-org", self.scope, previous, "issues", delivery(ISSUE, "closed", state="closed")
+        )
+
+        assert list(snapshots) == ["1900"]
+
+    def test_a_deleted_issue_leaves_the_scope(self) -> None:
+        """A deleted issue is reported gone, as a listing no longer holding it would."""
+        previous = self.recorded(ISSUE)
+
+        snapshots = apply_delivery(make_client(), "my-org", self.scope, previous, "issues", delivery(ISSUE, "deleted"))
+
+        assert snapshots == {}
+
+    def test_a_delivery_for_another_event_is_not_applied(self) -> None:
+        """Only the issue events carry an issue the scope could hold."""
+        payload = delivery(ISSUE)
+
+        assert apply_delivery(make_client(), "my-org", self.scope, {}, "push", payload) is None
+        assert apply_delivery(make_client(), "my-org", self.scope, {}, "issues", {"action": "opened"}) is None
+
+
+class TestCommand:
+    """Tests for the command end to end, against a local poster."""
+
+    def test_a_delivery_is_reported_as_the_changes_it_makes(self, tmp_path: Path) -> None:
+        """The records are the ones `watch run` writes for the same change."""
+        result, statuses = serve(
+            tmp_path / "watch-state.json",
+            ("issues", delivery(ISSUE, "label_updated", labels=[{"name": "docs"}])),
+            client=make_client([ISSUE]),
+        )
+
+        assert result.exit_code == 0, result.output
+        assert statuses == [204]
+        records, metadata = parse_records(result.stdout)
+        assert [(record["scope"], record["kind"], record["added"], record["removed"]) for record in records] == [
+            ("repo:my-org/my-repo", "labels", ["docs"], ["bug"])
+        ]
+        assert metadata["baselined_scopes"] == ["repo:my-org/my-repo"]
+        assert metadata["applied_deliveries"] == 1
+        assert metadata["change_count"] == 1
+
+    def test_the_start_reports_what_changed_while_nobody_listened(self, tmp_path: Path) -> None:
+        """A server started on a recorded cache catches up before taking deliveries."""
+        state_path = tmp_path / "watch-state.json"
+        serve(state_path, ("issues", delivery(ISSUE)), client=make_client([ISSUE]))
+
+        result, _ = serve(state_path, ("issues", delivery(ISSUE)), client=make_client([ISSUE, OTHER_ISSUE]))
+
+        records, metadata = parse_records(result.stdout)
+        assert [(record["kind"], record["number"]) for record in records] == [("new", 16)]
+        assert metadata["baselined_scopes"] == []
+
+    def test_a_delivery_made_during_the_first_poll_is_taken(self, tmp_path: Path) -> None:
+        """The port listens before the poll, so Gitea's delivery waits instead of being refused."""
+        port = free_port()
+        client = make_client([ISSUE])
+        listed = client.issue.list_issues.side_effect
+        posted: list[socket.socket] = []
+
+        def list_issues(**kwargs: Any) -> Any:
+            if not posted:
+                body, headers = delivery_request("issues", delivery(OTHER_ISSUE, "opened"))
+                request = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+                connection = socket.create_connection(("127.0.0.1", port), timeout=10)
+                connection.sendall(
+                    f"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n{request}\r\n".encode()
+                    + body
+                )
+                posted.append(connection)
+            return listed(**kwargs)
+
+        client.issue.list_issues.side_effect = list_issues
+        result, _ = serve(tmp_path / "watch-state.json", client=client, port=port, expected=1)
+
+        with posted[0] as connection:
+            answer = connection.recv(1024)
+        assert answer.split(b" ")[1] == b"204"
+        records, metadata = parse_records(result.stdout)
+        assert [(record["kind"], record["number"]) for record in records] == [("new", 16)]
+        assert metadata["applied_deliveries"] == 1
+
+    def test_a_delivery_is_recorded_before_it_is_answered(self, tmp_path: Path) -> None:
+        """Once Gitea sees a delivery succeed, the cache holds it."""
+        state_path = tmp_path / "watch-state.json"
+
+        serve(state_path, ("issues", delivery(OTHER_ISSUE, "opened")), client=make_client([ISSUE]))
+
+        recorded = json.loads(state_path.read_text(encoding="utf-8"))["scopes"]["repo:my-org/my-repo"]["issues"]
+        assert sorted(recorded) == ["1854", "1900"]
+
+    def test_a_delivery_keeps_the_last_full_walk(self, tmp_path: Path) -> None:
+        """A write should not cost `watch list --via-notifications` the time of the last full walk."""
+        state_path = tmp_path / "watch-state.json"
+        walked = "2026-08-01T09:00:00+00:00"
+        save_scopes(state_path, {"repo:my-org/my-repo": {}}, scanned_at={"repo:my-org/my-repo": walked})
+
+        with patch("gitea.cli.watch.serve.save_scopes", wraps=save_scopes) as write:
+            serve(state_path, ("issues", delivery(OTHER_ISSUE, "opened")), client=make_client([ISSUE]))
+
+        # The first poll walks the scope in full, and the delivery's write keeps that time.
+        assert write.call_count == 2
+        scope = json.loads(state_path.read_text(encoding="utf-8"))["scopes"]["repo:my-org/my-repo"]
+        assert sorted(scope["issues"]) == ["1854", "1900"]
+        assert datetime.fromisoformat(scope["scanned_at"]) > datetime.fromisoformat(walked)
+        assert write.call_args.kwargs["scanned_at"]["repo:my-org/my-repo"] == scope["scanned_at"]
+
+    def test_a_forged_delivery_changes_nothing(self, tmp_path: Path) -> None:
+        """A delivery without the secret's signature is refused and counted."""
+        with patch("gitea.cli.watch.serve.logger"):
+            result, statuses = serve(
+                tmp_path / "watch-state.json",
+                ("issues", delivery(OTHER_ISSUE, "opened"), "0" * 64),
+                client=make_client([ISSUE]),
+            )
+
+        assert statuses == [403]
+        records, metadata = parse_records(result.stdout)
+        assert records == []
+        assert metadata["rejected_deliveries"] == 1
+
+    def test_a_delivery_for_a_repository_not_watched_is_ignored(self, tmp_path: Path) -> None:
+        """One webhook may serve several repositories; only the watched ones count."""
+        payload = {**delivery(OTHER_ISSUE, "opened"), "repository": {"full_name": "my-org/elsewhere"}}
+
+        result, statuses = serve(tmp_path / "watch-state.json", ("issues", payload), client=make_client([ISSUE]))
+
+        assert statuses == [202]
+        assert parse_records(result.stdout)[1]["ignored_deliveries"] == 1
+
+    def test_a_delivery_whose_comments_cannot_be_read_is_failed(self, tmp_path: Path) -> None:
+        """Gitea should see the delivery fail, so it can be delivered again."""
+        client = make_client([])
+        client.comment.list_comments.side_effect = requests.ConnectionError("Connection refused")
+
+        with patch("gitea.cli.watch.serve.logger"):
+            result, statuses = serve(tmp_path / "watch-state.json", ("issue_comment", delivery(ISSUE)), client=client)
+
+        assert statuses == [502]
+        records, metadata = parse_records(result.stdout)
+        assert records == []
+        assert metadata["failed_deliveries"] == 1
+
+    def test_a_dry_run_never_writes_the_cache(self, tmp_path: Path) -> None:
+        """`--dry-run` leaves the cache as the other watch commands do."""
+        state_path = tmp_path / "watch-state.json"
+
+        serve(
+            state_path, ("issues", delivery(OTHER_ISSUE, "opened")), client=make_client([ISSUE]), extra=("--dry-run",)
+        )
+
+        assert not state_path.exists()
+
+    def test_a_port_in_use_fails_the_command(self, tmp_path: Path) -> None:
+        """A port taken by something else is a mistake to report."""
+        with socket.socket() as taken, patch("gitea.cli.utils.api.logger") as logger:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+            with patch("gitea.client.gitea.Gitea") as gitea:
+                gitea.return_value.__enter__.return_value = make_client([ISSUE])
+                result = runner.invoke(
+                    app,
+                    [
+                        "watch",
+                        "serve",
+                        "--owner",
+                        "my-org",
+                        "--repository",
+                        "my-repo",
+                        "--secret",
+                        SECRET,
+                        "--port",
+                        str(taken.getsockname()[1]),
+                        "--state-file",
+                        str(tmp_path / "watch-state.json"),
+                        *AUTH,
+                    ],
+                )
+
+        assert result.exit_code == 1
+        assert "Could not listen on 127.0.0.1" in logged_error(logger)
+
+    def test_naming_no_repository_is_refused(self) -> None:
+        """A delivery names its repository, so there is nothing else to serve."""
+        with patch("gitea.cli.utils.api.logger") as logger:
+            result = runner.invoke(app, ["watch", "serve", "--owner", "my-org", "--secret", SECRET, *AUTH])
+
+        assert result.exit_code == 1
+        assert "needs a repository to watch" in logged_error(logger)
@@ -0,0 +1,93 @@
+"""Helpers for posting signed webhook deliveries to a `watch serve` under test."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import http.client
+import json
+import socket
+import time
+from typing import Any
+
+from gitea.cli.watch.serve import EVENT_HEADER, SIGNATURE_HEADER
+
+SECRET = "webhook-secret"
+
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    """Sign a body as Gitea signs a delivery.
+
+    Args:
+        body: The body of the delivery.
+        secret: The secret the webhook was given.
+
+    Returns:
+        The hex digest Gitea sends in the signature header.
+
+    """
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def free_port() -> int:
+    """Find a port nothing is listening on.
+
+    Returns:
+        The port.
+
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def delivery_request(event: str, payload: Any, signature: str | None = None) -> tuple[bytes, dict[str, str]]:
+    """Build the body and headers of one delivery as Gitea sends it.
+
+    Args:
+        event: The event the delivery names.
+        payload: The payload of the delivery.
+        signature: The signature to send, or None to sign the body with `SECRET`.
+
+    Returns:
+        The body and the headers.
+
+    """
+    body = json.dumps(payload).encode("utf-8")
+    return body, {
+        "Content-Type": "application/json",
+        EVENT_HEADER: event,
+        SIGNATURE_HEADER: sign(body) if signature is None else signature,
+    }
+
+
+def post_delivery(port: int, event: str, payload: Any, signature: str | None = None, wait: float = 10.0) -> int:
+    """Post one delivery as Gitea does, once something is listening for it.
+
+    Args:
+        port: The port the server listens on, on the loopback address.
+        event: The event the delivery names.
+        payload: The payload of the delivery.
+        signature: The signature to send, or None to sign the body with `SECRET`.
+        wait: Seconds to wait for the server to start listening.
+
+    Returns:
+        The status the delivery was answered with.
+
+    Raises:
+        ConnectionRefusedError: If nothing listens on the port within `wait`.
+
+    """
+    body, headers = delivery_request(event, payload, signature)
+    deadline = time.monotonic() + wait
+    while True:
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=wait)
+        try:
+            connection.request("POST", "/", body=body, headers=headers)
+            return connection.getresponse().status
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+        finally:
+            connection.close()
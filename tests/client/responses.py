@@ -0,0 +1,53 @@
+"""Stand-ins for the responses the synchronous and asynchronous clients receive."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+BODY = {"id": 1, "login": "octo"}
+
+
+def sync_response(status: int, body: Any = None, headers: dict[str, str] | None = None) -> Mock:
+    """Build a stand-in for a `requests` response.
+
+    Args:
+        status: The status code.
+        body: The JSON body, or None for none.
+        headers: The headers.
+
+    Returns:
+        The response, raising from `raise_for_status` for an error status.
+
+    """
+    response = Mock()
+    response.status_code = status
+    response.content = b"" if body is None else json.dumps(body).encode()
+    response.json.return_value = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.raise_for_status.side_effect = requests.HTTPError(str(status)) if status >= 400 else None
+    return response
+
+
+def async_response(status: int, body: Any = None, headers: dict[str, str] | None = None) -> MagicMock:
+    """Build a stand-in for an `aiohttp` response.
+
+    Args:
+        status: The status code.
+        body: The JSON body, or None for none.
+        headers: The headers.
+
+    Returns:
+        The response.
+
+    """
+    response = MagicMock()
+    response.status = status
+    response.read = AsyncMock(return_value=b"" if body is None else json.dumps(body).encode())
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.raise_for_status.return_value = None
+    return response
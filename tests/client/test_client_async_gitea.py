@@ -41,6 +41,65 @@ class TestAsyncGitea:
         await client.__aexit__(None, None, None)
         assert client.session is None
 
+    @pytest.mark.asyncio
+    async def test_aenter_configures_the_connector(self):
+        """The session should be opened on a connector built from the client's options."""
+        client = AsyncGitea(
+            token="t",
+            base_url="https://g.example",
+            limit=300,
+            limit_per_host=50,
+            ttl_dns_cache=600,
+            keepalive_timeout=30,
+        )
+
+        with (
+            patch("gitea.client.async_gitea.TCPConnector") as mock_connector_class,
+            patch("gitea.client.async_gitea.ClientSession") as mock_session_class,
+        ):
+            mock_session_class.return_value.close = AsyncMock()
+            async with client:
+                pass
+
+        mock_connector_class.assert_called_once_with(
+            limit=300, limit_per_host=50, ttl_dns_cache=600, keepalive_timeout=30
+        )
+        mock_session_class.assert_called_once_with(
+            headers={"Authorization": "token t"}, connector=mock_connector_class.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_an_injected_session_is_used_and_left_open(self):
+        """A session handed in belongs to its owner, who closes it."""
+        session = MagicMock()
+        session.closed = False
+        session.close = AsyncMock()
+        client = AsyncGitea(token="t", base_url="https://g.example", session=session)
+
+        async with client:
+            assert client.session is session
+
+        assert client.session is None
+        session.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_a_timeout_is_built_once(self, client):
+        """Requests with the same timeout should share one ClientTimeout."""
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        session = MagicMock()
+        session.request = AsyncMock(return_value=response)
+        client.session = session
+
+        await client._request("GET", "users/a")
+        await client._request("GET", "users/b")
+        await client._request("GET", "users/c", timeout=60)
+
+        first, second, third = (call.kwargs["timeout"] for call in session.request.call_args_list)
+        assert first is second
+        assert first.total == 30
+        assert third.total == 60
+
     @patch("gitea.client.async_gitea.ClientSession")
     def test_get_session(self, mock_session_class, client):
         """Test _get_session creates a new session."""
@@ -0,0 +1,404 @@
+"""Unit tests for the conditional-request cache and the clients revalidating against it."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from gitea.client.async_gitea import AsyncGitea
+from gitea.client.cache import CACHE_DIR_ENV, CachedResponse, DiskResponseCache, ResponseCache, default_cache_dir
+from gitea.client.gitea import Gitea
+from gitea.utils.response import pagination_metadata, process_async_response, process_response
+
+URL = "https://gitea.example.com/api/v1/repos/o/r/labels"
+BODY = [{"id": 1, "name": "bug"}]
+HEADERS = {"ETag": '"v1"', "Last-Modified": "Sat, 01 Aug 2026 09:00:00 GMT", "X-Total-Count": "1"}
+
+
+def sync_response(status: int, body: Any = None, headers: dict[str, str] | None = None) -> Mock:
+    """Build a stand-in for a `requests` response.
+
+    Args:
+        status: The status code.
+        body: The JSON body, or None for none.
+        headers: The headers.
+
+    Returns:
+        The response.
+
+    """
+    response = Mock()
+    response.status_code = status
+    response.content = b"" if body is None else json.dumps(body).encode()
+    response.json.return_value = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.raise_for_status.return_value = None
+    return response
+
+
+def async_response(status: int, body: Any = None, headers: dict[str, str] | None = None) -> MagicMock:
+    """Build a stand-in for an `aiohttp` response.
+
+    Args:
+        status: The status code.
+        body: The JSON body, or None for none.
+        headers: The headers.
+
+    Returns:
+        The response.
+
+    """
+    response = MagicMock()
+    response.status = status
+    response.read = AsyncMock(return_value=b"" if body is None else json.dumps(body).encode())
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestResponseCache:
+    """Tests for what the cache keeps and what it keys it by."""
+
+    def test_only_a_get_is_keyed(self) -> None:
+        """A request that changes something is never answered from the cache."""
+        assert ResponseCache.key("GET", URL, None, {}) is not None
+        assert ResponseCache.key("POST", URL, None, {}) is None
+
+    def test_a_caller_validating_itself_is_left_alone(self) -> None:
+        """A request already carrying a validator wants to see the `304` itself."""
+        assert ResponseCache.key("GET", URL, None, {"if-none-match": '"v1"'}) is None
+
+    def test_the_parameters_and_credentials_are_part_of_the_key(self) -> None:
+        """Another page, or another account, is another response."""
+        key = ResponseCache.key("GET", URL, {"page": 1, "limit": 50}, {"Authorization": "token a"})
+
+        assert key == ResponseCache.key("GET", URL, {"limit": 50, "page": 1}, {"Authorization": "token a"})
+        assert key != ResponseCache.key("GET", URL, {"page": 2, "limit": 50}, {"Authorization": "token a"})
+        assert key != ResponseCache.key("GET", URL, {"page": 1, "limit": 50}, {"Authorization": "token b"})
+
+    def test_the_token_is_not_held_in_the_key(self) -> None:
+        """A key may be logged or written down; the token it was made for may not."""
+        key = ResponseCache.key("GET", URL, None, {"Authorization": "token secret-token"})
+
+        assert key is not None
+        assert "secret-token" not in key
+
+    def test_a_response_without_validators_is_not_held(self) -> None:
+        """Nothing could be asked about it, so holding it would only cost memory."""
+        cache = ResponseCache()
+
+        cache.store("k", URL, b"[]", CaseInsensitiveDict({"X-Total-Count": "0"}))
+
+        assert len(cache) == 0
+
+    def test_the_validators_and_pagination_headers_are_kept(self) -> None:
+        """What replaying the body needs is kept, and nothing else."""
+        cache = ResponseCache()
+
+        cache.store("k", URL, b"[]", CaseInsensitiveDict({**HEADERS, "Set-Cookie": "session=1"}))
+
+        entry = cache.get("k")
+        assert entry == CachedResponse(body=b"[]", headers=HEADERS, url=URL, stored_at=entry.stored_at)
+        assert entry.validators() == {"If-None-Match": '"v1"', "If-Modified-Since": HEADERS["Last-Modified"]}
+
+    def test_clear_drops_everything(self) -> None:
+        """A cleared cache revalidates nothing."""
+        cache = ResponseCache()
+        cache.store("k", URL, b"[]", CaseInsensitiveDict(HEADERS))
+
+        cache.clear()
+
+        assert cache.get("k") is None
+
+
+class TestTimeToLive:
+    """Tests for reusing a response without asking the server."""
+
+    def test_the_first_matching_pattern_wins(self) -> None:
+        """An endpoint's own time to live is preferred over the one for every endpoint."""
+        cache = ResponseCache(ttl=5, ttls={"repos/*/*/labels": 60})
+
+        assert cache.ttl_for(URL) == 60
+        assert cache.ttl_for("https://gitea.example.com/api/v1/repos/o/r/issues") == 5
+
+    def test_a_response_is_fresh_until_its_time_to_live_runs_out(self) -> None:
+        """A response is reused only while it is younger than its endpoint's time to live."""
+        cache = ResponseCache(ttls={"repos/*/*/labels": 60})
+
+        assert cache.is_fresh(CachedResponse(body=b"[]", url=URL, stored_at=time.time()))
+        assert not cache.is_fresh(CachedResponse(body=b"[]", url=URL, stored_at=time.time() - 61))
+
+    def test_a_response_without_validators_is_held_for_its_time_to_live(self) -> None:
+        """Reusing it is a use even without a validator to ask about it with."""
+        cache = ResponseCache(ttl=30)
+
+        cache.store("k", URL, b"[]", CaseInsensitiveDict({}))
+
+        assert cache.get("k") is not None
+
+    def test_a_fresh_response_is_answered_without_a_request(self) -> None:
+        """The point of a time to live: the second read never reaches the server."""
+        client = Gitea(token="test_token", base_url="https://gitea.example.com", cache=ResponseCache(ttl=60))
+        session = Mock()
+        session.request.return_value = sync_response(200, BODY)
+        client.session = session
+
+        client._request("GET", "repos/o/r/labels")
+        reused = client._request("GET", "repos/o/r/labels")
+
+        session.request.assert_called_once()
+        assert process_response(reused, default=[]) == (BODY, 200)
+
+    def test_a_304_starts_the_time_to_live_again(self) -> None:
+        """A confirmed response is as fresh as a refetched one."""
+        cache = ResponseCache(ttl=60)
+        key = ResponseCache.key("GET", URL, None, {"Authorization": "token test_token"})
+        cache.put(key, CachedResponse(body=json.dumps(BODY).encode(), headers=HEADERS, url=URL, stored_at=0.0))
+        client = Gitea(token="test_token", base_url="https://gitea.example.com", cache=cache)
+        session = Mock()
+        session.request.return_value = sync_response(304)
+        client.session = session
+
+        client._request("GET", "repos/o/r/labels")
+        client._request("GET", "repos/o/r/labels")
+
+        session.request.assert_called_once()
+        assert cache.is_fresh(cache.get(key))
+
+
+class TestInvalidation:
+    """Tests for a write dropping what it may have changed."""
+
+    def held(self, cache: ResponseCache, *endpoints: str) -> list[str]:
+        """Store a response for each endpoint, and name the keys.
+
+        Args:
+            cache: The cache to store into.
+            *endpoints: The endpoints under the API root.
+
+        Returns:
+            The key of each endpoint's response.
+
+        """
+        keys = []
+        for endpoint in endpoints:
+            url = f"https://gitea.example.com/api/v1/{endpoint}"
+            key = ResponseCache.key("GET", url, None, {})
+            cache.store(key, url, b"[]", CaseInsensitiveDict(HEADERS))
+            keys.append(key)
+        return keys
+
+    def test_a_write_drops_what_its_owner_holds(self) -> None:
+        """A card moved on an organization's board changes what its repositories say, and not another owner's."""
+        cache = ResponseCache()
+        repository, board, other = self.held(cache, "repos/o/r/issues", "orgs/o/projects/1/columns", "repos/x/r/labels")
+
+        cache.invalidate("https://gitea.example.com/api/v1/repos/o/r/issues/5")
+
+        assert cache.get(repository) is None
+        assert cache.get(board) is None
+        assert cache.get(other) is not None
+
+    def test_a_key_is_tagged_with_the_owner_its_url_names(self) -> None:
+        """The tag is what lets a write find what it made stale without reading any response."""
+        issues = ResponseCache.key("GET", "https://gitea.example.com/api/v1/repos/o/r/issues", None, {})
+        board = ResponseCache.key("GET", "https://gitea.example.com/api/v1/orgs/o/projects/1", None, {})
+        other = ResponseCache.key("GET", "https://gitea.example.com/api/v1/repos/x/r/issues", None, {})
+
+        tags = [str(key).partition("-")[0] for key in (issues, board, other)]
+        assert tags[0] == tags[1] != tags[2]
+
+    def test_a_write_naming_no_owner_drops_everything(self) -> None:
+        """There is no telling what a write to the account's own endpoints changed."""
+        cache = ResponseCache()
+        keys = self.held(cache, "repos/o/r/issues", "notifications")
+
+        cache.invalidate("https://gitea.example.com/api/v1/notifications")
+
+        assert all(cache.get(key) is None for key in keys)
+
+    def test_a_successful_write_through_the_client_invalidates(self) -> None:
+        """The client drops what a write made stale as soon as the write succeeds."""
+        cache = ResponseCache(ttl=60)
+        client = Gitea(token="test_token", base_url="https://gitea.example.com", cache=cache)
+        session = Mock()
+        session.request.side_effect = [sync_response(200, BODY), sync_response(201, {"id": 2}), sync_response(200, [])]
+        client.session = session
+
+        client._request("GET", "repos/o/r/labels")
+        client._request("POST", "repos/o/r/labels", json={"name": "docs"})
+        reread = client._request("GET", "repos/o/r/labels")
+
+        assert session.request.call_count == 3
+        assert process_response(reread, default=[]) == ([], 200)
+
+
+class TestDiskResponseCache:
+    """Tests for the cache kept as files between processes."""
+
+    def test_a_response_outlives_the_cache_that_kept_it(self, tmp_path: Path) -> None:
+        """Another process opening the same directory finds what this one kept."""
+        DiskResponseCache(tmp_path).store("k", URL, b"[1]", CaseInsensitiveDict(HEADERS))
+
+        entry = DiskResponseCache(tmp_path).get("k")
+
+        assert entry is not None
+        assert entry.body == b"[1]"
+        assert entry.url == URL
+        assert entry.validators()["If-None-Match"] == '"v1"'
+
+    def test_the_least_recently_used_are_evicted_first(self, tmp_path: Path) -> None:
+        """Reading a response keeps it; the one unread for longest goes when space runs out."""
+        cache = DiskResponseCache(tmp_path, max_bytes=10**6)
+        for key in ("a", "b", "c"):
+            cache.store(key, URL, b"x" * 1000, CaseInsensitiveDict(HEADERS))
+        for age, key in enumerate(("a", "b", "c")):
+            os.utime(tmp_path / f"{key}.json", (1000 + age, 1000 + age))
+        cache.get("a")
+        size = (tmp_path / "a.json").stat().st_size
+        # Room for three files, whatever a few bytes of timestamp differ by.
+        cache.max_bytes = 3 * size + size // 2
+
+        cache.store("d", URL, b"x" * 1000, CaseInsensitiveDict(HEADERS))
+
+        assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["a", "c", "d"]
+
+    def test_a_write_drops_files_without_reading_or_touching_the_rest(self, tmp_path: Path) -> None:
+        """Invalidating must not cost a read of every file, nor reset the order eviction goes by."""
+        cache = DiskResponseCache(tmp_path)
+        stale, kept = TestInvalidation().held(cache, "repos/o/r/issues", "repos/x/r/labels")
+        os.utime(tmp_path / f"{kept}.json", (1000, 1000))
+
+        with patch.object(DiskResponseCache, "_read") as read:
+            cache.invalidate("https://gitea.example.com/api/v1/repos/o/r/issues/5")
+
+        read.assert_not_called()
+        assert not (tmp_path / f"{stale}.json").exists()
+        assert (tmp_path / f"{kept}.json").stat().st_mtime == 1000
+
+    def test_the_directory_is_counted_once_while_it_fits(self, tmp_path: Path) -> None:
+        """Each store adds to a running total rather than listing every file again."""
+        cache = DiskResponseCache(tmp_path)
+
+        with patch.object(DiskResponseCache, "_files", autospec=True, wraps=DiskResponseCache._files) as files:
+            for key in ("a", "b", "c"):
+                cache.store(key, URL, b"x" * 1000, CaseInsensitiveDict(HEADERS))
+
+        assert files.call_count == 1
+
+    def test_an_unreadable_file_is_no_response(self, tmp_path: Path) -> None:
+        """A truncated file costs a request, not the command, and does not linger."""
+        (tmp_path / "k.json").write_text("{not json", encoding="utf-8")
+
+        assert DiskResponseCache(tmp_path).get("k") is None
+        assert not (tmp_path / "k.json").exists()
+
+    def test_a_directory_that_cannot_be_written_costs_nothing_but_the_cache(self, tmp_path: Path) -> None:
+        """Failing to keep a response is not failing the request."""
+        blocked = tmp_path / "file"
+        blocked.write_text("", encoding="utf-8")
+
+        DiskResponseCache(blocked / "responses").store("k", URL, b"[]", CaseInsensitiveDict(HEADERS))
+
+        assert DiskResponseCache(blocked / "responses").get("k") is None
+
+    def test_the_directory_can_be_named_by_the_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A caller without a writable home can keep the responses elsewhere."""
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "elsewhere"))
+
+        assert default_cache_dir() == tmp_path / "elsewhere"
+
+
+class TestSynchronousRevalidation:
+    """Tests for the synchronous client answering a `304` from its cache."""
+
+    @pytest.fixture
+    def client(self) -> Gitea:
+        """Build a client with an empty cache."""
+        return Gitea(token="test_token", base_url="https://gitea.example.com", cache=ResponseCache())
+
+    def test_a_304_is_answered_with_the_cached_body(self, client: Gitea) -> None:
+        """The second read is validated, and its empty answer replaced with the first body."""
+        session = Mock()
+        session.request.side_effect = [sync_response(200, BODY, HEADERS), sync_response(304)]
+        client.session = session
+
+        client._request("GET", "repos/o/r/labels", params={"page": 1})
+        replayed = client._request("GET", "repos/o/r/labels", params={"page": 1})
+
+        sent = session.request.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == HEADERS["Last-Modified"]
+        assert process_response(replayed, default=[]) == (BODY, 200)
+        assert pagination_metadata(replayed) == {"total_count": 1}
+
+    def test_a_changed_resource_replaces_the_cached_body(self, client: Gitea) -> None:
+        """A `200` to a validated request is the new body, and the new validators."""
+        session = Mock()
+        changed = [{"id": 1, "name": "bug"}, {"id": 2, "name": "docs"}]
+        session.request.side_effect = [
+            sync_response(200, BODY, HEADERS),
+            sync_response(200, changed, {"ETag": '"v2"'}),
+            sync_response(304),
+        ]
+        client.session = session
+
+        client._request("GET", "repos/o/r/labels")
+        client._request("GET", "repos/o/r/labels")
+        replayed = client._request("GET", "repos/o/r/labels")
+
+        assert session.request.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"v2"'
+        assert process_response(replayed, default=[]) == (changed, 200)
+
+    def test_a_write_is_neither_validated_nor_stored(self, client: Gitea) -> None:
+        """Only a read can be answered from the cache."""
+        session = Mock()
+        session.request.return_value = sync_response(200, BODY, HEADERS)
+        client.session = session
+
+        client._request("POST", "repos/o/r/labels", json={"name": "bug"})
+
+        assert len(client.cache) == 0
+
+    def test_without_a_cache_nothing_is_validated(self) -> None:
+        """The cache is opt-in: a client given none sends what it always sent."""
+        client = Gitea(token="test_token", base_url="https://gitea.example.com")
+        session = Mock()
+        session.request.return_value = sync_response(200, BODY, HEADERS)
+        client.session = session
+
+        client._request("GET", "repos/o/r/labels")
+        client._request("GET", "repos/o/r/labels")
+
+        assert session.request.call_args_list[1].kwargs["headers"] == {"Authorization": "token test_token"}
+
+
+class TestAsynchronousRevalidation:
+    """Tests for the asynchronous client answering a `304` from its cache."""
+
+    @pytest.mark.asyncio
+    async def test_a_304_is_answered_with_the_cached_body(self) -> None:
+        """The second read is validated, and its empty answer replaced with the first body."""
+        client = AsyncGitea(token="test_token", base_url="https://gitea.example.com", cache=ResponseCache())
+        not_modified = async_response(304)
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=[async_response(200, BODY, HEADERS), not_modified])
+        client.session = session
+
+        first = await client._request("GET", "repos/o/r/labels")
+        replayed = await client._request("GET", "repos/o/r/labels")
+
+        assert await process_async_response(first, default=[]) == (BODY, 200)
+        assert session.request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        not_modified.release.assert_called_once()
+        assert await process_async_response(replayed, default=[]) == (BODY, 200)
+        assert pagination_metadata(replayed) == {"total_count": 1}
@@ -0,0 +1,239 @@
+"""Unit tests for merging identical in-flight requests, and the clients merging them."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from gitea.client.async_gitea import AsyncGitea
+from gitea.client.flight import AsyncSingleFlight, SingleFlight, flight_key
+from gitea.client.gitea import Gitea
+from gitea.utils.response import process_async_response, process_response
+from tests.client.responses import BODY, async_response, sync_response
+
+BASE_URL = "https://gitea.example.com"
+URL = f"{BASE_URL}/api/v1/repos/o/r/labels"
+
+
+class TestFlightKey:
+    """Tests for which requests are merged."""
+
+    def test_identical_reads_share_a_key(self) -> None:
+        """The same URL, parameters and credentials are the same request."""
+        headers = {"Authorization": "token t"}
+
+        first = flight_key("GET", URL, headers, params={"page": 1})
+
+        assert first == flight_key("GET", URL, headers, params={"page": 1})
+        assert first != flight_key("GET", URL, headers, params={"page": 2})
+
+    def test_writes_and_requests_with_a_body_are_never_merged(self) -> None:
+        """Sending one of them once for two callers would drop a change."""
+        assert flight_key("POST", URL, {}) is None
+        assert flight_key("GET", URL, {}, json={"q": "x"}) is None
+
+
+class TestSingleFlight:
+    """Tests for merging calls made from several threads."""
+
+    def test_concurrent_calls_are_made_once(self) -> None:
+        """Every thread arriving while the call is in flight gets its result."""
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = 0
+
+        def call() -> str:
+            nonlocal calls
+            calls += 1
+            started.set()
+            release.wait(timeout=5)
+            return "answer"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flights.do, "k", call)]
+            started.wait(timeout=5)
+            futures += [pool.submit(flights.do, "k", call) for _ in range(3)]
+            # Give the followers time to join the flight before it lands.
+            threading.Event().wait(0.2)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ["answer"] * 4
+        assert calls == 1
+
+    def test_a_failure_is_raised_to_every_caller(self) -> None:
+        """Those waiting on a failed call fail with it rather than hang."""
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def call() -> str:
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flights.do, "k", call)
+            started.wait(timeout=5)
+            follower = pool.submit(flights.do, "k", call)
+            threading.Event().wait(0.2)
+            release.set()
+
+            with pytest.raises(RuntimeError, match="boom"):
+                leader.result()
+            with pytest.raises(RuntimeError, match="boom"):
+                follower.result()
+
+    def test_a_call_after_landing_is_made_afresh(self) -> None:
+        """Nothing is kept once a flight has landed."""
+        flights = SingleFlight()
+        answers = iter(["first", "second"])
+
+        assert flights.do("k", lambda: next(answers)) == "first"
+        assert flights.do("k", lambda: next(answers)) == "second"
+
+
+class TestAsyncSingleFlight:
+    """Tests for merging calls made from several tasks."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_made_once_and_shared(self) -> None:
+        """The result is readied for sharing once, and only because tasks waited."""
+        flights = AsyncSingleFlight()
+        calls = 0
+        share = AsyncMock()
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(flights.do("k", call, share=share) for _ in range(5)))
+
+        assert results == ["answer"] * 5
+        assert calls == 1
+        share.assert_awaited_once_with("answer")
+
+    @pytest.mark.asyncio
+    async def test_a_lone_call_is_not_readied_for_sharing(self) -> None:
+        """Reading a body nobody else waits for would only cost time."""
+        share = AsyncMock()
+
+        assert await AsyncSingleFlight().do("k", AsyncMock(return_value="answer"), share=share) == "answer"
+        share.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_a_failure_is_raised_to_every_task(self) -> None:
+        """Every task merged into a failed call sees its error."""
+        flights = AsyncSingleFlight()
+
+        async def call() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(flights.do("k", call) for _ in range(3)), return_exceptions=True)
+
+        assert [str(result) for result in results] == ["boom"] * 3
+
+    @pytest.mark.asyncio
+    async def test_a_cancelled_leader_hands_the_flight_on(self) -> None:
+        """A task waiting on a cancelled flight makes the call itself."""
+        flights = AsyncSingleFlight()
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        leader = asyncio.create_task(flights.do("k", call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("k", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "answer"
+        assert leader.cancelled()
+        assert calls == 2
+
+
+class TestClientsMergingRequests:
+    """Tests for the clients sending one request for identical concurrent reads."""
+
+    def test_threads_reading_the_same_listing_send_one_request(self) -> None:
+        """Each thread gets the body of the one response."""
+        client = Gitea(token="t", base_url=BASE_URL)
+        release = threading.Event()
+        session = Mock()
+
+        def answer(*args: object, **kwargs: object) -> Mock:
+            release.wait(timeout=5)
+            return sync_response(200, BODY)
+
+        session.request.side_effect = answer
+        client.session = session
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(client._request, "GET", "users/octo") for _ in range(3)]
+            threading.Event().wait(0.2)
+            release.set()
+            responses = [future.result() for future in futures]
+
+        assert [process_response(response) for response in responses] == [(BODY, 200)] * 3
+        session.request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_tasks_reading_the_same_listing_send_one_request(self) -> None:
+        """The body is read once, and each task parses its own copy."""
+        client = AsyncGitea(token="t", base_url=BASE_URL)
+        session = MagicMock()
+
+        async def answer(**kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return async_response(200, BODY)
+
+        session.request = AsyncMock(side_effect=answer)
+        client.session = session
+
+        responses = await asyncio.gather(*(client._request("GET", "users/octo") for _ in range(4)))
+        parsed = [await process_async_response(response) for response in responses]
+
+        assert parsed == [(BODY, 200)] * 4
+        assert parsed[0][0] is not parsed[1][0]
+        session.request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_merging_can_be_turned_off(self) -> None:
+        """A client told not to coalesce sends every request it is asked to."""
+        client = AsyncGitea(token="t", base_url=BASE_URL, coalesce=False)
+        session = MagicMock()
+
+        async def answer(**kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return async_response(200, BODY)
+
+        session.request = AsyncMock(side_effect=answer)
+        client.session = session
+
+        await asyncio.gather(*(client._request("GET", "users/octo") for _ in range(3)))
+
+        assert session.request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_writes_are_each_sent(self) -> None:
+        """Two identical writes are two writes."""
+        client = AsyncGitea(token="t", base_url=BASE_URL)
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=lambda **kwargs: async_response(201, BODY))
+        client.session = session
+
+        await asyncio.gather(*(client._request("DELETE", "repos/o/r/labels/1") for _ in range(2)))
+
+        assert session.request.await_count == 2
@@ -115,6 +115,27 @@ class TestGitea:
         # cleanup
         client.__exit__(None, None, None)
 
+    def test_enter_mounts_a_pooled_adapter(self):
+        """Both schemes should share one adapter sized as the client was asked to."""
+        client = Gitea(token="t", base_url="https://g.example", pool_connections=2, pool_maxsize=32, pool_block=True)
+
+        with client:
+            adapter = client.session.get_adapter("https://g.example/api/v1/user")
+
+            assert client.session.get_adapter("http://g.example/") is adapter
+            assert adapter._pool_connections == 2
+            assert adapter._pool_maxsize == 32
+            assert adapter._pool_block is True
+
+    def test_pool_defaults_match_requests(self):
+        """A client not asked to size its pool should keep what requests would have used."""
+        client = Gitea(token="t", base_url="https://g.example")
+
+        with client:
+            adapter = client.session.get_adapter("https://g.example/")
+
+            assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (10, 10, False)
+
     def test_enter_reenter_raises(self):
         """Re-entering when a session is already open should raise."""
         client = Gitea(token="t", base_url="https://g.example")
@@ -0,0 +1,202 @@
+"""Unit tests for the rate limiter and the clients sending under it."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from gitea.client.async_gitea import AsyncGitea
+from gitea.client.gitea import Gitea
+from gitea.client.limiter import RateLimiter, _draw
+from gitea.client.retry import RetryPolicy
+from tests.client.responses import BODY, async_response, sync_response
+
+BASE_URL = "https://gitea.example.com"
+
+
+class TestDraw:
+    """Tests for the token bucket arithmetic."""
+
+    def test_a_full_bucket_hands_out_a_token_without_waiting(self) -> None:
+        """A request within the burst is sent at once."""
+        assert _draw(tokens=3, elapsed=0, rate=1, burst=3) == (2, 0)
+
+    def test_an_empty_bucket_makes_the_request_wait_for_its_token(self) -> None:
+        """The token is taken on credit and paid back at the rate."""
+        assert _draw(tokens=0, elapsed=0, rate=4, burst=4) == (-1, 0.25)
+
+    def test_requests_queued_behind_an_empty_bucket_leave_at_the_rate(self) -> None:
+        """Each one waits one interval longer than the one before it."""
+        tokens, first = _draw(tokens=0, elapsed=0, rate=2, burst=2)
+        _, second = _draw(tokens=tokens, elapsed=0, rate=2, burst=2)
+
+        assert (first, second) == (0.5, 1.0)
+
+    def test_the_bucket_refills_up_to_its_burst(self) -> None:
+        """An idle minute is worth a burst, not a minute of requests."""
+        assert _draw(tokens=0, elapsed=60, rate=1, burst=5) == (4, 0)
+
+
+class TestRateLimiter:
+    """Tests for the limiter's budget."""
+
+    def test_no_rate_never_waits(self) -> None:
+        """A limiter bounding only the number in flight leaves the rate alone."""
+        limiter = RateLimiter(max_in_flight=2)
+
+        assert [limiter.reserve() for _ in range(100)] == [0.0] * 100
+
+    def test_the_burst_defaults_to_one_second_of_requests(self) -> None:
+        """Ten a second lets the first ten through at once, and no more."""
+        limiter = RateLimiter(rate=10)
+
+        waits = [limiter.reserve() for _ in range(11)]
+
+        assert waits[:10] == [0.0] * 10
+        assert waits[10] > 0
+
+    @pytest.mark.parametrize("options", [{"rate": 0}, {"rate": -1}, {"max_in_flight": 0}])
+    def test_a_budget_of_nothing_is_refused(self, options: dict[str, float]) -> None:
+        """A limiter that would never let a request through is a mistake."""
+        with pytest.raises(ValueError, match="must be"):
+            RateLimiter(**options)
+
+    def test_requests_in_flight_are_bounded(self) -> None:
+        """A thread past the bound waits for one in flight to finish."""
+        limiter = RateLimiter(max_in_flight=2)
+        inside = 0
+        most = 0
+        guard = threading.Lock()
+
+        def request() -> None:
+            nonlocal inside, most
+            with limiter.slot():
+                with guard:
+                    inside += 1
+                    most = max(most, inside)
+                time.sleep(0.01)
+                with guard:
+                    inside -= 1
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert most == 2
+
+    @pytest.mark.asyncio
+    async def test_tasks_in_flight_are_bounded(self) -> None:
+        """A task past the bound waits on the event loop, not on a thread."""
+        limiter = RateLimiter(max_in_flight=3)
+        inside = 0
+        most = 0
+
+        async def request() -> None:
+            nonlocal inside, most
+            async with limiter.async_slot():
+                inside += 1
+                most = max(most, inside)
+                await asyncio.sleep(0.01)
+                inside -= 1
+
+        await asyncio.gather(*(request() for _ in range(10)))
+
+        assert most == 3
+
+
+class TestSharedBucket:
+    """Tests for the bucket kept in a file between processes."""
+
+    def test_limiters_sharing_a_file_share_the_rate(self, tmp_path: Path) -> None:
+        """Two limiters - two processes - draw from one bucket."""
+        path = tmp_path / "bucket"
+        first = RateLimiter(rate=1, burst=2, path=path)
+        second = RateLimiter(rate=1, burst=2, path=path)
+
+        waits = [first.reserve(), second.reserve(), first.reserve()]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] > 0
+        assert (tmp_path / "bucket.lock").exists()
+
+    def test_an_unreadable_bucket_is_a_full_one(self, tmp_path: Path) -> None:
+        """Losing the file costs a burst, not every process sharing it."""
+        path = tmp_path / "bucket"
+        path.write_text("not json", encoding="utf-8")
+
+        assert RateLimiter(rate=1, burst=1, path=path).reserve() == 0
+        assert json.loads(path.read_text(encoding="utf-8"))["tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_an_asynchronous_slot_reserves_from_the_file_off_the_event_loop(self, tmp_path: Path) -> None:
+        """The file lock blocks, so it is waited for on a thread rather than on the loop."""
+        limiter = RateLimiter(rate=100, burst=2, path=tmp_path / "bucket")
+
+        with patch("gitea.client.limiter.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            async with limiter.async_slot():
+                pass
+
+        to_thread.assert_called_once_with(limiter.reserve)
+
+
+class TestClientsUnderALimiter:
+    """Tests for the clients sending every request under their limiter."""
+
+    def test_every_attempt_draws_a_token(self) -> None:
+        """A retry is a request to the instance like any other."""
+        limiter = RateLimiter(rate=100, burst=100)
+        client = Gitea(token="t", base_url=BASE_URL, retry=RetryPolicy(backoff=0, jitter=0), limiter=limiter)
+        session = Mock()
+        session.request.side_effect = [sync_response(503), sync_response(200, BODY)]
+        client.session = session
+
+        client._request("GET", "users/octo")
+
+        assert limiter.reserve() == 0
+        assert 96 <= limiter._tokens < 98
+
+    def test_handlers_share_the_clients_limiter(self) -> None:
+        """Each resource handler sends through the client, so one budget covers them all."""
+        limiter = RateLimiter(rate=100, burst=2)
+        client = Gitea(token="t", base_url=BASE_URL, limiter=limiter)
+        session = Mock()
+        session.request.return_value = sync_response(200, BODY)
+        client.session = session
+
+        client.user.get_user(username="octo")
+        client.label.list_labels(owner="o", repository="r")
+
+        assert limiter.reserve() > 0
+
+    @pytest.mark.asyncio
+    async def test_the_asynchronous_client_waits_for_its_slot(self) -> None:
+        """A request past the bound in flight is sent once one before it is answered."""
+        limiter = RateLimiter(max_in_flight=1)
+        client = AsyncGitea(token="t", base_url=BASE_URL, limiter=limiter)
+        inside = 0
+        most = 0
+
+        async def answer(**kwargs: object) -> MagicMock:
+            nonlocal inside, most
+            inside += 1
+            most = max(most, inside)
+            await asyncio.sleep(0.01)
+            inside -= 1
+            return async_response(200, BODY)
+
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=answer)
+        client.session = session
+
+        await asyncio.gather(*(client._request("GET", f"users/u{index}") for index in range(4)))
+
+        assert most == 1
+        assert session.request.call_count == 4
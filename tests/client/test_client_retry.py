@@ -0,0 +1,246 @@
+"""Unit tests for the retry policy and the clients sending requests again under it."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import aiohttp
+import pytest
+import requests
+
+from gitea.client.async_gitea import AsyncGitea
+from gitea.client.gitea import Gitea
+from gitea.client.retry import RetryPolicy, mark_retries, parse_retry_after, retries_of
+from gitea.utils.response import response_metadata
+from tests.client.responses import BODY, async_response, sync_response
+
+BASE_URL = "https://gitea.example.com"
+
+# A policy waiting no time at all, so that a test retrying does not sleep.
+IMMEDIATE = RetryPolicy(backoff=0, jitter=0)
+
+
+class TestRetryPolicy:
+    """Tests for what the policy retries, and how long it waits."""
+
+    def test_only_idempotent_methods_are_retried_by_default(self) -> None:
+        """A `POST` that failed on the way back may already have been applied."""
+        policy = RetryPolicy()
+
+        assert policy.allows("get", 1)
+        assert policy.allows("PUT", 1)
+        assert policy.allows("DELETE", 1)
+        assert not policy.allows("POST", 1)
+        assert not policy.allows("PATCH", 1)
+
+    def test_a_policy_naming_a_method_retries_it(self) -> None:
+        """The default protects writes; a caller knowing better can opt them in."""
+        assert RetryPolicy(methods=frozenset({"POST"})).allows("POST", 1)
+
+    def test_attempts_are_bounded(self) -> None:
+        """The last attempt's failure is the caller's to see."""
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.allows("GET", 2)
+        assert not policy.allows("GET", 3)
+        assert not RetryPolicy(max_attempts=1).allows("GET", 1)
+
+    def test_only_transient_statuses_are_retried(self) -> None:
+        """A `404` will be a `404` next time too."""
+        policy = RetryPolicy()
+
+        assert policy.retries_status("GET", 503, 1)
+        assert policy.retries_status("GET", 429, 1)
+        assert not policy.retries_status("GET", 404, 1)
+        assert not policy.retries_status("GET", 500, 1)
+
+    def test_the_wait_doubles_up_to_its_ceiling(self) -> None:
+        """Without jitter the backoff is exactly exponential, and bounded."""
+        policy = RetryPolicy(backoff=1, max_backoff=5, jitter=0)
+
+        assert [policy.delay(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+    def test_jitter_only_shortens_the_wait(self) -> None:
+        """Spreading the retries never makes one wait past its backoff."""
+        policy = RetryPolicy(backoff=2, jitter=0.5)
+
+        delays = [policy.delay(1) for _ in range(50)]
+
+        assert all(1 <= delay <= 2 for delay in delays)
+
+    def test_retry_after_replaces_the_backoff(self) -> None:
+        """The server knows when it will be ready better than the backoff does."""
+        assert RetryPolicy(backoff=1, jitter=0).delay(1, "7") == 7
+
+    def test_a_retry_after_past_the_limit_is_not_waited_for(self) -> None:
+        """A request is failed rather than left hanging as long as the server asks."""
+        assert RetryPolicy(max_retry_after=60).delay(1, "3600") is None
+
+
+class TestParseRetryAfter:
+    """Tests for reading both forms of `Retry-After`."""
+
+    def test_seconds(self) -> None:
+        """The delay form is a whole number of seconds."""
+        assert parse_retry_after(" 120 ") == 120
+
+    def test_a_date(self) -> None:
+        """The date form is measured against the current time."""
+        now = datetime(2026, 8, 1, 9, 0, 0, tzinfo=UTC)
+
+        assert parse_retry_after("Sat, 01 Aug 2026 09:00:30 GMT", now=now) == 30
+
+    def test_a_date_in_the_past_is_no_wait(self) -> None:
+        """A clock running ahead of the server's does not make the wait negative."""
+        now = datetime(2026, 8, 1, 9, 1, 0, tzinfo=UTC)
+
+        assert parse_retry_after("Sat, 01 Aug 2026 09:00:30 GMT", now=now) == 0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5", "1.5"])
+    def test_anything_else_is_no_header(self, value: str | None) -> None:
+        """An unreadable header falls back to the backoff."""
+        assert parse_retry_after(value) is None
+
+
+class TestRetryCount:
+    """Tests for carrying the retry count into the metadata."""
+
+    def test_a_response_carries_its_count(self) -> None:
+        """`retries_of` reads back what `mark_retries` recorded."""
+        response = requests.Response()
+
+        mark_retries(response, 2)
+
+        assert retries_of(response) == 2
+        assert response_metadata(response, 200) == {"status_code": 200, "retries": 2}
+
+    def test_a_request_sent_once_adds_nothing(self) -> None:
+        """The metadata of a first-time success is what it always was."""
+        assert response_metadata(requests.Response(), 200) == {"status_code": 200}
+        assert response_metadata(Mock(), 200) == {"status_code": 200}
+
+
+class TestSynchronousRetry:
+    """Tests for the synchronous client sending a request again."""
+
+    def test_a_transient_status_is_retried(self) -> None:
+        """A `503` followed by a `200` is the `200`, one retry later."""
+        client = Gitea(token="test_token", base_url=BASE_URL, retry=IMMEDIATE)
+        failed = sync_response(503)
+        session = Mock()
+        session.request.side_effect = [failed, sync_response(200, BODY)]
+        client.session = session
+
+        data, metadata = client.user.get_user(username="octo")
+
+        assert data == BODY
+        assert metadata == {"status_code": 200, "retries": 1}
+        assert session.request.call_count == 2
+        failed.close.assert_called_once()
+
+    def test_a_connection_error_is_retried(self) -> None:
+        """A dropped connection is as transient as a `502`."""
+        client = Gitea(token="test_token", base_url=BASE_URL, retry=IMMEDIATE)
+        session = Mock()
+        session.request.side_effect = [requests.ConnectionError("reset"), sync_response(200, BODY)]
+        client.session = session
+
+        _, metadata = client.user.get_user(username="octo")
+
+        assert metadata["retries"] == 1
+
+    def test_the_last_failure_is_raised(self) -> None:
+        """Once the attempts run out, the caller sees what the last one got."""
+        client = Gitea(token="test_token", base_url=BASE_URL, retry=IMMEDIATE)
+        session = Mock()
+        session.request.side_effect = [sync_response(503), sync_response(503), sync_response(503)]
+        client.session = session
+
+        with pytest.raises(requests.HTTPError):
+            client._request("GET", "users/octo")
+
+        assert session.request.call_count == IMMEDIATE.max_attempts
+
+    def test_a_post_is_not_retried(self) -> None:
+        """Sending a write twice could apply it twice."""
+        client = Gitea(token="test_token", base_url=BASE_URL, retry=IMMEDIATE)
+        session = Mock()
+        session.request.side_effect = [sync_response(503), sync_response(201, BODY)]
+        client.session = session
+
+        with pytest.raises(requests.HTTPError):
+            client._request("POST", "repos/o/r/issues", json={"title": "t"})
+
+        session.request.assert_called_once()
+
+    def test_retry_after_is_waited_for(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The client sleeps as long as the server asked before asking again."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("gitea.client.gitea.time.sleep", sleeps.append)
+        client = Gitea(token="test_token", base_url=BASE_URL, retry=RetryPolicy())
+        session = Mock()
+        session.request.side_effect = [sync_response(429, headers={"Retry-After": "3"}), sync_response(200, BODY)]
+        client.session = session
+
+        client._request("GET", "users/octo")
+
+        assert sleeps == [3]
+
+    def test_without_a_policy_a_request_is_sent_once(self) -> None:
+        """Retrying is opt-in for the library."""
+        client = Gitea(token="test_token", base_url=BASE_URL)
+        session = Mock()
+        session.request.side_effect = [sync_response(503), sync_response(200, BODY)]
+        client.session = session
+
+        with pytest.raises(requests.HTTPError):
+            client._request("GET", "users/octo")
+
+        session.request.assert_called_once()
+
+
+class TestAsynchronousRetry:
+    """Tests for the asynchronous client sending a request again."""
+
+    @pytest.mark.asyncio
+    async def test_a_transient_status_is_retried(self) -> None:
+        """A `502` followed by a `200` is the `200`, one retry later."""
+        client = AsyncGitea(token="test_token", base_url=BASE_URL, retry=IMMEDIATE)
+        failed = async_response(502)
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=[failed, async_response(200, BODY)])
+        client.session = session
+
+        data, metadata = await client.user.get_user(username="octo")
+
+        assert data == BODY
+        assert metadata == {"status_code": 200, "retries": 1}
+        failed.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_a_connection_error_is_retried(self) -> None:
+        """A dropped connection is sent again like a transient status."""
+        client = AsyncGitea(token="test_token", base_url=BASE_URL, retry=IMMEDIATE)
+        session = MagicMock()
+        session.request = AsyncMock(
+            side_effect=[aiohttp.ClientConnectionError("reset"), TimeoutError(), async_response(200, BODY)]
+        )
+        client.session = session
+
+        _, metadata = await client.user.get_user(username="octo")
+
+        assert metadata["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_the_last_connection_error_is_raised(self) -> None:
+        """Once the attempts run out, the caller sees the error itself."""
+        client = AsyncGitea(token="test_token", base_url=BASE_URL, retry=RetryPolicy(max_attempts=2, backoff=0))
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=aiohttp.ClientConnectionError("reset"))
+        client.session = session
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await client._request("GET", "users/octo")
+
+        assert session.request.call_count == 2
@@ -23,3 +23,13 @@ def setup_logger() -> None:
     for handler in list(logger.handlers):
         handler.close()
         logger.removeHandler(handler)
+
+
+@pytest.fixture(autouse=True)
+def isolate_response_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the CLI's response cache out of the user's cache directory, and out of the other tests.
+
+    Every test gets a directory of its own, so a response one test's stub
+    served is never answered from the cache in another.
+    """
+    monkeypatch.setenv("PYTHON_GITEA_CACHE_DIR", str(tmp_path_factory.mktemp("responses")))
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from aiohttp import ClientError
@@ -15,6 +15,7 @@ from tests.board import (
     REPOSITORY_PROJECT,
     column_ids,
     make_async_client,
+    make_bare_async_client,
     make_issue,
     make_issue_with_projects,
     paged_issues,
@@ -124,7 +125,7 @@ async def test_returns_the_issue_unchanged_when_it_lists_no_projects():
 @pytest.mark.asyncio
 async def test_a_refused_lookup_leaves_that_project_null_and_resolves_the_others(caplog):
     """A failed lookup should cost only its own column, not the issue or the other projects."""
-    client = MagicMock()
+    client = make_bare_async_client()
     client.project.list_project_columns = AsyncMock(
         side_effect=[
             ClientError("404 Not Found"),
@@ -154,7 +155,7 @@ async def test_a_timed_out_lookup_leaves_that_project_null_and_resolves_the_othe
     lookup, as it does on the synchronous path where requests reports a timeout
     as a RequestException.
     """
-    client = MagicMock()
+    client = make_bare_async_client()
     client.project.list_project_columns = AsyncMock(
         side_effect=[
             TimeoutError("Timeout on reading data from socket"),
@@ -179,7 +180,7 @@ async def test_a_timed_out_lookup_leaves_that_project_null_and_resolves_the_othe
 @pytest.mark.asyncio
 async def test_a_timeout_raised_as_asyncio_timeout_error_is_caught():
     """asyncio.TimeoutError is the alias the client's own timeouts surface under."""
-    client = MagicMock()
+    client = make_bare_async_client()
     client.project.list_project_columns = AsyncMock(side_effect=asyncio.TimeoutError)
 
     resolved = await resolve_async_project_column_ids(
@@ -229,3 +230,81 @@ async def test_skips_a_column_entry_that_is_not_an_object():
 
     assert column_ids(resolved) == [109]
     assert [call.kwargs["column_id"] for call in client.project.list_project_column_issues.await_args_list] == [109]
+
+
+@pytest.mark.asyncio
+async def test_board_index_reads_the_columns_concurrently_and_once():
+    """The columns should be read side by side, and every lookup after the first answered from the map."""
+    from gitea.issue.project_column import AsyncBoardIndex
+
+    inside = 0
+    most = 0
+    listing = paged_issues({107: [[{"id": 1}]], 108: [[{"id": ISSUE_ID}]], 109: [[]]})
+
+    async def list_issues(**kwargs):
+        nonlocal inside, most
+        inside += 1
+        most = max(most, inside)
+        await asyncio.sleep(0.01)
+        inside -= 1
+        return listing(**kwargs)
+
+    client = make_async_client({29: [[{"id": 107}, {"id": 108}, {"id": 109}]]}, {})
+    client.project.list_project_column_issues = AsyncMock(side_effect=list_issues)
+    board = AsyncBoardIndex(client=client, owner="o", repository=None, project_id=29, concurrency=2)
+
+    assert [await board.column_of(issue_id) for issue_id in (1, ISSUE_ID, 3)] == [107, 108, None]
+    assert await board.columns() == [107, 108, 109]
+    assert most == 2
+    assert sorted(
+        call.kwargs["column_id"]
+        for call in client.project.list_project_column_issues.call_args_list
+        if call.kwargs["page"] == 1
+    ) == [107, 108, 109]
+
+
+@pytest.mark.asyncio
+async def test_board_index_rereads_only_the_columns_marked_as_changed():
+    """A move should cost the listings of the columns it touched."""
+    from gitea.issue.project_column import AsyncBoardIndex
+
+    board_state = {107: [[{"id": ISSUE_ID}]], 108: [[]]}
+    client = make_async_client({29: [[{"id": 107}, {"id": 108}]]}, board_state)
+    board = AsyncBoardIndex(client=client, owner="o", repository=None, project_id=29)
+    assert await board.column_of(ISSUE_ID) == 107
+
+    board_state[107], board_state[108] = [[]], [[{"id": ISSUE_ID}]]
+    board.invalidate(108)
+
+    assert await board.holds(108, ISSUE_ID)
+    assert [
+        call.kwargs["column_id"]
+        for call in client.project.list_project_column_issues.call_args_list
+        if call.kwargs["page"] == 1
+    ] == [107, 108, 108]
+
+
+@pytest.mark.asyncio
+async def test_board_index_failure_cancels_the_other_columns():
+    """A column that cannot be read should fail the lookup without leaving reads running."""
+    from gitea.issue.project_column import AsyncBoardIndex
+
+    cancelled = asyncio.Event()
+
+    async def list_issues(**kwargs):
+        if kwargs["column_id"] == 107:
+            raise ClientError("boom")
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return [], {"status_code": 200}
+
+    client = make_async_client({29: [[{"id": 107}, {"id": 108}]]}, {})
+    client.project.list_project_column_issues = AsyncMock(side_effect=list_issues)
+    board = AsyncBoardIndex(client=client, owner="o", repository=None, project_id=29)
+
+    with pytest.raises(ClientError):
+        await board.column_of(ISSUE_ID)
+    assert cancelled.is_set()
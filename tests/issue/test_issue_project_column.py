@@ -332,3 +332,96 @@ def test_scopes_the_column_listing_to_the_kind_of_project(project, expected_repo
     resolve_project_column_ids(client=client, owner="example-org", repository="example-repo", issue=make_issue(project))
 
     assert client.project.list_project_columns.call_args.kwargs["repository"] == expected_repository
+
+
+def first_pages(listing):
+    """List what each walk of a listing was for, by the first page it asked for.
+
+    Args:
+        listing: The mocked listing method.
+
+    Returns:
+        The column ID, or project ID for a listing of columns, of every walk.
+
+    """
+    return [
+        call.kwargs.get("column_id", call.kwargs["project_id"])
+        for call in listing.call_args_list
+        if call.kwargs["page"] == 1
+    ]
+
+
+def test_board_index_reads_the_board_once_for_every_issue():
+    """Every lookup after the first should be answered without a request."""
+    from gitea.issue.project_column import BoardIndex
+
+    client = make_client(
+        {29: [[{"id": 107}, {"id": 108}, {"id": 109}]]},
+        {107: [[{"id": 1}]], 108: [[{"id": 2}, {"id": 3}]], 109: [[]]},
+    )
+    board = BoardIndex(client=client, owner="example-org", repository=None, project_id=29)
+
+    assert [board.column_of(issue_id) for issue_id in (1, 2, 3, 4)] == [107, 108, 108, None]
+    assert board.columns == [107, 108, 109]
+    assert first_pages(client.project.list_project_columns) == [29]
+    assert sorted(first_pages(client.project.list_project_column_issues)) == [107, 108, 109]
+
+
+def test_board_index_places_a_card_listed_twice_in_the_first_column():
+    """A board edited mid-read should answer as the walk stopping early would."""
+    from gitea.issue.project_column import BoardIndex
+
+    client = make_client({29: [[{"id": 109}, {"id": 107}]]}, {107: [[{"id": ISSUE_ID}]], 109: [[{"id": ISSUE_ID}]]})
+
+    assert BoardIndex(client=client, owner="o", repository=None, project_id=29).column_of(ISSUE_ID) == 109
+
+
+def test_board_index_rereads_only_the_columns_marked_as_changed():
+    """A move should cost the listings of the columns it touched, not the board's."""
+    from gitea.issue.project_column import BoardIndex
+
+    board_state = {107: [[{"id": ISSUE_ID}]], 108: [[]], 109: [[]]}
+    client = make_client({29: [[{"id": 107}, {"id": 108}, {"id": 109}]]}, board_state)
+    board = BoardIndex(client=client, owner="o", repository=None, project_id=29)
+    assert board.column_of(ISSUE_ID) == 107
+    client.project.list_project_column_issues.reset_mock()
+
+    board_state[107], board_state[108] = [[]], [[{"id": ISSUE_ID}]]
+    board.invalidate(107, 108)
+
+    assert board.holds(108, ISSUE_ID)
+    assert board.column_of(ISSUE_ID) == 108
+    assert sorted(first_pages(client.project.list_project_column_issues)) == [107, 108]
+    assert first_pages(client.project.list_project_columns) == [29]
+
+
+def test_board_index_invalidated_whole_lists_the_columns_again():
+    """Marking the whole board should read a column added since."""
+    from gitea.issue.project_column import BoardIndex
+
+    columns = {29: [[{"id": 107}]]}
+    client = make_client(columns, {107: [[]], 108: [[{"id": ISSUE_ID}]]})
+    board = BoardIndex(client=client, owner="o", repository=None, project_id=29)
+    assert board.column_of(ISSUE_ID) is None
+
+    columns[29] = [[{"id": 107}, {"id": 108}]]
+    board.invalidate()
+
+    assert board.column_of(ISSUE_ID) == 108
+    assert first_pages(client.project.list_project_columns) == [29, 29]
+
+
+def test_board_index_failure_leaves_the_board_to_be_read_again():
+    """A lookup that fails should raise, and the next one should try again."""
+    from gitea.issue.project_column import BoardIndex
+
+    client = make_client({29: [[{"id": 107}]]}, {107: [[{"id": ISSUE_ID}]]})
+    listing = client.project.list_project_column_issues.side_effect
+    client.project.list_project_column_issues.side_effect = HTTPError("502 Server Error")
+    board = BoardIndex(client=client, owner="o", repository=None, project_id=29)
+
+    with pytest.raises(HTTPError):
+        board.column_of(ISSUE_ID)
+    client.project.list_project_column_issues.side_effect = listing
+
+    assert board.column_of(ISSUE_ID) == 107
@@ -38,6 +38,7 @@ from gitea.client.async_gitea import AsyncGitea
 from gitea.client.gitea import Gitea
 from gitea.project.async_project import AsyncProject
 from gitea.project.project import Project
+from gitea.utils.pagination import collect_all_pages
 from tests.transport import NO_CONTENT, AsyncRecordingSession, RecordingSession
 
 BASE_URL = "https://gitea.invalid"
@@ -373,6 +374,37 @@ async def test_an_async_response_without_a_body_answers_with_the_default(call: C
     assert metadata == {"status_code": 204}
 
 
+# The headers Gitea sends with the last page of a listing that fits on one.
+LAST_PAGE_HEADERS = {"X-Total-Count": "1", "X-PageCount": "1", "X-HasMore": "false"}
+
+
+def test_a_listing_carries_the_pagination_headers() -> None:
+    """The listing's size reaches the metadata, and a walk stops on the page that reported it."""
+    session = RecordingSession([PROJECT], response_headers=LAST_PAGE_HEADERS)
+    client = Gitea(token=TOKEN, base_url=BASE_URL)
+    with patch("gitea.client.gitea.requests.Session", return_value=session), client:
+        _, metadata = client.project.list_projects(owner=OWNER, repository=REPOSITORY, limit=1)
+        items, _ = collect_all_pages(
+            lambda page: client.project.list_projects(owner=OWNER, repository=REPOSITORY, page=page, limit=1)
+        )
+
+    assert metadata == {"status_code": 200, "total_count": 1, "page_count": 1, "has_more": False}
+    assert items == [PROJECT]
+    assert len(session.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_an_async_listing_carries_the_pagination_headers() -> None:
+    """The asynchronous client carries the listing's size into the metadata alike."""
+    session = AsyncRecordingSession([PROJECT], response_headers=LAST_PAGE_HEADERS)
+    client = AsyncGitea(token=TOKEN, base_url=BASE_URL)
+    with patch("gitea.client.async_gitea.ClientSession", return_value=session):
+        async with client:
+            _, metadata = await client.project.list_projects(owner=OWNER, repository=REPOSITORY, limit=1)
+
+    assert metadata == {"status_code": 200, "total_count": 1, "page_count": 1, "has_more": False}
+
+
 def test_every_project_method_is_declared() -> None:
     """Every public method of both resources should be declared in the table above.
 
@@ -0,0 +1,42 @@
+"""Unit tests for the AsyncSettings class."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gitea.settings.async_settings import AsyncSettings
+
+API_SETTINGS = {
+    "max_response_items": 50,
+    "default_paging_num": 30,
+    "default_git_trees_per_page": 1000,
+    "default_max_blob_size": 10485760,
+}
+
+
+class TestAsyncSettings:
+    """Test cases for the AsyncSettings class."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Fixture to create a mock AsyncGitea client."""
+        client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.json = AsyncMock(return_value=API_SETTINGS)
+        mock_response.status = 200
+        client._request = AsyncMock(return_value=mock_response)
+        return client
+
+    @pytest.fixture
+    def async_settings(self, mock_client):
+        """Fixture to create an AsyncSettings instance."""
+        return AsyncSettings(client=mock_client)
+
+    @pytest.mark.asyncio
+    async def test_get_api_settings(self, async_settings, mock_client):
+        """Test get_api_settings."""
+        with patch("gitea.settings.async_settings.process_async_response") as mock_process:
+            mock_process.return_value = (API_SETTINGS, 200)
+            result = await async_settings.get_api_settings()
+            mock_client._request.assert_called_once_with(method="GET", endpoint="/settings/api")
+            assert result == (API_SETTINGS, {"status_code": 200})
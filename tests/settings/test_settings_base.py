@@ -0,0 +1,11 @@
+"""Unit tests for the BaseSettings class."""
+
+from gitea.settings.base import BaseSettings
+
+
+class TestBaseSettings:
+    """Test cases for the BaseSettings base class."""
+
+    def test_get_api_settings_endpoint(self):
+        """Test _get_api_settings_endpoint."""
+        assert BaseSettings()._get_api_settings_endpoint() == "/settings/api"
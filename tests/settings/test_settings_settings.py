@@ -0,0 +1,47 @@
+"""Unit tests for the Settings class."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gitea.settings.settings import Settings
+
+API_SETTINGS = {
+    "max_response_items": 50,
+    "default_paging_num": 30,
+    "default_git_trees_per_page": 1000,
+    "default_max_blob_size": 10485760,
+}
+
+
+class TestSettings:
+    """Test cases for the Settings class."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Fixture to create a mock Gitea client."""
+        client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.json.return_value = API_SETTINGS
+        mock_response.status_code = 200
+        client._request.return_value = mock_response
+        return client
+
+    @pytest.fixture
+    def settings(self, mock_client):
+        """Fixture to create a Settings instance."""
+        return Settings(client=mock_client)
+
+    def test_get_api_settings(self, settings, mock_client):
+        """Test get_api_settings."""
+        with patch("gitea.settings.settings.process_response") as mock_process:
+            mock_process.return_value = (API_SETTINGS, 200)
+            result = settings.get_api_settings()
+            mock_client._request.assert_called_once_with(method="GET", endpoint="/settings/api")
+            assert result == (API_SETTINGS, {"status_code": 200})
+
+    def test_get_api_settings_empty_body(self, settings):
+        """Test get_api_settings with a response carrying no settings."""
+        with patch("gitea.settings.settings.process_response") as mock_process:
+            mock_process.return_value = ({}, 200)
+            assert settings.get_api_settings() == ({}, {"status_code": 200})
@@ -26,7 +26,8 @@ never sends.
 `AsyncRecordingSession` is the same stand-in for the asynchronous client, which
 builds an `aiohttp` session rather than a `requests` one and awaits both the
 request and the reading of its body. It records what the synchronous one records,
-so a test asserting on either reads the same fields.
+so a test asserting on either reads the same fields. `AsyncRoutedSession` routes
+its requests as `RoutedSession` does.
 """
 
 from __future__ import annotations
@@ -35,6 +36,9 @@ import json
 from collections.abc import Sequence
 from typing import Any
 
+from multidict import CIMultiDict, CIMultiDictProxy
+from requests.structures import CaseInsensitiveDict
+
 
 class NoContent:
     """The answer of an endpoint that reports success without a body.
@@ -61,20 +65,23 @@ NO_CONTENT = NoContent()
 class RecordedResponse:
     """The answer the recording session gives, shaped like the response a request returns.
 
-    Only the parts `process_response` and the client's error handling read are
-    provided, so an addition to either shows up as an attribute error here
+    Only the parts `process_response`, `pagination_metadata` and the client's
+    error handling read are provided, so an addition to either shows up as an attribute error here
     rather than as a test passing against a response the real code could not
     have produced.
     """
 
-    def __init__(self, payload: Any) -> None:
+    def __init__(self, payload: Any, headers: dict[str, str] | None = None) -> None:
         """Hold the payload this response carries.
 
         Args:
             payload: JSON-serializable body to answer with, or `NO_CONTENT` to
                 answer as an endpoint that succeeds without a body does.
+            headers: Headers to answer with, such as the pagination headers
+                Gitea sends with a listing. None answers with none.
 
         """
+        self.headers = CaseInsensitiveDict(headers or {})
         if isinstance(payload, NoContent):
             self.status_code = 204
             self.content = b""
@@ -106,19 +113,32 @@ class RecordingSession:
     page forever.
     """
 
-    def __init__(self, payload: Any = None) -> None:
+    def __init__(self, payload: Any = None, response_headers: dict[str, str] | None = None) -> None:
         """Start a session recording nothing yet.
 
         Args:
             payload: Body every request is answered with. Defaults to an empty
                 listing.
+            response_headers: Headers every response carries. Defaults to none.
 
         """
         self.payload: Any = [] if payload is None else payload
+        self.response_headers = dict(response_headers or {})
         self.requests: list[tuple[str, str]] = []
         self.headers: list[dict[str, Any]] = []
         self.params: list[dict[str, Any]] = []
         self.bodies: list[Any] = []
+        self.adapters: dict[str, Any] = {}
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        """Keep the adapter the client mounted for a URL prefix.
+
+        Args:
+            prefix: The URL prefix.
+            adapter: The transport adapter.
+
+        """
+        self.adapters[prefix] = adapter
 
     def request(self, method: str, url: str, **kwargs: Any) -> RecordedResponse:
         """Record a request and answer it with the fixed payload.
@@ -137,7 +157,7 @@ class RecordingSession:
 
         """
         self._record(method, url, **kwargs)
-        return RecordedResponse(self.payload)
+        return RecordedResponse(self.payload, self.response_headers)
 
     def _record(self, method: str, url: str, **kwargs: Any) -> None:
         """Keep what one request was made with.
@@ -222,21 +242,24 @@ class RoutedSession(RecordingSession):
 class AsyncRecordedResponse:
     """The answer the asynchronous recording session gives, shaped like an `aiohttp` response.
 
-    Only the parts `process_async_response` and the asynchronous client's error
-    handling read are provided - the status, the body read as bytes, and the two
-    calls the client makes on a failure - so an addition to either shows up as an
+    Only the parts `process_async_response`, `pagination_metadata` and the
+    asynchronous client's error handling read are provided - the status, the
+    headers, the body read as bytes, and the two calls the client makes on a
+    failure - so an addition to either shows up as an
     attribute error here rather than as a test passing against a response the
     real code could not have produced.
     """
 
-    def __init__(self, payload: Any) -> None:
+    def __init__(self, payload: Any, headers: dict[str, str] | None = None) -> None:
         """Hold the payload this response carries.
 
         Args:
             payload: JSON-serializable body to answer with, or `NO_CONTENT` to
                 answer as an endpoint that succeeds without a body does.
+            headers: Headers to answer with. None answers with none.
 
         """
+        self.headers = CIMultiDictProxy(CIMultiDict(headers or {}))
         if isinstance(payload, NoContent):
             self.status = 204
             self.body = b""
@@ -283,6 +306,36 @@ class AsyncRecordingSession(RecordingSession):
 
         """
         self._record(method, url, **kwargs)
+        return AsyncRecordedResponse(self.payload, self.response_headers)
+
+    async def close(self) -> None:  # type: ignore[override]
+        """Close the session, as leaving the client's context manager does."""
+
+
+class AsyncRoutedSession(RoutedSession):
+    """Session answering the asynchronous client with the payload declared for each endpoint.
+
+    The routes are matched as `RoutedSession` matches them; only the request is
+    awaited, and answered with an `aiohttp`-shaped response.
+    """
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> AsyncRecordedResponse:  # type: ignore[override]
+        """Record a request and answer it with the payload its endpoint declared.
+
+        Args:
+            method: HTTP method the client asked for.
+            url: Full URL the client built.
+            **kwargs: Timeout, which is not recorded, and the headers, query
+                parameters and JSON body, which are.
+
+        Returns:
+            The recorded response.
+
+        """
+        self._record(method, url, **kwargs)
+        for fragment, payload in self.routes:
+            if fragment in url:
+                return AsyncRecordedResponse(payload)
         return AsyncRecordedResponse(self.payload)
 
     async def close(self) -> None:  # type: ignore[override]
@@ -0,0 +1,42 @@
+"""Unit tests for the advisory file locks."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from gitea.utils.locks import drop_lock, lock_path_for, take_lock
+
+
+class TestLockPath:
+    """Tests for where the lock of a file is kept."""
+
+    def test_the_lock_is_a_file_beside_the_one_it_guards(self, tmp_path: Path) -> None:
+        """A file replaced by a rename cannot carry its own lock."""
+        assert lock_path_for(tmp_path / "bucket") == tmp_path / "bucket.lock"
+
+
+class TestTakeAndDrop:
+    """Tests for taking and releasing the lock."""
+
+    def test_a_lock_taken_can_be_dropped_and_taken_again(self, tmp_path: Path) -> None:
+        """Dropping the lock leaves it free for the next holder."""
+        handle = os.open(tmp_path / "file.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            assert take_lock(handle) is True
+            drop_lock(handle)
+            assert take_lock(handle) is True
+            drop_lock(handle)
+        finally:
+            os.close(handle)
+
+    def test_a_platform_without_a_locking_call_says_so(self, tmp_path: Path) -> None:
+        """A caller must not believe a lock is held that could not be taken."""
+        handle = os.open(tmp_path / "file.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            with patch("gitea.utils.locks.fcntl", None), patch("gitea.utils.locks.msvcrt", None):
+                assert take_lock(handle) is False
+                drop_lock(handle)
+        finally:
+            os.close(handle)
@@ -1,21 +1,32 @@
 """Unit tests for the paginated-listing helpers."""
 
+import asyncio
 import inspect
-from unittest.mock import patch
+import threading
+import time
+from contextlib import aclosing
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import requests
+from aiohttp import ClientResponseError
 
 from gitea.utils import pagination
 from gitea.utils.pagination import (
     MAX_PAGES,
     PAGE_LIMIT,
+    PAGE_SIZE,
     REPEATED_PAGE,
     REPORTED_LAST_PAGE,
     SHORT_PAGE,
     _end_of_listing,
+    async_listing_page_size,
+    collect_all_async_pages,
     collect_all_pages,
+    gather_pages,
     iter_async_pages,
     iter_pages,
+    listing_page_size,
 )
 
 
@@ -540,3 +551,393 @@ def test_iter_pages_drops_a_repeat_that_other_rules_would_have_kept():
 
     assert requested == [1, 2]
     assert [item["id"] for item in items] == [1, 2]
+
+
+def make_counted_fetch_page(pages, requested, metadata, delays=None):
+    """Build a thread-safe page fetcher reporting the length of its listing.
+
+    Args:
+        pages: The items of each page, in order.
+        requested: List recording the page numbers requested.
+        metadata: The metadata every page reports, beyond its status.
+        delays: Seconds to hold each page number back for, if given, so a later
+            page can come back before an earlier one.
+
+    Returns:
+        A callable returning the requested page, or an empty page beyond the last one.
+
+    """
+    lock = threading.Lock()
+
+    def fetch_page(page):
+        with lock:
+            requested.append(page)
+        time.sleep((delays or {}).get(page, 0))
+        return (list(pages[page - 1]) if page <= len(pages) else [], {"status_code": 200, **metadata})
+
+    return fetch_page
+
+
+class TestConcurrentWalk:
+    """Tests for a walk fetching pages ahead once the first page says how many there are."""
+
+    def test_pages_are_handed_over_in_order_however_they_come_back(self):
+        """A later page answering first must not overtake the one before it."""
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}, {"id": 6}], [{"id": 7}]]
+        requested: list[int] = []
+        fetch_page = make_counted_fetch_page(pages, requested, {"total_count": 7}, delays={2: 0.05})
+
+        items, _ = collect_all_pages(fetch_page, concurrency=4)
+
+        assert [item["id"] for item in items] == [1, 2, 3, 4, 5, 6, 7]
+        assert sorted(requested) == [1, 2, 3, 4]
+        # The first page is always asked for on its own: nothing is known before it.
+        assert requested[0] == 1
+
+    def test_the_pages_after_the_first_are_in_flight_together(self):
+        """The point of it: page 3 is asked for before page 2 has come back."""
+        pages = [[{"id": n}, {"id": n + 100}] for n in range(1, 5)]
+        barrier = threading.Barrier(3, timeout=5)
+        requested: list[int] = []
+
+        def fetch_page(page):
+            requested.append(page)
+            if page > 1:
+                # Only reached by all three at once when they are fetched together;
+                # a walk asking for one page at a time breaks the barrier instead.
+                barrier.wait()
+            return (list(pages[page - 1]), {"status_code": 200, "page_count": 4})
+
+        items, _ = collect_all_pages(fetch_page, concurrency=3)
+
+        assert len(items) == 8
+        assert sorted(requested) == [1, 2, 3, 4]
+
+    def test_a_page_count_bounds_what_is_fetched_ahead(self):
+        """Nothing past the reported last page is asked for."""
+        pages = [[{"id": n}] for n in range(1, 4)]
+        requested: list[int] = []
+
+        items, _ = collect_all_pages(make_counted_fetch_page(pages, requested, {"page_count": 3}), concurrency=8)
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert sorted(requested) == [1, 2, 3]
+
+    def test_a_listing_shorter_than_reported_still_ends_where_it_ends(self):
+        """The verdicts decide the end; the count only plans how far to fetch.
+
+        The pages fetched ahead of the short one are the cost of fetching ahead,
+        and none of their items reaches the caller.
+        """
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}], [{"id": 4}, {"id": 5}], [{"id": 6}, {"id": 7}]]
+        requested: list[int] = []
+
+        items, _ = collect_all_pages(make_counted_fetch_page(pages, requested, {"page_count": 10}), concurrency=3)
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert max(requested) <= 1 + 3
+
+    def test_a_listing_longer_than_reported_is_walked_on_past_it(self):
+        """A last page that came back full is followed, one page at a time."""
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+        requested: list[int] = []
+
+        items, _ = collect_all_pages(make_counted_fetch_page(pages, requested, {"total_count": 4}), concurrency=4)
+
+        assert [item["id"] for item in items] == [1, 2, 3, 4, 5]
+        assert sorted(requested) == [1, 2, 3]
+
+    def test_without_a_count_the_walk_stays_one_page_at_a_time(self):
+        """Nothing is fetched ahead on a guess."""
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        requested: list[int] = []
+
+        items, _ = collect_all_pages(make_fetch_page(pages, requested), concurrency=8)
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert requested == [1, 2]
+
+    def test_a_repeat_still_ends_a_walk_fetched_ahead(self):
+        """An instance ignoring the page number is caught however the pages were asked for."""
+        requested: list[int] = []
+
+        def fetch_page(page):
+            requested.append(page)
+            return ([{"id": 1}, {"id": 2}], {"status_code": 200, "page_count": 500})
+
+        items, _ = collect_all_pages(fetch_page, concurrency=4)
+
+        assert [item["id"] for item in items] == [1, 2]
+        assert len(requested) <= 1 + 4
+
+    def test_a_failing_page_fails_the_walk_at_its_turn(self):
+        """The error is raised where a walk one page at a time would have raised it."""
+        pages = [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+        seen: list[int] = []
+
+        def fetch_page(page):
+            if page == 3:
+                raise RuntimeError("page 3 failed")
+            return (list(pages[page - 1]), {"status_code": 200, "page_count": 3})
+
+        def walk():
+            for batch, _ in iter_pages(fetch_page, concurrency=3):
+                seen.extend(item["id"] for item in batch)
+
+        with pytest.raises(RuntimeError, match="page 3 failed"):
+            walk()
+
+        assert seen == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_async_pages_fetches_ahead_and_hands_over_in_order():
+    """The asynchronous walk fetches ahead on tasks and keeps the order too."""
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    in_flight = 0
+    most_in_flight = 0
+
+    async def fetch_page_async(page):
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        # The earlier page answers last, so order is kept by the walk and not by luck.
+        await asyncio.sleep(0.02 if page == 2 else 0)
+        in_flight -= 1
+        return (list(pages[page - 1]) if page <= len(pages) else [], {"status_code": 200, "total_count": 5})
+
+    seen = [batch async for batch, _ in iter_async_pages(fetch_page_async, concurrency=4)]
+
+    assert [item["id"] for batch in seen for item in batch] == [1, 2, 3, 4, 5]
+    assert most_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_async_pages_cancels_what_a_stopped_walk_fetched_ahead():
+    """A caller closing the walk early leaves no page request running behind it.
+
+    An asynchronous generator abandoned by a `break` is only closed when it is
+    collected, so a caller stopping early closes it, as `aclosing` does.
+    """
+    pages = [[{"id": n}] for n in range(1, 11)]
+    cancelled: list[int] = []
+
+    async def fetch_page_async(page):
+        try:
+            await asyncio.sleep(0 if page <= 2 else 1)
+        except asyncio.CancelledError:
+            cancelled.append(page)
+            raise
+        return (list(pages[page - 1]), {"status_code": 200, "page_count": 10})
+
+    async with aclosing(iter_async_pages(fetch_page_async, concurrency=4)) as walk:
+        async for batch, _ in walk:
+            if batch[0]["id"] == 2:
+                break
+
+    assert sorted(cancelled) == [3, 4, 5]
+
+
+class TestGatherPages:
+    """Tests for the asynchronous walk guessing ahead from the first page."""
+
+    @pytest.mark.asyncio
+    async def test_collects_what_a_walk_one_page_at_a_time_collects(self):
+        """Guessing ahead changes when pages are asked for, not what is handed back."""
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}, {"id": 5}], [{"id": 6}, {"id": 7}], [{"id": 8}]]
+
+        serial = await collect_all_async_pages(make_async_fetch_page(pages))
+        guessed = await collect_all_async_pages(make_async_fetch_page(pages), concurrency=3)
+
+        assert guessed == serial
+        assert [item["id"] for item in guessed[0]] == [1, 2, 3, 4, 5, 6, 7, 8]
+        assert guessed[1] == {"status_code": 200, "page": 4}
+
+    @pytest.mark.asyncio
+    async def test_one_at_a_time_asks_for_nothing_past_the_end(self):
+        """The default asks for each page only once the one before it has been judged."""
+        requested: list[int] = []
+
+        items, _ = await collect_all_async_pages(
+            make_async_fetch_page([[{"id": 1}, {"id": 2}], [{"id": 3}]], requested)
+        )
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert requested == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_pages_are_in_flight_together_before_any_says_how_many_there_are(self):
+        """The point of it: page 3 is asked for before page 1 has come back, with no count reported."""
+        pages = [[{"id": n}, {"id": n + 100}] for n in range(1, 4)] + [[]]
+        started = {page: asyncio.Event() for page in range(1, 5)}
+
+        async def fetch_page(page):
+            started[page].set()
+            # Page 1 comes back only once page 3 has been asked for, which a
+            # walk waiting on page 1 before fetching ahead never lets happen.
+            if page == 1:
+                await asyncio.wait_for(started[3].wait(), timeout=5)
+            return (list(pages[page - 1]), {"status_code": 200})
+
+        items, _ = await collect_all_async_pages(fetch_page, concurrency=3)
+
+        assert len(items) == 6
+
+    @pytest.mark.asyncio
+    async def test_the_guesses_past_the_end_are_cancelled(self):
+        """A short page ends the walk, and the pages asked for after it stop with it."""
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        cancelled: list[int] = []
+
+        async def fetch_page(page):
+            try:
+                await asyncio.sleep(0 if page <= len(pages) else 1)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+            return (list(pages[page - 1]) if page <= len(pages) else [], {"status_code": 200})
+
+        items, _ = await collect_all_async_pages(fetch_page, concurrency=5)
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert sorted(cancelled) == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_a_reported_page_count_bounds_the_guesses_after_the_first_page(self):
+        """Once the first page has said how many there are, nothing past the last is asked for."""
+        pages = [[{"id": n}] for n in range(1, 3)]
+        requested: list[int] = []
+        fetch_page = make_counted_fetch_page(pages, requested, {"page_count": 2})
+
+        async def fetch_page_async(page):
+            return fetch_page(page)
+
+        items, _ = await collect_all_async_pages(fetch_page_async, concurrency=1)
+        assert [item["id"] for item in items] == [1, 2]
+        assert requested == [1, 2]
+
+        requested.clear()
+        items, _ = await collect_all_async_pages(fetch_page_async, concurrency=8)
+        assert [item["id"] for item in items] == [1, 2]
+        # The first round of guesses goes out before any count is known; none after it does.
+        assert sorted(requested) == list(range(1, 9))
+
+    @pytest.mark.asyncio
+    async def test_a_repeat_still_ends_a_walk_guessed_ahead(self):
+        """An instance ignoring the page number is caught however the pages were asked for."""
+        requested: list[int] = []
+
+        async def fetch_page(page):
+            requested.append(page)
+            return ([{"id": 1}, {"id": 2}], {"status_code": 200})
+
+        items, _ = await collect_all_async_pages(fetch_page, concurrency=4)
+
+        assert [item["id"] for item in items] == [1, 2]
+        assert len(requested) <= 2 + 3
+
+    @pytest.mark.asyncio
+    async def test_a_failing_page_fails_the_walk_at_its_turn(self):
+        """The error is raised where a walk one page at a time would have raised it."""
+        seen: list[int] = []
+
+        async def fetch_page(page):
+            if page == 3:
+                raise RuntimeError("page 3 failed")
+            return ([{"id": page}, {"id": page + 100}], {"status_code": 200})
+
+        async def walk():
+            async with aclosing(gather_pages(fetch_page, concurrency=4)) as pages:
+                async for batch, _ in pages:
+                    seen.extend(item["id"] for item in batch)
+
+        with pytest.raises(RuntimeError, match="page 3 failed"):
+            await walk()
+
+        assert seen == [1, 101, 2, 102]
+
+
+class TestListingPageSize:
+    """Tests for the page size asked of an instance once per client."""
+
+    @staticmethod
+    def make_client(answer):
+        """Build a client whose instance answers `/settings/api` as given.
+
+        Args:
+            answer: What `get_api_settings` returns, or an exception it raises.
+
+        Returns:
+            The mock client.
+
+        """
+        client = MagicMock()
+        if isinstance(answer, Exception):
+            client.settings.get_api_settings.side_effect = answer
+        else:
+            client.settings.get_api_settings.return_value = answer
+        return client
+
+    def test_the_size_is_the_most_the_instance_serves(self):
+        """A page as large as the instance allows walks the listing in the fewest requests."""
+        client = self.make_client(({"max_response_items": 100, "default_paging_num": 30}, {"status_code": 200}))
+
+        assert listing_page_size(client) == 100
+
+    def test_the_instance_is_asked_once_per_client(self):
+        """Every walk of a session shares the answer; a new session asks its own instance."""
+        client = self.make_client(({"max_response_items": 100}, {"status_code": 200}))
+        other = self.make_client(({"max_response_items": 20}, {"status_code": 200}))
+
+        assert [listing_page_size(client) for _ in range(3)] == [100, 100, 100]
+        assert listing_page_size(other) == 20
+        client.settings.get_api_settings.assert_called_once_with()
+        other.settings.get_api_settings.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "settings",
+        [{}, {"max_response_items": 0}, {"max_response_items": "100"}, {"max_response_items": True}],
+        ids=["absent", "zero", "string", "flag"],
+    )
+    def test_an_instance_without_a_usable_size_is_walked_at_the_default(self, settings):
+        """Only a positive count of items is taken as the page size.
+
+        Args:
+            settings: The settings the instance answers with.
+
+        """
+        assert listing_page_size(self.make_client((settings, {"status_code": 200}))) == PAGE_SIZE
+
+    def test_an_instance_refusing_the_request_is_walked_at_the_default(self):
+        """An instance too old to serve `/settings/api` still has its listings walked."""
+        client = self.make_client(requests.HTTPError("404 Client Error: Not Found"))
+
+        assert listing_page_size(client) == PAGE_SIZE
+        assert listing_page_size(client) == PAGE_SIZE
+        client.settings.get_api_settings.assert_called_once_with()
+
+    def test_an_unreachable_instance_fails_the_lookup(self):
+        """A connection failure is the walk's to report, not a reason to guess a size."""
+        client = self.make_client(requests.ConnectionError("Connection refused"))
+
+        with pytest.raises(requests.ConnectionError):
+            listing_page_size(client)
+
+    @pytest.mark.asyncio
+    async def test_the_asynchronous_lookup_reads_the_same_size_once(self):
+        """The asynchronous twin reads the same setting and remembers it the same way."""
+        client = MagicMock()
+        client.settings.get_api_settings = AsyncMock(return_value=({"max_response_items": 75}, {"status_code": 200}))
+
+        assert [await async_listing_page_size(client) for _ in range(2)] == [75, 75]
+        client.settings.get_api_settings.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_an_instance_refusing_the_asynchronous_request_is_walked_at_the_default(self):
+        """A refusal of the asynchronous request leaves the default too."""
+        client = MagicMock()
+        client.settings.get_api_settings = AsyncMock(
+            side_effect=ClientResponseError(MagicMock(), (), status=404, message="Not Found")
+        )
+
+        assert await async_listing_page_size(client) == PAGE_SIZE
@@ -4,7 +4,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from gitea.utils.response import process_async_response, process_response
+from gitea.utils.response import pagination_metadata, process_async_response, process_response
+from tests.transport import AsyncRecordedResponse, RecordedResponse
 
 
 class TestProcessResponse:
@@ -130,3 +131,63 @@ class TestProcessAsyncResponse:
         args, _ = mock_logger.error.call_args
         assert args[0] == "Failed to parse JSON response: %s"
         assert isinstance(args[1], ValueError)
+
+
+class TestPaginationMetadata:
+    """Test cases for pagination_metadata."""
+
+    def test_reads_the_gitea_headers(self):
+        """The count headers are read into the metadata, whatever their case."""
+        response = RecordedResponse([], headers={"x-total-count": "120", "X-PageCount": "3", "X-HasMore": "true"})
+
+        assert pagination_metadata(response) == {"total_count": 120, "page_count": 3, "has_more": True}
+
+    def test_has_more_false(self):
+        """A last page reports that nothing follows it."""
+        response = RecordedResponse([], headers={"X-HasMore": "False"})
+
+        assert pagination_metadata(response) == {"has_more": False}
+
+    def test_link_header_fills_in_missing_counts(self):
+        """Without the count headers, the Link relations stand in for them."""
+        link = (
+            '<https://gitea.invalid/api/v1/repos/o/r/issues?limit=50&page=3>; rel="next",'
+            '<https://gitea.invalid/api/v1/repos/o/r/issues?limit=50&page=4>; rel="last"'
+        )
+        response = RecordedResponse([], headers={"Link": link})
+
+        assert pagination_metadata(response) == {"page_count": 4, "has_more": True}
+
+    def test_link_header_without_next_is_the_last_page(self):
+        """A Link header with no next relation says no page follows."""
+        link = '<https://gitea.invalid/api/v1/repos/o/r/issues?limit=50&page=1>; rel="first"'
+        response = RecordedResponse([], headers={"Link": link})
+
+        assert pagination_metadata(response) == {"has_more": False}
+
+    def test_count_headers_win_over_the_link_header(self):
+        """The explicit headers are preferred when both are sent."""
+        link = '<https://gitea.invalid/api/v1/repos/o/r/issues?page=9>; rel="last"'
+        response = RecordedResponse([], headers={"Link": link, "X-PageCount": "2", "X-HasMore": "false"})
+
+        assert pagination_metadata(response) == {"page_count": 2, "has_more": False}
+
+    def test_no_headers(self):
+        """A response carrying none of the headers adds nothing."""
+        assert pagination_metadata(RecordedResponse([])) == {}
+
+    def test_headers_that_are_not_a_mapping_are_ignored(self):
+        """A response whose headers are not a mapping adds nothing."""
+        assert pagination_metadata(MagicMock()) == {}
+
+    def test_unreadable_values_are_ignored(self):
+        """Values that are not whole numbers or booleans are left out."""
+        response = RecordedResponse([], headers={"X-Total-Count": "-1", "X-PageCount": "two", "X-HasMore": "maybe"})
+
+        assert pagination_metadata(response) == {}
+
+    def test_asynchronous_response(self):
+        """The asynchronous response's headers are read the same way."""
+        response = AsyncRecordedResponse([], headers={"X-Total-Count": "7", "X-HasMore": "false"})
+
+        assert pagination_metadata(response) == {"total_count": 7, "has_more": False}
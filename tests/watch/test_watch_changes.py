@@ -8,6 +8,7 @@ import pytest
 
 from gitea.watch.changes import (
     comment_hash,
+    comments_unchanged,
     detect_changes,
     format_change,
     issue_key,
@@ -243,6 +244,45 @@ class TestIssueSnapshot:
         }
 
 
+class TestCommentsUnchanged:
+    """Tests for when an issue's recorded comments can stand in for walking them."""
+
+    def test_the_same_timestamp_and_count_keep_the_recorded_comments(self) -> None:
+        """Nothing added or deleted leaves both exactly as recorded."""
+        assert comments_unchanged({**ISSUE, "comments": 1}, snapshot())
+
+    def test_a_new_timestamp_walks_them(self) -> None:
+        """A comment added bumps the issue, which has to be walked again."""
+        assert not comments_unchanged({**ISSUE, "comments": 1, "updated_at": "2026-08-03T10:00:00Z"}, snapshot())
+
+    def test_a_snapshot_without_hashes_walks_them(self) -> None:
+        """A snapshot recording no comment hashes has none to stand in for the comments."""
+        recorded = {key: value for key, value in snapshot().items() if key != "comment_hashes"}
+
+        assert not comments_unchanged({**ISSUE, "comments": 0}, recorded)
+
+    def test_a_different_count_walks_them(self) -> None:
+        """A count that disagrees with the hashes recorded means the hashes are stale."""
+        assert not comments_unchanged({**ISSUE, "comments": 2}, snapshot())
+
+    def test_an_issue_never_recorded_walks_them(self) -> None:
+        """There is nothing to take the comments from."""
+        assert not comments_unchanged({**ISSUE, "comments": 1}, None)
+
+    @pytest.mark.parametrize(
+        "issue",
+        [
+            {**ISSUE, "comments": True},
+            {**ISSUE, "comments": "1"},
+            {key: value for key, value in ISSUE.items() if key != "updated_at"} | {"comments": 1},
+            ISSUE,
+        ],
+    )
+    def test_a_payload_that_cannot_say_walks_them(self, issue: dict[str, Any]) -> None:
+        """A missing or nonsense timestamp or count is never read as unchanged."""
+        assert not comments_unchanged(issue, snapshot())
+
+
 class TestDetectChanges:
     """Tests for the comparison of a scope's snapshots against the recorded ones."""
 
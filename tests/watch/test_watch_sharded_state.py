@@ -0,0 +1,194 @@
+"""Unit tests for the watch cache kept as a directory of one file per scope."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gitea.watch.sharded_state import load_sharded_state, save_sharded_scopes, shard_path
+from gitea.watch.state import (
+    STATE_VERSION,
+    StateBackend,
+    cache_lock,
+    load_state,
+    lock_path_for,
+    save_scopes,
+    scope_scanned_at,
+    scope_snapshots,
+    state_backend_for,
+)
+
+SNAPSHOT = {
+    "issue_id": 1854,
+    "number": 15,
+    "title": "Fix the docs",
+    "repository": "my-org/my-repo",
+    "updated_at": "2026-08-02T10:00:00Z",
+    "assignees": ["alice"],
+    "labels": ["bug"],
+    "comment_hashes": ["0123456789abcdef"],
+}
+
+
+def save_in_background(directory: Path, scope: str) -> threading.Event:
+    """Record one scope from another thread.
+
+    Args:
+        directory: The directory holding the shards.
+        scope: Key of the scope to record.
+
+    Returns:
+        An event set once the scope has been recorded.
+
+    """
+    saved = threading.Event()
+
+    def save() -> None:
+        """Record the scope, and say so."""
+        save_sharded_scopes(directory, {scope: {"1854": SNAPSHOT}})
+        saved.set()
+
+    threading.Thread(target=save, daemon=True).start()
+    return saved
+
+
+class TestBackendChoice:
+    """Tests for choosing the sharded layout."""
+
+    def test_a_directory_suffix_picks_the_sharded_layout(self) -> None:
+        """A path ending in `.d` should be a directory of shards."""
+        assert state_backend_for("watch-state.d") is StateBackend.SHARDED
+
+    def test_load_state_and_save_scopes_go_through_the_shards(self, tmp_path: Path) -> None:
+        """The functions a run calls should reach the layout the path picks."""
+        directory = tmp_path / "watch-state.d"
+        save_scopes(directory, {"repo:my-org/my-repo": {"1854": SNAPSHOT}})
+
+        assert shard_path(directory, "repo:my-org/my-repo").is_file()
+        assert scope_snapshots(load_state(directory), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
+
+    def test_a_named_backend_is_used_for_any_path(self, tmp_path: Path) -> None:
+        """The option should make a directory of any path."""
+        directory = tmp_path / "shards"
+        save_scopes(directory, {"repo:my-org/my-repo": {}}, backend="sharded")
+
+        assert directory.is_dir()
+        assert scope_snapshots(load_state(directory, backend="sharded"), "repo:my-org/my-repo") == {}
+
+
+class TestShards:
+    """Tests for how the scopes are laid out."""
+
+    def test_a_scope_key_is_one_file_name(self, tmp_path: Path) -> None:
+        """The separators every key carries must not become directories."""
+        path = shard_path(tmp_path, "project:my-org/my-repo/29")
+
+        assert path.parent == tmp_path
+        assert path.name == "project%3Amy-org%2Fmy-repo%2F29.json"
+
+    def test_each_scope_is_a_json_cache_of_its_own(self, tmp_path: Path) -> None:
+        """A shard should be readable as the single-document cache is."""
+        save_sharded_scopes(tmp_path, {"repo:my-org/api": {"1854": SNAPSHOT}, "repo:my-org/web": {}})
+
+        shard = json.loads(shard_path(tmp_path, "repo:my-org/api").read_text(encoding="utf-8"))
+        assert shard == {"version": STATE_VERSION, "scopes": {"repo:my-org/api": {"issues": {"1854": SNAPSHOT}}}}
+
+    def test_every_shard_is_read_when_no_scope_is_named(self, tmp_path: Path) -> None:
+        """Reading the whole cache should find every scope, and nothing else."""
+        save_sharded_scopes(tmp_path, {"repo:my-org/api": {}, "project:my-org/29": {}})
+
+        assert sorted(load_sharded_state(tmp_path)["scopes"]) == ["project:my-org/29", "repo:my-org/api"]
+
+    def test_only_the_shards_of_the_scopes_named_are_read(self, tmp_path: Path) -> None:
+        """A run watching one scope should not open the others' shards."""
+        save_sharded_scopes(tmp_path, {"repo:my-org/api": {}, "repo:my-org/web": {}})
+
+        with patch("gitea.watch.sharded_state.load_state", wraps=load_state) as read:
+            state = load_sharded_state(tmp_path, scopes=["repo:my-org/web"])
+
+        assert list(state["scopes"]) == ["repo:my-org/web"]
+        assert [call.args[0] for call in read.call_args_list] == [shard_path(tmp_path, "repo:my-org/web")]
+
+    def test_a_missing_directory_reads_as_no_cache_and_is_not_created(self, tmp_path: Path) -> None:
+        """Reading should not leave a directory behind for a dry run."""
+        directory = tmp_path / "watch-state.d"
+
+        assert load_sharded_state(directory) == {"version": STATE_VERSION, "scopes": {}}
+        assert load_sharded_state(directory, scopes=["repo:my-org/api"])["scopes"] == {}
+        assert not directory.exists()
+
+    def test_an_unreadable_shard_costs_its_own_scope_only(self, tmp_path: Path) -> None:
+        """One corrupt shard should baseline one scope, not every one."""
+        save_sharded_scopes(tmp_path, {"repo:my-org/api": {"1854": SNAPSHOT}, "repo:my-org/web": {}})
+        shard_path(tmp_path, "repo:my-org/web").write_text("not json", encoding="utf-8")
+
+        state = load_sharded_state(tmp_path)
+
+        assert scope_snapshots(state, "repo:my-org/api") == {"1854": SNAPSHOT}
+        assert scope_snapshots(state, "repo:my-org/web") is None
+
+    def test_a_shard_from_an_older_version_is_recorded_afresh(self, tmp_path: Path) -> None:
+        """The version rule applies shard by shard."""
+        save_sharded_scopes(tmp_path, {"repo:my-org/api": {"1854": SNAPSHOT}, "repo:my-org/web": {}})
+        shard = shard_path(tmp_path, "repo:my-org/api")
+        shard.write_text(
+            json.dumps({"version": 1, "scopes": {"repo:my-org/api": {"issues": {"1854": SNAPSHOT}}}}),
+            encoding="utf-8",
+        )
+
+        assert list(load_sharded_state(tmp_path)["scopes"]) == ["repo:my-org/web"]
+
+    def test_a_save_replaces_only_the_scopes_given(self, tmp_path: Path) -> None:
+        """A run is authoritative only for the scopes it watched."""
+        save_sharded_scopes(tmp_path, {"repo:my-org/api": {"1854": SNAPSHOT}})
+        recorded = shard_path(tmp_path, "repo:my-org/api").read_bytes()
+
+        save_sharded_scopes(tmp_path, {"repo:my-org/web": {}})
+
+        assert shard_path(tmp_path, "repo:my-org/api").read_bytes() == recorded
+
+    def test_when_each_scope_was_walked_in_full_goes_to_its_own_shard(self, tmp_path: Path) -> None:
+        """A scope's time is written with the scope, and only there."""
+        save_sharded_scopes(
+            tmp_path,
+            {"repo:my-org/api": {}, "repo:my-org/web": {}},
+            scanned_at={"repo:my-org/api": "2026-08-02T10:00:00+00:00"},
+        )
+
+        state = load_sharded_state(tmp_path)
+        assert scope_scanned_at(state, "repo:my-org/api") == datetime(2026, 8, 2, 10, 0, tzinfo=UTC)
+        assert scope_scanned_at(state, "repo:my-org/web") is None
+
+    """Tests for each scope being locked on its own."""
+
+    def test_each_shard_has_a_lock_of_its_own(self, tmp_path: Path) -> None:
+        """The lock of one scope should not be the lock of another."""
+        save_sharded_scopes(tmp_path, {"repo:my-org/api": {}, "repo:my-org/web": {}})
+
+        assert lock_path_for(shard_path(tmp_path, "repo:my-org/api")).is_file()
+        assert lock_path_for(shard_path(tmp_path, "repo:my-org/web")).is_file()
+
+    def test_a_run_on_another_scope_is_not_blocked(self, tmp_path: Path) -> None:
+        """Two jobs watching disjoint repositories should never wait on each other."""
+        with cache_lock(shard_path(tmp_path, "repo:my-org/api")) as held:
+            if not held:
+                pytest.skip("This platform cannot lock the shard.")
+            saved = save_in_background(tmp_path, "repo:my-org/web")
+
+            assert saved.wait(timeout=10)
+
+    def test_a_run_on_the_same_scope_waits_for_the_lock(self, tmp_path: Path) -> None:
+        """Two writers of one scope should still take turns."""
+        with cache_lock(shard_path(tmp_path, "repo:my-org/api")) as held:
+            if not held:
+                pytest.skip("This platform cannot lock the shard.")
+            saved = save_in_background(tmp_path, "repo:my-org/api")
+
+            assert not saved.wait(timeout=0.2)
+
+        assert saved.wait(timeout=10)
@@ -0,0 +1,294 @@
+"""Unit tests for the watch cache kept as a SQLite database."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gitea.watch.sqlite_state import load_sqlite_state, save_sqlite_scopes
+from gitea.watch.state import (
+    STATE_VERSION,
+    StateBackend,
+    load_state,
+    save_scopes,
+    scope_scanned_at,
+    scope_snapshots,
+    state_backend_for,
+)
+
+SNAPSHOT = {
+    "issue_id": 1854,
+    "number": 15,
+    "title": "Fix the docs",
+    "repository": "my-org/my-repo",
+    "updated_at": "2026-08-02T10:00:00Z",
+    "assignees": ["alice"],
+    "labels": ["bug"],
+    "comment_hashes": ["0123456789abcdef"],
+}
+
+
+def rows(path: Path, query: str) -> list[tuple]:
+    """Read rows of the database directly, bypassing the module under test.
+
+    Args:
+        path: Path of the database.
+        query: The query to run.
+
+    Returns:
+        The rows it answered.
+
+    """
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(query).fetchall()
+    finally:
+        connection.close()
+
+
+class TestBackendChoice:
+    """Tests for choosing how a cache is stored."""
+
+    @pytest.mark.parametrize("name", ["watch.db", "watch.sqlite", "watch.sqlite3", "WATCH.DB"])
+    def test_a_database_suffix_picks_sqlite(self, name: str) -> None:
+        """A path named like a database should be kept as one."""
+        assert state_backend_for(name) is StateBackend.SQLITE
+
+    @pytest.mark.parametrize("name", ["watch-state.json", "watch", "watch.db.bak"])
+    def test_any_other_suffix_picks_json(self, name: str) -> None:
+        """Every cache written before there was a choice keeps being JSON."""
+        assert state_backend_for(name) is StateBackend.JSON
+
+    def test_a_named_backend_wins_over_the_suffix(self) -> None:
+        """The option should decide when the path alone would decide otherwise."""
+        assert state_backend_for("watch-state.json", "sqlite") is StateBackend.SQLITE
+        assert state_backend_for("watch.db", StateBackend.JSON) is StateBackend.JSON
+
+    def test_load_state_and_save_scopes_go_through_the_database(self, tmp_path: Path) -> None:
+        """The functions a run calls should reach the backend the path picks."""
+        path = tmp_path / "watch.db"
+        save_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT}})
+
+        assert rows(path, "SELECT scope, issue FROM snapshots") == [("repo:my-org/my-repo", "1854")]
+        assert scope_snapshots(load_state(path), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
+
+    def test_a_named_backend_is_used_for_any_path(self, tmp_path: Path) -> None:
+        """A `.json` path kept as SQLite should be a database, not a document."""
+        path = tmp_path / "watch-state.json"
+        save_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT}}, backend="sqlite")
+
+        assert path.read_bytes().startswith(b"SQLite format 3\x00")
+        assert scope_snapshots(load_state(path, backend="sqlite"), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
+
+
+class TestRoundTrip:
+    """Tests for writing snapshots and reading them back."""
+
+    def test_snapshots_survive_a_write_and_a_read(self, tmp_path: Path) -> None:
+        """What is recorded should be what the next run compares against."""
+        path = tmp_path / "cache" / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT}})
+
+        assert scope_snapshots(load_sqlite_state(path), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
+
+    def test_each_issue_is_a_row_of_its_own(self, tmp_path: Path) -> None:
+        """A scope should be rows to replace, not a document to rewrite."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT, "1900": {**SNAPSHOT, "number": 16}}})
+
+        assert rows(path, "SELECT issue FROM snapshots ORDER BY issue") == [("1854",), ("1900",)]
+
+    def test_the_database_is_in_wal_mode(self, tmp_path: Path) -> None:
+        """A run reading the cache should not wait on one writing it."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {}})
+
+        assert rows(path, "PRAGMA journal_mode") == [("wal",)]
+
+    def test_the_database_records_the_version_it_was_written_by(self, tmp_path: Path) -> None:
+        """The version rule needs a version to apply to."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {}})
+
+        assert rows(path, "SELECT value FROM meta WHERE key = 'version'") == [(str(STATE_VERSION),)]
+
+    def test_a_scope_with_no_issues_is_told_apart_from_one_never_recorded(self, tmp_path: Path) -> None:
+        """An emptied scope is compared against; an unknown one is baselined."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/empty": {}})
+
+        state = load_sqlite_state(path)
+        assert scope_snapshots(state, "repo:my-org/empty") == {}
+        assert scope_snapshots(state, "repo:my-org/unseen") is None
+
+    def test_only_the_scopes_named_are_read(self, tmp_path: Path) -> None:
+        """A run watching one repository should not pay for the others."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/api": {"1854": SNAPSHOT}, "repo:my-org/web": {"1900": SNAPSHOT}})
+
+        state = load_sqlite_state(path, scopes=["repo:my-org/web", "repo:my-org/unseen"])
+
+        assert list(state["scopes"]) == ["repo:my-org/web"]
+
+    def test_a_row_that_is_not_a_snapshot_is_dropped(self, tmp_path: Path) -> None:
+        """One bad row should cost one issue, as one bad entry does in JSON."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT}})
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("INSERT INTO snapshots VALUES ('repo:my-org/my-repo', '1900', 'not json')")
+        connection.close()
+
+        assert scope_snapshots(load_sqlite_state(path), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
+
+    def test_when_a_scope_was_walked_in_full_is_a_column_of_its_row(self, tmp_path: Path) -> None:
+        """The time rides with the scope it belongs to, not with its issues."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(
+            path, {"repo:my-org/my-repo": {}}, scanned_at={"repo:my-org/my-repo": "2026-08-02T10:00:00+00:00"}
+        )
+
+        assert rows(path, "SELECT scope, scanned_at FROM scopes") == [
+            ("repo:my-org/my-repo", "2026-08-02T10:00:00+00:00")
+        ]
+        assert scope_scanned_at(load_sqlite_state(path), "repo:my-org/my-repo") == datetime(
+            2026, 8, 2, 10, 0, tzinfo=UTC
+        )
+
+    """Tests for replacing the scopes a run watched."""
+
+    def test_the_scopes_given_replace_what_was_recorded_for_them(self, tmp_path: Path) -> None:
+        """An issue gone from a scope should be gone from its rows."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT, "1900": SNAPSHOT}})
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1900": SNAPSHOT}})
+
+        assert list(scope_snapshots(load_sqlite_state(path), "repo:my-org/my-repo") or {}) == ["1900"]
+
+    def test_the_other_scopes_are_left_alone(self, tmp_path: Path) -> None:
+        """A run is authoritative only for the scopes it watched."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/api": {"1854": SNAPSHOT}})
+        save_sqlite_scopes(path, {"repo:my-org/web": {}})
+
+        state = load_sqlite_state(path)
+        assert scope_snapshots(state, "repo:my-org/api") == {"1854": SNAPSHOT}
+        assert scope_snapshots(state, "repo:my-org/web") == {}
+
+    def test_both_scopes_survive_concurrent_saves(self, tmp_path: Path) -> None:
+        """Two runs saving at once should both keep what they recorded."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {})
+        barrier = threading.Barrier(8)
+
+        def save(index: int) -> None:
+            """Record one scope once every writer is ready.
+
+            Args:
+                index: Which writer this is.
+
+            """
+            barrier.wait()
+            save_sqlite_scopes(path, {f"repo:my-org/repo-{index}": {"1854": SNAPSHOT}})
+
+        threads = [threading.Thread(target=save, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(load_sqlite_state(path)["scopes"]) == sorted(f"repo:my-org/repo-{index}" for index in range(8))
+
+    def test_a_failed_write_leaves_the_database_as_it_was(self, tmp_path: Path) -> None:
+        """A write that fails part-way should roll back every row it touched."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT}})
+
+        with pytest.raises(TypeError):
+            save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1900": {"unserialisable": object()}}})
+
+        assert scope_snapshots(load_sqlite_state(path), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
+
+    def test_a_database_that_cannot_be_written_raises_os_error(self, tmp_path: Path) -> None:
+        """The command reports an `OSError`, so a SQLite failure has to be one."""
+        with (
+            patch("gitea.watch.sqlite_state.sqlite3.connect", side_effect=sqlite3.OperationalError("disk I/O error")),
+            pytest.raises(OSError, match="disk I/O error"),
+        ):
+            save_sqlite_scopes(tmp_path / "watch.db", {"repo:my-org/my-repo": {}})
+
+
+class TestUnreadableCache:
+    """Tests for the databases a run has to survive."""
+
+    def test_a_missing_database_reads_as_no_cache_and_is_not_created(self, tmp_path: Path) -> None:
+        """Reading should not leave an empty database behind for a dry run."""
+        path = tmp_path / "watch.db"
+
+        assert load_sqlite_state(path) == {"version": STATE_VERSION, "scopes": {}}
+        assert not path.exists()
+
+    @pytest.mark.parametrize("content", [b"", b'{"scopes": {}}', b"\xff\xfe garbage"])
+    def test_a_file_that_is_not_a_cache_reads_as_no_cache(self, tmp_path: Path, content: bytes) -> None:
+        """A corrupt cache should baseline every scope, and say so."""
+        path = tmp_path / "watch.db"
+        path.write_bytes(content)
+
+        with patch("gitea.watch.sqlite_state.logger") as logger:
+            assert load_sqlite_state(path)["scopes"] == {}
+        assert logger.warning.call_count == 1
+
+    def test_a_file_that_is_not_a_database_is_replaced_by_the_next_write(self, tmp_path: Path) -> None:
+        """A watchdog has to recover from a corrupt cache by itself."""
+        path = tmp_path / "watch.db"
+        path.write_text("not a database", encoding="utf-8")
+
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT}})
+
+        assert scope_snapshots(load_sqlite_state(path), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
+
+
+class TestVersion:
+    """Tests for the rule discarding a cache an older version wrote."""
+
+    def test_a_database_written_by_an_older_version_is_recorded_afresh(self, tmp_path: Path) -> None:
+        """Digests an older version took would all compare unequal."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": SNAPSHOT}})
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("UPDATE meta SET value = ? WHERE key = 'version'", (str(STATE_VERSION - 1),))
+        connection.close()
+
+        with patch("gitea.watch.sqlite_state.logger") as logger:
+            assert scope_snapshots(load_sqlite_state(path), "repo:my-org/my-repo") is None
+        assert "older version" in logger.warning.call_args.args[0]
+
+    def test_the_next_write_clears_what_the_older_version_recorded(self, tmp_path: Path) -> None:
+        """The scopes not watched now should not come back once re-stamped."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/api": {"1854": SNAPSHOT}})
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("UPDATE meta SET value = '1' WHERE key = 'version'")
+        connection.close()
+
+        save_sqlite_scopes(path, {"repo:my-org/web": {}})
+
+        assert list(load_sqlite_state(path)["scopes"]) == ["repo:my-org/web"]
+
+    def test_a_database_written_by_a_newer_version_is_still_read(self, tmp_path: Path) -> None:
+        """A newer cache is read leniently, as the JSON one is."""
+        path = tmp_path / "watch.db"
+        save_sqlite_scopes(path, {"repo:my-org/my-repo": {"1854": {**SNAPSHOT, "invented_later": 1}}})
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("UPDATE meta SET value = '99' WHERE key = 'version'")
+        connection.close()
+
+        assert scope_snapshots(load_sqlite_state(path), "repo:my-org/my-repo") == {"1854": SNAPSHOT}
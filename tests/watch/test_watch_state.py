@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import threading
 import time
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -24,6 +25,7 @@ from gitea.watch.state import (
     resolve_state_path,
     save_scopes,
     save_state,
+    scope_scanned_at,
     scope_snapshots,
 )
 
@@ -448,8 +450,8 @@ class TestCacheLock:
         path = tmp_path / "watch-state.json"
 
         with (
-            patch("gitea.watch.state.fcntl", None),
-            patch("gitea.watch.state.msvcrt", None),
+            patch("gitea.utils.locks.fcntl", None),
+            patch("gitea.utils.locks.msvcrt", None),
             patch("gitea.watch.state.logger") as logger,
         ):
             with cache_lock(path) as held:
@@ -464,7 +466,7 @@ class TestCacheLock:
         """A refused lock is logged and the cache is still written."""
         path = tmp_path / "watch-state.json"
 
-        with patch("gitea.watch.state._take_lock", side_effect=OSError("No locks available")):
+        with patch("gitea.watch.state.take_lock", side_effect=OSError("No locks available")):
             with patch("gitea.watch.state.logger") as logger, cache_lock(path) as held:
                 assert held is False
             assert logger.warning.call_count == 1
@@ -515,7 +517,7 @@ class TestCacheLock:
         path = tmp_path / "watch-state.json"
 
         with (
-            patch("gitea.watch.state._drop_lock", wraps=watch_state._drop_lock) as drop_lock,
+            patch("gitea.watch.state.drop_lock", wraps=watch_state.drop_lock) as drop_lock,
             patch("gitea.watch.state.save_state", side_effect=OSError("No space left on device")),
             pytest.raises(OSError, match="No space left on device"),
         ):
@@ -534,7 +536,7 @@ class TestCacheLock:
         path = tmp_path / "watch-state.json"
         windows = MagicMock(LK_LOCK="lock", LK_UNLCK="unlock")
 
-        with patch("gitea.watch.state.fcntl", None), patch("gitea.watch.state.msvcrt", windows):
+        with patch("gitea.utils.locks.fcntl", None), patch("gitea.utils.locks.msvcrt", windows):
             with cache_lock(path) as held:
                 assert held is True
             assert windows.locking.call_args_list[0].args[1:] == ("lock", 1)
@@ -663,6 +665,34 @@ class TestSaveScopes:
         assert list(scope_snapshots(load_state(path), "repo:my-org/one")) == ["1"]
 
 
+class TestScannedAt:
+    """Tests for recording when a scope was last walked in full."""
+
+    def test_the_time_survives_a_write_and_a_read(self, tmp_path: Path) -> None:
+        """A run narrowed to what changed needs it to tell when a full walk is due."""
+        path = tmp_path / "watch-state.json"
+
+        save_scopes(path, {"repo:my-org/one": {}}, scanned_at={"repo:my-org/one": "2026-08-02T10:00:00+00:00"})
+
+        assert scope_scanned_at(load_state(path), "repo:my-org/one") == datetime(2026, 8, 2, 10, 0, tzinfo=UTC)
+
+    def test_a_save_that_does_not_say_drops_it(self, tmp_path: Path) -> None:
+        """A writer that did not walk in full must not vouch that one was recent."""
+        path = tmp_path / "watch-state.json"
+        save_scopes(path, {"repo:my-org/one": {}}, scanned_at={"repo:my-org/one": "2026-08-02T10:00:00+00:00"})
+
+        save_scopes(path, {"repo:my-org/one": {}})
+
+        assert scope_scanned_at(load_state(path), "repo:my-org/one") is None
+
+    @pytest.mark.parametrize("value", [None, 1754128800, "yesterday", "2026-08-02T10:00:00"])
+    def test_a_value_that_is_not_a_time_with_a_timezone_reads_as_none(self, value: Any) -> None:
+        """A time that cannot be compared with now is as good as none."""
+        state = {"scopes": {"repo:my-org/one": {"issues": {}, "scanned_at": value}}}
+
+        assert scope_scanned_at(state, "repo:my-org/one") is None
+
+
 class TestAtomicWrite:
     """Tests for a cache write that a reader can never catch half done."""
 